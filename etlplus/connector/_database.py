@@ -16,10 +16,13 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from dataclasses import dataclass
+from dataclasses import field
 from typing import Final
 from typing import Self
 from typing import TypedDict
 
+from ..utils import IntParser
+from ..utils import SequenceParser
 from ..utils import TextNormalizer
 from ..utils import ValueParser
 from ..utils._types import StrAnyMap
@@ -94,8 +97,17 @@ class ConnectorDbConfigDict(TypedDict, total=False):
     schema: str
     warehouse: str
     query: str
+    params: StrAnyMap
     table: str
+    fetch_size: int
+    partition_column: str
+    partitions: int
+    lower_bound: float
+    upper_bound: float
+    preserve_order: bool
     mode: str
+    keys: list[str]
+    batch_size: int
 
 
 # SECTION: DATA CLASSES ===================================================== #
@@ -130,10 +142,33 @@ class ConnectorDb(ConnectorBase):
         Optional Snowflake warehouse identifier.
     query : str | None
         Query to execute for extraction (optional).
+    params : dict[str, object]
+        Bind parameters for :attr:`query` (optional).
     table : str | None
         Target/source table name (optional).
+    fetch_size : int | None
+        Rows fetched per round trip when extracting (optional).
+    partition_column : str | None
+        Numeric column whose value ranges are extracted concurrently
+        (optional).
+    partitions : int | None
+        Number of ranges a partitioned extract is split into (optional).
+    lower_bound : object | None
+        Lowest :attr:`partition_column` value used to place range
+        boundaries; discovered when omitted (optional).
+    upper_bound : object | None
+        Highest :attr:`partition_column` value used to place range
+        boundaries; discovered when omitted (optional).
+    preserve_order : bool
+        Whether partitioned extracts yield ranges in ascending order rather
+        than as they arrive. Defaults to ``True``.
     mode : str | None
-        Load mode hint: ``'append'``, ``'replace'``, ``'upsert'`` (future use).
+        Load mode when writing: ``'append'``, ``'replace'``, or ``'upsert'``
+        (optional).
+    keys : tuple[str, ...]
+        Key columns matched by ``'upsert'`` loads (optional).
+    batch_size : int | None
+        Rows written per statement when loading (optional).
     """
 
     # -- Attributes -- #
@@ -149,8 +184,17 @@ class ConnectorDb(ConnectorBase):
     schema: str | None = None
     warehouse: str | None = None
     query: str | None = None
+    params: dict[str, object] = field(default_factory=dict)
     table: str | None = None
+    fetch_size: int | None = None
+    partition_column: str | None = None
+    partitions: int | None = None
+    lower_bound: object | None = None
+    upper_bound: object | None = None
+    preserve_order: bool = True
     mode: str | None = None
+    keys: tuple[str, ...] = ()
+    batch_size: int | None = None
 
     # -- Internal Class Methods -- #
 
@@ -327,7 +371,7 @@ class ConnectorDb(ConnectorBase):
         elif len(fields) == 2:
             field_text = f'both "{fields[0]}" and "{fields[1]}"'
         else:
-            field_text = ', '.join(f'"{field}"' for field in fields[:-1])
+            field_text = ', '.join(f'"{name}"' for name in fields[:-1])
             field_text += f', and "{fields[-1]}"'
 
         display_name = cls.provider_display_name(normalized) or normalized.title()
@@ -392,6 +436,18 @@ class ConnectorDb(ConnectorBase):
             schema=cls._optional_str(obj, 'schema'),
             warehouse=cls._optional_str(obj, 'warehouse'),
             query=cls._optional_str(obj, 'query'),
+            params=cls._dict_field(obj, 'params'),
             table=cls._optional_str(obj, 'table'),
+            fetch_size=IntParser.parse(obj.get('fetch_size'), minimum=1),
+            partition_column=cls._optional_str(obj, 'partition_column'),
+            partitions=IntParser.parse(obj.get('partitions'), minimum=1),
+            lower_bound=obj.get('lower_bound'),
+            upper_bound=obj.get('upper_bound'),
+            preserve_order=ValueParser.bool_flag(
+                obj.get('preserve_order'),
+                default=True,
+            ),
             mode=cls._optional_str(obj, 'mode'),
+            keys=tuple(SequenceParser.str_list(obj.get('keys'))),
+            batch_size=IntParser.parse(obj.get('batch_size'), minimum=1),
         )
@@ -0,0 +1,359 @@
+"""
+:mod:`etlplus.file._column_types` module.
+
+Column type hints and sample-based type inference for delimited reads.
+
+Delimited text stores every value as text. :class:`ColumnTypes` converts
+columns once at read time, from an explicit ``schema`` read option, from
+types inferred on a leading sample of rows, or both (explicit types win).
+Blank cells of typed columns read as ``None``; values that do not parse as
+their column type are kept as text.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import date
+from datetime import datetime
+from itertools import chain
+from itertools import islice
+from typing import Any
+from typing import Final
+from typing import Literal
+from typing import Self
+
+from ..utils import IntParser
+from ..utils import ValueParser
+from ..utils._types import JSONDict
+
+# SECTION: EXPORTS ========================================================== #
+
+
+__all__ = [
+    # Constants
+    'DEFAULT_INFER_SAMPLE_SIZE',
+    # Classes
+    'ColumnTypes',
+    # Type Aliases
+    'ColumnType',
+]
+
+
+# SECTION: TYPE ALIASES ===================================================== #
+
+
+type ColumnType = Literal['bool', 'date', 'datetime', 'float', 'int', 'str']
+
+
+# SECTION: CONSTANTS ======================================================== #
+
+
+DEFAULT_INFER_SAMPLE_SIZE: Final[int] = 1_000
+
+
+# SECTION: INTERNAL CONSTANTS =============================================== #
+
+
+_BOOL_TEXT: Final[dict[str, bool]] = {
+    '1': True,
+    'true': True,
+    'yes': True,
+    'y': True,
+    't': True,
+    '0': False,
+    'false': False,
+    'no': False,
+    'n': False,
+    'f': False,
+}
+
+_DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+# Leading zeros mark identifiers (ZIP codes, account numbers), not numbers.
+_FLOAT_PATTERN = re.compile(
+    r'[+-]?(?:(?:0|[1-9]\d*)(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?',
+)
+_INT_PATTERN = re.compile(r'[+-]?(?:0|[1-9]\d*)')
+
+
+# SECTION: INTERNAL FUNCTIONS =============================================== #
+
+
+def _is_bool(text: str) -> bool:
+    """Return whether *text* is a ``true``/``false`` literal."""
+    return text.lower() in {'false', 'true'}
+
+
+def _is_date(text: str) -> bool:
+    """Return whether *text* is an ISO 8601 calendar date."""
+    if _DATE_PATTERN.fullmatch(text) is None:
+        return False
+    try:
+        date.fromisoformat(text)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_datetime(text: str) -> bool:
+    """Return whether *text* is an ISO 8601 date and time."""
+    if len(text) <= 10 or _DATE_PATTERN.match(text) is None:
+        return False
+    try:
+        datetime.fromisoformat(text)
+    except ValueError:
+        return False
+    return True
+
+
+def _to_bool(text: str) -> bool:
+    """Return the boolean spelled by *text*, raising :class:`ValueError`."""
+    try:
+        return _BOOL_TEXT[text.strip().lower()]
+    except KeyError:
+        raise ValueError(text) from None
+
+
+# Candidate types in inference order; the first one matching every sampled
+# value of a column wins.
+_MATCHERS: Final[tuple[tuple[ColumnType, Callable[[str], bool]], ...]] = (
+    ('int', lambda text: _INT_PATTERN.fullmatch(text) is not None),
+    ('float', lambda text: _FLOAT_PATTERN.fullmatch(text) is not None),
+    ('bool', _is_bool),
+    ('date', _is_date),
+    ('datetime', _is_datetime),
+)
+
+_CONVERTERS: Final[dict[str, Callable[[str], Any]]] = {
+    'bool': _to_bool,
+    'date': date.fromisoformat,
+    'datetime': datetime.fromisoformat,
+    'float': float,
+    'int': int,
+}
+
+_TYPE_ALIASES: Final[dict[str, ColumnType]] = {
+    'bool': 'bool',
+    'boolean': 'bool',
+    'date': 'date',
+    'datetime': 'datetime',
+    'timestamp': 'datetime',
+    'float': 'float',
+    'double': 'float',
+    'number': 'float',
+    'int': 'int',
+    'integer': 'int',
+    'str': 'str',
+    'string': 'str',
+    'text': 'str',
+}
+
+
+# SECTION: CLASSES ========================================================== #
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnTypes:
+    """
+    Column types applied to delimited rows at read time.
+
+    Attributes
+    ----------
+    types : Mapping[str, ColumnType]
+        Explicit column types, by column name.
+    infer : bool
+        Whether to infer the types of other columns from a sample of rows.
+    sample_size : int
+        Number of leading rows sampled for inference.
+    """
+
+    # -- Instance Attributes -- #
+
+    types: Mapping[str, ColumnType] = field(default_factory=dict)
+    infer: bool = False
+    sample_size: int = DEFAULT_INFER_SAMPLE_SIZE
+
+    # -- Class Methods -- #
+
+    @classmethod
+    def from_options(
+        cls,
+        *,
+        schema: object = None,
+        infer: object = None,
+        sample_size: object = None,
+    ) -> Self | None:
+        """
+        Build column types from ``schema``/``infer_types`` read extras.
+
+        Parameters
+        ----------
+        schema : object, optional
+            Mapping of column names to type names (``int``, ``float``,
+            ``bool``, ``date``, ``datetime``, ``str``, or a common alias).
+        infer : object, optional
+            Flag enabling sample-based inference for other columns.
+        sample_size : object, optional
+            Number of leading rows sampled for inference.
+
+        Returns
+        -------
+        Self | None
+            Column types, or ``None`` when neither option asks for typing.
+
+        Raises
+        ------
+        ValueError
+            If *schema* is not a mapping or names an unknown type.
+        """
+        infer_types = ValueParser.bool_flag(infer, default=False)
+        if schema is None and not infer_types:
+            return None
+        if schema is not None and not isinstance(schema, Mapping):
+            raise ValueError('Delimited "schema" option must be a mapping')
+        types: dict[str, ColumnType] = {}
+        for name, type_name in (schema or {}).items():
+            key = str(type_name).strip().lower()
+            if key not in _TYPE_ALIASES:
+                raise ValueError(
+                    f'Unsupported column type {type_name!r} for column '
+                    f'{name!r}; expected one of: '
+                    f'{", ".join(sorted(set(_TYPE_ALIASES.values())))}',
+                )
+            types[str(name)] = _TYPE_ALIASES[key]
+        return cls(
+            types=types,
+            infer=infer_types,
+            sample_size=IntParser.positive(
+                sample_size,
+                default=DEFAULT_INFER_SAMPLE_SIZE,
+            ),
+        )
+
+    # -- Static Methods -- #
+
+    @staticmethod
+    def infer_types(
+        rows: Iterable[JSONDict],
+    ) -> dict[str, ColumnType]:
+        """
+        Infer the narrowest type holding every non-blank value per column.
+
+        Parameters
+        ----------
+        rows : Iterable[JSONDict]
+            Sample rows of text values.
+
+        Returns
+        -------
+        dict[str, ColumnType]
+            Inferred type of each column, ``'str'`` for columns without a
+            narrower match or without values.
+        """
+        values: dict[str, list[str]] = {}
+        for row in rows:
+            for name, value in row.items():
+                if not isinstance(name, str):
+                    continue
+                bucket = values.setdefault(name, [])
+                if isinstance(value, str) and value.strip():
+                    bucket.append(value.strip())
+        inferred: dict[str, ColumnType] = {}
+        for name, texts in values.items():
+            inferred[name] = next(
+                (
+                    type_name
+                    for type_name, matches in _MATCHERS
+                    if texts and all(map(matches, texts))
+                ),
+                'str',
+            )
+        return inferred
+
+    # -- Instance Methods -- #
+
+    def apply(
+        self,
+        rows: Iterable[JSONDict],
+    ) -> Iterator[JSONDict]:
+        """
+        Yield *rows* with typed columns converted in place.
+
+        Parameters
+        ----------
+        rows : Iterable[JSONDict]
+            Rows of text values, consumed lazily. When inference is on, the
+            first :attr:`sample_size` rows are buffered to infer types.
+
+        Yields
+        ------
+        JSONDict
+            Rows with typed values.
+        """
+        iterator = iter(rows)
+        types = dict(self.types)
+        if self.infer:
+            sample = list(islice(iterator, self.sample_size))
+            types = {**self.infer_types(sample), **types}
+            iterator = chain(sample, iterator)
+        converters = [
+            (name, _CONVERTERS[type_name])
+            for name, type_name in types.items()
+            if type_name != 'str'
+        ]
+        for row in iterator:
+            for name, convert in converters:
+                value = row.get(name)
+                if not isinstance(value, str):
+                    continue
+                if not value.strip():
+                    row[name] = None
+                    continue
+                try:
+                    row[name] = convert(value.strip())
+                except ValueError:
+                    pass
+            yield row
+
+    def arrow_types(
+        self,
+        pa: Any,
+        header: Iterable[str],
+    ) -> dict[str, Any]:
+        """
+        Return :mod:`pyarrow.csv` column types for one file header.
+
+        Columns without an explicit type are read as text unless inference
+        is on, in which case :mod:`pyarrow.csv` infers them itself.
+
+        Parameters
+        ----------
+        pa : Any
+            The :mod:`pyarrow` module.
+        header : Iterable[str]
+            Column names of the file.
+
+        Returns
+        -------
+        dict[str, Any]
+            Arrow data type per column name.
+        """
+        arrow_types = {
+            'bool': pa.bool_(),
+            'date': pa.date32(),
+            'datetime': pa.timestamp('us'),
+            'float': pa.float64(),
+            'int': pa.int64(),
+            'str': pa.string(),
+        }
+        return {
+            name: arrow_types[self.types.get(name, 'str')]
+            for name in header
+            if name in self.types or not self.infer
+        }
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import shutil
 import tempfile
+from collections.abc import Iterable
 from collections.abc import Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -22,11 +23,14 @@ from typing import cast
 
 from ..storage import StorageLocation
 from ..storage import get_backend
+from ..utils._types import JSONData
+from ..utils._types import JSONList
 from ..utils._types import StrPath
 from . import xml
 from ._enums import FileFormat
 from ._enums import infer_file_format_and_compression
 from ._registry import get_handler
+from .base import DEFAULT_BATCH_SIZE
 from .base import BoundFileHandler
 from .base import FileHandlerABC
 from .base import ReadOptions
@@ -382,6 +386,76 @@ class File:
                 return bound_handler.read()
             return bound_handler.read(options=options)
 
+    def read_arrow(
+        self,
+        *,
+        options: ReadOptions | None = None,
+        handler: FileHandlerABC | None = None,
+    ) -> Any:
+        """
+        Read :attr:`path` as a ``pyarrow.Table``.
+
+        Columnar formats (Arrow, Feather, ORC, Parquet) are read natively;
+        other formats are read as records and converted.
+
+        Parameters
+        ----------
+        options : ReadOptions | None, optional
+            Optional read parameters forwarded to the active handler.
+        handler : FileHandlerABC | None, optional
+            Explicit handler instance to use instead of resolving one from the
+            registry.
+
+        Returns
+        -------
+        Any
+            ``pyarrow.Table`` holding the file contents.
+        """
+        self._assert_exists()
+        with self._dispatch_path(for_write=False) as path:
+            return (handler or self._resolve_handler()).read_arrow(
+                path,
+                options=options,
+            )
+
+    def read_iter(
+        self,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        options: ReadOptions | None = None,
+        handler: FileHandlerABC | None = None,
+    ) -> Iterator[JSONList]:
+        """
+        Lazily read record batches from :attr:`path`.
+
+        Parameters
+        ----------
+        batch_size : int, optional
+            Maximum number of records per yielded batch.
+        options : ReadOptions | None, optional
+            Optional read parameters forwarded to the active handler.
+        handler : FileHandlerABC | None, optional
+            Explicit handler instance to use instead of resolving one from the
+            registry.
+
+        Yields
+        ------
+        JSONList
+            Consecutive record batches in file order.
+
+        Notes
+        -----
+        Remote objects are staged to a temporary local path that lives until
+        the iterator is exhausted or closed.
+        """
+        self._assert_exists()
+        with self._dispatch_path(for_write=False) as path:
+            yield from (handler or self._resolve_handler()).read_iter(
+                path,
+                batch_size=batch_size,
+                options=options,
+            )
+
     def read_bytes(self) -> bytes:
         """
         Read and return binary content from :attr:`path`.
@@ -450,6 +524,46 @@ class File:
                 options=resolved_options,
             )
 
+    def write_iter(
+        self,
+        batches: Iterable[JSONData],
+        *,
+        options: WriteOptions | None = None,
+        root_tag: str = xml.DEFAULT_XML_ROOT,
+        handler: FileHandlerABC | None = None,
+    ) -> int:
+        """
+        Write record *batches* to :attr:`path` using :attr:`file_format`.
+
+        Parameters
+        ----------
+        batches : Iterable[JSONData]
+            Record batches to write, consumed lazily.
+        options : WriteOptions | None, optional
+            Optional write parameters forwarded to the active handler.
+        root_tag : str, optional
+            Root tag name to use when writing XML files. Defaults to
+            ``xml.DEFAULT_XML_ROOT``.
+        handler : FileHandlerABC | None, optional
+            Explicit handler instance to use instead of resolving one from the
+            registry.
+
+        Returns
+        -------
+        int
+            The number of records written.
+        """
+        resolved_options = self._resolved_write_options(
+            options=options,
+            root_tag=root_tag,
+        )
+        with self._dispatch_path(for_write=True) as path:
+            return (handler or self._resolve_handler()).write_iter(
+                path,
+                batches,
+                options=resolved_options,
+            )
+
     def write_bytes(
         self,
         payload: bytes,
@@ -8,9 +8,15 @@ from __future__ import annotations
 
 import csv
 import shutil
+import sys
 import tempfile
+from collections.abc import Iterable
 from collections.abc import Iterator
+from collections.abc import Sequence
 from contextlib import contextmanager
+from functools import partial
+from itertools import batched
+from itertools import chain
 from pathlib import Path
 from typing import IO
 from typing import TYPE_CHECKING
@@ -25,12 +31,225 @@ from ..utils._types import JSONData
 from ..utils._types import JSONDict
 from ..utils._types import JSONList
 from ..utils._types import StrPath
+from ._column_types import ColumnTypes
+from ._imports import get_dependency
 
 if TYPE_CHECKING:
     from .base import ReadOptions
     from .base import WriteOptions
 
 
+# SECTION: INTERNAL CONSTANTS =============================================== #
+
+
+# Engines accepted by the ``engine`` read option of delimited handlers.
+_DELIMITED_ENGINES = frozenset({'arrow', 'python'})
+
+# Leading rows buffered to type columns that are all-null in the first batch
+# of an incremental Arrow write.
+_ARROW_SCHEMA_SAMPLE_ROWS = 10_000
+
+# Rows per ``writerows`` call when writing one in-memory delimited payload.
+_DELIMITED_WRITE_CHUNK_SIZE = 10_000
+
+# Policies for columns that first appear after the header is written.
+_LATE_COLUMN_POLICIES = frozenset({'drop', 'error', 'rewrite'})
+
+# Late-column policy shared by in-memory and streaming delimited writes.
+_DEFAULT_LATE_COLUMN_POLICY = 'rewrite'
+
+
+# SECTION: INTERNAL FUNCTIONS =============================================== #
+
+
+def _arrow_invalid_row(
+    row: Any,
+    *,
+    delimiter: str,
+) -> str:
+    """
+    Skip blank ragged rows, as the pure-Python reader does, and reject the
+    rest.
+    """
+    fields = next(csv.reader([row.text], delimiter=delimiter), [])
+    return 'error' if any(fields) else 'skip'
+
+
+def _arrow_parse_error(
+    exc: Exception,
+) -> ValueError:
+    """Return the error raised when :mod:`pyarrow.csv` rejects a file."""
+    return ValueError(
+        f'Arrow engine cannot parse delimited file: {exc}. Use engine '
+        '"python" for ragged rows or values that do not fit their column type',
+    )
+
+
+def _delimited_arrow_options(
+    path: StrPath,
+    *,
+    delimiter: str,
+    column_types: ColumnTypes | None,
+) -> dict[str, Any] | None:
+    """
+    Return :mod:`pyarrow.csv` reader options for one delimited file.
+
+    Without *column_types*, every column is read as text. The header is
+    decoded like :mod:`pyarrow.csv` decodes it, without a leading
+    byte-order mark, so every column gets its text type. Files without a
+    header row yield ``None``.
+    """
+    pa = get_dependency('pyarrow', format_name='CSV', required=True)
+    pa_csv = _pyarrow_csv()
+    with _open_text_handle(
+        path,
+        mode='r',
+        encoding='utf-8-sig',
+        newline='',
+    ) as handle:
+        header = next(
+            (row for row in csv.reader(handle, delimiter=delimiter) if row),
+            [],
+        )
+    if not header:
+        return None
+    if column_types is None:
+        column_types = ColumnTypes()
+    return {
+        'read_options': pa_csv.ReadOptions(use_threads=True),
+        'parse_options': pa_csv.ParseOptions(
+            delimiter=delimiter,
+            invalid_row_handler=partial(_arrow_invalid_row, delimiter=delimiter),
+        ),
+        'convert_options': pa_csv.ConvertOptions(
+            column_types=column_types.arrow_types(pa, header),
+            strings_can_be_null=False,
+        ),
+    }
+
+
+def _drop_blank_arrow_rows(
+    batch: Any,
+) -> Any:
+    """
+    Drop rows of *batch* whose cells are all empty, as the pure-Python
+    reader skips them.
+    """
+    pa = get_dependency('pyarrow', format_name='CSV', required=True)
+    pc = pa.compute
+    blank = None
+    for column in batch.columns:
+        empty = pc.is_null(column)
+        if pa.types.is_string(column.type):
+            empty = pc.or_(empty, pc.equal(column, ''))
+        blank = empty if blank is None else pc.and_(blank, empty)
+    if blank is None or not pc.any(blank).as_py():
+        return batch
+    return batch.filter(pc.invert(blank))
+
+
+def _iter_delimited_rows(
+    handle: IO[str],
+    *,
+    delimiter: str,
+) -> Iterator[JSONDict]:
+    """
+    Yield non-blank delimited rows from an open text *handle*.
+
+    Rows are parsed as tuples and zipped onto one interned header, which
+    avoids the per-row overhead of :class:`csv.DictReader`. Short rows are
+    padded with ``None`` and surplus fields are kept under the ``None`` key,
+    as :class:`csv.DictReader` does.
+    """
+    reader = csv.reader(handle, delimiter=delimiter)
+    header = next((row for row in reader if row), None)
+    if header is None:
+        return
+    fields = tuple(sys.intern(name) for name in header)
+    width = len(fields)
+    for row in reader:
+        if not any(row):
+            continue
+        if len(row) == width:
+            yield dict(zip(fields, row, strict=True))
+            continue
+        padded = chain(row[:width], [None] * (width - len(row)))
+        record: dict[Any, Any] = dict(zip(fields, padded, strict=True))
+        if len(row) > width:
+            record[None] = row[width:]
+        yield cast(JSONDict, record)
+
+
+def _late_column_policy(
+    value: str | None,
+) -> str:
+    """Return one validated late-column policy for delimited writers."""
+    if value is None:
+        return _DEFAULT_LATE_COLUMN_POLICY
+    policy = str(value).strip().lower()
+    if policy not in _LATE_COLUMN_POLICIES:
+        raise ValueError(
+            f'Invalid late column policy {value!r}; '
+            f'expected one of: {", ".join(sorted(_LATE_COLUMN_POLICIES))}',
+        )
+    return policy
+
+
+def _pyarrow_csv() -> Any:
+    """Return the :mod:`pyarrow.csv` module."""
+    return get_dependency(
+        'pyarrow.csv',
+        format_name='CSV',
+        pip_name='pyarrow',
+        required=True,
+    )
+
+
+def _rewrite_delimited_columns(
+    path: StrPath,
+    *,
+    written: Sequence[str],
+    header: Sequence[str],
+    delimiter: str,
+) -> None:
+    """
+    Rewrite a delimited file under a header that grew while rows streamed.
+
+    Rows on disk hold one cell per *written* column, or fewer when they
+    were written before later columns appeared. Each row is padded and
+    reordered to match *header*.
+    """
+    width = len(written)
+    position = {name: index for index, name in enumerate(written)}
+    order = [position[name] for name in header]
+    with tempfile.TemporaryFile(
+        'w+',
+        encoding='utf-8',
+        newline='',
+    ) as spool:
+        writer = csv.writer(spool, delimiter=delimiter)
+        writer.writerow(header)
+        with _open_text_handle(
+            path,
+            mode='r',
+            encoding='utf-8',
+            newline='',
+        ) as handle:
+            reader = csv.reader(handle, delimiter=delimiter)
+            next(reader, None)
+            for row in reader:
+                cells = row + [''] * (width - len(row))
+                writer.writerow([cells[index] for index in order])
+        spool.seek(0)
+        with _open_text_handle(
+            path,
+            mode='w',
+            encoding='utf-8',
+            newline='',
+        ) as handle:
+            shutil.copyfileobj(spool, handle)
+
+
 def _staging_filename(location: StorageLocation) -> str:
     """Return one safe temporary filename for a storage location."""
     filename = Path(location.path).name
@@ -110,6 +329,156 @@ def _staged_local_read_path(
 # SECTION: FUNCTIONS ======================================================== #
 
 
+def arrow_write_tables(
+    pyarrow_mod: Any,
+    batches: Iterable[JSONData],
+    *,
+    format_name: str,
+) -> tuple[Any | None, Iterator[Any]]:
+    """
+    Fix one Arrow schema for an incremental write and convert each batch.
+
+    The first non-empty batch fixes the columns: the union of its row keys,
+    in first-seen order. Column types are inferred over every row of that
+    batch. When a column holds only ``None`` there, later batches are
+    buffered (up to a bounded sample) until it has a value, so sparse
+    columns get a concrete type instead of ``null``.
+
+    Parameters
+    ----------
+    pyarrow_mod : Any
+        The :mod:`pyarrow` module.
+    batches : Iterable[JSONData]
+        Record batches, consumed lazily.
+    format_name : str
+        Human-readable format name for error messages.
+
+    Returns
+    -------
+    tuple[Any | None, Iterator[Any]]
+        The file schema (``None`` when there is no data) and an iterator of
+        ``pyarrow.Table`` objects, one per non-empty batch.
+
+    Raises
+    ------
+    ValueError
+        If a later batch introduces new columns or holds values that do not
+        fit the fixed schema, such as values in a column that stayed
+        all-null through the sampled rows.
+    """
+    first, pending = split_record_batches(batches, format_name=format_name)
+    if first is None:
+        return None, iter(())
+    known = frozenset(chain.from_iterable(first))
+    sample = [first]
+    sampled = len(first)
+    schema = records_to_arrow_table(
+        pyarrow_mod,
+        first,
+        format_name=format_name,
+    ).schema
+    is_null = pyarrow_mod.types.is_null
+    nulls = {field.name for field in schema if is_null(field.type)}
+    while nulls and sampled < _ARROW_SCHEMA_SAMPLE_ROWS:
+        if (rows := next(pending, None)) is None:
+            break
+        check_batch_columns(rows, known, format_name=format_name)
+        sample.append(rows)
+        sampled += len(rows)
+        if any(row.get(name) is not None for row in rows for name in nulls):
+            schema = records_to_arrow_table(
+                pyarrow_mod,
+                list(chain.from_iterable(sample)),
+                format_name=format_name,
+            ).schema
+            nulls = {field.name for field in schema if is_null(field.type)}
+
+    def _tables() -> Iterator[Any]:
+        for rows in chain(sample, pending):
+            check_batch_columns(rows, known, format_name=format_name)
+            try:
+                yield pyarrow_mod.Table.from_pylist(rows, schema=schema)
+            except (pyarrow_mod.ArrowInvalid, pyarrow_mod.ArrowTypeError) as exc:
+                late = sorted(
+                    name
+                    for name in nulls
+                    if any(row.get(name) is not None for row in rows)
+                )
+                if late:
+                    raise ValueError(
+                        f'{format_name} batch has values in columns that were '
+                        f'all-null in the first {sampled} rows: '
+                        f'{", ".join(late)}',
+                    ) from exc
+                raise ValueError(
+                    f'{format_name} batch does not match the schema of '
+                    f'earlier batches: {exc}',
+                ) from exc
+
+    return schema, _tables()
+
+
+def batch_records(
+    records: Iterable[JSONDict],
+    batch_size: int,
+) -> Iterator[JSONList]:
+    """
+    Yield *records* as consecutive lists of at most *batch_size* rows.
+
+    Parameters
+    ----------
+    records : Iterable[JSONDict]
+        Row records to group, consumed lazily.
+    batch_size : int
+        Maximum number of rows per yielded batch.
+
+    Yields
+    ------
+    JSONList
+        Non-empty record batches in input order.
+
+    Raises
+    ------
+    ValueError
+        If *batch_size* is not positive.
+    """
+    if batch_size < 1:
+        raise ValueError('batch_size must be a positive integer')
+    for batch in batched(records, batch_size, strict=False):
+        yield list(batch)
+
+
+def check_batch_columns(
+    rows: JSONList,
+    known: frozenset[str],
+    *,
+    format_name: str,
+) -> None:
+    """
+    Reject rows carrying columns outside an already-written schema.
+
+    Parameters
+    ----------
+    rows : JSONList
+        Row records about to be written.
+    known : frozenset[str]
+        Column names fixed by the first written batch.
+    format_name : str
+        Human-readable format name for error messages.
+
+    Raises
+    ------
+    ValueError
+        If any row introduces a column missing from *known*.
+    """
+    for row in rows:
+        if extra := row.keys() - known:
+            raise ValueError(
+                f'{format_name} batch introduces columns missing '
+                f'from the header: {", ".join(sorted(extra))}',
+            )
+
+
 def coerce_record_payload(
     payload: object,
     *,
@@ -201,6 +570,7 @@ def read_delimited(
     path: StrPath,
     *,
     delimiter: str,
+    column_types: ColumnTypes | None = None,
 ) -> JSONList:
     """
     Read delimited content from *path*.
@@ -211,6 +581,9 @@ def read_delimited(
         Path to the delimited file on disk.
     delimiter : str
         Delimiter character for parsing.
+    column_types : ColumnTypes | None, optional
+        Column types converted at read time. Defaults to ``None``, which
+        keeps every value as text.
 
     Returns
     -------
@@ -223,16 +596,150 @@ def read_delimited(
         encoding='utf-8',
         newline='',
     ) as handle:
-        reader: csv.DictReader[str] = csv.DictReader(
-            handle,
-            delimiter=delimiter,
-        )
-        rows: JSONList = []
-        for row in reader:
-            if not any(row.values()):
-                continue
-            rows.append(cast(JSONDict, dict(row)))
-    return rows
+        rows = _iter_delimited_rows(handle, delimiter=delimiter)
+        if column_types is not None:
+            rows = column_types.apply(rows)
+        return list(rows)
+
+
+def read_delimited_batches(
+    path: StrPath,
+    *,
+    delimiter: str,
+    batch_size: int,
+    column_types: ColumnTypes | None = None,
+) -> Iterator[JSONList]:
+    """
+    Lazily read delimited content from *path* in record batches.
+
+    Parameters
+    ----------
+    path : StrPath
+        Path to the delimited file on disk.
+    delimiter : str
+        Delimiter character for parsing.
+    batch_size : int
+        Maximum number of rows per yielded batch.
+    column_types : ColumnTypes | None, optional
+        Column types converted at read time. Defaults to ``None``, which
+        keeps every value as text.
+
+    Yields
+    ------
+    JSONList
+        Consecutive batches of parsed rows; at most one batch is held in
+        memory at a time.
+    """
+    with _open_text_handle(
+        path,
+        mode='r',
+        encoding='utf-8',
+        newline='',
+    ) as handle:
+        rows = _iter_delimited_rows(handle, delimiter=delimiter)
+        if column_types is not None:
+            rows = column_types.apply(rows)
+        yield from batch_records(rows, batch_size)
+
+
+def read_delimited_arrow(
+    path: StrPath,
+    *,
+    delimiter: str,
+    column_types: ColumnTypes | None = None,
+) -> Any:
+    """
+    Read delimited content from *path* as a ``pyarrow.Table``.
+
+    The file is parsed by :func:`pyarrow.csv.read_csv`, which splits it into
+    blocks and parses them on multiple threads. Rows match the pure-Python
+    reader, which also skips blank rows, except that a leading byte-order
+    mark is stripped from the first column name and ragged rows are
+    rejected rather than padded.
+
+    Parameters
+    ----------
+    path : StrPath
+        Path to the delimited file on disk.
+    delimiter : str
+        Delimiter character for parsing.
+    column_types : ColumnTypes | None, optional
+        Column types read natively by :mod:`pyarrow.csv`. Defaults to
+        ``None``, which reads every column as text.
+
+    Returns
+    -------
+    Any
+        ``pyarrow.Table`` with one column per header field.
+
+    Raises
+    ------
+    ValueError
+        If a non-blank row has more or fewer fields than the header, or a
+        value does not fit its column type.
+    """
+    pa = get_dependency('pyarrow', format_name='CSV', required=True)
+    options = _delimited_arrow_options(
+        path,
+        delimiter=delimiter,
+        column_types=column_types,
+    )
+    if options is None:
+        return pa.table({})
+    with _open_binary_handle(path, mode='rb') as handle:
+        try:
+            table = _pyarrow_csv().read_csv(handle, **options)
+        except pa.ArrowInvalid as exc:
+            raise _arrow_parse_error(exc) from exc
+    return _drop_blank_arrow_rows(table)
+
+
+def read_delimited_arrow_batches(
+    path: StrPath,
+    *,
+    delimiter: str,
+    column_types: ColumnTypes | None = None,
+) -> Iterator[Any]:
+    """
+    Lazily read delimited content from *path* as ``pyarrow.RecordBatch``.
+
+    Parameters
+    ----------
+    path : StrPath
+        Path to the delimited file on disk.
+    delimiter : str
+        Delimiter character for parsing.
+    column_types : ColumnTypes | None, optional
+        Column types read natively by :mod:`pyarrow.csv`. Defaults to
+        ``None``, which reads every column as text.
+
+    Yields
+    ------
+    Any
+        Consecutive non-empty ``pyarrow.RecordBatch`` objects, one per
+        parsed block.
+
+    Raises
+    ------
+    ValueError
+        If a non-blank row has more or fewer fields than the header, or a
+        value does not fit its column type.
+    """
+    pa = get_dependency('pyarrow', format_name='CSV', required=True)
+    options = _delimited_arrow_options(
+        path,
+        delimiter=delimiter,
+        column_types=column_types,
+    )
+    if options is None:
+        return
+    with _open_binary_handle(path, mode='rb') as handle:
+        try:
+            for batch in _pyarrow_csv().open_csv(handle, **options):
+                if (batch := _drop_blank_arrow_rows(batch)).num_rows:
+                    yield batch
+        except pa.ArrowInvalid as exc:
+            raise _arrow_parse_error(exc) from exc
 
 
 def read_sas_table(
@@ -280,6 +787,51 @@ def read_text(
         return handle.read()
 
 
+def records_to_arrow_table(
+    pyarrow_mod: Any,
+    records: JSONList,
+    *,
+    format_name: str,
+) -> Any:
+    """
+    Convert row records into a ``pyarrow.Table`` over the union of keys.
+
+    ``Table.from_pylist`` takes its columns from the first record only and
+    drops keys that first appear later. Here every key becomes a column, in
+    first-seen order, and records missing a key hold ``null`` there.
+
+    Parameters
+    ----------
+    pyarrow_mod : Any
+        The :mod:`pyarrow` module.
+    records : JSONList
+        Records to convert. Column types are inferred over every value.
+    format_name : str
+        Human-readable format name for error messages.
+
+    Returns
+    -------
+    Any
+        ``pyarrow.Table`` holding *records*.
+
+    Raises
+    ------
+    ValueError
+        If one field holds values Arrow cannot store in a single column,
+        such as numbers mixed with text.
+    """
+    columns: dict[str, Any] = {}
+    for name in dict.fromkeys(chain.from_iterable(records)):
+        try:
+            columns[name] = pyarrow_mod.array([row.get(name) for row in records])
+        except (pyarrow_mod.ArrowInvalid, pyarrow_mod.ArrowTypeError) as exc:
+            raise ValueError(
+                f'{format_name} field {name!r} holds values of incompatible '
+                f'types: {exc}',
+            ) from exc
+    return pyarrow_mod.table(columns)
+
+
 def records_from_table(
     table: Any,
 ) -> JSONList:
@@ -299,6 +851,35 @@ def records_from_table(
     return cast(JSONList, table.to_dict(orient='records'))
 
 
+def split_record_batches(
+    batches: Iterable[JSONData],
+    *,
+    format_name: str,
+) -> tuple[JSONList | None, Iterator[JSONList]]:
+    """
+    Normalize *batches* and split off the first non-empty batch.
+
+    Incremental writers derive headers and schemas from the first batch
+    before any rows reach disk.
+
+    Parameters
+    ----------
+    batches : Iterable[JSONData]
+        Record batches, consumed lazily.
+    format_name : str
+        Human-readable format name for error messages.
+
+    Returns
+    -------
+    tuple[JSONList | None, Iterator[JSONList]]
+        The first non-empty batch (``None`` when there is no data) and an
+        iterator over every batch that follows it.
+    """
+    parser = RecordPayloadParser(format_name)
+    pending = (parser.normalize(batch) for batch in batches)
+    return next((rows for rows in pending if rows), None), pending
+
+
 def write_bytes(
     path: StrPath,
     payload: bytes,
@@ -315,10 +896,14 @@ def write_delimited(
     *,
     delimiter: str,
     format_name: str = 'Delimited',
+    columns: Sequence[str] | None = None,
+    late_columns: str | None = None,
 ) -> int:
     """
     Write *data* to a delimited file and return record count.
 
+    Rows stream to disk in chunks through :func:`write_delimited_batches`.
+
     Parameters
     ----------
     path : StrPath
@@ -330,6 +915,11 @@ def write_delimited(
     format_name : str, optional
         Human-readable format name for error messages. Defaults to
         ``'Delimited'``.
+    columns : Sequence[str] | None, optional
+        Explicit header columns. Defaults to the sorted keys of all rows.
+    late_columns : str | None, optional
+        Policy for columns missing from *columns*: ``'rewrite'`` (the
+        default), ``'drop'``, or ``'error'``.
 
     Returns
     -------
@@ -337,8 +927,75 @@ def write_delimited(
         The number of rows written.
     """
     rows = RecordPayloadParser(format_name).normalize(data)
+    return write_delimited_batches(
+        path,
+        batch_records(rows, _DELIMITED_WRITE_CHUNK_SIZE),
+        delimiter=delimiter,
+        format_name=format_name,
+        columns=columns,
+        late_columns=late_columns,
+    )
+
+
+def write_delimited_batches(
+    path: StrPath,
+    batches: Iterable[JSONData],
+    *,
+    delimiter: str,
+    format_name: str = 'Delimited',
+    columns: Sequence[str] | None = None,
+    late_columns: str | None = None,
+) -> int:
+    """
+    Write record batches to a delimited file and return record count.
+
+    Parameters
+    ----------
+    path : StrPath
+        Path to the delimited file on disk.
+    batches : Iterable[JSONData]
+        Record batches to write, consumed lazily.
+    delimiter : str
+        Delimiter character for writing.
+    format_name : str, optional
+        Human-readable format name for error messages. Defaults to
+        ``'Delimited'``.
+    columns : Sequence[str] | None, optional
+        Explicit header columns. Defaults to the sorted keys of the first
+        non-empty batch.
+    late_columns : str | None, optional
+        Policy for columns that first appear after the header is written:
+        ``'rewrite'`` (the default) appends them to the header and rewrites
+        the file once every batch is written, ``'drop'`` leaves them out,
+        and ``'error'`` rejects them.
+
+    Returns
+    -------
+    int
+        The number of rows written.
 
-    fieldnames = sorted({key for row in rows for key in row})
+    Raises
+    ------
+    ValueError
+        If *late_columns* is unknown, or if a later batch introduces a
+        column missing from the header under the ``'error'`` policy.
+
+    Notes
+    -----
+    Rows are written in one pass as :func:`csv.writer` tuples, so at most
+    one batch is held in memory. Under the ``'rewrite'`` policy, inferred
+    headers end up sorted across every column, as if all rows had been
+    scanned up front.
+    """
+    policy = _late_column_policy(late_columns)
+    first, pending = split_record_batches(batches, format_name=format_name)
+    if columns is not None:
+        fields = list(columns)
+    else:
+        fields = sorted({key for row in first or () for key in row})
+    header = list(fields)
+    known = frozenset(fields)
+    count = 0
     ensure_parent_dir(path)
     with _open_text_handle(
         path,
@@ -346,16 +1003,27 @@ def write_delimited(
         encoding='utf-8',
         newline='',
     ) as handle:
-        writer = csv.DictWriter(
-            handle,
-            fieldnames=fieldnames,
+        writer = csv.writer(handle, delimiter=delimiter)
+        writer.writerow(fields)
+        for rows in chain([first] if first else [], pending):
+            if policy == 'error':
+                check_batch_columns(rows, known, format_name=format_name)
+            elif policy == 'rewrite' and (
+                late := {key for row in rows for key in row.keys() - known}
+            ):
+                fields.extend(sorted(late))
+                known = frozenset(fields)
+            writer.writerows(tuple(map(row.get, fields)) for row in rows)
+            count += len(rows)
+
+    if len(fields) > len(header):
+        _rewrite_delimited_columns(
+            path,
+            written=fields,
+            header=fields if columns is not None else sorted(fields),
             delimiter=delimiter,
         )
-        writer.writeheader()
-        for row in rows:
-            writer.writerow({field: row.get(field) for field in fieldnames})
-
-    return len(rows)
+    return count
 
 
 def write_text(
@@ -587,6 +1255,56 @@ class DelimitedOption(FileHandlerOption):
 
     # -- Instance Methods -- #
 
+    def columns_from_options(
+        self,
+        options: WriteOptions | None,
+    ) -> list[str] | None:
+        """
+        Extract explicit header columns from write options.
+
+        Parameters
+        ----------
+        options : WriteOptions | None
+            Write options to extract the ``columns`` extra from.
+
+        Returns
+        -------
+        list[str] | None
+            Column names from a list or comma-separated ``columns`` extra,
+            else ``None`` to infer the header from the rows.
+        """
+        columns = self.extra_option(options, 'columns')
+        if columns is None:
+            return None
+        if isinstance(columns, str):
+            columns = columns.split(',')
+        return [str(column).strip() for column in columns]
+
+    def column_types_from_options(
+        self,
+        options: ReadOptions | None,
+    ) -> ColumnTypes | None:
+        """
+        Extract column typing from read options.
+
+        Parameters
+        ----------
+        options : ReadOptions | None
+            Read options to extract the ``schema``, ``infer_types``, and
+            ``infer_sample`` extras from.
+
+        Returns
+        -------
+        ColumnTypes | None
+            Column types to convert at read time, else ``None`` to keep
+            every value as text.
+        """
+        return ColumnTypes.from_options(
+            schema=self.extra_option(options, 'schema'),
+            infer=self.extra_option(options, 'infer_types'),
+            sample_size=self.extra_option(options, 'infer_sample'),
+        )
+
     def delimiter_from_options(
         self,
         options: ReadOptions | WriteOptions | None,
@@ -601,6 +1319,37 @@ class DelimitedOption(FileHandlerOption):
             return default
         return self.delimiter
 
+    def engine_from_options(
+        self,
+        options: ReadOptions | None,
+    ) -> str:
+        """
+        Extract the delimited read engine from read options.
+
+        Parameters
+        ----------
+        options : ReadOptions | None
+            Read options to extract the ``engine`` extra from.
+
+        Returns
+        -------
+        str
+            ``'arrow'`` for the :mod:`pyarrow.csv` reader, else
+            ``'python'`` (the default) for the :mod:`csv` reader.
+
+        Raises
+        ------
+        ValueError
+            If the ``engine`` extra names an unknown engine.
+        """
+        engine = str(self.extra_option(options, 'engine', default='python'))
+        if engine not in _DELIMITED_ENGINES:
+            raise ValueError(
+                f'Unsupported delimited read engine {engine!r}; '
+                f'expected one of: {", ".join(sorted(_DELIMITED_ENGINES))}',
+            )
+        return engine
+
 
 class EmbeddedDatabaseTableOption(FileHandlerOption):
     """Shared helpers for embedded-database table selection and cleanup."""
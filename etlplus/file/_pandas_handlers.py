@@ -360,9 +360,44 @@ class PandasColumnarHandlerMixin(
     write_method: ClassVar[str]
     write_kwargs: ClassVar[tuple[tuple[str, Any], ...]] = ()
     requires_pyarrow: ClassVar[bool] = False
+    arrow_module: ClassVar[str | None] = None
 
     # -- Instance Methods -- #
 
+    def read_arrow(
+        self,
+        path: Path,
+        *,
+        options: ReadOptions | None = None,
+    ) -> Any:
+        """
+        Read *path* as a ``pyarrow.Table`` without a pandas round trip.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the file on disk.
+        options : ReadOptions | None, optional
+            Optional read parameters.
+
+        Returns
+        -------
+        Any
+            ``pyarrow.Table`` read by :attr:`arrow_module` when set, else
+            converted from records.
+        """
+        if self.arrow_module is None:
+            return super().read_arrow(path, options=options)
+        self.resolve_pyarrow()
+        reader = resolve_dependency(
+            self,
+            self.arrow_module,
+            format_name=self.pandas_format_name,
+            pip_name='pyarrow',
+            required=True,
+        )
+        return reader.read_table(str(path))
+
     def read_table(
         self,
         path: Path,
@@ -18,15 +18,22 @@ Notes
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 from typing import cast
 
 from ..utils import RecordPayloadParser
 from ..utils._types import JSONData
+from ..utils._types import JSONDict
 from ..utils._types import JSONList
 from ._enums import FileFormat
 from ._imports import get_dependency
+from ._io import arrow_write_tables
+from ._io import batch_records
+from ._io import ensure_parent_dir
+from .base import DEFAULT_BATCH_SIZE
 from .base import ColumnarFileHandlerABC
 from .base import ReadOptions
 from .base import WriteOptions
@@ -86,6 +93,64 @@ class ArrowFile(ColumnarFileHandlerABC):
         pyarrow_mod = _pyarrow()
         return pyarrow_mod.Table.from_pylist(records)
 
+    def read_arrow(
+        self,
+        path: Path,
+        *,
+        options: ReadOptions | None = None,
+    ) -> object:
+        """
+        Read *path* as a ``pyarrow.Table``.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the Arrow file on disk.
+        options : ReadOptions | None, optional
+            Optional read parameters.
+
+        Returns
+        -------
+        object
+            PyArrow table object.
+        """
+        return self.read_table(path, options=options)
+
+    def read_iter(
+        self,
+        path: Path,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        options: ReadOptions | None = None,
+    ) -> Iterator[JSONList]:
+        """
+        Lazily read Arrow IPC record batches from *path*.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the Arrow file on disk.
+        batch_size : int, optional
+            Maximum number of records per yielded batch.
+        options : ReadOptions | None, optional
+            Optional read parameters.
+
+        Yields
+        ------
+        JSONList
+            Consecutive record batches in file order.
+        """
+        _ = options
+        pyarrow_mod = _pyarrow()
+        with pyarrow_mod.memory_map(str(path), 'r') as source:
+            reader = pyarrow_mod.ipc.open_file(source)
+            rows = (
+                cast(JSONDict, row)
+                for index in range(reader.num_record_batches)
+                for row in reader.get_batch(index).to_pylist()
+            )
+            yield from batch_records(rows, batch_size)
+
     def read_table(
         self,
         path: Path,
@@ -156,3 +221,46 @@ class ArrowFile(ColumnarFileHandlerABC):
         with pyarrow_mod.OSFile(str(path), 'wb') as sink:
             with pyarrow_mod.ipc.new_file(sink, table.schema) as writer:
                 writer.write_table(table)
+
+    def write_iter(
+        self,
+        path: Path,
+        batches: Iterable[JSONData],
+        *,
+        options: WriteOptions | None = None,
+    ) -> int:
+        """
+        Write record *batches* to *path* as Arrow IPC record batches.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the Arrow file on disk.
+        batches : Iterable[JSONData]
+            Record batches to write, consumed lazily. The first non-empty
+            batch fixes the file columns; see :func:`arrow_write_tables`.
+        options : WriteOptions | None, optional
+            Optional write parameters.
+
+        Returns
+        -------
+        int
+            Number of records written.
+        """
+        _ = options
+        pyarrow_mod = _pyarrow()
+        schema, tables = arrow_write_tables(
+            pyarrow_mod,
+            batches,
+            format_name=self.format_name,
+        )
+        if schema is None:
+            return 0
+        count = 0
+        ensure_parent_dir(path)
+        with pyarrow_mod.OSFile(str(path), 'wb') as sink:
+            with pyarrow_mod.ipc.new_file(sink, schema) as writer:
+                for table in tables:
+                    writer.write_table(table)
+                    count += table.num_rows
+        return count
@@ -18,7 +18,11 @@ Notes
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from collections.abc import Iterator
 from io import BytesIO
+from itertools import chain
+from pathlib import Path
 from typing import Any
 from typing import cast
 
@@ -28,6 +32,11 @@ from ..utils._types import JSONDict
 from ..utils._types import JSONList
 from ._enums import FileFormat
 from ._imports import get_dependency
+from ._io import _open_binary_handle
+from ._io import batch_records
+from ._io import ensure_parent_dir
+from ._io import split_record_batches
+from .base import DEFAULT_BATCH_SIZE
 from .base import BinarySerializationFileHandlerABC
 from .base import ReadOptions
 from .base import WriteOptions
@@ -201,3 +210,76 @@ class AvroFile(BinarySerializationFileHandlerABC):
         with BytesIO(payload) as handle:
             reader = fastavro.reader(handle)
             return [cast(JSONDict, record) for record in reader]
+
+    def read_iter(
+        self,
+        path: Path,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        options: ReadOptions | None = None,
+    ) -> Iterator[JSONList]:
+        """
+        Lazily read AVRO records from *path* block by block.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the AVRO file on disk.
+        batch_size : int, optional
+            Maximum number of records per yielded batch.
+        options : ReadOptions | None, optional
+            Optional read parameters.
+
+        Yields
+        ------
+        JSONList
+            Consecutive record batches in file order.
+        """
+        _ = options
+        fastavro = _fastavro()
+        with _open_binary_handle(path, mode='rb') as handle:
+            yield from batch_records(fastavro.reader(handle), batch_size)
+
+    def write_iter(
+        self,
+        path: Path,
+        batches: Iterable[JSONData],
+        *,
+        options: WriteOptions | None = None,
+    ) -> int:
+        """
+        Write record *batches* to *path* as one AVRO object container.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the AVRO file on disk.
+        batches : Iterable[JSONData]
+            Record batches to write, consumed lazily. The schema is inferred
+            from the first non-empty batch.
+        options : WriteOptions | None, optional
+            Optional write parameters.
+
+        Returns
+        -------
+        int
+            Number of records written.
+        """
+        _ = options
+        first, pending = split_record_batches(batches, format_name='AVRO')
+        if first is None:
+            return 0
+        fastavro = _fastavro()
+        parsed_schema = fastavro.parse_schema(_infer_schema(first))
+        count = 0
+
+        def _records() -> Iterator[JSONDict]:
+            nonlocal count
+            for rows in chain([first], pending):
+                yield from rows
+                count += len(rows)
+
+        ensure_parent_dir(path)
+        with _open_binary_handle(path, mode='wb') as handle:
+            fastavro.writer(handle, parsed_schema, _records())
+        return count
@@ -8,14 +8,19 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Iterable
+from collections.abc import Iterator
 from dataclasses import dataclass
 from dataclasses import field
+from itertools import chain
 from pathlib import Path
 from typing import Any
 from typing import ClassVar
+from typing import Final
 from typing import cast
 
 from ..storage import StorageLocation
+from ..utils import RecordPayloadParser
 from ..utils._types import JSONData
 from ..utils._types import JSONDict
 from ..utils._types import JSONList
@@ -28,11 +33,18 @@ from ._handler_abc import RowReadWriteABC
 from ._handler_abc import ScientificDatasetABC
 from ._handler_abc import SemiStructuredTextABC
 from ._handler_abc import SpreadsheetSheetABC
+from ._imports import get_dependency
 from ._io import ArchiveInnerNameOption
 from ._io import DelimitedOption
 from ._io import FileHandlerOption
+from ._io import batch_records
 from ._io import read_delimited
+from ._io import read_delimited_arrow
+from ._io import read_delimited_arrow_batches
+from ._io import read_delimited_batches
+from ._io import records_to_arrow_table
 from ._io import write_delimited
+from ._io import write_delimited_batches
 from ._mixins import SemiStructuredPayloadMixin
 from ._mixins import SingleDatasetValidation
 from ._mixins import TemplateTextIOMixin
@@ -41,6 +53,8 @@ from ._mixins import TemplateTextIOMixin
 
 
 __all__ = [
+    # Constants
+    'DEFAULT_BATCH_SIZE',
     # Data Classes
     'BoundFileHandler',
     'ReadOptions',
@@ -77,6 +91,12 @@ type SheetName = str | int
 type SheetSelector = SheetName | None
 
 
+# SECTION: CONSTANTS ======================================================== #
+
+
+DEFAULT_BATCH_SIZE: Final[int] = 10_000
+
+
 # SECTION: DATA CLASSES ===================================================== #
 
 
@@ -144,6 +164,41 @@ class BoundFileHandler:
             handler=self.handler,
         )
 
+    def read_iter(
+        self,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        options: ReadOptions | None = None,
+    ) -> Iterator[JSONList]:
+        """
+        Lazily read record batches from :attr:`path` using :attr:`handler`.
+
+        Parameters
+        ----------
+        batch_size : int, optional
+            Maximum number of records per yielded batch.
+        options : ReadOptions | None, optional
+            Optional read parameters. Defaults to ``None``.
+
+        Yields
+        ------
+        JSONList
+            Consecutive record batches in file order.
+        """
+        location = StorageLocation.from_value(self.path)
+        if location.is_local:
+            yield from self.handler.read_iter(
+                location.as_path(),
+                batch_size=batch_size,
+                options=options,
+            )
+            return
+        yield from self._core_file().read_iter(
+            batch_size=batch_size,
+            options=options,
+            handler=self.handler,
+        )
+
     def write(
         self,
         data: object,
@@ -180,6 +235,40 @@ class BoundFileHandler:
             handler=self.handler,
         )
 
+    def write_iter(
+        self,
+        batches: Iterable[JSONData],
+        *,
+        options: WriteOptions | None = None,
+    ) -> int:
+        """
+        Write record *batches* to :attr:`path` using :attr:`handler`.
+
+        Parameters
+        ----------
+        batches : Iterable[JSONData]
+            Record batches to write, consumed lazily.
+        options : WriteOptions | None, optional
+            Optional write parameters. Defaults to ``None``.
+
+        Returns
+        -------
+        int
+            The number of records written.
+        """
+        location = StorageLocation.from_value(self.path)
+        if location.is_local:
+            return self.handler.write_iter(
+                location.as_path(),
+                batches,
+                options=options,
+            )
+        return cast(Any, self._core_file()).write_iter(
+            batches,
+            options=options,
+            handler=self.handler,
+        )
+
 
 @dataclass(slots=True, frozen=True)
 class ReadOptions:
@@ -351,6 +440,108 @@ class FileHandlerABC(FileHandlerOption, ABC):
             Number of records written.
         """
 
+    # -- Instance Methods (Incremental IO) -- #
+
+    def read_iter(
+        self,
+        path: Path,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        options: ReadOptions | None = None,
+    ) -> Iterator[JSONList]:
+        """
+        Lazily read record batches from *path*.
+
+        The default implementation performs one full :meth:`read` and slices
+        the result. Row-oriented and columnar handlers override this with
+        native incremental readers.
+
+        Parameters
+        ----------
+        path : Path
+            File path to read from.
+        batch_size : int, optional
+            Maximum number of records per yielded batch.
+        options : ReadOptions | None, optional
+            Optional read parameters.
+
+        Yields
+        ------
+        JSONList
+            Consecutive record batches in file order.
+        """
+        rows = RecordPayloadParser(self.format_name).normalize(
+            self.read(path, options=options),
+        )
+        yield from batch_records(rows, batch_size)
+
+    def read_arrow(
+        self,
+        path: Path,
+        *,
+        options: ReadOptions | None = None,
+    ) -> Any:
+        """
+        Read *path* as a ``pyarrow.Table``.
+
+        The default implementation converts :meth:`read` records. Columnar
+        handlers override this with native Arrow readers that skip the
+        record round trip.
+
+        Parameters
+        ----------
+        path : Path
+            File path to read from.
+        options : ReadOptions | None, optional
+            Optional read parameters.
+
+        Returns
+        -------
+        Any
+            ``pyarrow.Table`` holding the file records.
+        """
+        rows = RecordPayloadParser(self.format_name).normalize(
+            self.read(path, options=options),
+        )
+        pyarrow = get_dependency(
+            'pyarrow',
+            format_name=self.format_name,
+            required=True,
+        )
+        return records_to_arrow_table(pyarrow, rows, format_name=self.format_name)
+
+    def write_iter(
+        self,
+        path: Path,
+        batches: Iterable[JSONData],
+        *,
+        options: WriteOptions | None = None,
+    ) -> int:
+        """
+        Write record *batches* to *path* and return record count.
+
+        The default implementation gathers every batch and performs one
+        :meth:`write`. Row-oriented and columnar handlers override this with
+        native incremental writers.
+
+        Parameters
+        ----------
+        path : Path
+            File path to write to.
+        batches : Iterable[JSONData]
+            Record batches to write, consumed lazily.
+        options : WriteOptions | None, optional
+            Optional write parameters.
+
+        Returns
+        -------
+        int
+            Number of records written.
+        """
+        parser = RecordPayloadParser(self.format_name)
+        rows = [row for batch in batches for row in parser.normalize(batch)]
+        return self.write(path, rows, options=options)
+
 
 class ReadOnlyFileHandlerABC(FileHandlerABC):
     """Base class for formats that support reads but not writes."""
@@ -488,8 +679,43 @@ class StandardDelimitedTextFileHandlerABC(DelimitedTextFileHandlerABC):
     Shared implementation for straightforward delimited text handlers.
 
     Subclasses only need to define :attr:`format` and :attr:`delimiter`.
+
+    Rows are parsed by :mod:`csv` unless the ``engine`` read extra selects
+    ``'arrow'``, which parses with the multi-threaded :mod:`pyarrow.csv`
+    reader. :meth:`read_arrow` always uses :mod:`pyarrow.csv`. Values stay
+    text unless the ``schema`` or ``infer_types`` read extras type columns.
     """
 
+    # -- Instance Methods -- #
+
+    def read_arrow(
+        self,
+        path: Path,
+        *,
+        options: ReadOptions | None = None,
+    ) -> Any:
+        """
+        Read *path* as a ``pyarrow.Table`` without a record round trip.
+
+        Parameters
+        ----------
+        path : Path
+            File path to read from.
+        options : ReadOptions | None, optional
+            Read options, which may include delimiter and column type
+            overrides. Defaults to ``None``.
+
+        Returns
+        -------
+        Any
+            ``pyarrow.Table`` with one column per header field.
+        """
+        return read_delimited_arrow(
+            path,
+            delimiter=self.delimiter_from_options(options),
+            column_types=self.column_types_from_options(options),
+        )
+
     def read_rows(
         self,
         path: Path,
@@ -504,17 +730,76 @@ class StandardDelimitedTextFileHandlerABC(DelimitedTextFileHandlerABC):
         path : Path
             File path to read from.
         options : ReadOptions | None, optional
-            Read options, which may include delimiter overrides. Defaults to
-            ``None``.
+            Read options, which may include delimiter, engine, and column
+            type overrides. Defaults to ``None``.
 
         Returns
         -------
         JSONList
             List of parsed rows as dictionaries.
         """
+        delimiter = self.delimiter_from_options(options)
+        column_types = self.column_types_from_options(options)
+        if self.engine_from_options(options) == 'arrow':
+            return cast(
+                JSONList,
+                read_delimited_arrow(
+                    path,
+                    delimiter=delimiter,
+                    column_types=column_types,
+                ).to_pylist(),
+            )
         return read_delimited(
             path,
-            delimiter=self.delimiter_from_options(options),
+            delimiter=delimiter,
+            column_types=column_types,
+        )
+
+    def read_iter(
+        self,
+        path: Path,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        options: ReadOptions | None = None,
+    ) -> Iterator[JSONList]:
+        """
+        Lazily read delimited rows from *path* in record batches.
+
+        Parameters
+        ----------
+        path : Path
+            File path to read from.
+        batch_size : int, optional
+            Maximum number of rows per yielded batch.
+        options : ReadOptions | None, optional
+            Read options, which may include delimiter, engine, and column
+            type overrides. Defaults to ``None``.
+
+        Yields
+        ------
+        JSONList
+            Consecutive batches of parsed rows.
+        """
+        delimiter = self.delimiter_from_options(options)
+        column_types = self.column_types_from_options(options)
+        if self.engine_from_options(options) == 'arrow':
+            yield from batch_records(
+                chain.from_iterable(
+                    batch.to_pylist()
+                    for batch in read_delimited_arrow_batches(
+                        path,
+                        delimiter=delimiter,
+                        column_types=column_types,
+                    )
+                ),
+                batch_size,
+            )
+            return
+        yield from read_delimited_batches(
+            path,
+            delimiter=delimiter,
+            batch_size=batch_size,
+            column_types=column_types,
         )
 
     def write_rows(
@@ -534,8 +819,8 @@ class StandardDelimitedTextFileHandlerABC(DelimitedTextFileHandlerABC):
         rows : JSONList
             List of row dictionaries to write.
         options : WriteOptions | None, optional
-            Write options, which may include delimiter overrides. Defaults to
-            ``None``.
+            Write options, which may include delimiter overrides, explicit
+            ``columns``, and a ``late_columns`` policy. Defaults to ``None``.
 
         Returns
         -------
@@ -547,6 +832,42 @@ class StandardDelimitedTextFileHandlerABC(DelimitedTextFileHandlerABC):
             rows,
             delimiter=self.delimiter_from_options(options),
             format_name=self.format_name,
+            columns=self.columns_from_options(options),
+            late_columns=self.extra_option(options, 'late_columns'),
+        )
+
+    def write_iter(
+        self,
+        path: Path,
+        batches: Iterable[JSONData],
+        *,
+        options: WriteOptions | None = None,
+    ) -> int:
+        """
+        Write record *batches* to *path* one batch at a time.
+
+        Parameters
+        ----------
+        path : Path
+            File path to write to.
+        batches : Iterable[JSONData]
+            Record batches to write, consumed lazily.
+        options : WriteOptions | None, optional
+            Write options, which may include delimiter overrides, explicit
+            ``columns``, and a ``late_columns`` policy. Defaults to ``None``.
+
+        Returns
+        -------
+        int
+            The number of rows written to the file.
+        """
+        return write_delimited_batches(
+            path,
+            batches,
+            delimiter=self.delimiter_from_options(options),
+            format_name=self.format_name,
+            columns=self.columns_from_options(options),
+            late_columns=self.extra_option(options, 'late_columns'),
         )
 
 
@@ -45,3 +45,4 @@ class FeatherFile(PandasColumnarHandlerMixin):
     read_method = 'read_feather'
     write_method = 'to_feather'
     requires_pyarrow = True
+    arrow_module = 'pyarrow.feather'
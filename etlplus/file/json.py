@@ -19,11 +19,27 @@ Notes
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO
+from typing import Final
+from typing import cast
 
 from ..utils import JsonCodec
+from ..utils import RecordPayloadParser
+from ..utils._json import JsonBackend
 from ..utils._types import JSONData
+from ..utils._types import JSONDict
+from ..utils._types import JSONList
 from ._enums import FileFormat
+from ._io import _open_text_handle
+from ._io import batch_records
+from ._io import ensure_parent_dir
 from ._semi_structured_handlers import RecordPayloadTextCodecHandlerMixin
+from .base import DEFAULT_BATCH_SIZE
+from .base import ReadOptions
+from .base import WriteOptions
 
 # SECTION: EXPORTS ========================================================== #
 
@@ -34,6 +50,100 @@ __all__ = [
 ]
 
 
+# SECTION: INTERNAL CONSTANTS ============================================== #
+
+
+# Number of characters pulled from the handle per incremental read.
+_READ_CHUNK_SIZE: Final[int] = 1 << 16
+
+_WHITESPACE: Final[str] = ' \t\n\r'
+
+
+# SECTION: INTERNAL FUNCTIONS =============================================== #
+
+
+def _iter_array_items(
+    handle: IO[str],
+    buffer: str,
+    *,
+    chunk_size: int = _READ_CHUNK_SIZE,
+) -> Iterator[object]:
+    """
+    Lazily decode the elements of a top-level JSON array.
+
+    Parameters
+    ----------
+    handle : IO[str]
+        Open text handle positioned just after *buffer*.
+    buffer : str
+        Text already read from *handle*, starting with the opening ``[``.
+    chunk_size : int, optional
+        Number of characters pulled from *handle* per refill.
+
+    Yields
+    ------
+    object
+        Decoded array elements in document order.
+
+    Raises
+    ------
+    ValueError
+        If the array is not well-formed JSON.
+    """
+    decoder = json.JSONDecoder()
+    pos = 1
+    first = True
+    expect_value = True
+    eof = False
+    while True:
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        if pos >= len(buffer):
+            if eof:
+                raise ValueError('Unterminated JSON array')
+            buffer = buffer[pos:] + handle.read(chunk_size)
+            pos = 0
+            eof = pos >= len(buffer)
+            continue
+        char = buffer[pos]
+        if char == ']':
+            if expect_value and not first:
+                raise ValueError("Unexpected ']' after ',' in JSON array")
+            if buffer[pos + 1 :].strip(_WHITESPACE) or handle.read().strip(
+                _WHITESPACE,
+            ):
+                raise ValueError('Extra data after JSON array')
+            return
+        if not expect_value:
+            if char != ',':
+                raise ValueError(f"Expected ',' or ']' in JSON array, got {char!r}")
+            pos += 1
+            expect_value = True
+            continue
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            item, end = None, -1
+        # Values ending exactly at the buffer edge (e.g. numbers) may be
+        # truncated, so only accept them once a following character exists.
+        if end < 0 or (end >= len(buffer) and not eof):
+            chunk = handle.read(chunk_size)
+            if not chunk:
+                if eof:
+                    raise ValueError('Malformed JSON array element')
+                eof = True
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            continue
+        yield item
+        pos = end
+        first = False
+        expect_value = False
+        if pos > chunk_size:
+            buffer = buffer[pos:]
+            pos = 0
+
+
 # SECTION: CLASSES ========================================================== #
 
 
@@ -52,11 +162,105 @@ class JsonFile(RecordPayloadTextCodecHandlerMixin):
         text: str,
     ) -> object:
         """Parse raw JSON text into a Python payload."""
-        return json.loads(text)
+        return JsonBackend.resolve().loads(text)
 
     def encode_text_payload(
         self,
         data: JSONData,
     ) -> str:
         """Serialize *data* to JSON text."""
-        return JsonCodec(compact=False, pretty=True).serialize(data)
+        return JsonCodec(
+            compact=False,
+            pretty=True,
+            default_serializer=JsonCodec.default,
+        ).serialize(data)
+
+    def read_iter(
+        self,
+        path: Path,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        options: ReadOptions | None = None,
+    ) -> Iterator[JSONList]:
+        """
+        Lazily read JSON array elements from *path* in record batches.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the JSON file on disk.
+        batch_size : int, optional
+            Maximum number of records per yielded batch.
+        options : ReadOptions | None, optional
+            Optional read parameters.
+
+        Yields
+        ------
+        JSONList
+            Consecutive record batches in array order. A top-level object is
+            yielded as a one-record batch.
+        """
+        encoding = self.encoding_from_options(options)
+        with _open_text_handle(path, mode='r', encoding=encoding) as handle:
+            yield from batch_records(self._iter_records(handle), batch_size)
+
+    def write_iter(
+        self,
+        path: Path,
+        batches: Iterable[JSONData],
+        *,
+        options: WriteOptions | None = None,
+    ) -> int:
+        """
+        Write record *batches* to *path* as one JSON array.
+
+        Records are serialized one at a time, producing the same text as
+        :meth:`write` for the equivalent list payload.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the JSON file on disk.
+        batches : Iterable[JSONData]
+            Record batches to write, consumed lazily.
+        options : WriteOptions | None, optional
+            Optional write parameters.
+
+        Returns
+        -------
+        int
+            Number of records written.
+        """
+        parser = RecordPayloadParser(self.format_name)
+        encoding = self.encoding_from_options(options)
+        ensure_parent_dir(path)
+        count = 0
+        with _open_text_handle(path, mode='w', encoding=encoding) as handle:
+            for batch in batches:
+                for row in parser.normalize(batch):
+                    handle.write(',\n  ' if count else '[\n  ')
+                    handle.write(self.encode_text_payload(row).replace('\n', '\n  '))
+                    count += 1
+            handle.write('\n]\n' if count else '[]\n')
+        return count
+
+    # -- Internal Instance Methods -- #
+
+    def _iter_records(
+        self,
+        handle: IO[str],
+    ) -> Iterator[JSONDict]:
+        """Yield validated records decoded incrementally from *handle*."""
+        head = handle.read(_READ_CHUNK_SIZE).lstrip(_WHITESPACE)
+        if not head.startswith('['):
+            payload = self.decode_text_payload(head + handle.read())
+            yield from RecordPayloadParser(self.format_name).normalize(
+                self.coerce_record_payload(payload),
+            )
+            return
+        for item in _iter_array_items(handle, head):
+            if not isinstance(item, dict):
+                raise TypeError(
+                    f'{self.format_name} array must contain only objects (dicts)',
+                )
+            yield cast(JSONDict, item)
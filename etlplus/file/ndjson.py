@@ -17,19 +17,25 @@ Notes
 
 from __future__ import annotations
 
-import json
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from itertools import chain
 from pathlib import Path
 from typing import cast
 
 from ..utils import JsonCodec
 from ..utils import RecordPayloadParser
-from ..utils import count_records
+from ..utils._json import JsonBackend
 from ..utils._types import JSONData
 from ..utils._types import JSONDict
 from ..utils._types import JSONList
 from ._enums import FileFormat
-from ._io import read_text
-from ._io import write_text
+from ._io import _open_text_handle
+from ._io import batch_records
+from ._io import ensure_parent_dir
+from ._io import split_record_batches
+from .base import DEFAULT_BATCH_SIZE
 from .base import ReadOptions
 from .base import SemiStructuredTextFileHandlerABC
 from .base import WriteOptions
@@ -43,6 +49,29 @@ __all__ = [
 ]
 
 
+# SECTION: INTERNAL CONSTANTS =============================================== #
+
+
+# Shared line serializer; typed values such as dates write as ISO text.
+_LINE_CODEC = JsonCodec(default_serializer=JsonCodec.default)
+
+
+# SECTION: INTERNAL FUNCTIONS =============================================== #
+
+
+def _parse_line(
+    text: str,
+    line_number: int | None,
+    loads: Callable[[str], object],
+) -> JSONDict:
+    """Parse one stripped, non-blank NDJSON line into a dictionary."""
+    payload = loads(text)
+    if not isinstance(payload, dict):
+        suffix = f' (line {line_number})' if line_number is not None else ''
+        raise TypeError(f'NDJSON lines must be objects (dicts){suffix}')
+    return cast(JSONDict, payload)
+
+
 # SECTION: CLASSES ========================================================== #
 
 
@@ -79,7 +108,7 @@ class NdjsonFile(SemiStructuredTextFileHandlerABC):
             Serialized NDJSON line including the trailing newline.
         """
         _ = options
-        return f'{JsonCodec(compact=False).serialize(data)}\n'
+        return f'{_LINE_CODEC.serialize(data)}\n'
 
     def dumps(
         self,
@@ -105,6 +134,33 @@ class NdjsonFile(SemiStructuredTextFileHandlerABC):
         rows = RecordPayloadParser('NDJSON').normalize(data)
         return ''.join(self.dump_line(row, options=options) for row in rows)
 
+    def iter_lines(
+        self,
+        lines: Iterable[str],
+        *,
+        options: ReadOptions | None = None,
+    ) -> Iterator[JSONDict]:
+        """
+        Lazily parse NDJSON *lines* into dictionaries, skipping blank lines.
+
+        Parameters
+        ----------
+        lines : Iterable[str]
+            NDJSON record lines.
+        options : ReadOptions | None, optional
+            Optional read parameters.
+
+        Yields
+        ------
+        JSONDict
+            Parsed JSON object for each non-blank line.
+        """
+        _ = options
+        loads = JsonBackend.resolve().loads
+        for idx, line in enumerate(lines, start=1):
+            if stripped := line.strip():
+                yield _parse_line(stripped, idx, loads)
+
     def load_line(
         self,
         text: str,
@@ -140,11 +196,7 @@ class NdjsonFile(SemiStructuredTextFileHandlerABC):
         stripped = text.strip()
         if not stripped:
             raise ValueError('NDJSON line cannot be blank')
-        payload = json.loads(stripped)
-        if not isinstance(payload, dict):
-            suffix = f' (line {line_number})' if line_number is not None else ''
-            raise TypeError(f'NDJSON lines must be objects (dicts){suffix}')
-        return cast(JSONDict, payload)
+        return _parse_line(stripped, line_number, JsonBackend.resolve().loads)
 
     def loads(
         self,
@@ -167,13 +219,7 @@ class NdjsonFile(SemiStructuredTextFileHandlerABC):
         JSONData
             Parsed records.
         """
-        rows: JSONList = []
-        for idx, line in enumerate(text.splitlines(), start=1):
-            stripped = line.strip()
-            if not stripped:
-                continue
-            rows.append(self.load_line(stripped, options=options, line_number=idx))
-        return rows
+        return list(self.iter_lines(text.splitlines(), options=options))
 
     def read(
         self,
@@ -182,7 +228,7 @@ class NdjsonFile(SemiStructuredTextFileHandlerABC):
         options: ReadOptions | None = None,
     ) -> JSONList:
         """
-        Read and return NDJSON content from *path*.
+        Read and return NDJSON content from *path*, parsing line by line.
 
         Parameters
         ----------
@@ -197,10 +243,39 @@ class NdjsonFile(SemiStructuredTextFileHandlerABC):
             The list of dictionaries read from the NDJSON file.
         """
         encoding = self.encoding_from_options(options)
-        return cast(
-            JSONList,
-            self.loads(read_text(path, encoding=encoding), options=options),
-        )
+        with _open_text_handle(path, mode='r', encoding=encoding) as handle:
+            return list(self.iter_lines(handle, options=options))
+
+    def read_iter(
+        self,
+        path: Path,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        options: ReadOptions | None = None,
+    ) -> Iterator[JSONList]:
+        """
+        Lazily read NDJSON records from *path* one line at a time.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the NDJSON file on disk.
+        batch_size : int, optional
+            Maximum number of records per yielded batch.
+        options : ReadOptions | None, optional
+            Optional read parameters.
+
+        Yields
+        ------
+        JSONList
+            Consecutive record batches in file order.
+        """
+        encoding = self.encoding_from_options(options)
+        with _open_text_handle(path, mode='r', encoding=encoding) as handle:
+            yield from batch_records(
+                self.iter_lines(handle, options=options),
+                batch_size,
+            )
 
     def write(
         self,
@@ -212,6 +287,9 @@ class NdjsonFile(SemiStructuredTextFileHandlerABC):
         """
         Write *data* to NDJSON at *path* and return record count.
 
+        Lines stream to the file handle one record at a time, without
+        building the whole NDJSON text in memory.
+
         Parameters
         ----------
         path : Path
@@ -226,13 +304,40 @@ class NdjsonFile(SemiStructuredTextFileHandlerABC):
         int
             Number of records written.
         """
-        rows = RecordPayloadParser('NDJSON').normalize(data)
-        if not rows:
+        return self.write_iter(path, [data], options=options)
+
+    def write_iter(
+        self,
+        path: Path,
+        batches: Iterable[JSONData],
+        *,
+        options: WriteOptions | None = None,
+    ) -> int:
+        """
+        Write record *batches* to NDJSON at *path* one line at a time.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the NDJSON file on disk.
+        batches : Iterable[JSONData]
+            Record batches to write, consumed lazily.
+        options : WriteOptions | None, optional
+            Optional write parameters.
+
+        Returns
+        -------
+        int
+            Number of records written.
+        """
+        first, pending = split_record_batches(batches, format_name='NDJSON')
+        if first is None:
             return 0
         encoding = self.encoding_from_options(options)
-        write_text(
-            path,
-            self.dumps(rows, options=options),
-            encoding=encoding,
-        )
-        return count_records(rows)
+        ensure_parent_dir(path)
+        count = 0
+        with _open_text_handle(path, mode='w', encoding=encoding) as handle:
+            for rows in chain([first], pending):
+                handle.writelines(self.dump_line(row, options=options) for row in rows)
+                count += len(rows)
+        return count
@@ -46,3 +46,4 @@ class OrcFile(PandasColumnarHandlerMixin):
     write_method = 'to_orc'
     write_kwargs = (('index', False),)
     requires_pyarrow = True
+    arrow_module = 'pyarrow.orc'
@@ -18,10 +18,23 @@ Notes
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from typing import cast
+
+from ..utils._types import JSONData
+from ..utils._types import JSONList
 from ._enums import FileFormat
-from ._imports import get_dependency  # noqa: F401
+from ._imports import get_dependency
 from ._imports import get_pandas  # noqa: F401
+from ._io import arrow_write_tables
+from ._io import ensure_parent_dir
 from ._pandas_handlers import PandasColumnarHandlerMixin
+from .base import DEFAULT_BATCH_SIZE
+from .base import ReadOptions
+from .base import WriteOptions
 
 # SECTION: EXPORTS ========================================================== #
 
@@ -46,3 +59,94 @@ class ParquetFile(PandasColumnarHandlerMixin):
     write_method = 'to_parquet'
     write_kwargs = (('index', False),)
     requires_pyarrow = True
+    arrow_module = 'pyarrow.parquet'
+
+    # -- Internal Instance Methods -- #
+
+    def _pyarrow_parquet(self) -> Any:
+        """Return the required :mod:`pyarrow.parquet` module."""
+        self.resolve_pyarrow()
+        return get_dependency(
+            'pyarrow.parquet',
+            format_name=self.pandas_format_name,
+            pip_name='pyarrow',
+            required=True,
+        )
+
+    # -- Instance Methods -- #
+
+    def read_iter(
+        self,
+        path: Path,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        options: ReadOptions | None = None,
+    ) -> Iterator[JSONList]:
+        """
+        Lazily read Parquet row groups from *path* in record batches.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the Parquet file on disk.
+        batch_size : int, optional
+            Maximum number of records per yielded batch.
+        options : ReadOptions | None, optional
+            Optional read parameters.
+
+        Yields
+        ------
+        JSONList
+            Consecutive record batches in file order.
+        """
+        _ = options
+        if batch_size < 1:
+            raise ValueError('batch_size must be a positive integer')
+        parquet_file = self._pyarrow_parquet().ParquetFile(path)
+        try:
+            for record_batch in parquet_file.iter_batches(batch_size=batch_size):
+                if record_batch.num_rows:
+                    yield cast(JSONList, record_batch.to_pylist())
+        finally:
+            parquet_file.close()
+
+    def write_iter(
+        self,
+        path: Path,
+        batches: Iterable[JSONData],
+        *,
+        options: WriteOptions | None = None,
+    ) -> int:
+        """
+        Write record *batches* to *path*, one row group per batch.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the Parquet file on disk.
+        batches : Iterable[JSONData]
+            Record batches to write, consumed lazily. The first non-empty
+            batch fixes the file columns; see :func:`arrow_write_tables`.
+        options : WriteOptions | None, optional
+            Optional write parameters.
+
+        Returns
+        -------
+        int
+            Number of records written.
+        """
+        _ = options
+        schema, tables = arrow_write_tables(
+            self.resolve_pyarrow(),
+            batches,
+            format_name=self.format_name,
+        )
+        if schema is None:
+            return 0
+        count = 0
+        ensure_parent_dir(path)
+        with self._pyarrow_parquet().ParquetWriter(path, schema) as writer:
+            for table in tables:
+                writer.write_table(table)
+                count += table.num_rows
+        return count
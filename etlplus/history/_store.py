@@ -6,7 +6,6 @@ Local run-history persistence backends.
 
 from __future__ import annotations
 
-import json
 import os
 import sqlite3
 from abc import ABC
@@ -25,6 +24,7 @@ from ..file.ndjson import NdjsonFile
 from ..file.sqlite import SqliteFile
 from ..utils import JsonCodec
 from ..utils import SequenceParser
+from ..utils._json import JsonBackend
 from ..utils._types import JSONData
 from ._config import DEFAULT_HISTORY_BACKEND
 from ._config import HistoryBackend
@@ -113,7 +113,7 @@ def _deserialize_result_summary(
     """Deserialize one optional persisted JSON result summary."""
     if result_summary is None:
         return None
-    return json.loads(result_summary)
+    return JsonBackend.resolve().loads(result_summary)
 
 
 def _deserialize_string_list(
@@ -122,7 +122,7 @@ def _deserialize_string_list(
     """Deserialize one optional JSON string list."""
     if payload is None:
         return None
-    if not SequenceParser.is_non_text(values := json.loads(payload)):
+    if not SequenceParser.is_non_text(values := JsonBackend.resolve().loads(payload)):
         return None
     return SequenceParser.str_list(values)
 
@@ -0,0 +1,479 @@
+"""
+:mod:`etlplus.ops._accumulators` module.
+
+Streaming aggregate accumulators backing the aggregate transformations.
+
+Each accumulator consumes one value at a time through :meth:`add` and reports
+its aggregate through :meth:`result`, so its state never holds the full
+column. :meth:`merge` folds in another accumulator of the same kind, which
+lets partial aggregates computed over separate partitions be combined.
+Callers only pass values for records where the aggregated field is present,
+which keeps ``count`` semantics aligned with
+:func:`etlplus.ops.transformations.aggregate.apply_aggregate`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Protocol
+from typing import cast
+
+from ..utils import is_number_value
+from ._enums import AggregateName
+from ._types import AggregateFunc
+
+# SECTION: EXPORTS ========================================================== #
+
+
+__all__ = [
+    # Classes
+    'Accumulator',
+    'AvgAccumulator',
+    'CountAccumulator',
+    'DistinctAccumulator',
+    'ListAccumulator',
+    'MaxAccumulator',
+    'MinAccumulator',
+    'QuantileSketch',
+    'SumAccumulator',
+    # Functions
+    'new_accumulator',
+]
+
+
+# SECTION: INTERNAL CONSTANTS =============================================== #
+
+
+_DEFAULT_QUANTILE = 0.5
+_DEFAULT_SKETCH_CAPACITY = 256
+
+
+# SECTION: INTERNAL FUNCTIONS =============================================== #
+
+
+def _hashable(
+    value: Any,
+) -> Any:
+    """Return *value*, or its ``repr`` when it cannot be hashed."""
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+# SECTION: PROTOCOLS ======================================================== #
+
+
+class Accumulator(Protocol):
+    """Incremental aggregate state for one output value."""
+
+    def add(
+        self,
+        value: Any,
+    ) -> None:
+        """Consume one present field value."""
+
+    def merge(
+        self,
+        other: Any,
+    ) -> None:
+        """Fold the state of *other* into this accumulator."""
+
+    def result(self) -> Any:
+        """Return the aggregate of all consumed values."""
+
+
+# SECTION: DATA CLASSES ===================================================== #
+
+
+@dataclass(slots=True)
+class AvgAccumulator:
+    """Running mean of numeric values; ``0.0`` when none were seen."""
+
+    # -- Instance Attributes -- #
+
+    total: float = 0.0
+    count: int = 0
+
+    # -- Instance Methods -- #
+
+    def add(
+        self,
+        value: Any,
+    ) -> None:
+        """Add *value* to the mean when it is numeric."""
+        if is_number_value(value):
+            self.total += float(value)
+            self.count += 1
+
+    def merge(
+        self,
+        other: AvgAccumulator,
+    ) -> None:
+        """Fold the state of *other* into this accumulator."""
+        self.total += other.total
+        self.count += other.count
+
+    def result(self) -> float:
+        """Return the mean of the numeric values seen so far."""
+        return self.total / self.count if self.count else 0.0
+
+
+@dataclass(slots=True)
+class CountAccumulator:
+    """Count of present values, numeric or not."""
+
+    # -- Instance Attributes -- #
+
+    count: int = 0
+
+    # -- Instance Methods -- #
+
+    def add(
+        self,
+        value: Any,
+    ) -> None:
+        """Count one present value."""
+        self.count += 1
+
+    def merge(
+        self,
+        other: CountAccumulator,
+    ) -> None:
+        """Fold the state of *other* into this accumulator."""
+        self.count += other.count
+
+    def result(self) -> int:
+        """Return the number of values seen so far."""
+        return self.count
+
+
+@dataclass(slots=True)
+class DistinctAccumulator:
+    """Exact count of distinct non-null values of any type."""
+
+    # -- Instance Attributes -- #
+
+    seen: set[Any] = field(default_factory=set)
+
+    # -- Instance Methods -- #
+
+    def add(
+        self,
+        value: Any,
+    ) -> None:
+        """Record *value* unless it is ``None``."""
+        if value is not None:
+            self.seen.add(_hashable(value))
+
+    def merge(
+        self,
+        other: DistinctAccumulator,
+    ) -> None:
+        """Fold the state of *other* into this accumulator."""
+        self.seen |= other.seen
+
+    def result(self) -> int:
+        """Return the number of distinct values seen so far."""
+        return len(self.seen)
+
+
+@dataclass(slots=True)
+class ListAccumulator:
+    """
+    Compatibility accumulator for list-based :data:`AggregateFunc` callables.
+
+    Numeric values are buffered so the callable receives the same
+    ``(values, present)`` arguments as the ungrouped aggregate step.
+    """
+
+    # -- Instance Attributes -- #
+
+    func: AggregateFunc
+    values: list[float] = field(default_factory=list)
+    present: int = 0
+
+    # -- Instance Methods -- #
+
+    def add(
+        self,
+        value: Any,
+    ) -> None:
+        """Count *value* and buffer it when it is numeric."""
+        self.present += 1
+        if is_number_value(value):
+            self.values.append(float(value))
+
+    def merge(
+        self,
+        other: ListAccumulator,
+    ) -> None:
+        """Fold the state of *other* into this accumulator."""
+        self.values.extend(other.values)
+        self.present += other.present
+
+    def result(self) -> Any:
+        """Return the callable applied to the buffered values."""
+        return self.func(self.values, self.present)
+
+
+@dataclass(slots=True)
+class MaxAccumulator:
+    """Running maximum of numeric values; ``None`` when none were seen."""
+
+    # -- Instance Attributes -- #
+
+    value: float | None = None
+
+    # -- Instance Methods -- #
+
+    def add(
+        self,
+        value: Any,
+    ) -> None:
+        """Keep *value* when it is numeric and larger than the current one."""
+        if is_number_value(value):
+            number = float(value)
+            if self.value is None or number > self.value:
+                self.value = number
+
+    def merge(
+        self,
+        other: MaxAccumulator,
+    ) -> None:
+        """Fold the state of *other* into this accumulator."""
+        if other.value is not None:
+            self.add(other.value)
+
+    def result(self) -> float | None:
+        """Return the largest numeric value seen so far."""
+        return self.value
+
+
+@dataclass(slots=True)
+class MinAccumulator:
+    """Running minimum of numeric values; ``None`` when none were seen."""
+
+    # -- Instance Attributes -- #
+
+    value: float | None = None
+
+    # -- Instance Methods -- #
+
+    def add(
+        self,
+        value: Any,
+    ) -> None:
+        """Keep *value* when it is numeric and smaller than the current one."""
+        if is_number_value(value):
+            number = float(value)
+            if self.value is None or number < self.value:
+                self.value = number
+
+    def merge(
+        self,
+        other: MinAccumulator,
+    ) -> None:
+        """Fold the state of *other* into this accumulator."""
+        if other.value is not None:
+            self.add(other.value)
+
+    def result(self) -> float | None:
+        """Return the smallest numeric value seen so far."""
+        return self.value
+
+
+@dataclass(slots=True)
+class QuantileSketch:
+    """
+    Bounded-memory approximate quantile of numeric values.
+
+    Values are buffered in weighted levels. When a level reaches *capacity*
+    items it is sorted and every other item is promoted to the next level
+    with double weight, alternating the kept offset between compactions so
+    the estimate stays unbiased and deterministic. Results are exact until
+    *capacity* values have been seen, and memory stays proportional to
+    ``capacity * log2(n / capacity)`` afterward.
+
+    Attributes
+    ----------
+    q : float
+        Quantile to report, between ``0`` and ``1``.
+    capacity : int
+        Items kept per level before it is compacted.
+    levels : list[list[float]]
+        Buffered values; items on level ``h`` weigh ``2 ** h``.
+    """
+
+    # -- Instance Attributes -- #
+
+    q: float = _DEFAULT_QUANTILE
+    capacity: int = _DEFAULT_SKETCH_CAPACITY
+    levels: list[list[float]] = field(default_factory=lambda: [[]])
+    _offset: int = field(default=0, init=False, repr=False)
+
+    # -- Magic Methods (Object Lifecycle) -- #
+
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.q <= 1.0:
+            raise ValueError(f'Quantile must be between 0 and 1, got {self.q!r}')
+        if self.capacity < 2:
+            raise ValueError('Quantile sketch capacity must be at least 2')
+
+    # -- Internal Instance Methods -- #
+
+    def _compact(self) -> None:
+        """Promote half of every full level to the level above it."""
+        height = 0
+        while height < len(self.levels):
+            items = self.levels[height]
+            if len(items) >= self.capacity:
+                items.sort()
+                promoted = items[self._offset :: 2]
+                self._offset ^= 1
+                self.levels[height] = []
+                if height + 1 == len(self.levels):
+                    self.levels.append([])
+                self.levels[height + 1].extend(promoted)
+            height += 1
+
+    # -- Instance Methods -- #
+
+    def add(
+        self,
+        value: Any,
+    ) -> None:
+        """Add *value* to the sketch when it is numeric."""
+        if not is_number_value(value):
+            return
+        self.levels[0].append(float(value))
+        if len(self.levels[0]) >= self.capacity:
+            self._compact()
+
+    def merge(
+        self,
+        other: QuantileSketch,
+    ) -> None:
+        """
+        Fold the buffered values of *other* into this sketch.
+
+        The merged sketch keeps this sketch's :attr:`q` and :attr:`capacity`
+        and compacts any level that grew past capacity.
+        """
+        for height, items in enumerate(other.levels):
+            if height == len(self.levels):
+                self.levels.append([])
+            self.levels[height].extend(items)
+        self._compact()
+
+    def result(self) -> float | None:
+        """
+        Return the nearest-rank estimate of quantile :attr:`q`.
+
+        Returns
+        -------
+        float | None
+            Smallest buffered value whose cumulative weight reaches
+            ``q * total``, or ``None`` when no numeric value was seen.
+        """
+        weighted = sorted(
+            (value, 1 << height)
+            for height, items in enumerate(self.levels)
+            for value in items
+        )
+        if not weighted:
+            return None
+        target = self.q * sum(weight for _, weight in weighted)
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return weighted[-1][0]
+
+
+@dataclass(slots=True)
+class SumAccumulator:
+    """Running sum of numeric values; ``0`` when none were seen."""
+
+    # -- Instance Attributes -- #
+
+    total: float = 0
+
+    # -- Instance Methods -- #
+
+    def add(
+        self,
+        value: Any,
+    ) -> None:
+        """Add *value* to the sum when it is numeric."""
+        if is_number_value(value):
+            self.total += float(value)
+
+    def merge(
+        self,
+        other: SumAccumulator,
+    ) -> None:
+        """Fold the state of *other* into this accumulator."""
+        self.total += other.total
+
+    def result(self) -> float:
+        """Return the sum of the numeric values seen so far."""
+        return self.total
+
+
+# SECTION: FUNCTIONS ======================================================== #
+
+
+def new_accumulator(
+    func: AggregateName | AggregateFunc | str,
+    spec: Mapping[str, Any] | None = None,
+) -> Accumulator:
+    """
+    Return a fresh accumulator for one aggregate function.
+
+    Parameters
+    ----------
+    func : AggregateName | AggregateFunc | str
+        Aggregate name (with aliases) or list-based callable.
+    spec : Mapping[str, Any] | None, optional
+        Aggregate spec supplying options such as ``q`` for ``quantile``.
+
+    Returns
+    -------
+    Accumulator
+        Empty accumulator for *func*.
+
+    Raises
+    ------
+    TypeError
+        If *func* is neither an aggregate name nor a callable.
+    """
+    if not isinstance(func, AggregateName | str):
+        if callable(func):
+            return ListAccumulator(cast(AggregateFunc, func))
+        raise TypeError(f'Invalid aggregate func: {func!r}')
+
+    match AggregateName.coerce(func):
+        case AggregateName.AVG:
+            return AvgAccumulator()
+        case AggregateName.COUNT:
+            return CountAccumulator()
+        case AggregateName.DISTINCT:
+            return DistinctAccumulator()
+        case AggregateName.MAX:
+            return MaxAccumulator()
+        case AggregateName.MIN:
+            return MinAccumulator()
+        case AggregateName.QUANTILE:
+            options = spec or {}
+            return QuantileSketch(
+                q=float(options.get('q', _DEFAULT_QUANTILE)),
+                capacity=int(options.get('capacity', _DEFAULT_SKETCH_CAPACITY)),
+            )
+        case _:
+            return SumAccumulator()
@@ -0,0 +1,767 @@
+"""
+:mod:`etlplus.ops._arrow` module.
+
+Columnar transform engine backed by :mod:`pyarrow`.
+
+Pipelines configured with ``engine: arrow`` keep their payload as a
+``pyarrow.Table`` and run each step with Arrow compute kernels:
+
+- ``filter`` uses comparison, ``is_in``, and substring kernels.
+- ``map`` renames columns without copying their buffers.
+- ``select`` projects columns, padding missing ones with nulls.
+- ``sort`` uses stable ``sort_indices``, one pass per key.
+- ``top_n`` sorts like ``sort`` and keeps the first ``n`` rows.
+- ``limit`` slices the table without copying.
+- ``group_by`` runs one hash aggregation over the key columns.
+- ``sql`` runs a DuckDB query that scans the table in place.
+- ``aggregate`` reduces numeric columns with ``sum``/``min_max``/``mean``,
+  counts distinct values with ``count_distinct``, and reads quantiles from
+  one ``array_sort_indices`` pass.
+
+Conditions with no exact kernel equivalent, such as custom operator callables
+or numeric comparisons against text columns, are evaluated with the Python
+operator over that one column. Custom aggregate callables, and group keys or
+distinct counts over column types Arrow cannot hash, fall back to the
+row-wise accumulators. Results therefore match the row-wise engine, except
+that ``quantile`` is always exact here, while the row-wise sketch estimates
+it for groups past its capacity.
+
+Notes
+-----
+Arrow cannot distinguish a missing key from an explicit ``None``. Records
+convert over the union of their keys and get nulls for absent keys, so
+filters and ``count`` aggregates treat them as present ``None`` values.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Mapping
+from functools import partial
+from math import ceil
+from typing import Any
+
+from ..file._imports import get_dependency
+from ..file._io import records_to_arrow_table
+from ..utils._numbers import is_number_value
+from ..utils._types import JSONDict
+from ..utils._types import JSONList
+from ._accumulators import Accumulator
+from ._accumulators import AvgAccumulator
+from ._accumulators import CountAccumulator
+from ._accumulators import DistinctAccumulator
+from ._accumulators import MaxAccumulator
+from ._accumulators import MinAccumulator
+from ._accumulators import QuantileSketch
+from ._accumulators import SumAccumulator
+from ._enums import OperatorName
+from ._types import SortField
+from ._types import StepSpec
+from ._types import TableStep
+from .transformations.aggregate import AggregateState
+from .transformations.filter import bind_operator
+from .transformations.filter import filter_group
+from .transformations.group_by import compile_group_by_step
+from .transformations.group_by import group_keys
+from .transformations.limit import limit_count
+from .transformations.select import select_fields
+from .transformations.sort import sort_fields
+from .transformations.sort import sort_key
+from .transformations.sql import apply_sql_table
+from .transformations.sql import sql_args
+from .transformations.top_n import top_n_args
+
+# SECTION: EXPORTS ========================================================== #
+
+
+__all__ = [
+    # Functions
+    'aggregate_table',
+    'compile_table_step',
+    'records_to_table',
+    'table_to_records',
+]
+
+
+# SECTION: INTERNAL CONSTANTS =============================================== #
+
+
+_COMPARE_KERNELS: dict[OperatorName, str] = {
+    OperatorName.EQ: 'equal',
+    OperatorName.NE: 'not_equal',
+    OperatorName.GT: 'greater',
+    OperatorName.GTE: 'greater_equal',
+    OperatorName.LT: 'less',
+    OperatorName.LTE: 'less_equal',
+}
+
+
+# Grouped Arrow kernels matching the numeric row-wise accumulators.
+_HASH_KERNELS: dict[type[Accumulator], str] = {
+    AvgAccumulator: 'mean',
+    MaxAccumulator: 'max',
+    MinAccumulator: 'min',
+    SumAccumulator: 'sum',
+}
+
+
+# SECTION: INTERNAL FUNCTIONS =============================================== #
+
+
+def _pa() -> Any:
+    """Return the :mod:`pyarrow` module."""
+    return get_dependency('pyarrow', format_name='ARROW', required=True)
+
+
+def _pc() -> Any:
+    """Return the :mod:`pyarrow.compute` module."""
+    return get_dependency(
+        'pyarrow.compute',
+        format_name='ARROW',
+        pip_name='pyarrow',
+        required=True,
+    )
+
+
+def _is_numeric_type(
+    data_type: Any,
+) -> bool:
+    """Return whether *data_type* is an integer or floating-point type."""
+    types = _pa().types
+    return bool(types.is_integer(data_type) or types.is_floating(data_type))
+
+
+def _is_string_type(
+    data_type: Any,
+) -> bool:
+    """Return whether *data_type* is a (large) UTF-8 string type."""
+    types = _pa().types
+    return bool(types.is_string(data_type) or types.is_large_string(data_type))
+
+
+def _kernel_mask(
+    column: Any,
+    op: OperatorName,
+    value: Any,
+) -> Any | None:
+    """
+    Return a boolean filter mask computed by Arrow kernels, if exact.
+
+    ``None`` means no kernel reproduces the row-wise semantics for this
+    column type and value, and the caller should fall back to Python.
+    """
+    pa = _pa()
+    pc = _pc()
+    data_type = column.type
+
+    if op in _COMPARE_KERNELS:
+        if not (_is_numeric_type(data_type) and is_number_value(value)):
+            return None
+        mask = getattr(pc, _COMPARE_KERNELS[op])(column, value)
+        if op is OperatorName.NE:
+            # ``None != value`` is true in the row-wise engine.
+            return pc.or_kleene(mask, pc.is_null(column))
+        return mask
+
+    if op is OperatorName.IN:
+        if not isinstance(value, list | tuple | set | frozenset) or not value:
+            return None
+        members = list(value)
+        if _is_numeric_type(data_type):
+            if not all(is_number_value(member) for member in members):
+                return None
+        elif not (
+            _is_string_type(data_type)
+            and all(isinstance(member, str) for member in members)
+        ):
+            return None
+        try:
+            value_set = pa.array(members, type=data_type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+            return None
+        return pc.is_in(column, value_set=value_set)
+
+    if op is OperatorName.CONTAINS:
+        if _is_string_type(data_type) and isinstance(value, str):
+            return pc.match_substring(column, value)
+    return None
+
+
+def _python_mask(
+    column: Any,
+    op_func: Callable[[Any, Any], Any],
+    value: Any,
+) -> Any:
+    """Return a boolean filter mask by applying *op_func* to each value."""
+
+    def _matches(lhs: Any) -> bool:
+        try:
+            return bool(op_func(lhs, value))
+        except Exception:  # noqa: BLE001 - mirrors catch-all row filters
+            return False
+
+    return _pa().array(
+        [_matches(lhs) for lhs in column.to_pylist()],
+        type=_pa().bool_(),
+    )
+
+
+def _numeric_values(
+    table: Any,
+    field: str,
+) -> Any | None:
+    """Return the non-null float64 values of a numeric column, if any."""
+    if field not in table.column_names:
+        return None
+    column = table.column(field)
+    if not _is_numeric_type(column.type):
+        return None
+    return _pc().drop_null(column.cast(_pa().float64(), safe=False))
+
+
+def _aggregate_column(
+    table: Any,
+    field: str | None,
+    accumulator: Accumulator,
+) -> Any:
+    """Reduce one aggregate over *table* as *accumulator* would row by row."""
+    if isinstance(accumulator, CountAccumulator):
+        return table.num_rows if field is None or field in table.column_names else 0
+    if field is None:
+        # Field-less aggregates see one ``None`` per record.
+        for _ in range(table.num_rows):
+            accumulator.add(None)
+        return accumulator.result()
+    if field not in table.column_names:
+        return accumulator.result()
+    column = table.column(field)
+    if isinstance(accumulator, DistinctAccumulator) and _is_hashable_type(column.type):
+        return _pc().count_distinct(column, mode='only_valid').as_py()
+    if not isinstance(accumulator, QuantileSketch) and type(accumulator) not in (
+        _HASH_KERNELS
+    ):
+        # Custom callables and unhashable distinct columns see every value.
+        for value in column.to_pylist():
+            accumulator.add(value)
+        return accumulator.result()
+    if (values := _numeric_values(table, field)) is None or not len(values):
+        return accumulator.result()
+
+    pc = _pc()
+    match accumulator:
+        case QuantileSketch(q=q):
+            ranked = values.take(pc.array_sort_indices(values))
+            return ranked[_nearest_rank(q, len(ranked)) - 1].as_py()
+        case SumAccumulator():
+            return pc.sum(values).as_py()
+        case AvgAccumulator():
+            return pc.mean(values).as_py()
+        case MinAccumulator():
+            return pc.min_max(values)['min'].as_py()
+    return pc.min_max(values)['max'].as_py()
+
+
+def _group_table(
+    table: Any,
+    keys: tuple[str, ...],
+    state: AggregateState,
+) -> Any:
+    """
+    Aggregate *table* per key combination with one Arrow hash aggregation.
+
+    Groups come out in first-seen order with the key columns first, like
+    :func:`etlplus.ops.transformations.group_by.apply_group_by`.
+
+    Raises
+    ------
+    NotImplementedError
+        If a key or aggregate needs the row-wise accumulators.
+    """
+    pa = _pa()
+    pc = _pc()
+    keys = tuple(dict.fromkeys(keys))
+    present = frozenset(table.column_names)
+    for key in keys:
+        if key not in table.column_names:
+            # Missing key fields group under ``None``.
+            table = table.append_column(key, pa.nulls(table.num_rows))
+    if not all(_is_hashable_type(table.column(key).type) for key in keys):
+        raise NotImplementedError('unhashable group key')
+    source = table.select(list(keys))
+    aggregations: list[tuple[Any, ...]] = [([], 'count_all')]
+    for index, (column, accumulator) in enumerate(
+        zip(state.columns, state.accumulators, strict=True),
+    ):
+        field = column.field
+        if isinstance(accumulator, CountAccumulator) or field not in present:
+            if field is None and not isinstance(accumulator, CountAccumulator):
+                raise NotImplementedError('field-less aggregate')
+            continue
+        name = f'__agg{index}'
+        values = table.column(field)
+        if isinstance(accumulator, DistinctAccumulator):
+            if not _is_hashable_type(values.type):
+                raise NotImplementedError('unhashable distinct column')
+            source = source.append_column(name, values)
+            aggregations.append(
+                (name, 'count_distinct', pc.CountOptions(mode='only_valid')),
+            )
+        elif not _is_numeric_type(values.type):
+            if not isinstance(accumulator, QuantileSketch) and (
+                type(accumulator) not in _HASH_KERNELS
+            ):
+                raise NotImplementedError('custom aggregate')
+        elif isinstance(accumulator, QuantileSketch):
+            source = source.append_column(name, values.cast(pa.float64(), safe=False))
+            aggregations.append((name, 'list'))
+            aggregations.append((name, 'count', pc.CountOptions(mode='only_valid')))
+        elif (kernel := _HASH_KERNELS.get(type(accumulator))) is not None:
+            source = source.append_column(name, values.cast(pa.float64(), safe=False))
+            aggregations.append((name, kernel))
+        else:
+            raise NotImplementedError('custom aggregate')
+    grouped = source.group_by(list(keys), use_threads=False).aggregate(aggregations)
+
+    rows = grouped.num_rows
+    columns: dict[str, Any] = {key: grouped.column(key) for key in keys}
+    for index, (column, accumulator) in enumerate(
+        zip(state.columns, state.accumulators, strict=True),
+    ):
+        name = f'__agg{index}'
+        if isinstance(accumulator, CountAccumulator):
+            counted = column.field is None or column.field in present
+            columns[column.key] = (
+                grouped.column('count_all') if counted else pa.repeat(0, rows)
+            )
+        elif f'{name}_count_distinct' in grouped.column_names:
+            columns[column.key] = grouped.column(f'{name}_count_distinct')
+        elif isinstance(accumulator, QuantileSketch) and f'{name}_list' in (
+            grouped.column_names
+        ):
+            columns[column.key] = _grouped_quantile(
+                grouped.column(f'{name}_list'),
+                grouped.column(f'{name}_count'),
+                accumulator.q,
+            )
+        elif (kernel := _HASH_KERNELS.get(type(accumulator))) is not None and (
+            f'{name}_{kernel}' in grouped.column_names
+        ):
+            values = grouped.column(f'{name}_{kernel}')
+            default = accumulator.result()
+            columns[column.key] = (
+                values if default is None else pc.fill_null(values, default)
+            )
+        else:
+            # No usable values in any group: every group gets the empty result.
+            columns[column.key] = pa.array([accumulator.result()] * rows)
+    return pa.table(columns)
+
+
+def _grouped_quantile(
+    lists: Any,
+    counts: Any,
+    q: float,
+) -> Any:
+    """
+    Return the nearest-rank quantile *q* of each group's values.
+
+    *lists* holds each group's values, nulls included, and *counts* the
+    number of non-null values per group. One sort over ``(group, value)``
+    ranks every group at once.
+    """
+    pa = _pa()
+    pc = _pc()
+    lists = lists.combine_chunks()
+    flat = pc.list_flatten(lists)
+    groups = pc.list_parent_indices(lists)
+    valid = pc.is_valid(flat)
+    ranked = pa.table({'group': groups.filter(valid), 'value': flat.filter(valid)})
+    order = pc.sort_indices(
+        ranked,
+        sort_keys=[('group', 'ascending'), ('value', 'ascending')],
+    )
+    values = ranked.column('value').take(order)
+    counts = counts.combine_chunks()
+    starts = pc.subtract(pc.cumulative_sum(counts), counts)
+    ranks = pa.array(
+        [_nearest_rank(q, count) for count in counts.to_pylist()],
+        type=pa.int64(),
+    )
+    positions = pc.if_else(
+        pc.greater(counts, 0),
+        pc.subtract(pc.add(starts, ranks), 1),
+        None,
+    )
+    return values.take(positions)
+
+
+def _is_hashable_type(
+    data_type: Any,
+) -> bool:
+    """Return whether Arrow can group or count distinct *data_type* values."""
+    types = _pa().types
+    return not (
+        types.is_nested(data_type)
+        or types.is_dictionary(data_type)
+        or isinstance(data_type, _pa().ExtensionType)
+    )
+
+
+def _nearest_rank(
+    q: float,
+    count: int,
+) -> int:
+    """
+    Return the 1-based rank of quantile *q* among *count* sorted values.
+
+    Matches :meth:`etlplus.ops._accumulators.QuantileSketch.result`: the
+    smallest rank whose cumulative count reaches ``q * count``.
+    """
+    return max(1, ceil(q * count))
+
+
+def _reduce_table(
+    table: Any,
+    state: AggregateState,
+) -> JSONDict:
+    """Reduce every aggregate of *state* over the whole of *table*."""
+    return {
+        column.key: _aggregate_column(table, column.field, accumulator)
+        for column, accumulator in zip(
+            state.columns,
+            state.accumulators,
+            strict=True,
+        )
+    }
+
+
+def _compile_filter(
+    spec: Any,
+) -> TableStep | None:
+    """Compile a filter spec or boolean tree into a table step."""
+    if (mask := _compile_mask(spec)) is None:
+        return None
+
+    def _step(table: Any) -> Any:
+        return table.filter(mask(table))
+
+    return _step
+
+
+def _compile_mask(
+    spec: Any,
+) -> Callable[[Any], Any] | None:
+    """
+    Compile a filter spec or boolean tree into a null-free mask builder.
+
+    Null comparison results count as non-matches, so ``not`` nodes invert
+    them the same way the row-wise engine does. Malformed trees raise
+    :class:`ValueError`, as they do in the row-wise engine.
+    """
+    if (group := filter_group(spec)) is not None:
+        kind, children = group
+        masks: list[Callable[[Any], Any]] = []
+        for child in children:
+            if (mask := _compile_mask(child)) is None:
+                raise ValueError(
+                    f'Filter {kind!r} node holds an unusable condition: {child!r}',
+                )
+            masks.append(mask)
+        if kind == 'not':
+            return lambda table: _pc().invert(masks[0](table))
+        combine = _pc().and_ if kind == 'all' else _pc().or_
+
+        def _combined(table: Any) -> Any:
+            result = masks[0](table)
+            for mask in masks[1:]:
+                result = combine(result, mask(table))
+            return result
+
+        return _combined
+    if not isinstance(spec, Mapping):
+        return None
+    field = spec.get('field')
+    op = spec.get('op')
+    value = spec.get('value')
+    if not field or op is None:
+        return None
+    try:
+        op_func = bind_operator(op, value)
+    except TypeError:
+        return None
+    op_name = OperatorName.coerce(op) if isinstance(op, OperatorName | str) else None
+    field = str(field)
+
+    def _mask(table: Any) -> Any:
+        if field not in table.column_names:
+            return _pa().repeat(False, table.num_rows)
+        column = table.column(field)
+        mask = None
+        if op_name is not None and value is not None:
+            mask = _kernel_mask(column, op_name, value)
+        if mask is None:
+            mask = _python_mask(column, op_func, value)
+        return _pc().fill_null(mask, False)
+
+    return _mask
+
+
+def _compile_map(
+    spec: Any,
+) -> TableStep | None:
+    """Compile a map spec into a column-renaming table step."""
+    if not isinstance(spec, Mapping):
+        return None
+    rename_map = {str(old): str(new) for old, new in spec.items()}
+
+    def _step(table: Any) -> Any:
+        # Same key order and collision rules as the row-wise rename.
+        names = table.column_names
+        indices: dict[str, int] = {}
+        for old_name, new_name in rename_map.items():
+            if old_name in names:
+                indices[new_name] = names.index(old_name)
+        for index, name in enumerate(names):
+            if name not in rename_map:
+                indices[name] = index
+        return table.select(list(indices.values())).rename_columns(list(indices))
+
+    return _step
+
+
+def _compile_select(
+    spec: Any,
+) -> TableStep | None:
+    """Compile a select spec into a projection table step."""
+    if (fields := select_fields(spec)) is None:
+        return None
+    fields = list(dict.fromkeys(fields))
+
+    def _step(table: Any) -> Any:
+        projected = table.select([])
+        for name in fields:
+            projected = projected.append_column(
+                name,
+                (
+                    table.column(name)
+                    if name in table.column_names
+                    else _pa().nulls(table.num_rows)
+                ),
+            )
+        return projected
+
+    return _step
+
+
+def _compile_limit(
+    spec: Any,
+) -> TableStep | None:
+    """Compile a limit spec into a zero-copy table slice."""
+    if (count := limit_count(spec)) is None:
+        return None
+
+    def _step(table: Any) -> Any:
+        return table.slice(0, count)
+
+    return _step
+
+
+def _compile_sort(
+    spec: Any,
+) -> TableStep | None:
+    """Compile a sort spec into stable ``sort_indices`` passes per key."""
+    if not (fields := sort_fields(spec)):
+        return None
+    return partial(_sort_table, fields=fields)
+
+
+def _compile_top_n(
+    spec: Any,
+) -> TableStep | None:
+    """Compile a top-N spec into a sort followed by a table slice."""
+    n, fields = top_n_args(spec)
+    if n is None or not fields:
+        return None
+
+    def _step(table: Any) -> Any:
+        return _sort_table(table, fields).slice(0, n)
+
+    return _step
+
+
+def _sort_table(
+    table: Any,
+    fields: tuple[SortField, ...],
+) -> Any:
+    """Sort *table* by *fields* with stable passes per key."""
+    # Stable passes from the least significant key keep earlier ties.
+    for field, reverse in reversed(fields):
+        if field not in table.column_names:
+            continue
+        column = table.column(field)
+        if _is_numeric_type(column.type) or _is_string_type(column.type):
+            indices = _pc().array_sort_indices(
+                column,
+                order='descending' if reverse else 'ascending',
+                null_placement='at_start' if reverse else 'at_end',
+            )
+        else:
+            values = column.to_pylist()
+            indices = sorted(
+                range(len(values)),
+                key=lambda index: sort_key(values[index]),
+                reverse=reverse,
+            )
+        table = table.take(indices)
+    return table
+
+
+def _compile_group_by(
+    spec: Any,
+) -> TableStep | None:
+    """
+    Compile a group-by spec into one Arrow hash aggregation.
+
+    Specs with custom aggregate callables, or tables whose key or distinct
+    columns Arrow cannot hash, run the row-wise accumulators instead.
+    """
+    if (group_by := compile_group_by_step(spec)) is None:
+        return None
+    keys = group_keys(spec.get('keys'))
+    template = AggregateState.from_specs(spec.get('aggregates'))
+
+    def _step(table: Any) -> Any:
+        if not keys:
+            if not table.num_rows:
+                return records_to_table([])
+            return records_to_table([_reduce_table(table, template)])
+        try:
+            return _group_table(table, keys, AggregateState(template.columns))
+        except (NotImplementedError, TypeError):
+            # ``ArrowNotImplementedError`` and ``ArrowTypeError`` land here too.
+            return records_to_table(group_by(table_to_records(table)))
+
+    return _step
+
+
+def _compile_sql(
+    spec: Any,
+) -> TableStep | None:
+    """Compile a SQL spec into a DuckDB query table step."""
+    query, table_name = sql_args(spec)
+    if query is None:
+        return None
+    return partial(apply_sql_table, query=query, table_name=table_name)
+
+
+# SECTION: FUNCTIONS ======================================================== #
+
+
+def aggregate_table(
+    table: Any,
+    specs: tuple[StepSpec, ...] | list[StepSpec],
+) -> JSONDict | None:
+    """
+    Apply aggregate specs to *table* and merge their single-row results.
+
+    Parameters
+    ----------
+    table : Any
+        ``pyarrow.Table`` to aggregate.
+    specs : tuple[StepSpec, ...] | list[StepSpec]
+        Aggregate specs in the shape accepted by
+        :func:`etlplus.ops.transformations.aggregate.apply_aggregate_step`.
+
+    Returns
+    -------
+    JSONDict | None
+        Merged aggregate results, or ``None`` when no spec produced output.
+    """
+    state = AggregateState.from_specs(
+        [spec for spec in specs if isinstance(spec, Mapping)],
+    )
+    return _reduce_table(table, state) or None
+
+
+def compile_table_step(
+    step: str,
+    spec: Any,
+) -> TableStep | None:
+    """
+    Compile one pipeline step spec into a ``pyarrow.Table`` callable.
+
+    Parameters
+    ----------
+    step : str
+        Step name: ``filter``, ``map``, ``select``, ``group_by``, ``top_n``,
+        ``sort``, ``sql``, or ``limit``.
+    spec : Any
+        Step spec in the same shape accepted by the row-wise engine.
+
+    Returns
+    -------
+    TableStep | None
+        Table-to-table callable, or ``None`` when *spec* is unusable.
+    """
+    match step:
+        case 'filter':
+            return _compile_filter(spec)
+        case 'group_by':
+            return _compile_group_by(spec)
+        case 'limit':
+            return _compile_limit(spec)
+        case 'map':
+            return _compile_map(spec)
+        case 'select':
+            return _compile_select(spec)
+        case 'sort':
+            return _compile_sort(spec)
+        case 'sql':
+            return _compile_sql(spec)
+        case 'top_n':
+            return _compile_top_n(spec)
+    return None
+
+
+def records_to_table(
+    records: JSONList,
+) -> Any:
+    """
+    Convert row records into a ``pyarrow.Table``.
+
+    Parameters
+    ----------
+    records : JSONList
+        Records to convert. Every key becomes a column, and column types are
+        inferred from the values.
+
+    Returns
+    -------
+    Any
+        ``pyarrow.Table`` holding *records*.
+
+    Raises
+    ------
+    ValueError
+        If one field holds values of incompatible types.
+    """
+    return records_to_arrow_table(_pa(), records, format_name='Arrow')
+
+
+def table_to_records(
+    table: Any,
+) -> JSONList:
+    """
+    Convert a ``pyarrow.Table`` back into row records.
+
+    Parameters
+    ----------
+    table : Any
+        ``pyarrow.Table`` to convert.
+
+    Returns
+    -------
+    JSONList
+        Row-oriented records in table order.
+    """
+    return table.to_pylist()
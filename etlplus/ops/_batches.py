@@ -0,0 +1,81 @@
+"""
+:mod:`etlplus.ops._batches` module.
+
+Helpers for slicing record payloads into bounded batches for streaming runs
+and for starting the worker processes that handle record partitions.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from collections.abc import Iterator
+from itertools import batched
+from multiprocessing import get_all_start_methods
+from multiprocessing import get_context
+from multiprocessing.context import BaseContext
+from typing import cast
+
+from ..utils._types import JSONData
+from ..utils._types import JSONDict
+from ..utils._types import JSONList
+
+# SECTION: EXPORTS ========================================================== #
+
+
+__all__ = [
+    # Functions
+    'iter_record_batches',
+    'worker_context',
+]
+
+
+# SECTION: FUNCTIONS ======================================================== #
+
+
+def iter_record_batches(
+    data: JSONData | Iterable[JSONDict],
+    batch_size: int,
+) -> Iterator[JSONList]:
+    """
+    Yield *data* as lists of at most *batch_size* records.
+
+    Parameters
+    ----------
+    data : JSONData | Iterable[JSONDict]
+        One record, a list of records, or any iterable of records.
+    batch_size : int
+        Maximum number of records per yielded batch.
+
+    Yields
+    ------
+    JSONList
+        Consecutive, non-empty record batches in source order.
+
+    Raises
+    ------
+    ValueError
+        If *batch_size* is not positive.
+    """
+    if batch_size < 1:
+        raise ValueError('batch_size must be a positive integer')
+    records = [cast(JSONDict, data)] if isinstance(data, dict) else data
+    for batch in batched(records, batch_size, strict=False):
+        yield list(batch)
+
+
+def worker_context() -> BaseContext:
+    """
+    Return the multiprocessing context for partition worker pools.
+
+    Workers start from a fresh ``forkserver`` process where the platform
+    supports it, because forking a process that already runs Arrow threads
+    can deadlock. Platforms without ``forkserver`` (Windows) use ``spawn``.
+
+    Returns
+    -------
+    BaseContext
+        ``forkserver`` context when available, else ``spawn``.
+    """
+    if 'forkserver' in get_all_start_methods():
+        return get_context('forkserver')
+    return get_context('spawn')
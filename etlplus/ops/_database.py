@@ -1,25 +1,1006 @@
 """
 :mod:`etlplus.ops._database` module.
 
-Shared database placeholder constants for extract/load orchestration.
+Shared SQLAlchemy helpers for database extract/load orchestration.
+
+Reads run on a streaming connection (``stream_results`` plus ``yield_per``),
+so dialects with server-side cursors, such as PostgreSQL and MySQL, fetch
+rows from the server one batch at a time instead of buffering the whole
+result set in memory. Sources with a ``partition_column`` are split into
+value ranges that are read concurrently, one pooled connection per range.
+Incremental reads push a ``watermark_column > :watermark`` filter into the
+statement so only new rows leave the server.
+
+Loads run in one transaction and pick the fastest path the target offers:
+
+- PostgreSQL (psycopg2/psycopg) appends with ``COPY ... FROM STDIN``.
+- SQLite relaxes ``synchronous`` and keeps temporary data in memory.
+- DuckDB files ingest each batch as an Arrow table through :mod:`duckdb`.
+- SQL Server over pyodbc enables ``fast_executemany``.
+- Every other dialect inserts with SQLAlchemy ``executemany``, which batches
+    rows into multi-row ``INSERT`` statements (``insertmanyvalues``) where the
+    driver supports it.
 """
 
 from __future__ import annotations
 
+import csv
+import io
+import logging
+import queue
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from datetime import datetime
+from decimal import Decimal
+from itertools import batched
+from itertools import chain
+from numbers import Real
+from threading import Event
+from time import perf_counter
+from typing import Any
+from typing import Literal
+
+from sqlalchemy import JSON
+from sqlalchemy import BigInteger
+from sqlalchemy import Boolean
+from sqlalchemy import Column
+from sqlalchemy import Connection
+from sqlalchemy import Date
+from sqlalchemy import DateTime
+from sqlalchemy import Float
+from sqlalchemy import MetaData
+from sqlalchemy import Numeric
+from sqlalchemy import Table
+from sqlalchemy import Text
+from sqlalchemy import and_
+from sqlalchemy import bindparam
+from sqlalchemy import column as sql_column
+from sqlalchemy import delete
+from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import literal_column
+from sqlalchemy import or_
+from sqlalchemy import select
+from sqlalchemy import table as sql_table
+from sqlalchemy import text
+from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import NoSuchTableError
+from sqlalchemy.sql import Executable
+from sqlalchemy.sql import FromClause
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.expression import ColumnClause
+from sqlalchemy.types import TypeEngine
+
+from ..database import DatabaseDialect
+from ..database import make_engine
+from ..file._io import records_to_arrow_table
+from ..file._sql import quote_identifier
+from ..utils import JsonCodec
+from ..utils._types import JSONDict
+from ..utils._types import JSONList
+from ._imports import get_dependency
+
 # SECTION: EXPORTS ========================================================== #
 
 
 __all__ = [
     # Constants
-    'DATABASE_DRIVER_NOTE',
-    'DATABASE_EXTRACT_NOT_IMPLEMENTED',
-    'DATABASE_LOAD_NOT_IMPLEMENTED',
+    'DATABASE_LOAD_MODES',
+    'DEFAULT_DATABASE_BATCH_SIZE',
+    'DEFAULT_DATABASE_FETCH_SIZE',
+    'DEFAULT_DATABASE_PARTITIONS',
+    # Functions
+    'database_select',
+    'iter_database_batches',
+    'iter_partitioned_batches',
+    'load_database_batches',
+    # Type Aliases
+    'DatabaseLoadMode',
 ]
 
 
+# SECTION: TYPE ALIASES ===================================================== #
+
+
+type DatabaseLoadMode = Literal['append', 'replace', 'upsert']
+type _RowWriter = Callable[[JSONList], object]
+
+
 # SECTION: CONSTANTS ======================================================== #
 
 
-DATABASE_DRIVER_NOTE = 'Install database-specific drivers to enable this feature'
-DATABASE_EXTRACT_NOT_IMPLEMENTED = 'Database extraction not yet implemented'
-DATABASE_LOAD_NOT_IMPLEMENTED = 'Database loading not yet implemented'
+# Supported ``mode`` values for database targets.
+DATABASE_LOAD_MODES: tuple[DatabaseLoadMode, ...] = ('append', 'replace', 'upsert')
+
+# Rows written per insert batch by default.
+DEFAULT_DATABASE_BATCH_SIZE = 10_000
+
+# Rows fetched from the server per round trip by default.
+DEFAULT_DATABASE_FETCH_SIZE = 10_000
+
+# Value ranges a partitioned source is split into by default.
+DEFAULT_DATABASE_PARTITIONS = 4
+
+
+# SECTION: INTERNAL CONSTANTS =============================================== #
+
+
+# PostgreSQL drivers whose raw cursors support ``COPY ... FROM STDIN``.
+_COPY_DRIVERS = frozenset({'psycopg', 'psycopg2'})
+
+# Name under which each Arrow batch is registered on a DuckDB connection.
+_DUCKDB_BATCH = '_etlplus_batch'
+
+_LOGGER = logging.getLogger(__name__)
+
+# Ranges read at once; later ranges start as earlier ones finish.
+_MAX_PARTITION_WORKERS = 8
+
+# Batches each range reader may buffer ahead of the consumer.
+_MAX_PENDING_BATCHES = 4
+
+# Seconds between cancellation checks while a range reader is blocked.
+_POLL_SECONDS = 0.1
+
+# Alias of a partitioned ``query`` wrapped as a subquery.
+_PARTITION_SOURCE = '_etlplus_source'
+
+# Per-connection SQLite settings for bulk loads; durability is traded for
+# speed only until the connection closes.
+_SQLITE_LOAD_PRAGMAS = (
+    'PRAGMA synchronous = OFF',
+    'PRAGMA temp_store = MEMORY',
+)
+
+# Column types for tables created from the first loaded batch.
+_PYTHON_COLUMN_TYPES: tuple[
+    tuple[type | tuple[type, ...], Callable[[], TypeEngine]],
+    ...,
+] = (
+    (bool, Boolean),
+    (int, BigInteger),
+    (float, Float),
+    (Decimal, Numeric),
+    (datetime, DateTime),
+    (date, Date),
+    ((dict, list), lambda: JSON(none_as_null=True)),
+)
+
+
+# SECTION: INTERNAL DATA CLASSES ============================================ #
+
+
+@dataclass(frozen=True, slots=True)
+class _LoadSpec:
+    """Validated settings for one database load."""
+
+    # -- Instance Attributes -- #
+
+    table: str
+    schema: str | None
+    mode: DatabaseLoadMode
+    keys: tuple[str, ...]
+    batch_size: int
+
+    # -- Instance Properties -- #
+
+    @property
+    def qualified_name(self) -> str:
+        """Return the ``schema.table`` name used in load results."""
+        return self.table if self.schema is None else f'{self.schema}.{self.table}'
+
+
+@dataclass(frozen=True, slots=True)
+class _Partition:
+    """
+    One value range of a partitioned source.
+
+    ``None`` bounds are open: the first range also holds ``NULL`` values and
+    everything below the lower bound, the last range everything above the
+    upper bound.
+    """
+
+    # -- Instance Attributes -- #
+
+    index: int
+    lower: Any | None
+    upper: Any | None
+
+    # -- Instance Methods -- #
+
+    def where(
+        self,
+        column: Any,
+    ) -> Any | None:
+        """Return the filter selecting this range of *column*."""
+        clauses = []
+        if self.lower is not None:
+            clauses.append(column >= self.lower)
+        if self.upper is not None:
+            clauses.append(column < self.upper)
+        if not clauses:
+            return None
+        condition = and_(*clauses)
+        if self.lower is None:
+            condition = or_(condition, column.is_(None))
+        return condition
+
+
+# SECTION: INTERNAL FUNCTIONS =============================================== #
+
+
+def _column_type(
+    rows: JSONList,
+    column: str,
+) -> TypeEngine:
+    """Infer a column type from the first non-null value in *rows*."""
+    for row in rows:
+        if (value := row.get(column)) is None:
+            continue
+        for python_type, column_type in _PYTHON_COLUMN_TYPES:
+            if isinstance(value, python_type):
+                return column_type()
+        break
+    return Text()
+
+
+def _check_columns(
+    rows: JSONList,
+    columns: list[str],
+    table: str,
+) -> None:
+    """
+    Ensure every field in *rows* is one of *columns*.
+
+    Raises
+    ------
+    ValueError
+        If a row has a field the target table does not.
+    """
+    known = set(columns)
+    unknown = {name for row in rows for name in row if name not in known}
+    if unknown:
+        raise ValueError(
+            f'Columns not in table "{table}": {", ".join(sorted(unknown))}',
+        )
+
+
+def _conform_rows(
+    rows: JSONList,
+    columns: list[str],
+    table: str,
+) -> JSONList:
+    """Return *rows* keyed by exactly *columns*, missing values as ``None``."""
+    _check_columns(rows, columns, table)
+    return [{name: row.get(name) for name in columns} for row in rows]
+
+
+def _copy_writer(
+    conn: Connection,
+    table: Table,
+) -> _RowWriter:
+    """Return a writer that appends rows with PostgreSQL ``COPY``."""
+    columns = [column.name for column in table.columns]
+    preparer = conn.dialect.identifier_preparer
+    statement = (
+        f'COPY {preparer.format_table(table)} '
+        f'({", ".join(preparer.quote(name) for name in columns)}) '
+        'FROM STDIN WITH (FORMAT csv)'
+    )
+
+    def _write(rows: JSONList) -> None:
+        buffer = _csv_buffer(rows, columns)
+        cursor = conn.connection.dbapi_connection.cursor()  # type: ignore[union-attr]
+        try:
+            if hasattr(cursor, 'copy_expert'):
+                cursor.copy_expert(statement, buffer)
+            else:
+                with cursor.copy(statement) as copy:
+                    copy.write(buffer.getvalue())
+        finally:
+            cursor.close()
+
+    return _write
+
+
+def _create_table(
+    conn: Connection,
+    spec: _LoadSpec,
+    rows: JSONList,
+) -> Table:
+    """Create the target table from the columns of the first batch."""
+    names = list(dict.fromkeys(name for row in rows for name in row))
+    table = Table(
+        spec.table,
+        MetaData(),
+        *(
+            Column(name, _column_type(rows, name), primary_key=name in spec.keys)
+            for name in names
+        ),
+        schema=spec.schema,
+    )
+    table.create(conn)
+    return table
+
+
+def _csv_buffer(
+    rows: JSONList,
+    columns: list[str],
+) -> io.StringIO:
+    """Serialize *rows* as CSV where unquoted empty fields mean ``NULL``."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, quoting=csv.QUOTE_NOTNULL, lineterminator='\n')
+    for row in rows:
+        writer.writerow([_csv_value(row[name]) for name in columns])
+    buffer.seek(0)
+    return buffer
+
+
+def _csv_value(
+    value: Any,
+) -> Any:
+    """Return one value in the text form PostgreSQL ``COPY`` expects."""
+    if isinstance(value, dict | list):
+        return JsonCodec().serialize(value)
+    return value
+
+
+def _delete_insert_writer(
+    conn: Connection,
+    table: Table,
+    keys: tuple[str, ...],
+) -> _RowWriter:
+    """Return a portable upsert writer: delete matching keys, then insert."""
+    matches = and_(*(table.c[key] == bindparam(f'_key_{key}') for key in keys))
+    remove = delete(table).where(matches)
+
+    def _write(rows: JSONList) -> None:
+        conn.execute(
+            remove,
+            [{f'_key_{key}': row[key] for key in keys} for row in rows],
+        )
+        conn.execute(insert(table), rows)
+
+    return _write
+
+
+def _database_from(
+    query: str | None,
+    table: str | None,
+    schema: str | None,
+) -> FromClause:
+    """Return the source of a query or table as a selectable FROM clause."""
+    if query:
+        return text(query).columns().subquery(_PARTITION_SOURCE)
+    if table:
+        if schema is None and '.' in table:
+            schema, table = table.rsplit('.', 1)
+        return sql_table(table, schema=schema)
+    raise ValueError('Database source requires a "query" or "table"')
+
+
+def _duckdb_path(
+    connection_string: str,
+) -> str | None:
+    """Return the database path of a ``duckdb://`` URL, else ``None``."""
+    if not connection_string.startswith(DatabaseDialect.DUCKDB.scheme_prefixes()):
+        return None
+    return make_url(connection_string).database or ':memory:'
+
+
+def _engine_kwargs(
+    connection_string: str,
+) -> dict[str, Any]:
+    """Return dialect-specific engine options for bulk loads."""
+    url = make_url(connection_string)
+    if url.get_backend_name() == 'mssql' and url.get_driver_name() == 'pyodbc':
+        return {'fast_executemany': True}
+    return {}
+
+
+def _load_duckdb(
+    batches: Iterable[JSONList],
+    path: str,
+    spec: _LoadSpec,
+) -> int:
+    """Load *batches* into a DuckDB file through Arrow batch ingestion."""
+    duckdb = get_dependency('duckdb', format_name='DUCKDB', required=True)
+    pa = get_dependency('pyarrow', format_name='ARROW', required=True)
+    target = '.'.join(
+        quote_identifier(part) for part in (spec.schema, spec.table) if part
+    )
+    conn = duckdb.connect(path)
+    try:
+        conn.begin()
+        exists = bool(
+            conn.execute(
+                'SELECT count(*) FROM information_schema.tables '
+                'WHERE table_name = ? '
+                'AND table_schema = coalesce(?, current_schema())',
+                [spec.table, spec.schema],
+            ).fetchone()[0],
+        )
+        if exists and spec.mode == 'replace':
+            conn.execute(f'DELETE FROM {target}')
+        matches = ' AND '.join(
+            f'{target}.{quote_identifier(key)} = '
+            f'{_DUCKDB_BATCH}.{quote_identifier(key)}'
+            for key in spec.keys
+        )
+        count = 0
+        columns: list[str] = []
+        for rows in _rebatch(batches, spec.batch_size):
+            batch = records_to_arrow_table(pa, rows, format_name='DuckDB')
+            if not exists:
+                # All-null columns would otherwise be created as INTEGER.
+                batch = batch.cast(
+                    pa.schema(
+                        field.with_type(pa.string())
+                        if pa.types.is_null(field.type)
+                        else field
+                        for field in batch.schema
+                    ),
+                )
+                conn.register(_DUCKDB_BATCH, batch)
+                conn.execute(
+                    f'CREATE TABLE {target} AS SELECT * FROM {_DUCKDB_BATCH} LIMIT 0',
+                )
+                exists = True
+            else:
+                conn.register(_DUCKDB_BATCH, batch)
+            if not columns:
+                columns = [
+                    row[0] for row in conn.execute(f'DESCRIBE {target}').fetchall()
+                ]
+            _check_columns(rows, columns, spec.qualified_name)
+            if spec.mode == 'upsert':
+                conn.execute(
+                    f'DELETE FROM {target} USING {_DUCKDB_BATCH} WHERE {matches}',
+                )
+            conn.execute(
+                f'INSERT INTO {target} BY NAME SELECT * FROM {_DUCKDB_BATCH}',
+            )
+            conn.unregister(_DUCKDB_BATCH)
+            count += len(rows)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    return count
+
+
+def _load_sqlalchemy(
+    batches: Iterable[JSONList],
+    connection_string: str,
+    spec: _LoadSpec,
+) -> tuple[int, str]:
+    """Load *batches* through SQLAlchemy; return the count and write method."""
+    engine = make_engine(connection_string, **_engine_kwargs(connection_string))
+    count = 0
+    method = 'insert'
+    try:
+        with engine.begin() as conn:
+            if conn.dialect.name == 'sqlite':
+                for pragma in _SQLITE_LOAD_PRAGMAS:
+                    conn.exec_driver_sql(pragma)
+            table = _reflect_table(conn, spec)
+            if table is not None and spec.mode == 'replace':
+                conn.execute(delete(table))
+            write: _RowWriter | None = None
+            columns: list[str] = []
+            for rows in _rebatch(batches, spec.batch_size):
+                if table is None:
+                    table = _create_table(conn, spec, rows)
+                if write is None:
+                    columns = [column.name for column in table.columns]
+                    write, method = _row_writer(conn, table, spec)
+                write(_conform_rows(rows, columns, spec.qualified_name))
+                count += len(rows)
+    finally:
+        engine.dispose()
+    return count, method
+
+
+def _partition_ranges(
+    lower: Any,
+    upper: Any,
+    count: int,
+) -> list[_Partition]:
+    """
+    Split ``[lower, upper]`` into at most *count* contiguous ranges.
+
+    Raises
+    ------
+    ValueError
+        If the bounds are not numbers.
+    """
+    if lower is None or upper is None or count <= 1:
+        return [_Partition(0, None, None)]
+    if isinstance(lower, bool) or not isinstance(lower, Real | Decimal):
+        raise ValueError(f'Partition bounds must be numbers, got {lower!r}')
+    if isinstance(upper, bool) or not isinstance(upper, Real | Decimal):
+        raise ValueError(f'Partition bounds must be numbers, got {upper!r}')
+    low: float
+    high: float
+    if isinstance(lower, int) and isinstance(upper, int):
+        low, high = lower, upper
+        cuts = [lower + (upper - lower) * step // count for step in range(1, count)]
+    else:
+        low, high = float(lower), float(upper)
+        cuts = [low + (high - low) * step / count for step in range(1, count)]
+    # Narrow integer ranges repeat cut points; each range must be non-empty.
+    bounds = [None, *sorted({cut for cut in cuts if low < cut <= high}), None]
+    return [
+        _Partition(index, bounds[index], bounds[index + 1])
+        for index in range(len(bounds) - 1)
+    ]
+
+
+def _put_until(
+    pending: queue.Queue[Any],
+    item: Any,
+    stop: Event,
+) -> bool:
+    """Queue *item* unless *stop* is set first; return whether it was queued."""
+    while not stop.is_set():
+        try:
+            pending.put(item, timeout=_POLL_SECONDS)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _rebatch(
+    batches: Iterable[JSONList],
+    size: int,
+) -> Iterator[JSONList]:
+    """Regroup record batches into lists of at most *size* records."""
+    for chunk in batched(chain.from_iterable(batches), max(size, 1), strict=False):
+        yield list(chunk)
+
+
+def _reflect_table(
+    conn: Connection,
+    spec: _LoadSpec,
+) -> Table | None:
+    """Return the existing target table, or ``None`` when it is missing."""
+    try:
+        table = Table(spec.table, MetaData(), schema=spec.schema, autoload_with=conn)
+    except NoSuchTableError:
+        return None
+    for column in table.columns:
+        if isinstance(column.type, JSON):
+            # Store missing values as SQL NULL rather than JSON ``null``.
+            column.type.none_as_null = True
+    return table
+
+
+def _row_writer(
+    conn: Connection,
+    table: Table,
+    spec: _LoadSpec,
+) -> tuple[_RowWriter, str]:
+    """Return the fastest row writer for *table* and its method name."""
+    dialect = conn.dialect
+    if spec.mode != 'upsert':
+        if dialect.name == 'postgresql' and dialect.driver in _COPY_DRIVERS:
+            return _copy_writer(conn, table), 'copy'
+        return (lambda rows: conn.execute(insert(table), rows)), 'insert'
+
+    updates = [column.name for column in table.columns if column.name not in spec.keys]
+    match dialect.name:
+        case 'postgresql' | 'sqlite':
+            module = postgresql if dialect.name == 'postgresql' else sqlite
+            statement = module.insert(table)
+            statement = (
+                statement.on_conflict_do_update(
+                    index_elements=list(spec.keys),
+                    set_={name: statement.excluded[name] for name in updates},
+                )
+                if updates
+                else statement.on_conflict_do_nothing(index_elements=list(spec.keys))
+            )
+        case 'mysql' | 'mariadb':
+            statement = mysql.insert(table)
+            statement = statement.on_duplicate_key_update(
+                {name: statement.inserted[name] for name in updates or spec.keys},
+            )
+        case _:
+            return _delete_insert_writer(conn, table, spec.keys), 'delete_insert'
+    return (lambda rows: conn.execute(statement, rows)), 'upsert'
+
+
+def _watermark_filter(
+    column: str | None,
+    watermark: Any | None,
+) -> Any | None:
+    """Return the ``column > watermark`` filter of an incremental read."""
+    if not column or watermark is None:
+        return None
+    return sql_column(column) > watermark
+
+
+def _load_spec(
+    *,
+    table: str | None,
+    schema: str | None,
+    mode: str | None,
+    keys: Iterable[str] | None,
+    batch_size: int,
+) -> _LoadSpec:
+    """
+    Validate database load settings.
+
+    Raises
+    ------
+    ValueError
+        If the table is missing, the mode is unknown, or an upsert has no
+        key columns.
+    """
+    if not table:
+        raise ValueError('Database target requires a "table"')
+    if schema is None and '.' in table:
+        schema, table = table.rsplit('.', 1)
+    resolved_mode = (mode or 'append').strip().lower()
+    if resolved_mode not in DATABASE_LOAD_MODES:
+        raise ValueError(
+            f'Invalid database load mode "{mode}"; '
+            f'expected one of: {", ".join(DATABASE_LOAD_MODES)}',
+        )
+    resolved_keys = tuple(keys or ())
+    if resolved_mode == 'upsert' and not resolved_keys:
+        raise ValueError('Upsert loads require "keys" naming the key columns')
+    return _LoadSpec(
+        table=table,
+        schema=schema,
+        mode=resolved_mode,  # type: ignore[arg-type]
+        keys=resolved_keys,
+        batch_size=max(batch_size, 1),
+    )
+
+
+# SECTION: FUNCTIONS ======================================================== #
+
+
+def database_select(
+    query: str | None = None,
+    table: str | None = None,
+    schema: str | None = None,
+    *,
+    watermark_column: str | None = None,
+    watermark: Any | None = None,
+) -> Executable:
+    """
+    Build the statement that reads one database source.
+
+    Parameters
+    ----------
+    query : str | None, optional
+        Raw SQL query. Takes precedence over *table*.
+    table : str | None, optional
+        Table name to read in full, optionally qualified as
+        ``schema.table``.
+    schema : str | None, optional
+        Schema qualifying *table* when it is not already qualified.
+    watermark_column : str | None, optional
+        Column compared against *watermark* by incremental reads.
+    watermark : Any | None, optional
+        Only rows whose *watermark_column* is greater are selected. Ignored
+        when ``None``.
+
+    Returns
+    -------
+    Executable
+        SQLAlchemy statement; table names are quoted by the dialect.
+
+    Raises
+    ------
+    ValueError
+        If neither *query* nor *table* is provided.
+    """
+    condition = _watermark_filter(watermark_column, watermark)
+    if query and condition is None:
+        return text(query)
+    statement: Select[Any] = select(literal_column('*')).select_from(
+        _database_from(query, table, schema),
+    )
+    return statement if condition is None else statement.where(condition)
+
+
+def iter_database_batches(
+    connection_string: str,
+    *,
+    query: str | None = None,
+    table: str | None = None,
+    schema: str | None = None,
+    params: Mapping[str, Any] | None = None,
+    fetch_size: int = DEFAULT_DATABASE_FETCH_SIZE,
+    watermark_column: str | None = None,
+    watermark: Any | None = None,
+) -> Iterator[JSONList]:
+    """
+    Yield the rows of one query or table as record batches.
+
+    Parameters
+    ----------
+    connection_string : str
+        SQLAlchemy database URL.
+    query : str | None, optional
+        Raw SQL query; ``:name`` placeholders are bound from *params*.
+    table : str | None, optional
+        Table to read when *query* is omitted.
+    schema : str | None, optional
+        Schema qualifying *table*.
+    params : Mapping[str, Any] | None, optional
+        Bind parameters for *query*.
+    fetch_size : int, optional
+        Rows fetched per round trip and per yielded batch.
+    watermark_column : str | None, optional
+        Column compared against *watermark* by incremental reads.
+    watermark : Any | None, optional
+        Only rows whose *watermark_column* is greater are read.
+
+    Yields
+    ------
+    JSONList
+        Row mappings, at most *fetch_size* per batch, in result order.
+
+    Raises
+    ------
+    ValueError
+        If neither *query* nor *table* is provided.
+    """
+    statement = database_select(
+        query,
+        table,
+        schema,
+        watermark_column=watermark_column,
+        watermark=watermark,
+    )
+    engine = make_engine(connection_string)
+    try:
+        with engine.connect() as conn:
+            result = conn.execution_options(
+                stream_results=True,
+                yield_per=max(fetch_size, 1),
+            ).execute(statement, dict(params or {}))
+            for rows in result.mappings().partitions():
+                yield [dict(row) for row in rows]
+    finally:
+        engine.dispose()
+
+
+def iter_partitioned_batches(
+    connection_string: str,
+    *,
+    partition_column: str,
+    partitions: int = DEFAULT_DATABASE_PARTITIONS,
+    query: str | None = None,
+    table: str | None = None,
+    schema: str | None = None,
+    params: Mapping[str, Any] | None = None,
+    lower_bound: Any | None = None,
+    upper_bound: Any | None = None,
+    preserve_order: bool = True,
+    fetch_size: int = DEFAULT_DATABASE_FETCH_SIZE,
+    partition_stats: list[JSONDict] | None = None,
+    watermark_column: str | None = None,
+    watermark: Any | None = None,
+) -> Iterator[JSONList]:
+    """
+    Yield the rows of one query or table, reading value ranges concurrently.
+
+    Parameters
+    ----------
+    connection_string : str
+        SQLAlchemy database URL.
+    partition_column : str
+        Numeric column whose values are split into ranges.
+    partitions : int, optional
+        Number of ranges to split the source into.
+    query : str | None, optional
+        Raw SQL query, read as a subquery; ``:name`` placeholders are bound
+        from *params*. It must select *partition_column*.
+    table : str | None, optional
+        Table to read when *query* is omitted.
+    schema : str | None, optional
+        Schema qualifying *table*.
+    params : Mapping[str, Any] | None, optional
+        Bind parameters for *query*.
+    lower_bound : Any | None, optional
+        Lowest value used to place range boundaries. Discovered with
+        ``min()`` when omitted.
+    upper_bound : Any | None, optional
+        Highest value used to place range boundaries. Discovered with
+        ``max()`` when omitted.
+    preserve_order : bool, optional
+        Yield ranges in ascending order (default) instead of as their
+        batches arrive.
+    fetch_size : int, optional
+        Rows fetched per round trip and per yielded batch.
+    partition_stats : list[JSONDict] | None, optional
+        List that receives one timing entry per finished range.
+    watermark_column : str | None, optional
+        Column compared against *watermark* by incremental reads.
+    watermark : Any | None, optional
+        Only rows whose *watermark_column* is greater are read, and bounds
+        are discovered over those rows only.
+
+    Yields
+    ------
+    JSONList
+        Row mappings, at most *fetch_size* per batch.
+
+    Raises
+    ------
+    ValueError
+        If neither *query* nor *table* is provided, or the bounds are not
+        numbers.
+
+    Notes
+    -----
+    Bounds only place the boundaries: rows outside them, and ``NULL``
+    values, land in the first or last range, so no row is skipped. Ranges
+    share one engine and its connection pool, and each reader buffers only
+    a few batches ahead of the consumer.
+    """
+    source = _database_from(query, table, schema)
+    column: ColumnClause[Any] = sql_column(partition_column)
+    newer = _watermark_filter(watermark_column, watermark)
+    bound_params = dict(params or {})
+    engine = make_engine(connection_string)
+    stop = Event()
+    executor: ThreadPoolExecutor | None = None
+    try:
+        if lower_bound is None or upper_bound is None:
+            bounds = select(func.min(column), func.max(column)).select_from(source)
+            if newer is not None:
+                bounds = bounds.where(newer)
+            with engine.connect() as conn:
+                found = conn.execute(bounds, bound_params).one()
+            lower_bound = found[0] if lower_bound is None else lower_bound
+            upper_bound = found[1] if upper_bound is None else upper_bound
+        ranges = _partition_ranges(lower_bound, upper_bound, max(partitions, 1))
+        queues = [
+            queue.Queue[Any](_MAX_PENDING_BATCHES)
+            for _ in (ranges if preserve_order else ranges[:1])
+        ]
+
+        def _read(partition: _Partition) -> None:
+            pending = queues[partition.index if preserve_order else 0]
+            started = perf_counter()
+            statement: Select[Any] = select(literal_column('*')).select_from(source)
+            if newer is not None:
+                statement = statement.where(newer)
+            if (condition := partition.where(column)) is not None:
+                statement = statement.where(condition)
+            count = 0
+            try:
+                with engine.connect() as conn:
+                    result = conn.execution_options(
+                        stream_results=True,
+                        yield_per=max(fetch_size, 1),
+                    ).execute(statement, bound_params)
+                    for rows in result.mappings().partitions():
+                        if not _put_until(pending, [dict(r) for r in rows], stop):
+                            return
+                        count += len(rows)
+            except Exception as exc:  # noqa: BLE001 - re-raised by the consumer
+                _put_until(pending, exc, stop)
+                return
+            stats: JSONDict = {
+                'partition': partition.index,
+                'lower': partition.lower,
+                'upper': partition.upper,
+                'records': count,
+                'elapsed_seconds': round(perf_counter() - started, 3),
+            }
+            _put_until(pending, stats, stop)
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(ranges), _MAX_PARTITION_WORKERS),
+            thread_name_prefix='etlplus-partition',
+        )
+        for partition in ranges:
+            executor.submit(_read, partition)
+        # Ordered reads drain each range's queue in turn; unordered reads
+        # share one queue until every range has reported back.
+        remaining = len(ranges)
+        pending = queues[0]
+        while remaining:
+            item = pending.get()
+            if isinstance(item, Exception):
+                raise item
+            if isinstance(item, dict):
+                _LOGGER.debug('Read database partition %s', item)
+                if partition_stats is not None:
+                    partition_stats.append(item)
+                remaining -= 1
+                if preserve_order and remaining:
+                    pending = queues[len(ranges) - remaining]
+                continue
+            yield item
+    finally:
+        stop.set()
+        if executor is not None:
+            executor.shutdown(wait=True)
+        engine.dispose()
+
+
+def load_database_batches(
+    batches: Iterable[JSONList],
+    connection_string: str,
+    *,
+    table: str | None,
+    schema: str | None = None,
+    mode: str | None = None,
+    keys: Iterable[str] | None = None,
+    batch_size: int = DEFAULT_DATABASE_BATCH_SIZE,
+) -> JSONDict:
+    """
+    Write record batches into one database table in a single transaction.
+
+    Parameters
+    ----------
+    batches : Iterable[JSONList]
+        Record batches to write, consumed once.
+    connection_string : str
+        SQLAlchemy database URL. ``duckdb:///path`` URLs are written with
+        :mod:`duckdb` directly.
+    table : str | None
+        Target table, optionally qualified as ``schema.table``. It is created
+        from the first batch when missing.
+    schema : str | None, optional
+        Schema qualifying *table* when it is not already qualified.
+    mode : str | None, optional
+        ``'append'`` (default), ``'replace'`` (delete existing rows first), or
+        ``'upsert'`` (update rows whose *keys* match, insert the rest).
+    keys : Iterable[str] | None, optional
+        Key columns matched by ``upsert`` loads.
+    batch_size : int, optional
+        Rows written per statement.
+
+    Returns
+    -------
+    JSONDict
+        Load result with the row count, write ``method``, elapsed time, and
+        ``rows_per_second``.
+
+    Raises
+    ------
+    ValueError
+        If the settings are invalid or a row has a field the table lacks.
+    """
+    spec = _load_spec(
+        table=table,
+        schema=schema,
+        mode=mode,
+        keys=keys,
+        batch_size=batch_size,
+    )
+    started = perf_counter()
+    if (duckdb_path := _duckdb_path(connection_string)) is not None:
+        count, method = _load_duckdb(batches, duckdb_path, spec), 'arrow'
+    else:
+        count, method = _load_sqlalchemy(batches, connection_string, spec)
+    elapsed = perf_counter() - started
+    return {
+        'status': 'success',
+        'table': spec.qualified_name,
+        'mode': spec.mode,
+        'method': method,
+        'records': count,
+        'elapsed_seconds': round(elapsed, 3),
+        'rows_per_second': round(count / elapsed, 1) if elapsed > 0 else None,
+    }
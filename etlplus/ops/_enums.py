@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import operator as _op
 from statistics import fmean
+from statistics import median_low
 
 from ..utils._enums import CoercibleStrEnum
 from ..utils._types import StrStrMap
@@ -22,6 +23,7 @@ __all__ = [
     'AggregateName',
     'OperatorName',
     'PipelineStep',
+    'TransformEngine',
 ]
 
 
@@ -35,12 +37,33 @@ class AggregateName(CoercibleStrEnum):
 
     AVG = 'avg'
     COUNT = 'count'
+    DISTINCT = 'distinct'
     MAX = 'max'
     MIN = 'min'
+    QUANTILE = 'quantile'
     SUM = 'sum'
 
     # -- Class Methods -- #
 
+    @classmethod
+    def aliases(cls) -> StrStrMap:
+        """
+        Return a mapping of common aliases for each enum member.
+
+        Returns
+        -------
+        StrStrMap
+            A mapping of alias names to their corresponding enum member names.
+        """
+        return {
+            'count_distinct': 'distinct',
+            'nunique': 'distinct',
+            'median': 'quantile',
+            'percentile': 'quantile',
+        }
+
+    # -- Getters -- #
+
     @property
     def func(self) -> AggregateFunc:
         """
@@ -59,6 +82,10 @@ class AggregateName(CoercibleStrEnum):
             return lambda xs, n: min(xs) if xs else None
         if self is AggregateName.SUM:
             return lambda xs, n: sum(xs)
+        if self is AggregateName.DISTINCT:
+            return lambda xs, n: len(set(xs))
+        if self is AggregateName.QUANTILE:
+            return lambda xs, n: median_low(xs) if xs else None
 
         # AVG
         return lambda xs, n: fmean(xs) if xs else 0.0
@@ -143,6 +170,10 @@ class PipelineStep(CoercibleStrEnum):
     MAP = 'map'
     SELECT = 'select'
     SORT = 'sort'
+    SQL = 'sql'
+    GROUP_BY = 'group_by'
+    TOP_N = 'top_n'
+    LIMIT = 'limit'
     AGGREGATE = 'aggregate'
 
     # -- Getters -- #
@@ -160,6 +191,15 @@ class PipelineStep(CoercibleStrEnum):
         return _PIPELINE_ORDER_INDEX[self]
 
 
+class TransformEngine(CoercibleStrEnum):
+    """Execution engines available to transform pipelines."""
+
+    # -- Constants -- #
+
+    ARROW = 'arrow'
+    PYTHON = 'python'
+
+
 # SECTION: INTERNAL CONSTANTS =============================================== #
 
 # Precomputed order index for PipelineStep; avoids recomputing on each access.
@@ -169,4 +209,8 @@ _PIPELINE_ORDER_INDEX: dict[PipelineStep, int] = {
     PipelineStep.SELECT: 2,
     PipelineStep.SORT: 3,
     PipelineStep.AGGREGATE: 4,
+    PipelineStep.SQL: 5,
+    PipelineStep.GROUP_BY: 6,
+    PipelineStep.TOP_N: 7,
+    PipelineStep.LIMIT: 8,
 }
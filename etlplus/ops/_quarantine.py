@@ -0,0 +1,185 @@
+"""
+:mod:`etlplus.ops._quarantine` module.
+
+Dead-letter writer for records rejected by ``quarantine`` validation.
+
+:class:`QuarantineWriter` accepts record batches as they are rejected and
+streams them into one file target with
+:func:`etlplus.ops.load.load_batches_to_file` on a background thread. Any
+:mod:`etlplus.file` format works, and formats with incremental writers never
+hold the quarantined records in memory. The file is only created once the
+first rejected record arrives.
+"""
+
+from __future__ import annotations
+
+import queue
+from collections.abc import Iterator
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from ..file._core import FileFormatArg
+from ..file.base import WriteOptions
+from ..utils._types import JSONDict
+from ..utils._types import JSONList
+from ..utils._types import StrPath
+from ._types import FileOptionsArg
+from .load import load_batches_to_file
+
+# SECTION: EXPORTS ========================================================== #
+
+
+__all__ = [
+    # Classes
+    'QuarantineWriter',
+]
+
+
+# SECTION: INTERNAL CONSTANTS =============================================== #
+
+
+# Rejected batches buffered ahead of the writer thread.
+_MAX_PENDING_BATCHES = 4
+
+# Seconds between writer-thread health checks while the buffer is full.
+_POLL_SECONDS = 0.1
+
+_DONE = object()
+
+
+# SECTION: CLASSES ========================================================== #
+
+
+class QuarantineWriter:
+    """
+    Push rejected record batches into one file target.
+
+    Parameters
+    ----------
+    path : StrPath
+        Target local file path or remote URI.
+    file_format : FileFormatArg, optional
+        Output format. If omitted, the format is inferred from *path*.
+    options : FileOptionsArg[WriteOptions], optional
+        File-write options forwarded to the writer.
+    """
+
+    # -- Magic Methods (Object Lifecycle) -- #
+
+    def __init__(
+        self,
+        path: StrPath,
+        file_format: FileFormatArg = None,
+        options: FileOptionsArg[WriteOptions] = None,
+    ) -> None:
+        self.path = path
+        self.file_format = file_format
+        self.options = options
+        self.records = 0
+        self._queue: queue.Queue[Any] = queue.Queue(_MAX_PENDING_BATCHES)
+        self._executor: ThreadPoolExecutor | None = None
+        self._future: Future[JSONDict] | None = None
+        self._result: JSONDict | None = None
+
+    # -- Internal Instance Methods -- #
+
+    def _batches(self) -> Iterator[JSONList]:
+        """Yield queued batches until :meth:`close` is called."""
+        while (batch := self._queue.get()) is not _DONE:
+            yield batch
+
+    def _put(
+        self,
+        item: Any,
+    ) -> None:
+        """Queue *item*, surfacing writer failures instead of blocking."""
+        assert self._future is not None
+        while True:
+            if self._future.done():
+                # The writer stopped early; raise its error, if any.
+                self._future.result()
+                raise RuntimeError('Quarantine writer stopped unexpectedly')
+            try:
+                self._queue.put(item, timeout=_POLL_SECONDS)
+                return
+            except queue.Full:
+                continue
+
+    # -- Instance Methods -- #
+
+    def close(self) -> JSONDict:
+        """
+        Finish writing and return the load result.
+
+        Returns
+        -------
+        JSONDict
+            Load result of the quarantine file, or a result with zero
+            records when nothing was rejected. Calling :meth:`close` again
+            returns the same result.
+
+        Raises
+        ------
+        Exception
+            Any error raised while writing the quarantine file.
+        """
+        if self._result is not None:
+            return self._result
+        if self._future is None:
+            self._result = {'status': 'success', 'records': 0}
+            return self._result
+        assert self._executor is not None
+        try:
+            if not self._future.done():
+                self._put(_DONE)
+            result = self._future.result()
+        finally:
+            self._executor.shutdown(wait=True)
+        self._result = {
+            **result,
+            'path': str(self.path),
+            'records': self.records,
+        }
+        return self._result
+
+    def write(
+        self,
+        records: list[Any],
+    ) -> None:
+        """
+        Queue one batch of rejected records for writing.
+
+        Parameters
+        ----------
+        records : list[Any]
+            Rejected records. Non-mapping items are wrapped as
+            ``{'value': item}`` so every format can store them.
+
+        Raises
+        ------
+        RuntimeError
+            If the writer has already been closed.
+        """
+        if not records:
+            return
+        if self._result is not None:
+            raise RuntimeError('Quarantine writer is closed')
+        if self._future is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix='etlplus-quarantine',
+            )
+            self._future = self._executor.submit(
+                load_batches_to_file,
+                self._batches(),
+                self.path,
+                self.file_format,
+                self.options,
+            )
+        batch = [
+            record if isinstance(record, dict) else {'value': record}
+            for record in records
+        ]
+        self._put(batch)
+        self.records += len(batch)
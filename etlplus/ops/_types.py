@@ -27,6 +27,7 @@ from typing import Literal
 
 from ..connector import DataConnectorType
 from ..utils._types import JSONData
+from ..utils._types import JSONDict
 from ..utils._types import JSONList
 from ..utils._types import StrAnyMap
 from ..utils._types import StrPath
@@ -53,9 +54,13 @@ __all__ = [
     # Type Aliases (Transform Specs)
     'AggregateSpec',
     'FilterSpec',
+    'GroupBySpec',
+    'LimitSpec',
     'MapSpec',
     'SelectSpec',
     'SortSpec',
+    'SqlSpec',
+    'TopNSpec',
     # Type Aliases (Pipelines)
     'StepOrSteps',
     'StepSeq',
@@ -63,8 +68,12 @@ __all__ = [
     'PipelineConfig',
     'PipelineStepName',
     # Type Aliases (Helpers)
+    'BatchStep',
+    'RecordStep',
     'StepApplier',
     'SortKey',
+    'SortField',
+    'TableStep',
 ]
 
 
@@ -137,6 +146,33 @@ type SelectSpec = Fields | StrSeqMap
 # >>> spec2: SortSpec = {'field': 'x', 'reverse': True}
 type SortSpec = str | StrAnyMap
 
+# SQL directive expressed as a query string or mapping with a relation name.
+#
+# Examples
+# --------
+# >>> from etlplus.ops._types import SqlSpec
+# >>> spec1: SqlSpec = 'SELECT * FROM data'
+# >>> spec2: SqlSpec = {'query': 'SELECT * FROM t', 'table': 't'}
+type SqlSpec = str | StrAnyMap
+
+# Limit directive expressed as a record count or mapping with ``count``.
+#
+# Examples
+# --------
+# >>> from etlplus.ops._types import LimitSpec
+# >>> spec1: LimitSpec = 100
+# >>> spec2: LimitSpec = {'count': 100}
+type LimitSpec = int | StrAnyMap
+
+# Top-N directive with a record count and sort-style ranking keys.
+#
+# Examples
+# --------
+# >>> from etlplus.ops._types import TopNSpec
+# >>> spec1: TopNSpec = {'n': 10, 'field': 'score'}
+# >>> spec2: TopNSpec = {'n': 10, 'keys': ['score', 'id'], 'reverse': False}
+type TopNSpec = StrAnyMap
+
 # Aggregate instruction covering ``field``, ``func``, and optional alias.
 #
 # Supported functions: ``avg``, ``count``, ``max``, ``min``, and ``sum``.
@@ -147,10 +183,31 @@ type SortSpec = str | StrAnyMap
 # ...   {'field': 'x', 'func': 'sum' | 'avg' | ..., 'alias'?: '...'}
 type AggregateSpec = StrAnyMap
 
+# Grouped aggregate instruction with key fields and aggregate specs.
+#
+# Examples
+# --------
+# >>> from etlplus.ops._types import GroupBySpec
+# >>> spec: GroupBySpec = {
+# ...     'keys': ['customer_id'],
+# ...     'aggregates': [{'field': 'amount', 'func': 'sum'}],
+# ... }
+type GroupBySpec = StrAnyMap
+
 # -- Pipelines-- #
 
 # Unified pipeline step spec consumed by :mod:`etlplus.ops.transform`.
-type StepSpec = AggregateSpec | FilterSpec | MapSpec | SelectSpec | SortSpec
+type StepSpec = (
+    AggregateSpec
+    | FilterSpec
+    | GroupBySpec
+    | LimitSpec
+    | MapSpec
+    | SelectSpec
+    | SortSpec
+    | SqlSpec
+    | TopNSpec
+)
 
 # Collections of steps
 
@@ -161,7 +218,17 @@ type StepSeq = Sequence[StepSpec]
 type StepOrSteps = StepSpec | StepSeq
 
 # Canonical literal names for supported transform stages.
-type PipelineStepName = Literal['aggregate', 'filter', 'map', 'select', 'sort']
+type PipelineStepName = Literal[
+    'aggregate',
+    'filter',
+    'group_by',
+    'limit',
+    'map',
+    'select',
+    'sort',
+    'sql',
+    'top_n',
+]
 
 # Mapping from step name to its associated specification payload.
 # TODO: Consider replacing with etlplus.workflow.types.PipelineConfig.
@@ -172,5 +239,17 @@ type PipelineConfig = Mapping[PipelineStepName, StepOrSteps]
 # Callable that applies step configuration to a batch of records.
 type StepApplier = Callable[[JSONList, Any], JSONList]
 
+# Pre-compiled step that transforms one record, or returns ``None`` to drop it.
+type RecordStep = Callable[[JSONDict], JSONDict | None]
+
+# Pre-compiled step that transforms a whole batch of records.
+type BatchStep = Callable[[JSONList], JSONList]
+
 # Tuple combining stable sort index and computed sort value.
 type SortKey = tuple[int, Any]
+
+# One sort key as a ``(field, reverse)`` pair, most significant first.
+type SortField = tuple[FieldName, bool]
+
+# Pre-compiled step that transforms a whole ``pyarrow.Table``.
+type TableStep = Callable[[Any], Any]
@@ -48,6 +48,7 @@ class ValidationResultDict(TypedDict, total=False):
     data: Any
     errors: Any
     field_errors: Any
+    summary: Any
 
 
 # SECTION: TYPE ALIASES ===================================================== #
@@ -57,7 +58,8 @@ type Ruleset = StrAnyMap
 
 type ValidationPhase = Literal['before_transform', 'after_transform']
 type ValidationWindow = Literal['before_transform', 'after_transform', 'both']
-type ValidationChoice = ValidationPhase | ValidationWindow | IssueSeverity
+type ValidationSeverity = IssueSeverity | Literal['quarantine']
+type ValidationChoice = ValidationPhase | ValidationWindow | ValidationSeverity
 
 type ValidateFn = Callable[[Any, Ruleset], ValidationResultDict]
 type PrintFn = Callable[[Any], None]
@@ -75,6 +77,7 @@ _SEVERITY_CHOICES = MappingProxyType(
     {
         'warn': 'warn',
         'error': 'error',
+        'quarantine': 'quarantine',
     },
 )
 _WINDOW_CHOICES = MappingProxyType(
@@ -106,8 +109,8 @@ class ValidationSettings:
     window : ValidationWindow
         Configured validation window. Accepts ``"before_transform"``,
         ``"after_transform"``, or ``"both"``.
-    severity : IssueSeverity
-        Failure severity (``"warn"`` or ``"error"``).
+    severity : ValidationSeverity
+        Failure severity (``"warn"``, ``"error"``, or ``"quarantine"``).
     """
 
     # -- Attributes -- #
@@ -116,7 +119,7 @@ class ValidationSettings:
     rules: Ruleset | None
     phase: ValidationPhase
     window: ValidationWindow
-    severity: IssueSeverity
+    severity: ValidationSeverity
 
     # -- Class Methods -- #
 
@@ -147,7 +150,7 @@ class ValidationSettings:
             Configured validation window. Accepts ``"before_transform"``,
             ``"after_transform"``, or ``"both"``.
         severity : str | None
-            Failure severity (``"warn"`` or ``"error"``).
+            Failure severity (``"warn"``, ``"error"``, or ``"quarantine"``).
 
         Returns
         -------
@@ -255,7 +258,7 @@ def _normalize_phase(
 
 def _normalize_severity(
     value: str | None,
-) -> IssueSeverity:
+) -> ValidationSeverity:
     """
     Normalize severity, defaulting to ``"error"`` when unspecified.
 
@@ -266,7 +269,7 @@ def _normalize_severity(
 
     Returns
     -------
-    IssueSeverity
+    ValidationSeverity
         Normalized severity. Defaults to ``"error"`` when unspecified.
     """
     return _normalize_choice(
@@ -377,7 +380,10 @@ def maybe_validate(
     phase : str
         Current pipeline phase requesting validation.
     severity : str
-        Failure severity (``"warn"`` or ``"error"``).
+        Failure severity (``"warn"``, ``"error"``, or ``"quarantine"``).
+        With ``"quarantine"``, *validate_fn* is expected to divert invalid
+        records itself and return the remaining records as valid ``data``;
+        a failed result is treated like ``"error"``.
     validate_fn : ValidateFn
         Engine that performs validation and returns a
         :class:`ValidationResultDict` instance.
@@ -394,7 +400,8 @@ def maybe_validate(
     Raises
     ------
     ValueError
-        Raised when validation fails and *severity* is ``"error"``.
+        Raised when validation fails and *severity* is ``"error"`` or
+        ``"quarantine"``.
 
     Examples
     --------
@@ -0,0 +1,389 @@
+"""
+:mod:`etlplus.ops._watermarks` module.
+
+High-water marks for incremental (delta) extraction.
+
+:class:`WatermarkStore` persists the highest watermark value each job has
+loaded in ``watermarks.json`` under the local state directory shared with
+run history and the scheduler. :class:`WatermarkTracker` carries one job's
+stored mark into extraction, drops records at or below it, and follows the
+highest value among the extracted records that remain; the store is only
+advanced by :meth:`WatermarkTracker.commit`, after a successful load. The
+mark is read before transforms run, so steps that rename or drop the field
+cannot stall it, and records a ``filter`` drops stay consumed.
+
+Values of different kinds compare in a stable order: numbers (including
+numeric strings, as read from CSV files) compare numerically and sort below
+dates and timestamps, which sort below other text. Dates, timestamps, and
+ISO 8601 text compare as points in time, so ``Z`` and ``+00:00`` offsets
+and different fractional precisions order correctly. Naive timestamps are
+taken as UTC.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+from datetime import time
+from decimal import Decimal
+from pathlib import Path
+from threading import Lock
+from typing import Any
+from typing import Self
+
+from ..utils import JsonCodec
+from ..utils._types import JSONDict
+from ..utils._types import JSONList
+
+# SECTION: EXPORTS ========================================================== #
+
+
+__all__ = [
+    # Classes
+    'WatermarkStore',
+    'WatermarkTracker',
+]
+
+
+# SECTION: INTERNAL CONSTANTS =============================================== #
+
+
+_WATERMARK_STATE_FILE = 'watermarks.json'
+
+# Tags restoring stored values that JSON cannot represent natively.
+_DECODERS: dict[str, Callable[[Any], Any]] = {
+    'date': date.fromisoformat,
+    'datetime': datetime.fromisoformat,
+    'decimal': Decimal,
+}
+
+
+# SECTION: INTERNAL FUNCTIONS =============================================== #
+
+
+def _decode(
+    entry: JSONDict,
+) -> Any:
+    """Return the watermark value stored in one state entry."""
+    value = entry.get('value')
+    if (decoder := _DECODERS.get(entry.get('type', ''))) is None:
+        return value
+    try:
+        return decoder(value)
+    except (TypeError, ValueError, ArithmeticError):
+        return value
+
+
+def _encode(
+    value: Any,
+) -> JSONDict:
+    """Return one JSON-safe state entry for a watermark value."""
+    if isinstance(value, datetime):
+        return {'value': value.isoformat(), 'type': 'datetime'}
+    if isinstance(value, date):
+        return {'value': value.isoformat(), 'type': 'date'}
+    if isinstance(value, Decimal):
+        return {'value': str(value), 'type': 'decimal'}
+    return {'value': value}
+
+
+def _instant(
+    value: date,
+) -> datetime:
+    """Return *value* as a naive UTC timestamp, dates at midnight."""
+    if not isinstance(value, datetime):
+        return datetime.combine(value, time.min)
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
+
+
+def _sort_key(
+    value: Any,
+) -> tuple[int, float | datetime | str]:
+    """Return a key ordering watermark values of mixed kinds."""
+    if isinstance(value, int | float | Decimal) and not isinstance(value, bool):
+        return (0, float(value))
+    if isinstance(value, date):
+        return (1, _instant(value))
+    text = str(value)
+    try:
+        return (0, float(text))
+    except ValueError:
+        pass
+    try:
+        return (1, _instant(datetime.fromisoformat(text)))
+    except ValueError:
+        return (2, text)
+
+
+# SECTION: CLASSES ========================================================== #
+
+
+class WatermarkStore:
+    """
+    Small JSON-backed store for per-job high-water marks.
+
+    Parameters
+    ----------
+    state_dir : Path
+        Local state directory, as resolved for run history.
+    """
+
+    # -- Magic Methods (Object Lifecycle) -- #
+
+    def __init__(
+        self,
+        state_dir: Path,
+    ) -> None:
+        self._state_dir = state_dir
+        self._state_file = state_dir / _WATERMARK_STATE_FILE
+        self._lock = Lock()
+
+    # -- Internal Instance Methods -- #
+
+    def _load(self) -> dict[str, JSONDict]:
+        if not self._state_file.exists():
+            return {}
+        try:
+            data = JsonCodec.parse(self._state_file.read_text(encoding='utf-8'))
+        except ValueError:
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        jobs = data.get('jobs')
+        if not isinstance(jobs, dict):
+            return {}
+        return {
+            key: value
+            for key, value in jobs.items()
+            if isinstance(key, str) and isinstance(value, dict)
+        }
+
+    # -- Instance Methods -- #
+
+    def get(
+        self,
+        key: str,
+        field: str,
+    ) -> Any | None:
+        """
+        Return the stored watermark of one job, if it tracks *field*.
+
+        Parameters
+        ----------
+        key : str
+            Job key, as returned by :meth:`WatermarkTracker.job_key`.
+        field : str
+            Watermark field the job currently declares. A mark recorded for
+            a different field is ignored.
+
+        Returns
+        -------
+        Any | None
+            Stored watermark value, or ``None`` when none applies.
+        """
+        entry = self._load().get(key)
+        if entry is None or entry.get('field') != field:
+            return None
+        return _decode(entry)
+
+    def set(
+        self,
+        key: str,
+        field: str,
+        value: Any,
+    ) -> None:
+        """
+        Persist the watermark of one job.
+
+        Parameters
+        ----------
+        key : str
+            Job key, as returned by :meth:`WatermarkTracker.job_key`.
+        field : str
+            Watermark field the value was read from.
+        value : Any
+            Highest *field* value loaded by the job.
+        """
+        # Jobs of one parallel run share the store; merge writes one by one.
+        with self._lock:
+            jobs = self._load()
+            jobs[key] = {
+                'field': field,
+                **_encode(value),
+                'updated_at': datetime.now(UTC).isoformat(),
+            }
+            self._state_dir.mkdir(parents=True, exist_ok=True)
+            self._state_file.write_text(
+                JsonCodec().serialize({'jobs': jobs}),
+                encoding='utf-8',
+            )
+
+
+@dataclass(slots=True)
+class WatermarkTracker:
+    """
+    Watermark state for one incremental job run.
+
+    Attributes
+    ----------
+    store : WatermarkStore
+        Store the watermark is read from and committed to.
+    key : str
+        Store key of the job.
+    field : str
+        Record field holding the watermark.
+    param : str
+        Query parameter carrying :attr:`start` to API sources.
+    start : Any | None
+        Watermark of the previous run; only records above it are new.
+    high : Any | None
+        Highest watermark value extracted so far, starting at
+        :attr:`start`.
+    """
+
+    # -- Instance Attributes -- #
+
+    store: WatermarkStore
+    key: str
+    field: str
+    param: str
+    start: Any | None = None
+    high: Any | None = None
+
+    # -- Class Methods -- #
+
+    @classmethod
+    def load(
+        cls,
+        store: WatermarkStore,
+        key: str,
+        *,
+        field: str,
+        param: str | None = None,
+        initial: Any | None = None,
+    ) -> Self:
+        """
+        Return a tracker starting from the stored watermark of one job.
+
+        Parameters
+        ----------
+        store : WatermarkStore
+            Store holding the job's watermark.
+        key : str
+            Store key of the job.
+        field : str
+            Record field holding the watermark.
+        param : str | None, optional
+            Query parameter for API sources. Defaults to *field*.
+        initial : Any | None, optional
+            Watermark used when the store has none for the job.
+
+        Returns
+        -------
+        Self
+            Tracker whose :attr:`start` is the stored or initial watermark.
+        """
+        start = store.get(key, field)
+        if start is None:
+            start = initial
+        return cls(
+            store=store,
+            key=key,
+            field=field,
+            param=param or field,
+            start=start,
+            high=start,
+        )
+
+    # -- Static Methods -- #
+
+    @staticmethod
+    def job_key(
+        pipeline: str | None,
+        job: str,
+    ) -> str:
+        """Return the store key of *job*, scoped to its pipeline name."""
+        return f'{pipeline}/{job}' if pipeline else job
+
+    # -- Instance Methods -- #
+
+    def commit(self) -> None:
+        """Persist :attr:`high` when this run moved the watermark."""
+        if self.high is not None and self.high != self.start:
+            self.store.set(self.key, self.field, self.high)
+
+    def track(
+        self,
+        batches: Iterable[JSONList],
+    ) -> Iterator[JSONList]:
+        """Yield the new records of each batch, advancing :attr:`high`."""
+        for batch in batches:
+            yield self.observe(self.newer(batch))
+
+    def newer(
+        self,
+        records: JSONList,
+    ) -> JSONList:
+        """
+        Return the records whose watermark is above :attr:`start`.
+
+        Once a watermark exists, records without the field are dropped, as
+        a SQL ``field > :watermark`` filter drops ``NULL`` values; they
+        cannot be placed and would otherwise load again on every run.
+        """
+        if self.start is None:
+            return records
+        start = _sort_key(self.start)
+        return [
+            record
+            for record in records
+            if (value := record.get(self.field)) is not None
+            and _sort_key(value) > start
+        ]
+
+    def observe(
+        self,
+        records: JSONList,
+    ) -> JSONList:
+        """
+        Advance :attr:`high` past *records* and return them unchanged.
+
+        Raises
+        ------
+        ValueError
+            If *records* is not empty and no record seen so far carries
+            :attr:`field`, since the mark could never advance and every run
+            would reload the whole source.
+        """
+        values = [
+            value for record in records if (value := record.get(self.field)) is not None
+        ]
+        if self.high is not None:
+            values.append(self.high)
+        if values:
+            self.high = max(values, key=_sort_key)
+        elif records:
+            raise ValueError(
+                f'Incremental field {self.field!r} is missing from every '
+                'extracted record; the watermark cannot advance',
+            )
+        return records
+
+    def start_text(self) -> Any | None:
+        """Return :attr:`start` as a JSON value, dates as ISO 8601 text."""
+        return _encode(self.start)['value']
+
+    def summary(self) -> JSONDict:
+        """Return the watermark movement of this run."""
+        return {
+            'field': self.field,
+            'previous': _encode(self.start)['value'],
+            'current': _encode(self.high)['value'],
+        }
@@ -6,6 +6,7 @@ Helpers to extract data from files, databases, and REST APIs.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from collections.abc import Mapping
 from typing import Any
 from typing import cast
@@ -25,11 +26,14 @@ from ..file._core import FileFormatArg
 from ..file.base import ReadOptions
 from ..utils import FloatParser
 from ..utils._types import JSONData
+from ..utils._types import JSONDict
 from ..utils._types import JSONList
 from ..utils._types import StrPath
 from ..utils._types import Timeout
-from ._database import DATABASE_DRIVER_NOTE
-from ._database import DATABASE_EXTRACT_NOT_IMPLEMENTED
+from ._database import DEFAULT_DATABASE_FETCH_SIZE
+from ._database import DEFAULT_DATABASE_PARTITIONS
+from ._database import iter_database_batches
+from ._database import iter_partitioned_batches
 from ._files import resolve_file
 from ._http import DirectRequestEnvDict
 from ._http import build_direct_request_env
@@ -49,6 +53,9 @@ __all__ = [
     'extract_from_api',
     'extract_from_database',
     'extract_from_file',
+    'extract_database_batches',
+    'extract_file_batches',
+    'extract_file_table',
 ]
 
 
@@ -305,31 +312,80 @@ def extract_from_api_source(
 
 def extract_from_database(
     connection_string: str,
+    query: str | None = None,
+    *,
+    table: str | None = None,
+    schema: str | None = None,
+    params: Mapping[str, Any] | None = None,
+    fetch_size: int = DEFAULT_DATABASE_FETCH_SIZE,
+    partition_column: str | None = None,
+    partitions: int = DEFAULT_DATABASE_PARTITIONS,
+    lower_bound: Any | None = None,
+    upper_bound: Any | None = None,
+    preserve_order: bool = True,
+    partition_stats: list[JSONDict] | None = None,
+    watermark_column: str | None = None,
+    watermark: Any | None = None,
 ) -> JSONList:
     """
-    Extract data from a database.
-
-    Notes
-    -----
-    Placeholder implementation. To enable database extraction, install and
-    configure database-specific drivers and query logic.
+    Extract the rows of one query or table from a database.
 
     Parameters
     ----------
     connection_string : str
-        Database connection string.
+        SQLAlchemy database URL.
+    query : str | None, optional
+        Raw SQL query; ``:name`` placeholders are bound from *params*.
+    table : str | None, optional
+        Table to read in full when *query* is omitted.
+    schema : str | None, optional
+        Schema qualifying *table*.
+    params : Mapping[str, Any] | None, optional
+        Bind parameters for *query*.
+    fetch_size : int, optional
+        Rows fetched from the server per round trip.
+    partition_column : str | None, optional
+        Numeric column whose value ranges are read concurrently. Reads one
+        cursor when omitted.
+    partitions : int, optional
+        Number of ranges to split a partitioned read into.
+    lower_bound : Any | None, optional
+        Lowest *partition_column* value used to place range boundaries.
+    upper_bound : Any | None, optional
+        Highest *partition_column* value used to place range boundaries.
+    preserve_order : bool, optional
+        Whether partitioned reads keep ranges in ascending order.
+    partition_stats : list[JSONDict] | None, optional
+        List that receives one timing entry per partition read.
+    watermark_column : str | None, optional
+        Column compared against *watermark* by incremental reads.
+    watermark : Any | None, optional
+        Only rows whose *watermark_column* is greater are read.
 
     Returns
     -------
     JSONList
-        Informational message payload.
+        Row mappings in result order.
     """
     return [
-        {
-            'message': DATABASE_EXTRACT_NOT_IMPLEMENTED,
-            'connection_string': connection_string,
-            'note': DATABASE_DRIVER_NOTE,
-        },
+        record
+        for batch in extract_database_batches(
+            connection_string,
+            query,
+            table=table,
+            schema=schema,
+            params=params,
+            batch_size=fetch_size,
+            partition_column=partition_column,
+            partitions=partitions,
+            lower_bound=lower_bound,
+            upper_bound=upper_bound,
+            preserve_order=preserve_order,
+            partition_stats=partition_stats,
+            watermark_column=watermark_column,
+            watermark=watermark,
+        )
+        for record in batch
     ]
 
 
@@ -371,6 +427,188 @@ def extract_from_file(
     )
 
 
+def extract_database_batches(
+    connection_string: str,
+    query: str | None = None,
+    *,
+    table: str | None = None,
+    schema: str | None = None,
+    params: Mapping[str, Any] | None = None,
+    batch_size: int,
+    partition_column: str | None = None,
+    partitions: int = DEFAULT_DATABASE_PARTITIONS,
+    lower_bound: Any | None = None,
+    upper_bound: Any | None = None,
+    preserve_order: bool = True,
+    partition_stats: list[JSONDict] | None = None,
+    watermark_column: str | None = None,
+    watermark: Any | None = None,
+) -> Iterator[JSONList]:
+    """
+    Extract the rows of one query or table as consecutive record batches.
+
+    Parameters
+    ----------
+    connection_string : str
+        SQLAlchemy database URL.
+    query : str | None, optional
+        Raw SQL query; ``:name`` placeholders are bound from *params*.
+    table : str | None, optional
+        Table to read in full when *query* is omitted.
+    schema : str | None, optional
+        Schema qualifying *table*.
+    params : Mapping[str, Any] | None, optional
+        Bind parameters for *query*.
+    batch_size : int
+        Rows fetched per round trip and per yielded batch.
+    partition_column : str | None, optional
+        Numeric column whose value ranges are read concurrently. Reads one
+        cursor when omitted.
+    partitions : int, optional
+        Number of ranges to split a partitioned read into.
+    lower_bound : Any | None, optional
+        Lowest *partition_column* value used to place range boundaries.
+        Discovered with ``min()`` when omitted.
+    upper_bound : Any | None, optional
+        Highest *partition_column* value used to place range boundaries.
+        Discovered with ``max()`` when omitted.
+    preserve_order : bool, optional
+        Whether partitioned reads yield ranges in ascending order rather
+        than as their batches arrive.
+    partition_stats : list[JSONDict] | None, optional
+        List that receives one timing entry per partition read.
+    watermark_column : str | None, optional
+        Column compared against *watermark* by incremental reads.
+    watermark : Any | None, optional
+        Only rows whose *watermark_column* is greater are read; the filter
+        runs in the database.
+
+    Yields
+    ------
+    JSONList
+        Record batches in result order.
+
+    Raises
+    ------
+    ValueError
+        If neither *query* nor *table* is provided, or partition bounds are
+        not numbers.
+
+    Notes
+    -----
+    Rows are streamed with SQLAlchemy ``stream_results``/``yield_per``, so
+    dialects with server-side cursors hold at most one batch in memory.
+    Partitioned reads run each range on its own pooled connection of one
+    shared engine.
+    """
+    if partition_column:
+        yield from iter_partitioned_batches(
+            connection_string,
+            partition_column=partition_column,
+            partitions=partitions,
+            query=query,
+            table=table,
+            schema=schema,
+            params=params,
+            lower_bound=lower_bound,
+            upper_bound=upper_bound,
+            preserve_order=preserve_order,
+            fetch_size=batch_size,
+            partition_stats=partition_stats,
+            watermark_column=watermark_column,
+            watermark=watermark,
+        )
+        return
+    yield from iter_database_batches(
+        connection_string,
+        query=query,
+        table=table,
+        schema=schema,
+        params=params,
+        fetch_size=batch_size,
+        watermark_column=watermark_column,
+        watermark=watermark,
+    )
+
+
+def extract_file_batches(
+    file_path: StrPath,
+    file_format: FileFormatArg = FileFormat.JSON,
+    options: FileOptionsArg[ReadOptions] = None,
+    *,
+    batch_size: int,
+) -> Iterator[JSONList]:
+    """
+    Extract records from a file as consecutive record batches.
+
+    Parameters
+    ----------
+    file_path : StrPath
+        Source local file path or remote URI.
+    file_format : FileFormatArg, optional
+        File format to parse. If ``None``, infer from the filename
+        extension.
+    options : FileOptionsArg[ReadOptions], optional
+        Optional file-read options such as ``encoding`` plus format-specific
+        extras like ``delimiter``.
+    batch_size : int
+        Maximum number of records per yielded batch.
+
+    Yields
+    ------
+    JSONList
+        Record batches in file order.
+
+    Notes
+    -----
+    Formats with native incremental readers (delimited text, NDJSON, JSON
+    arrays, Parquet, Arrow, and Avro) never hold more than one batch in
+    memory; other formats are parsed in full and then sliced.
+    """
+    source = resolve_file(
+        file_path,
+        file_format,
+        file_cls=File,
+    )
+    yield from source.file.read_iter(
+        batch_size=batch_size,
+        options=_coerce_read_options(options),
+    )
+
+
+def extract_file_table(
+    file_path: StrPath,
+    file_format: FileFormatArg = FileFormat.JSON,
+    options: FileOptionsArg[ReadOptions] = None,
+) -> Any:
+    """
+    Extract a file as a ``pyarrow.Table`` for the columnar transform engine.
+
+    Parameters
+    ----------
+    file_path : StrPath
+        Source local file path or remote URI.
+    file_format : FileFormatArg, optional
+        File format to parse. If ``None``, infer from the filename
+        extension.
+    options : FileOptionsArg[ReadOptions], optional
+        Optional file-read options such as ``encoding`` plus format-specific
+        extras like ``delimiter``.
+
+    Returns
+    -------
+    Any
+        ``pyarrow.Table`` holding the file contents. Arrow, Feather, ORC, and
+        Parquet files are read without building row records.
+    """
+    source = resolve_file(
+        file_path,
+        file_format,
+        file_cls=File,
+    )
+    return source.file.read_arrow(options=_coerce_read_options(options))
+
+
 # -- Orchestration -- #
 
 
@@ -411,7 +649,7 @@ def extract(
             # Prefer explicit format if provided, else infer from filename.
             return extract_from_file(source, file_format, file_options)
         case DataConnectorType.DATABASE:
-            return extract_from_database(str(source))
+            return extract_from_database(str(source), **kwargs)
         case DataConnectorType.API:
             # API extraction always uses an HTTP method; default is GET.
             # ``file_format`` is ignored for APIs.
@@ -8,6 +8,8 @@ from __future__ import annotations
 
 import json
 import sys
+from collections.abc import Iterable
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -23,9 +25,10 @@ from ..storage import StorageLocation
 from ..utils import count_records
 from ..utils._types import JSONData
 from ..utils._types import JSONDict
+from ..utils._types import JSONList
 from ..utils._types import StrPath
-from ._database import DATABASE_DRIVER_NOTE
-from ._database import DATABASE_LOAD_NOT_IMPLEMENTED
+from ._database import DEFAULT_DATABASE_BATCH_SIZE
+from ._database import load_database_batches
 from ._files import resolve_file
 from ._http import DirectRequestEnvDict
 from ._http import build_direct_request_env
@@ -43,6 +46,8 @@ from ._types import FileOptionsArg
 __all__ = [
     # Functions
     'load',
+    'load_batches_to_database',
+    'load_batches_to_file',
     'load_data',
     'load_to_api',
     'load_to_database',
@@ -270,41 +275,181 @@ def load_to_api_target(
     return _load_to_api_env(data, env)
 
 
-def load_to_database(
-    data: JSONData,
+def load_batches_to_database(
+    batches: Iterable[JSONList],
     connection_string: str,
+    *,
+    table: str | None = None,
+    schema: str | None = None,
+    mode: str | None = None,
+    keys: Iterable[str] | None = None,
+    batch_size: int | None = None,
 ) -> JSONDict:
     """
-    Load data to a database.
-
-    Notes
-    -----
-    Placeholder implementation. To enable database loading, install and
-    configure database-specific drivers and query logic.
+    Write consecutive record batches into one database table.
 
     Parameters
     ----------
-    data : JSONData
-        Data to load.
+    batches : Iterable[JSONList]
+        Record batches to write, in output order.
     connection_string : str
-        Database connection string.
+        SQLAlchemy database URL.
+    table : str | None, optional
+        Target table, optionally qualified as ``schema.table``. Missing
+        tables are created from the first batch.
+    schema : str | None, optional
+        Schema qualifying *table*.
+    mode : str | None, optional
+        ``'append'`` (default), ``'replace'``, or ``'upsert'``.
+    keys : Iterable[str] | None, optional
+        Key columns matched by ``upsert`` loads.
+    batch_size : int | None, optional
+        Rows written per statement. Defaults to
+        :data:`etlplus.ops._database.DEFAULT_DATABASE_BATCH_SIZE`.
 
     Returns
     -------
     JSONDict
-        Result object describing the operation.
+        Result dictionary with status, record count, write method, and
+        throughput in ``rows_per_second``.
+    """
+    result = load_database_batches(
+        batches,
+        connection_string,
+        table=table,
+        schema=schema,
+        mode=mode,
+        keys=keys,
+        batch_size=batch_size or DEFAULT_DATABASE_BATCH_SIZE,
+    )
+    return {
+        **result,
+        'message': f'Data loaded to {result["table"]}',
+    }
+
+
+def load_batches_to_file(
+    batches: Iterable[JSONList],
+    file_path: StrPath,
+    file_format: FileFormatArg = None,
+    options: FileOptionsArg[WriteOptions] = None,
+) -> JSONDict:
     """
-    records = count_records(data)
+    Persist consecutive record batches to one local file path or remote URI.
+
+    Parameters
+    ----------
+    batches : Iterable[JSONList]
+        Record batches to write, in output order.
+    file_path : StrPath
+        Target local file path or remote URI.
+    file_format : FileFormatArg, optional
+        Output format. If omitted (None), the format is inferred from the
+        filename extension.
+    options : FileOptionsArg[WriteOptions], optional
+        Optional file-write options such as ``encoding`` plus format-specific
+        extras like ``delimiter``.
+
+    Returns
+    -------
+    JSONDict
+        Result dictionary with status, record count, and batch count.
+
+    Notes
+    -----
+    Formats with native incremental writers (delimited text, NDJSON, JSON
+    arrays, Parquet, Arrow, and Avro) write each batch as it arrives; other
+    formats gather every batch and write one document.
+    """
+    target_label = str(file_path)
+    target = resolve_file(
+        file_path,
+        file_format,
+        inferred_default=FileFormat.JSON,
+        file_cls=File,
+    )
+    batch_count = 0
+
+    def _counted() -> Iterator[JSONList]:
+        nonlocal batch_count
+        for batch in batches:
+            batch_count += 1
+            yield batch
+
+    records = target.file.write_iter(
+        _counted(),
+        options=_coerce_write_options(options),
+    )
+    message = (
+        'No data to write'
+        if target.file_format is FileFormat.CSV and records == 0
+        else f'Data loaded to {target_label}'
+    )
 
     return {
-        'status': 'not_implemented',
-        'message': DATABASE_LOAD_NOT_IMPLEMENTED,
-        'connection_string': connection_string,
+        'status': 'success',
+        'message': message,
         'records': records,
-        'note': DATABASE_DRIVER_NOTE,
+        'batches': batch_count,
     }
 
 
+def load_to_database(
+    data: JSONData,
+    connection_string: str,
+    *,
+    table: str | None = None,
+    schema: str | None = None,
+    mode: str | None = None,
+    keys: Iterable[str] | None = None,
+    batch_size: int | None = None,
+) -> JSONDict:
+    """
+    Load data into one database table.
+
+    Parameters
+    ----------
+    data : JSONData
+        Record or records to load.
+    connection_string : str
+        SQLAlchemy database URL.
+    table : str | None, optional
+        Target table, optionally qualified as ``schema.table``.
+    schema : str | None, optional
+        Schema qualifying *table*.
+    mode : str | None, optional
+        ``'append'`` (default), ``'replace'``, or ``'upsert'``.
+    keys : Iterable[str] | None, optional
+        Key columns matched by ``upsert`` loads.
+    batch_size : int | None, optional
+        Rows written per statement.
+
+    Returns
+    -------
+    JSONDict
+        Result dictionary with status, record count, and throughput.
+
+    Raises
+    ------
+    ValueError
+        If *table* is missing, *mode* is unknown, or an upsert has no *keys*.
+
+    Notes
+    -----
+    See :mod:`etlplus.ops._database` for the dialect-specific write paths.
+    """
+    records = data if isinstance(data, list) else [data]
+    return load_batches_to_database(
+        [records],
+        connection_string,
+        table=table,
+        schema=schema,
+        mode=mode,
+        keys=keys,
+        batch_size=batch_size,
+    )
+
+
 def load_to_file(
     data: JSONData,
     file_path: StrPath,
@@ -405,7 +550,7 @@ def load(
             # Prefer explicit format if provided, else infer from filename.
             return load_to_file(data, target, file_format, file_options)
         case DataConnectorType.DATABASE:
-            return load_to_database(data, str(target))
+            return load_to_database(data, str(target), **kwargs)
         case DataConnectorType.API:
             api_method = method if method is not None else HttpMethod.POST
             return load_to_api(
@@ -6,6 +6,10 @@ A module for running ETL jobs defined in YAML configurations.
 
 from __future__ import annotations
 
+import os
+from collections.abc import Hashable
+from collections.abc import Iterable
+from collections.abc import Iterator
 from collections.abc import Mapping
 from concurrent.futures import FIRST_COMPLETED
 from concurrent.futures import Future
@@ -13,9 +17,13 @@ from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures import wait
 from dataclasses import dataclass
 from dataclasses import field
+from dataclasses import replace
 from datetime import UTC
 from datetime import datetime
+from functools import partial
+from itertools import chain
 from pathlib import Path
+from threading import Lock
 from time import perf_counter
 from time import sleep
 from typing import Any
@@ -24,30 +32,53 @@ from typing import Self
 from typing import cast
 from typing import overload
 
+from sqlalchemy.exc import SQLAlchemyError
+
 from .._config import Config
 from ..api import HttpMethod
 from ..connector import DataConnectorType
 from ..file._core import FileFormatArg
+from ..history._config import ResolvedHistoryConfig
 from ..utils import FloatParser
 from ..utils import IntParser
 from ..utils import JsonCodec
 from ..utils import MappingParser
 from ..utils._types import JSONData
 from ..utils._types import JSONDict
+from ..utils._types import JSONList
 from ..utils._types import StrPath
 from ..workflow import topological_sort_jobs
+from ._arrow import table_to_records
+from ._batches import iter_record_batches
+from ._enums import TransformEngine
+from ._quarantine import QuarantineWriter
 from ._types import DataSourceArg
 from ._types import OptionalConnectorTypeArg
 from ._types import OptionalPathArg
 from ._types import PipelineConfig
+from ._validation import ValidateFn
 from ._validation import ValidationResultDict
+from ._validation import ValidationSettings
 from ._validation import maybe_validate
+from ._watermarks import WatermarkStore
+from ._watermarks import WatermarkTracker
 from .extract import extract
+from .extract import extract_database_batches
+from .extract import extract_file_batches
+from .extract import extract_file_table
 from .extract import extract_from_api_source
 from .load import load
+from .load import load_batches_to_database
+from .load import load_batches_to_file
 from .load import load_to_api_target
+from .transform import TransformPlan
+from .transform import compile_pipeline
 from .transform import transform
+from .validate import DEFAULT_ERROR_SAMPLES
+from .validate import CompiledRules
 from .validate import FieldRulesDict
+from .validate import ValidationReport
+from .validate import compile_rules
 from .validate import validate
 
 # SECTION: EXPORTS ========================================================== #
@@ -63,18 +94,53 @@ __all__ = [
 # SECTION: INTERNALCONSTANTS ================================================ #
 
 
+# Source keys forwarded to database extraction, from overrides or connector.
+_DATABASE_SOURCE_KEYS: Final[tuple[str, ...]] = (
+    'query',
+    'table',
+    'schema',
+    'params',
+    'fetch_size',
+    'partition_column',
+    'partitions',
+    'lower_bound',
+    'upper_bound',
+    'preserve_order',
+    'watermark_column',
+    'watermark',
+)
+
+# Target keys forwarded to database loads, from overrides or connector.
+_DATABASE_TARGET_KEYS: Final[tuple[str, ...]] = (
+    'table',
+    'schema',
+    'mode',
+    'keys',
+    'batch_size',
+)
+
 _JOB_EXECUTION_EXCEPTIONS: Final[tuple[type[Exception], ...]] = (
     KeyError,
     OSError,
     RuntimeError,
+    SQLAlchemyError,
     ValueError,
 )
 
+# Blocking transform steps that streaming jobs run with bounded memory.
+_STREAMING_STEPS: Final[frozenset[str]] = frozenset({'sort', 'top_n'})
+
+# Compiled transform plans kept across runs, least recently used first.
+_TRANSFORM_PLAN_CACHE_SIZE: Final[int] = 32
+_TRANSFORM_PLANS: Final[dict[Hashable, TransformPlan]] = {}
+_TRANSFORM_PLANS_LOCK: Final[Lock] = Lock()
+
 
 # SECTION: CONSTANTS ======================================================== #
 
 
 DEFAULT_CONFIG_PATH: Final[str] = 'in/pipeline.yml'
+DEFAULT_STREAMING_BATCH_SIZE: Final[int] = 10_000
 
 
 # SECTION: INTERNAL DATA CLASSES ============================================ #
@@ -119,7 +185,20 @@ class _JobExecutionOutcome:
 
 @dataclass(frozen=True, slots=True)
 class _JobValidationConfig:
-    """Normalized per-job validation settings."""
+    """
+    Normalized per-job validation settings.
+
+    Setting ``max_errors`` or ``max_samples`` switches to bounded validation:
+    each payload or batch is tallied into one :class:`ValidationReport` per
+    phase, so failures only carry counts and sample errors, and ``error``
+    severity tolerates up to ``max_errors`` errors (default ``0``) before
+    failing.
+
+    ``quarantine`` severity always keeps a report. Invalid records are
+    streamed to :attr:`writer` and only valid records continue; the job
+    fails only once more than ``max_errors`` errors (default unlimited) have
+    been seen.
+    """
 
     # -- Instance Attributes -- #
 
@@ -127,6 +206,21 @@ class _JobValidationConfig:
     rules: Mapping[str, Any]
     severity: str
     phase: str
+    compiled: CompiledRules | None = None
+    max_errors: int | None = None
+    max_samples: int | None = None
+    quarantine: str | None = None
+    writer: QuarantineWriter | None = None
+    reports: dict[str, ValidationReport] = field(default_factory=dict)
+
+    # -- Instance Properties -- #
+
+    @property
+    def bounded(self) -> bool:
+        """Return whether validation keeps a bounded report per phase."""
+        return self.compiled is not None and (
+            self.max_errors is not None or self.max_samples is not None
+        )
 
     # -- Class Methods -- #
 
@@ -153,12 +247,21 @@ class _JobValidationConfig:
         )
         if not isinstance(rules, Mapping):
             rules = {}
+        try:
+            compiled = compile_rules(cast(Mapping[str, FieldRulesDict], rules))
+        except TypeError:
+            # Malformed rulesets keep failing when validation runs.
+            compiled = None
 
         return cls(
             enabled=True,
             rules=dict(rules),
             severity=(val_ref.severity or 'error').lower(),
             phase=(val_ref.phase or 'before_transform').lower(),
+            compiled=compiled,
+            max_errors=getattr(val_ref, 'max_errors', None),
+            max_samples=getattr(val_ref, 'max_samples', None),
+            quarantine=getattr(val_ref, 'quarantine', None),
         )
 
     # -- Instance Methods -- #
@@ -170,6 +273,22 @@ class _JobValidationConfig:
         when: str,
     ) -> JSONData:
         """Validate one pipeline payload for the requested phase."""
+        validate_fn: ValidateFn = _validate_payload
+        if self.compiled is not None and self.writer is not None:
+            validate_fn = partial(
+                _validate_quarantine_payload,
+                self.compiled,
+                self._report(when),
+                self.writer,
+            )
+        elif self.compiled is not None and self.bounded:
+            validate_fn = partial(
+                _validate_bounded_payload,
+                self.compiled,
+                self._report(when),
+            )
+        elif self.compiled is not None:
+            validate_fn = partial(_validate_compiled_payload, self.compiled)
         return maybe_validate(
             data,
             when,
@@ -177,10 +296,72 @@ class _JobValidationConfig:
             rules=self.rules,
             phase=self.phase,
             severity=self.severity,
-            validate_fn=_validate_payload,
+            validate_fn=validate_fn,
             print_json_fn=JsonCodec(pretty=True).print,
         )
 
+    def runs(
+        self,
+        when: str,
+    ) -> bool:
+        """Return whether validation runs for the requested phase."""
+        return ValidationSettings.from_raw(
+            enabled=self.enabled,
+            rules=self.rules,
+            phase=self.phase,
+            window=when,
+            severity=self.severity,
+        ).should_run()
+
+    def close(self) -> None:
+        """Finish writing quarantined records, if any were configured."""
+        if self.writer is not None:
+            self.writer.close()
+
+    def with_summary(
+        self,
+        result: JSONDict,
+    ) -> JSONDict:
+        """
+        Attach bounded validation summaries, keyed by phase, to *result*.
+
+        The quarantine writer is closed first, and its load result is added
+        under ``quarantine``.
+        """
+        if not self.reports and self.writer is None:
+            return result
+        summary: JSONDict = {
+            when: report.summary() for when, report in self.reports.items()
+        }
+        if self.writer is not None:
+            summary['quarantine'] = self.writer.close()
+        return {**result, 'validation': summary}
+
+    # -- Internal Instance Methods -- #
+
+    def _report(
+        self,
+        when: str,
+    ) -> ValidationReport:
+        """Return the bounded report for one phase, creating it on first use."""
+        if (report := self.reports.get(when)) is None:
+            # ``error`` tolerates no errors by default; ``warn`` never fails.
+            budget = None
+            if self.severity == 'error':
+                budget = self.max_errors or 0
+            elif self.severity == 'quarantine':
+                budget = self.max_errors
+            report = ValidationReport(
+                max_samples=(
+                    DEFAULT_ERROR_SAMPLES
+                    if self.max_samples is None
+                    else self.max_samples
+                ),
+                max_errors=budget,
+            )
+            self.reports[when] = report
+        return report
+
 
 @dataclass(frozen=True, slots=True)
 class _ResolvedJobConnector:
@@ -214,6 +395,16 @@ class _ResolvedJobRetry:
         return self.max_attempts > 1
 
 
+@dataclass(frozen=True, slots=True)
+class _ResolvedJobStreaming:
+    """Normalized streaming controls for one job execution."""
+
+    # -- Instance Attributes -- #
+
+    enabled: bool = False
+    batch_size: int = DEFAULT_STREAMING_BATCH_SIZE
+
+
 @dataclass(frozen=True, slots=True)
 class _RunContext:
     """Resolved config and connector indexes used across one run."""
@@ -223,6 +414,37 @@ class _RunContext:
     cfg: Any
     sources_by_name: dict[str, Any]
     targets_by_name: dict[str, Any]
+    watermarks: WatermarkStore
+
+    # -- Instance Methods -- #
+
+    def watermark(
+        self,
+        job_obj: Any,
+    ) -> WatermarkTracker | None:
+        """Return the watermark tracker of an incremental job, if any."""
+        extract_cfg = getattr(job_obj, 'extract', None)
+        if (incremental := getattr(extract_cfg, 'incremental', None)) is None:
+            return None
+        return WatermarkTracker.load(
+            self.watermarks,
+            WatermarkTracker.job_key(
+                getattr(self.cfg, 'name', None),
+                _require_job_name(job_obj),
+            ),
+            field=incremental.field,
+            param=incremental.param,
+            initial=incremental.initial,
+        )
+
+    def transform_plan(
+        self,
+        job_obj: Any,
+    ) -> TransformPlan | None:
+        """Return the compiled transform plan for a job, reusing prior ones."""
+        if (operations := _resolve_transform_ops(self.cfg, job_obj)) is None:
+            return None
+        return _transform_plan(operations)
 
     # -- Class Methods -- #
 
@@ -242,6 +464,7 @@ class _RunContext:
                 list(getattr(cfg, 'targets', []) or []),
                 label='target',
             ),
+            watermarks=WatermarkStore(_state_dir(cfg)),
         )
 
 
@@ -535,14 +758,14 @@ def _job_dependencies(
     return [dep for dep in depends_on if isinstance(dep, str)]
 
 
-def _job_retry_value(
-    retry_obj: object,
+def _job_policy_value(
+    policy_obj: object,
     field_name: str,
 ) -> object:
-    """Return one retry field from a mapping-like or object payload."""
-    if isinstance(retry_obj, Mapping):
-        return retry_obj.get(field_name)
-    return getattr(retry_obj, field_name, None)
+    """Return one policy field from a mapping-like or object payload."""
+    if isinstance(policy_obj, Mapping):
+        return policy_obj.get(field_name)
+    return getattr(policy_obj, field_name, None)
 
 
 def _job_retry_settings(
@@ -554,12 +777,12 @@ def _job_retry_settings(
         return _ResolvedJobRetry()
     return _ResolvedJobRetry(
         max_attempts=IntParser.positive(
-            _job_retry_value(retry_obj, 'max_attempts'),
+            _job_policy_value(retry_obj, 'max_attempts'),
             default=1,
         ),
         backoff_seconds=(
             FloatParser.parse(
-                _job_retry_value(retry_obj, 'backoff_seconds'),
+                _job_policy_value(retry_obj, 'backoff_seconds'),
                 default=0.0,
                 minimum=0.0,
             )
@@ -568,6 +791,70 @@ def _job_retry_settings(
     )
 
 
+def _job_validation(
+    context: _RunContext,
+    job_obj: Any,
+) -> _JobValidationConfig:
+    """
+    Return validation settings for one job, with its quarantine writer.
+
+    Raises
+    ------
+    ValueError
+        If ``quarantine`` severity lacks a file target to write to.
+    """
+    validation = _JobValidationConfig.from_job(job_obj, context.cfg)
+    if validation.severity != 'quarantine' or not validation.enabled:
+        return validation
+    if not validation.quarantine:
+        raise ValueError('Quarantine validation requires a "quarantine" target')
+    target = _resolve_job_connector(
+        context.targets_by_name,
+        ref_name=validation.quarantine,
+        label='quarantine target',
+        overrides=None,
+        missing_path_message='Quarantine target missing "path"',
+    )
+    if not _is_file_connector_type(target.connector_type):
+        raise ValueError('Quarantine target must be a file target')
+    return replace(
+        validation,
+        writer=QuarantineWriter(
+            target.value,
+            target.file_format,
+            target.options or None,
+        ),
+    )
+
+
+def _job_streaming_settings(
+    cfg: Any,
+    job_obj: Any,
+) -> _ResolvedJobStreaming:
+    """
+    Return normalized streaming settings for one job-like object.
+
+    A job-level ``streaming`` policy wins over the config-wide
+    ``profile.streaming`` default. Plain booleans toggle streaming with the
+    default batch size.
+    """
+    streaming_obj = getattr(job_obj, 'streaming', None)
+    if streaming_obj is None:
+        streaming_obj = getattr(getattr(cfg, 'profile', None), 'streaming', None)
+    if streaming_obj is None:
+        return _ResolvedJobStreaming()
+    if isinstance(streaming_obj, bool):
+        return _ResolvedJobStreaming(enabled=streaming_obj)
+    enabled = _job_policy_value(streaming_obj, 'enabled')
+    return _ResolvedJobStreaming(
+        enabled=True if enabled is None else bool(enabled),
+        batch_size=IntParser.positive(
+            _job_policy_value(streaming_obj, 'batch_size'),
+            default=DEFAULT_STREAMING_BATCH_SIZE,
+        ),
+    )
+
+
 def _job_retry_summary(
     *,
     attempts: list[JSONDict],
@@ -752,40 +1039,293 @@ def _run_job_config(
     job_obj: Any,
 ) -> JSONDict:
     """Execute one configured job object against an already-loaded config."""
-    data = _extract_job_data(context, job_obj)
-    validation = _JobValidationConfig.from_job(job_obj, context.cfg)
-    data = validation.apply(data, when='before_transform')
-    data = _apply_operations(
-        data,
-        _resolve_transform_ops(context.cfg, job_obj),
+    streaming = _job_streaming_settings(context.cfg, job_obj)
+    if streaming.enabled:
+        return _run_job_streaming(
+            context,
+            job_obj,
+            batch_size=streaming.batch_size,
+        )
+
+    plan = context.transform_plan(job_obj)
+    watermark = context.watermark(job_obj)
+    _check_incremental_plan(plan, watermark)
+    validation = _job_validation(context, job_obj)
+    partition_stats: list[JSONDict] = []
+    try:
+        table = (
+            None
+            if watermark is not None
+            else _extract_job_table(context, job_obj, plan, validation)
+        )
+        if plan is not None and table is not None:
+            # Columnar pipelines only materialize records after the transform.
+            result = plan.apply_table(table)
+            data = result if isinstance(result, dict) else table_to_records(result)
+        else:
+            data = _extract_job_data(
+                context,
+                job_obj,
+                partition_stats=partition_stats,
+                watermark=watermark,
+            )
+            data = validation.apply(data, when='before_transform')
+            data = _apply_operations(data, plan)
+        data = validation.apply(data, when='after_transform')
+        loaded = _load_job_result(context, job_obj, data)
+    finally:
+        validation.close()
+    loaded = _with_watermark(loaded, watermark)
+    return _with_partition_stats(validation.with_summary(loaded), partition_stats)
+
+
+def _run_job_streaming(
+    context: _RunContext,
+    job_obj: Any,
+    *,
+    batch_size: int,
+) -> JSONDict:
+    """
+    Execute one job by pushing bounded record batches through each stage.
+
+    Row-wise transform steps run per batch. ``top_n`` keeps a bounded heap
+    and ``sort`` runs as one external merge sort over the processed batches,
+    so memory stays bounded rather than growing with the dataset. ``limit``
+    stops extraction once enough records have been produced. ``aggregate``,
+    ``group_by``, and ``sql`` need the full dataset before emitting their
+    first row and are rejected.
+    """
+    plan = context.transform_plan(job_obj)
+    blocked = plan.blocking_steps if plan is not None else ()
+    if unsupported := [step for step in blocked if step not in _STREAMING_STEPS]:
+        raise ValueError(
+            'Streaming execution does not support transform steps: '
+            + ', '.join(unsupported),
+        )
+    batch_plan = plan
+    if blocked and plan is not None and plan.engine is TransformEngine.PYTHON:
+        # Python plans only hold top_n/sort batch steps here; defer them all,
+        # and the limit with them, so it applies after the global ordering.
+        batch_plan = replace(plan, batch_steps=(), limit=None)
+    watermark = context.watermark(job_obj)
+    _check_incremental_plan(plan, watermark)
+    validation = _job_validation(context, job_obj)
+    partition_stats: list[JSONDict] = []
+
+    def _before(batch: JSONList) -> JSONList:
+        return _as_record_batch(validation.apply(batch, when='before_transform'))
+
+    def _after(data: JSONData) -> JSONList:
+        return _as_record_batch(validation.apply(data, when='after_transform'))
+
+    staged = map(
+        _before,
+        _extract_job_batches(
+            context,
+            job_obj,
+            batch_size=batch_size,
+            partition_stats=partition_stats,
+            watermark=watermark,
+        ),
     )
-    data = validation.apply(data, when='after_transform')
-    return _load_job_result(context, job_obj, data)
+    # Plans with workers spread consecutive batches over one worker pool.
+    batches: Iterator[JSONList] = map(
+        _after,
+        staged if batch_plan is None else batch_plan.iter_apply(staged),
+    )
+    if plan is not None and (blocked or plan.limit is not None):
+        batches = iter_record_batches(
+            plan.iter_bounded(chain.from_iterable(batches)),
+            batch_size,
+        )
+    try:
+        loaded = _load_job_batches(context, job_obj, batches)
+    finally:
+        validation.close()
+    loaded = _with_watermark(loaded, watermark)
+    return _with_partition_stats(validation.with_summary(loaded), partition_stats)
 
 
-def _extract_job_data(
+def _resolve_job_source(
     context: _RunContext,
     job_obj: Any,
-) -> JSONData:
-    """Extract the source payload for one configured job."""
+) -> _ResolvedJobConnector:
+    """Resolve the configured extract source for one job."""
     if not (extract_cfg := getattr(job_obj, 'extract', None)):
         raise ValueError('Job missing "extract" section')
 
-    source = _resolve_job_connector(
+    return _resolve_job_connector(
         context.sources_by_name,
         ref_name=extract_cfg.source,
         label='source',
         overrides=getattr(extract_cfg, 'options', None),
         missing_path_message='File source missing "path"',
     )
-    return _dispatch_extract(
+
+
+def _resolve_job_target(
+    context: _RunContext,
+    job_obj: Any,
+) -> _ResolvedJobConnector:
+    """Resolve the configured load target for one job."""
+    if not (load_cfg := getattr(job_obj, 'load', None)):
+        raise ValueError('Job missing "load" section')
+
+    return _resolve_job_connector(
+        context.targets_by_name,
+        ref_name=load_cfg.target,
+        label='target',
+        overrides=getattr(load_cfg, 'overrides', None),
+        missing_path_message='File target missing "path"',
+    )
+
+
+def _extract_job_batches(
+    context: _RunContext,
+    job_obj: Any,
+    *,
+    batch_size: int,
+    partition_stats: list[JSONDict] | None = None,
+    watermark: WatermarkTracker | None = None,
+) -> Iterator[JSONList]:
+    """Extract the source payload for one configured job as record batches."""
+    source = _resolve_job_source(context, job_obj)
+    options = _watermark_options(source.connector_type, source.options, watermark)
+    batches: Iterator[JSONList]
+    if _is_file_connector_type(source.connector_type):
+        batches = extract_file_batches(
+            source.value,
+            source.file_format,
+            options or None,
+            batch_size=batch_size,
+        )
+    elif _is_database_connector_type(source.connector_type):
+        # Stream straight from the cursor, one fetch per batch.
+        kwargs = _database_kwargs(
+            source.connector_obj,
+            options,
+            _DATABASE_SOURCE_KEYS,
+        )
+        batches = extract_database_batches(
+            str(source.value),
+            batch_size=kwargs.pop('fetch_size', None) or batch_size,
+            partition_stats=partition_stats,
+            **kwargs,
+        )
+    else:
+        batches = iter_record_batches(
+            _dispatch_extract(
+                source.connector_type,
+                source.value,
+                options=options,
+                cfg=context.cfg,
+                connector_obj=source.connector_obj,
+            ),
+            batch_size,
+        )
+    return batches if watermark is None else watermark.track(batches)
+
+
+def _load_job_batches(
+    context: _RunContext,
+    job_obj: Any,
+    batches: Iterable[JSONList],
+) -> JSONDict:
+    """Load record batches into the configured target for one job."""
+    target = _resolve_job_target(context, job_obj)
+    if _is_file_connector_type(target.connector_type):
+        return load_batches_to_file(
+            batches,
+            target.value,
+            target.file_format,
+            target.options or None,
+        )
+    if _is_database_connector_type(target.connector_type):
+        # One transaction for the whole job; rows are written per batch.
+        return load_batches_to_database(
+            batches,
+            str(target.value),
+            **_database_kwargs(
+                target.connector_obj,
+                target.options,
+                _DATABASE_TARGET_KEYS,
+            ),
+        )
+
+    result: JSONDict = {}
+    batch_count = 0
+    record_count = 0
+    for batch in batches:
+        if not batch:
+            continue
+        batch_result = _dispatch_load(
+            batch,
+            target.connector_type,
+            target.value,
+            options=target.options,
+            cfg=context.cfg,
+            connector_obj=target.connector_obj,
+        )
+        if not isinstance(batch_result, dict):
+            raise TypeError('load result must be a mapping')
+        result = batch_result
+        batch_count += 1
+        record_count += len(batch)
+    return {
+        **result,
+        'status': result.get('status', 'success'),
+        'batches': batch_count,
+        'records': record_count,
+    }
+
+
+def _extract_job_table(
+    context: _RunContext,
+    job_obj: Any,
+    plan: TransformPlan | None,
+    validation: _JobValidationConfig,
+) -> Any | None:
+    """
+    Extract a file source as a ``pyarrow.Table`` for Arrow-engine jobs.
+
+    Returns ``None`` when the job needs row records before the transform:
+    non-Arrow plans, non-file sources, or ``before_transform`` validation.
+    """
+    if plan is None or plan.engine is not TransformEngine.ARROW:
+        return None
+    if validation.runs('before_transform'):
+        return None
+    source = _resolve_job_source(context, job_obj)
+    if not _is_file_connector_type(source.connector_type):
+        return None
+    return extract_file_table(
+        source.value,
+        source.file_format,
+        source.options or None,
+    )
+
+
+def _extract_job_data(
+    context: _RunContext,
+    job_obj: Any,
+    *,
+    partition_stats: list[JSONDict] | None = None,
+    watermark: WatermarkTracker | None = None,
+) -> JSONData:
+    """Extract the source payload for one configured job."""
+    source = _resolve_job_source(context, job_obj)
+    data = _dispatch_extract(
         source.connector_type,
         source.value,
         file_format=source.file_format,
-        options=source.options,
+        options=_watermark_options(source.connector_type, source.options, watermark),
         cfg=context.cfg,
         connector_obj=source.connector_obj,
+        partition_stats=partition_stats,
     )
+    if watermark is None:
+        return data
+    return watermark.observe(watermark.newer(_as_record_batch(data)))
 
 
 def _load_job_result(
@@ -794,16 +1334,7 @@ def _load_job_result(
     data: JSONData,
 ) -> JSONDict:
     """Load one job payload into its configured target."""
-    if not (load_cfg := getattr(job_obj, 'load', None)):
-        raise ValueError('Job missing "load" section')
-
-    target = _resolve_job_connector(
-        context.targets_by_name,
-        ref_name=load_cfg.target,
-        label='target',
-        overrides=getattr(load_cfg, 'overrides', None),
-        missing_path_message='File target missing "path"',
-    )
+    target = _resolve_job_target(context, job_obj)
     result = _dispatch_load(
         data,
         target.connector_type,
@@ -819,6 +1350,36 @@ def _load_job_result(
     return result
 
 
+def _check_incremental_plan(
+    plan: TransformPlan | None,
+    watermark: WatermarkTracker | None,
+) -> None:
+    """
+    Reject transforms that would make an incremental job skip records.
+
+    The watermark advances past every extracted record, so steps that keep
+    only some of them by count (``limit`` and ``top_n``) would drop the rest
+    for good.
+
+    Raises
+    ------
+    ValueError
+        If an incremental job's transform has a ``limit`` or ``top_n`` step.
+    """
+    if watermark is None or plan is None:
+        return
+    steps = [
+        *(['top_n'] if plan.top_n else []),
+        *(['limit'] if plan.limit is not None else []),
+    ]
+    if steps:
+        raise ValueError(
+            'Incremental jobs do not support transform steps: '
+            + ', '.join(steps)
+            + '; records they cut would be skipped by the next run',
+        )
+
+
 def _dispatch_extract(
     source_type: OptionalConnectorTypeArg,
     source: StrPath,
@@ -827,6 +1388,7 @@ def _dispatch_extract(
     options: Mapping[str, Any] | None = None,
     cfg: Any | None = None,
     connector_obj: Any | None = None,
+    partition_stats: list[JSONDict] | None = None,
 ) -> JSONData:
     """Dispatch one extract request through the extract module boundary."""
     resolved_options = dict(options or {})
@@ -840,10 +1402,14 @@ def _dispatch_extract(
                 **resolved_options,
             )
         case DataConnectorType.DATABASE:
-            return extract(
-                DataConnectorType.DATABASE,
-                str(source),
+            kwargs = _database_kwargs(
+                connector_obj,
+                resolved_options,
+                _DATABASE_SOURCE_KEYS,
             )
+            if partition_stats is not None:
+                kwargs['partition_stats'] = partition_stats
+            return extract(DataConnectorType.DATABASE, str(source), **kwargs)
         case DataConnectorType.API:
             if cfg is not None and connector_obj is not None:
                 return extract_from_api_source(
@@ -888,6 +1454,11 @@ def _dispatch_load(
                 data,
                 DataConnectorType.DATABASE,
                 str(target),
+                **_database_kwargs(
+                    connector_obj,
+                    resolved_options,
+                    _DATABASE_TARGET_KEYS,
+                ),
             )
         case DataConnectorType.API:
             if cfg is not None and connector_obj is not None:
@@ -908,6 +1479,30 @@ def _dispatch_load(
             raise ValueError(f'Unsupported target type: {target_type}')
 
 
+def _database_kwargs(
+    connector_obj: Any | None,
+    options: Mapping[str, Any],
+    keys: tuple[str, ...],
+) -> dict[str, Any]:
+    """Return the database settings named by *keys*, overrides first."""
+    kwargs: dict[str, Any] = {}
+    for key in keys:
+        value = options.get(key, getattr(connector_obj, key, None))
+        if value is not None:
+            kwargs[key] = value
+    return kwargs
+
+
+def _is_database_connector_type(
+    connector_type: object,
+) -> bool:
+    """Return True when a connector type represents database IO."""
+    return connector_type in {
+        DataConnectorType.DATABASE,
+        DataConnectorType.DATABASE.value,
+    }
+
+
 def _is_file_connector_type(
     connector_type: object,
 ) -> bool:
@@ -1003,23 +1598,72 @@ def _resolve_transform_ops(
     return transforms.get(getattr(transform_cfg, 'pipeline', None), {})
 
 
+def _pipeline_key(
+    value: Any,
+) -> Hashable:
+    """
+    Return a hashable, type-exact key for one JSON-like pipeline spec.
+
+    Raises
+    ------
+    TypeError
+        If *value* holds anything but mappings, sequences, and scalars, such
+        as custom callables.
+    """
+    match value:
+        case None | bool() | int() | float() | str():
+            return (type(value).__name__, value)
+        case Mapping():
+            return (
+                'mapping',
+                tuple((_pipeline_key(k), _pipeline_key(v)) for k, v in value.items()),
+            )
+        case list() | tuple():
+            return ('sequence', tuple(_pipeline_key(item) for item in value))
+    raise TypeError(f'Uncacheable pipeline value: {value!r}')
+
+
+def _transform_plan(
+    operations: Any,
+) -> TransformPlan:
+    """
+    Return the compiled plan for *operations*, reusing one from earlier runs.
+
+    Plans are keyed by their normalized spec, so identical pipelines share
+    one plan, and its worker pool, across jobs and :func:`run` calls. At most
+    :data:`_TRANSFORM_PLAN_CACHE_SIZE` plans are kept. Specs holding custom
+    callables are compiled afresh every time.
+    """
+    try:
+        key = _pipeline_key(operations)
+    except TypeError:
+        return compile_pipeline(operations)
+    with _TRANSFORM_PLANS_LOCK:
+        if (plan := _TRANSFORM_PLANS.pop(key, None)) is None:
+            plan = compile_pipeline(operations)
+            if len(_TRANSFORM_PLANS) >= _TRANSFORM_PLAN_CACHE_SIZE:
+                del _TRANSFORM_PLANS[next(iter(_TRANSFORM_PLANS))]
+        _TRANSFORM_PLANS[key] = plan
+    return plan
+
+
 @overload
 def _apply_operations(
     data: JSONData,
-    operations: PipelineConfig | None,
+    operations: PipelineConfig | TransformPlan | None,
 ) -> JSONData: ...
 
 
 @overload
 def _apply_operations(
     data: DataSourceArg,
-    operations: PipelineConfig | None,
+    operations: PipelineConfig | TransformPlan | None,
 ) -> DataSourceArg: ...
 
 
 def _apply_operations(
     data: DataSourceArg,
-    operations: PipelineConfig | None,
+    operations: PipelineConfig | TransformPlan | None,
 ) -> DataSourceArg:
     """Apply configured transform operations, preserving absent transforms."""
     if operations is None:
@@ -1248,6 +1892,15 @@ def _require_record_payload(
     return data
 
 
+def _as_record_batch(
+    data: JSONData,
+) -> JSONList:
+    """Return one streamed stage result as a list of records."""
+    if isinstance(data, dict):
+        return [data]
+    return data
+
+
 def _run_job_plan(
     context: _RunContext,
     jobs: list[Any],
@@ -1335,6 +1988,63 @@ def _utc_now_iso() -> str:
     return datetime.now(UTC).replace(microsecond=0).isoformat().replace('+00:00', 'Z')
 
 
+def _validate_bounded_payload(
+    compiled: CompiledRules,
+    report: ValidationReport,
+    payload: Any,
+    rules: Mapping[str, Any],
+) -> ValidationResultDict:
+    """
+    Tally one payload into a bounded report for :func:`maybe_validate`.
+
+    The payload passes until the report's error budget is exceeded. The
+    result omits ``data`` so failure logs only carry the bounded summary.
+    """
+    del rules
+    compiled.split(payload, report)
+    return {'valid': not report.exhausted, 'summary': report.summary()}
+
+
+def _validate_quarantine_payload(
+    compiled: CompiledRules,
+    report: ValidationReport,
+    writer: QuarantineWriter,
+    payload: Any,
+    rules: Mapping[str, Any],
+) -> ValidationResultDict:
+    """
+    Divert invalid records to *writer* and pass the valid ones through.
+
+    The payload keeps its shape: a lone invalid record becomes an empty list.
+    """
+    del rules
+    valid, invalid = compiled.split(payload, report)
+    writer.write(invalid)
+    data: JSONData = valid
+    if isinstance(payload, dict) and valid:
+        data = valid[0]
+    return {
+        'valid': not report.exhausted,
+        'data': data,
+        'summary': report.summary(),
+    }
+
+
+def _validate_compiled_payload(
+    compiled: CompiledRules,
+    payload: Any,
+    rules: Mapping[str, Any],
+) -> ValidationResultDict:
+    """
+    Adapt :meth:`CompiledRules.validate` to the generic callback shape.
+
+    The rules were compiled when the job configuration was resolved, so the
+    *rules* mapping passed by the orchestration layer is not re-read.
+    """
+    del rules
+    return cast(ValidationResultDict, compiled.validate(payload))
+
+
 def _validate_payload(
     payload: Any,
     rules: Mapping[str, Any],
@@ -1356,6 +2066,64 @@ def _validate_payload(
     )
 
 
+def _state_dir(
+    cfg: Any,
+) -> Path:
+    """Return the local state directory shared with run history."""
+    return ResolvedHistoryConfig.resolve(
+        getattr(cfg, 'history', None),
+        env=os.environ,
+    ).state_dir
+
+
+def _watermark_options(
+    connector_type: object,
+    options: Mapping[str, Any],
+    watermark: WatermarkTracker | None,
+) -> dict[str, Any]:
+    """
+    Return source options that push the watermark down to the source.
+
+    Database sources filter in SQL and API sources receive the watermark as
+    a query parameter. File sources have no predicate to push down; their
+    records are filtered by the tracker instead.
+    """
+    resolved = dict(options)
+    if watermark is None:
+        return resolved
+    if _is_database_connector_type(connector_type):
+        resolved['watermark_column'] = watermark.field
+        resolved['watermark'] = watermark.start
+    elif connector_type in {DataConnectorType.API, DataConnectorType.API.value}:
+        if watermark.start is not None:
+            resolved['query_params'] = {
+                **MappingParser.to_dict(resolved.get('query_params')),
+                watermark.param: watermark.start_text(),
+            }
+    return resolved
+
+
+def _with_partition_stats(
+    result: JSONDict,
+    partition_stats: list[JSONDict],
+) -> JSONDict:
+    """Attach per-partition extract timings, if any, to *result*."""
+    if not partition_stats:
+        return result
+    return {**result, 'extract_partitions': partition_stats}
+
+
+def _with_watermark(
+    result: JSONDict,
+    watermark: WatermarkTracker | None,
+) -> JSONDict:
+    """Commit a loaded job's watermark and attach its movement to *result*."""
+    if watermark is None:
+        return result
+    watermark.commit()
+    return {**result, 'watermark': watermark.summary()}
+
+
 # SECTION: FUNCTIONS ======================================================== #
 
 
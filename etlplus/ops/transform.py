@@ -1,8 +1,8 @@
 """
 :mod:`etlplus.ops.transform` module.
 
-Helpers to filter, map/rename, select, sort, aggregate, and otherwise
-transform JSON-like records (dicts and lists of dicts).
+Helpers to filter, map/rename, select, sort, aggregate, group, query with SQL,
+and otherwise transform JSON-like records (dicts and lists of dicts).
 
 The pipeline accepts both **string** names (e.g., ``"filter"``) and the
 enum ``PipelineStep`` for operation keys. For operators and aggregates,
@@ -38,48 +38,125 @@ Using enums for keys and functions::
         },
     }
     result = transform(data, ops)
+
+Compiling once for repeated runs::
+
+    plan = compile_pipeline(ops)
+    for batch in batches:
+        result = transform(batch, plan)
+
+Per-customer rollups computed in a single pass::
+
+    ops = {
+        'group_by': {
+            'keys': ['customer_id'],
+            'aggregates': [{'field': 'amount', 'func': 'sum', 'alias': 'total'}],
+        },
+        'sort': {'field': 'total', 'reverse': True},
+    }
+    result = transform(data, ops)
+
+Reshaping records with a DuckDB query over the ``data`` relation::
+
+    ops = {'sql': 'SELECT name, count(*) AS n FROM data GROUP BY name'}
+    result = transform(data, ops)
+
+Running the same steps on the columnar Arrow engine::
+
+    plan = compile_pipeline({**ops, 'engine': 'arrow'})
+    table = plan.apply_table(pyarrow_table)
+
+Spreading row-wise steps and aggregates over worker processes::
+
+    plan = compile_pipeline({**ops, 'workers': 8, 'partition_size': 50_000})
+    result = transform(data, plan)
+
+Spreading a stream of record batches over the same worker processes::
+
+    for batch in plan.iter_apply(batches):
+        ...
 """
 
 from __future__ import annotations
 
+import pickle
+from collections import deque
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
 from collections.abc import Mapping
 from collections.abc import Sequence
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from itertools import chain
+from os import process_cpu_count
+from threading import Lock
 from typing import Any
 from typing import cast
+from weakref import finalize
 
+from ..utils import IntParser
 from ..utils import SequenceParser
 from ..utils._types import JSONData
 from ..utils._types import JSONDict
 from ..utils._types import JSONList
+from ._accumulators import Accumulator
+from ._arrow import aggregate_table
+from ._arrow import compile_table_step
+from ._arrow import records_to_table
+from ._arrow import table_to_records
+from ._batches import worker_context
 from ._enums import PipelineStep
+from ._enums import TransformEngine
+from ._types import AggregateSpec
+from ._types import BatchStep
 from ._types import DataSourceArg
 from ._types import PipelineConfig
 from ._types import PipelineStepName
-from ._types import StepApplier
+from ._types import RecordStep
+from ._types import SortSpec
 from ._types import StepOrSteps
 from ._types import StepSpec
+from ._types import TableStep
 from .load import load_data
+from .transformations.aggregate import AggregateState
 from .transformations.aggregate import apply_aggregate
-from .transformations.aggregate import apply_aggregate_step
+from .transformations.aggregate import apply_aggregates
 from .transformations.filter import apply_filter
-from .transformations.filter import apply_filter_step
+from .transformations.filter import compile_filter_step
+from .transformations.group_by import compile_group_by_step
+from .transformations.limit import iter_limit
+from .transformations.limit import limit_count
 from .transformations.map import apply_map
-from .transformations.map import apply_map_step
+from .transformations.map import compile_map_step
 from .transformations.select import apply_select
-from .transformations.select import apply_select_step
+from .transformations.select import compile_select_step
 from .transformations.select import is_plain_fields_list
+from .transformations.sort import DEFAULT_SORT_BUFFER
 from .transformations.sort import apply_sort
-from .transformations.sort import apply_sort_step
+from .transformations.sort import compile_sort_step
+from .transformations.sort import iter_sorted
+from .transformations.sort import sort_fields
+from .transformations.sql import compile_sql_step
+from .transformations.top_n import apply_top_n_step
+from .transformations.top_n import compile_top_n_step
 
 # SECTION: EXPORTS ========================================================== #
 
 
 __all__ = [
+    # Data Classes
+    'TransformPlan',
+    # Functions
     'apply_aggregate',
     'apply_filter',
     'apply_map',
     'apply_select',
     'apply_sort',
+    'blocking_steps',
+    'compile_pipeline',
     'transform',
 ]
 
@@ -92,58 +169,163 @@ _PIPELINE_STEPS: tuple[PipelineStepName, ...] = (
     'filter',
     'map',
     'select',
+    'group_by',
+    'top_n',
     'sort',
+    'sql',
+    'limit',
+)
+
+
+_BLOCKING_STEPS: frozenset[PipelineStepName] = frozenset(
+    {'aggregate', 'group_by', 'sort', 'sql', 'top_n'},
+)
+
+# Steps that run inside worker processes when a pipeline sets ``workers``.
+_PARTITION_STEPS: tuple[PipelineStepName, ...] = (
+    'aggregate',
+    'filter',
+    'map',
+    'select',
+)
+
+# Records per partition handed to one worker process by default.
+_DEFAULT_PARTITION_SIZE = 50_000
+
+# Plan compiled once per worker process by :func:`_init_partition_worker`.
+_WORKER_PLANS: dict[str, TransformPlan] = {}
+
+
+# Whole-batch steps, in pipeline order, applied after the record pass.
+_BATCH_STEP_COMPILERS: tuple[
+    tuple[PipelineStepName, Callable[[Any], BatchStep | None]],
+    ...,
+] = (
+    ('group_by', compile_group_by_step),
+    ('top_n', compile_top_n_step),
+    ('sort', compile_sort_step),
+    ('sql', compile_sql_step),
+)
+
+# Row-wise steps, in pipeline order, fused into one pass per record.
+_RECORD_STEP_COMPILERS: tuple[
+    tuple[PipelineStepName, Callable[[Any], RecordStep | None]],
+    ...,
+] = (
+    ('filter', compile_filter_step),
+    ('map', compile_map_step),
+    ('select', compile_select_step),
 )
 
+# SECTION: INTERNAL CLASSES ================================================= #
+
+
+class _WorkerPool:
+    """
+    Worker process pool started on first use and kept for the lifetime of
+    the plans sharing it.
+
+    Parameters
+    ----------
+    workers : int
+        Maximum number of worker processes.
+    payload : bytes
+        Pickled partition-phase operations each worker compiles once.
+    """
+
+    # -- Magic Methods (Object Lifecycle) -- #
+
+    def __init__(
+        self,
+        workers: int,
+        payload: bytes,
+    ) -> None:
+        self._workers = workers
+        self._payload = payload
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = Lock()
+
+    # -- Instance Methods -- #
+
+    def close(self) -> None:
+        """Shut the worker processes down; the next use starts new ones."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    def executor(self) -> ProcessPoolExecutor:
+        """Return the shared executor, starting it on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    mp_context=worker_context(),
+                    initializer=_init_partition_worker,
+                    initargs=(self._payload,),
+                )
+                # Stop the workers once no plan references this pool.
+                finalize(self, self._executor.shutdown, cancel_futures=True)
+            return self._executor
 
-_STEP_APPLIERS: dict[PipelineStepName, StepApplier] = {
-    'aggregate': apply_aggregate_step,
-    'filter': apply_filter_step,
-    'map': apply_map_step,
-    'select': apply_select_step,
-    'sort': apply_sort_step,
-}
 
 # SECTION: INTERNAL FUNCTIONS ============================================== #
 
 
 def _aggregate_specs(
     data: JSONList,
-    specs: list[StepSpec],
+    specs: Sequence[AggregateSpec],
 ) -> JSONDict | None:
-    """Apply aggregate specs and merge the resulting single-row payloads."""
-    combined: JSONDict = {}
-    for spec in specs:
-        if not isinstance(spec, Mapping):
-            continue
-        out_rows = apply_aggregate_step(data, spec)
-        if out_rows and isinstance(out_rows[0], Mapping):
-            combined.update(cast(JSONDict, out_rows[0]))
-    return combined or None
-
-
-def _apply_row_step(
-    data: JSONList,
-    *,
-    step: PipelineStepName,
-    raw_spec: Any,
-) -> JSONList:
-    """Apply one non-aggregate pipeline step to a record batch."""
-    specs = _normalize_specs(raw_spec)
-    if not specs:
-        return data
+    """Apply aggregate specs in one pass and merge their single-row payloads."""
+    return apply_aggregates(data, specs) or None
 
-    if step == 'select' and is_plain_fields_list(raw_spec):
-        specs = [cast(StepSpec, raw_spec)]
 
-    applier = _STEP_APPLIERS.get(step)
-    if applier is None:
-        return data
+def _aggregate_partition(
+    records: JSONList,
+) -> list[Accumulator]:
+    """Return partial aggregate accumulators for one partition (worker)."""
+    plan = _WORKER_PLANS['plan']
+    state = AggregateState.from_specs(list(plan.aggregates))
+    return state.update(records).accumulators
 
-    result = data
-    for spec in specs:
-        result = applier(result, spec)
-    return result
+
+def _init_partition_worker(
+    payload: bytes,
+) -> None:
+    """Compile the pickled partition operations once per worker process."""
+    _WORKER_PLANS['plan'] = compile_pipeline(pickle.loads(payload))
+
+
+def _partition_payload(
+    ops: Mapping[str, Any],
+) -> bytes | None:
+    """
+    Pickle the partition-phase steps of *ops* for worker processes.
+
+    Returns ``None`` when a spec cannot be pickled, such as a lambda
+    operator, so the plan falls back to running in-process.
+    """
+    partition_ops = {step: ops[step] for step in _PARTITION_STEPS if step in ops}
+    try:
+        return pickle.dumps(partition_ops)
+    except (AttributeError, TypeError, pickle.PicklingError):
+        return None
+
+
+def _pipeline_workers(
+    value: Any,
+) -> int:
+    """Resolve a pipeline ``workers`` entry; ``'auto'`` uses every CPU."""
+    if isinstance(value, str) and value.strip().lower() == 'auto':
+        return process_cpu_count() or 1
+    return IntParser.positive(value, default=1)
+
+
+def _transform_partition(
+    records: JSONList,
+) -> JSONList:
+    """Run the fused row-wise steps over one partition (worker)."""
+    return _run_record_steps(records, _WORKER_PLANS['plan'].record_steps)
 
 
 def _normalize_specs(
@@ -203,54 +385,513 @@ def _normalize_operation_keys(ops: Mapping[Any, Any]) -> dict[str, Any]:
     return normalized
 
 
-def _transform_records(
-    data: JSONList,
-    ops: Mapping[str, Any],
-) -> JSONData:
-    """Apply normalized pipeline operations to a record batch."""
-    for step in _PIPELINE_STEPS:
-        raw_spec = ops.get(step)
-        if raw_spec is None:
-            continue
-
-        specs = _normalize_specs(raw_spec)
-        if not specs:
-            continue
-
-        if step == 'aggregate':
-            if combined := _aggregate_specs(data, specs):
-                return combined
-            continue
+def _pipeline_limit(
+    specs: list[StepSpec],
+) -> int | None:
+    """Return the smallest usable count among limit *specs*, if any."""
+    counts = [count for spec in specs if (count := limit_count(spec)) is not None]
+    return min(counts, default=None)
+
+
+def _run_record_steps(
+    records: JSONList,
+    steps: tuple[RecordStep, ...],
+    limit: int | None = None,
+) -> JSONList:
+    """
+    Apply fused row-wise *steps* to each record in a single pass.
+
+    The pass stops once *limit* records have been kept.
+    """
+    result: JSONList = []
+    if limit is not None and limit < 1:
+        return result
+    append = result.append
+    for record in records:
+        current = record
+        for step in steps:
+            if (stepped := step(current)) is None:
+                break
+            current = stepped
+        else:
+            append(current)
+            if limit is not None and len(result) >= limit:
+                break
+    return result
+
 
-        data = _apply_row_step(
-            data,
-            step=step,
-            raw_spec=raw_spec,
+def _step_specs(
+    step: PipelineStepName,
+    raw_spec: StepOrSteps | None,
+) -> list[StepSpec]:
+    """Normalize one step config, keeping plain select field lists whole."""
+    specs = _normalize_specs(raw_spec)
+    if specs and step == 'select' and is_plain_fields_list(raw_spec):
+        return [cast(StepSpec, raw_spec)]
+    return specs
+
+
+# SECTION: DATA CLASSES ===================================================== #
+
+
+@dataclass(frozen=True, slots=True)
+class TransformPlan:
+    """
+    Pre-compiled, reusable form of a transform pipeline.
+
+    Build instances with :func:`compile_pipeline`, then pass them to
+    :func:`transform` in place of the raw operations mapping.
+
+    Attributes
+    ----------
+    aggregates : tuple[AggregateSpec, ...]
+        Aggregate specs whose merged result replaces the records.
+    record_steps : tuple[RecordStep, ...]
+        Fused ``filter``/``map``/``select`` callables applied in one pass per
+        record.
+    batch_steps : tuple[BatchStep, ...]
+        Whole-batch ``group_by``/``top_n``/``sort``/``sql`` callables applied
+        after the record pass.
+    blocking_steps : tuple[PipelineStepName, ...]
+        Configured steps that need the full dataset before emitting rows.
+    engine : TransformEngine
+        Engine executing the plan. ``arrow`` plans run :attr:`table_steps`
+        against a ``pyarrow.Table`` instead of the record steps.
+    table_steps : tuple[TableStep, ...]
+        Columnar ``filter``/``map``/``select``/``group_by``/``top_n``/
+        ``sort``/``sql``/``limit`` callables used by the ``arrow`` engine.
+    sorts : tuple[SortSpec, ...]
+        Sort specs in application order, kept for :meth:`iter_sorted`.
+    top_n : tuple[StepSpec, ...]
+        Top-N specs in application order, kept for :meth:`iter_bounded`.
+    limit : int | None
+        Smallest configured ``limit`` count, applied after every other step.
+    workers : int
+        Worker processes for the ``aggregate``/``filter``/``map``/``select``
+        phase of ``python`` plans. ``1`` runs everything in-process.
+    partition_size : int
+        Records per partition handed to one worker process.
+    partition_payload : bytes | None
+        Pickled partition-phase operations compiled by each worker, or
+        ``None`` when the plan runs in-process.
+
+    Notes
+    -----
+    Plans with a :attr:`partition_payload` start their worker processes on
+    first use and keep them for every later :meth:`apply` and
+    :meth:`iter_apply` call, including calls on copies made with
+    :func:`dataclasses.replace`. The workers stop when :meth:`close` is
+    called or the plan is garbage collected.
+    """
+
+    # -- Instance Attributes -- #
+
+    aggregates: tuple[AggregateSpec, ...] = ()
+    record_steps: tuple[RecordStep, ...] = ()
+    batch_steps: tuple[BatchStep, ...] = ()
+    blocking_steps: tuple[PipelineStepName, ...] = ()
+    engine: TransformEngine = TransformEngine.PYTHON
+    table_steps: tuple[TableStep, ...] = ()
+    sorts: tuple[SortSpec, ...] = ()
+    top_n: tuple[StepSpec, ...] = ()
+    limit: int | None = None
+    workers: int = 1
+    partition_size: int = _DEFAULT_PARTITION_SIZE
+    partition_payload: bytes | None = None
+    _pool: _WorkerPool | None = field(default=None, repr=False, compare=False)
+
+    # -- Internal Instance Methods -- #
+
+    def _aggregate(
+        self,
+        records: JSONList,
+    ) -> JSONDict | None:
+        """Merge aggregate results, from partial states when partitioned."""
+        state = AggregateState.from_specs(list(self.aggregates))
+        partials = (
+            self._map_partitions(_aggregate_partition, records)
+            if state.columns
+            else None
+        )
+        if partials is None:
+            return _aggregate_specs(records, list(self.aggregates))
+        for accumulators in partials:
+            state.merge(AggregateState(state.columns, accumulators))
+        return state.result() or None
+
+    def _map_partitions(
+        self,
+        func: Callable[[JSONList], Any],
+        records: JSONList,
+    ) -> list[Any] | None:
+        """
+        Run *func* over consecutive partitions of *records* in worker
+        processes and return the results in partition order.
+
+        ``None`` means the plan runs in-process: it has no worker payload, or
+        *records* fit in one partition.
+        """
+        size = self.partition_size
+        if self._pool is None or len(records) <= size:
+            return None
+        partitions = [
+            records[start : start + size] for start in range(0, len(records), size)
+        ]
+        return list(self._pool.executor().map(func, partitions))
+
+    def _run_batch_steps(
+        self,
+        records: JSONList,
+    ) -> JSONList:
+        """Apply the whole-batch steps and the limit after the record pass."""
+        for step in self.batch_steps:
+            records = step(records)
+        if self.limit is not None:
+            records = records[: self.limit]
+        return records
+
+    # -- Instance Methods -- #
+
+    def apply(
+        self,
+        records: JSONList,
+    ) -> JSONData:
+        """
+        Run the plan against one record batch.
+
+        Parameters
+        ----------
+        records : JSONList
+            Records to transform.
+
+        Returns
+        -------
+        JSONData
+            Transformed records, or one merged mapping when aggregates run.
+
+        Notes
+        -----
+        With :attr:`workers` above ``1``, batches larger than
+        :attr:`partition_size` are split into partitions. Worker processes
+        run the fused row-wise steps, or build partial aggregate states, per
+        partition. Results are merged in partition order, so the output
+        matches an in-process run. Whole-batch steps then run in-process.
+        """
+        if self.engine is TransformEngine.ARROW:
+            result = self.apply_table(records_to_table(records))
+            return result if isinstance(result, dict) else table_to_records(result)
+        if self.aggregates:
+            if combined := self._aggregate(records):
+                return combined
+        if self.record_steps:
+            partitions = self._map_partitions(_transform_partition, records)
+            records = (
+                _run_record_steps(
+                    records,
+                    self.record_steps,
+                    # Without whole-batch steps, stop once the limit is met.
+                    None if self.batch_steps else self.limit,
+                )
+                if partitions is None
+                else list(chain.from_iterable(partitions))
+            )
+        return self._run_batch_steps(records)
+
+    def close(self) -> None:
+        """Stop this plan's worker processes, if any are running."""
+        if self._pool is not None:
+            self._pool.close()
+
+    def iter_apply(
+        self,
+        batches: Iterable[JSONList],
+    ) -> Iterator[JSONData]:
+        """
+        Run the plan against a stream of record batches.
+
+        Parameters
+        ----------
+        batches : Iterable[JSONList]
+            Record batches to transform, consumed lazily.
+
+        Yields
+        ------
+        JSONData
+            The result of :meth:`apply` for each batch, in batch order.
+
+        Notes
+        -----
+        With worker processes, consecutive batches run their row-wise steps
+        on different workers, with up to two batches per worker in flight,
+        so a stream of batches smaller than :attr:`partition_size` still
+        runs in parallel. Whole-batch steps and the limit then run
+        in-process on each result. Plans with aggregates, or without
+        workers, apply each batch in turn.
+        """
+        if self._pool is None or self.aggregates or not self.record_steps:
+            yield from map(self.apply, batches)
+            return
+        executor = self._pool.executor()
+        window = 2 * self.workers
+        pending: deque[Future[JSONList]] = deque()
+        try:
+            for batch in batches:
+                pending.append(executor.submit(_transform_partition, batch))
+                if len(pending) >= window:
+                    yield self._run_batch_steps(pending.popleft().result())
+            while pending:
+                yield self._run_batch_steps(pending.popleft().result())
+        finally:
+            # A consumer that stops early leaves queued batches unneeded.
+            for future in pending:
+                future.cancel()
+
+    def iter_bounded(
+        self,
+        records: Iterable[JSONDict],
+    ) -> Iterator[JSONDict]:
+        """
+        Stream *records* through this plan's ``top_n``, ``sort``, and
+        ``limit`` steps with bounded memory.
+
+        ``top_n`` keeps a heap of ``n`` records, ``sort`` runs as
+        :meth:`iter_sorted`, and ``limit`` stops reading *records* once
+        enough have been yielded, so a lazy extract feeding this iterator
+        stops early.
+
+        Parameters
+        ----------
+        records : Iterable[JSONDict]
+            Records that already went through the row-wise steps.
+
+        Returns
+        -------
+        Iterator[JSONDict]
+            Records after the bounded steps.
+        """
+        for spec in self.top_n:
+            records = apply_top_n_step(cast(JSONList, records), spec)
+        if self.sorts:
+            records = self.iter_sorted(records)
+        return iter_limit(records, self.limit)
+
+    def iter_sorted(
+        self,
+        records: Iterable[JSONDict],
+    ) -> Iterator[JSONDict]:
+        """
+        Stream *records* through this plan's sort steps with bounded memory.
+
+        Sequential sort specs are folded into one multi-key external sort:
+        each later spec's keys take precedence over the earlier ones, which
+        matches applying the specs one after another.
+
+        Parameters
+        ----------
+        records : Iterable[JSONDict]
+            Records to sort. Any iterable works; it is consumed once.
+
+        Returns
+        -------
+        Iterator[JSONDict]
+            Sorted records. Sorted runs spill to disk past the smallest
+            ``max_in_memory`` budget among the specs, or
+            :data:`DEFAULT_SORT_BUFFER` records when none sets one.
+        """
+        fields = tuple(
+            field for spec in reversed(self.sorts) for field in sort_fields(spec)
+        )
+        options = [spec for spec in self.sorts if isinstance(spec, Mapping)]
+        budgets = [
+            int(spec['max_in_memory'])
+            for spec in options
+            if spec.get('max_in_memory') is not None
+        ]
+        spill_dirs = [spec['spill_dir'] for spec in options if spec.get('spill_dir')]
+        return iter_sorted(
+            records,
+            fields,
+            max_in_memory=min(budgets, default=DEFAULT_SORT_BUFFER),
+            spill_dir=spill_dirs[0] if spill_dirs else None,
         )
 
-    return data
+    def apply_table(
+        self,
+        table: Any,
+    ) -> Any:
+        """
+        Run the plan against one ``pyarrow.Table``.
+
+        Parameters
+        ----------
+        table : Any
+            ``pyarrow.Table`` to transform.
+
+        Returns
+        -------
+        Any
+            Transformed ``pyarrow.Table``, or one merged mapping when
+            aggregates run. Plans for the ``python`` engine convert through
+            records and back.
+        """
+        if self.engine is not TransformEngine.ARROW:
+            result = self.apply(table_to_records(table))
+            return result if isinstance(result, dict) else records_to_table(result)
+        if self.aggregates:
+            if combined := aggregate_table(table, self.aggregates):
+                return combined
+        for step in self.table_steps:
+            table = step(table)
+        return table
 
 
 # SECTION: FUNCTIONS ======================================================== #
 
 
+def blocking_steps(
+    operations: PipelineConfig | None,
+) -> tuple[PipelineStepName, ...]:
+    """
+    Return configured steps that need the full dataset before emitting rows.
+
+    Parameters
+    ----------
+    operations : PipelineConfig | None
+        Pipeline operations in the same shape accepted by :func:`transform`.
+
+    Returns
+    -------
+    tuple[PipelineStepName, ...]
+        Names of configured ``aggregate``/``group_by``/``top_n``/``sort``/
+        ``sql`` steps in pipeline order.
+        Row-wise ``filter``, ``map``, and ``select`` steps can be applied to
+        each record batch independently and are never reported, and neither
+        is ``limit``, which only stops the stream early.
+    """
+    if not operations:
+        return ()
+    ops = _normalize_operation_keys(operations)
+    return tuple(
+        step
+        for step in _PIPELINE_STEPS
+        if step in _BLOCKING_STEPS and _normalize_specs(ops.get(step))
+    )
+
+
+def compile_pipeline(
+    operations: PipelineConfig | None,
+) -> TransformPlan:
+    """
+    Compile pipeline operations into a reusable :class:`TransformPlan`.
+
+    Step specs are normalized, operators resolved, and consecutive
+    ``filter``/``map``/``select`` steps fused once, so repeated runs of the
+    same pipeline skip that work and avoid per-step intermediate lists.
+    An ``engine: arrow`` entry compiles the steps to columnar callables
+    instead. A ``workers`` entry (a count, or ``'auto'`` for every CPU) and
+    optional ``partition_size`` spread the ``aggregate``, ``filter``,
+    ``map``, and ``select`` steps of ``python`` plans over worker processes.
+    Pipelines whose specs cannot be pickled, such as lambda operators, run
+    in-process.
+
+    Parameters
+    ----------
+    operations : PipelineConfig | None
+        Pipeline operations in the same shape accepted by :func:`transform`.
+
+    Returns
+    -------
+    TransformPlan
+        Compiled plan. Empty when *operations* is empty or ``None``.
+
+    Raises
+    ------
+    ValueError
+        If the ``engine`` entry names an unknown engine.
+    """
+    if not operations:
+        return TransformPlan()
+
+    ops = _normalize_operation_keys(operations)
+    aggregates = tuple(
+        cast(list[AggregateSpec], _step_specs('aggregate', ops.get('aggregate'))),
+    )
+    sorts = tuple(cast(list[SortSpec], _step_specs('sort', ops.get('sort'))))
+    top_n = tuple(_step_specs('top_n', ops.get('top_n')))
+    limit = _pipeline_limit(_step_specs('limit', ops.get('limit')))
+    engine = TransformEngine.coerce(ops.get('engine') or TransformEngine.PYTHON)
+    if engine is TransformEngine.ARROW:
+        return TransformPlan(
+            aggregates=aggregates,
+            blocking_steps=blocking_steps(operations),
+            engine=engine,
+            sorts=sorts,
+            top_n=top_n,
+            limit=limit,
+            table_steps=tuple(
+                compiled
+                for step in _PIPELINE_STEPS
+                if step != 'aggregate'
+                for spec in _step_specs(step, ops.get(step))
+                if (compiled := compile_table_step(step, spec)) is not None
+            ),
+        )
+
+    workers = _pipeline_workers(ops.get('workers'))
+    record_steps = tuple(
+        compiled
+        for step, compiler in _RECORD_STEP_COMPILERS
+        for spec in _step_specs(step, ops.get(step))
+        if (compiled := compiler(spec)) is not None
+    )
+    batch_steps = tuple(
+        compiled
+        for step, compiler in _BATCH_STEP_COMPILERS
+        for spec in _step_specs(step, ops.get(step))
+        if (compiled := compiler(spec)) is not None
+    )
+    payload = _partition_payload(ops) if workers > 1 else None
+    return TransformPlan(
+        aggregates=aggregates,
+        record_steps=record_steps,
+        batch_steps=batch_steps,
+        blocking_steps=blocking_steps(operations),
+        sorts=sorts,
+        top_n=top_n,
+        limit=limit,
+        workers=workers,
+        partition_size=IntParser.positive(
+            ops.get('partition_size'),
+            default=_DEFAULT_PARTITION_SIZE,
+        ),
+        partition_payload=payload,
+        _pool=None if payload is None else _WorkerPool(workers, payload),
+    )
+
+
 def transform(
     source: DataSourceArg,
-    operations: PipelineConfig | None = None,
+    operations: PipelineConfig | TransformPlan | None = None,
 ) -> JSONData:
     """
-    Transform data using optional filter/map/select/sort/aggregate steps.
+    Transform data using optional filter/map/select/group/top-N/sort/sql/
+    limit/aggregate steps.
 
     Parameters
     ----------
     source : DataSourceArg
         Data source to transform.
-    operations : PipelineConfig | None, optional
+    operations : PipelineConfig | TransformPlan | None, optional
         Operation dictionary that may contain the keys ``filter``, ``map``,
-        ``select``, ``sort``, and ``aggregate`` with their respective
-        configs. Each value may be a single config or a sequence of configs
-        to apply in order. Aggregations accept multiple configs and merge
-        the results.
+        ``select``, ``group_by``, ``top_n``, ``sort``, ``sql``, ``limit``,
+        and ``aggregate`` with
+        their respective configs. Each value may be a single config or a
+        sequence of configs to apply in order. Aggregations accept multiple
+        configs and merge the results. An ``engine`` entry of ``"arrow"``
+        runs the steps on the columnar Arrow engine, and a ``workers`` entry
+        partitions large batches across worker processes. A plan from
+        :func:`compile_pipeline` may be passed instead to skip per-call
+        compilation.
 
     Returns
     -------
@@ -261,9 +902,16 @@ def transform(
     -----
     Operation keys may be provided as strings (e.g., ``"filter"``) or as
     :class:`PipelineStep` enum members. Steps are evaluated in the fixed order
-    ``aggregate``, ``filter``, ``map``, ``select``, ``sort``. When the
-    aggregate step is present, it returns a **single mapping** with merged
-    aggregate results and row-wise steps are not applied afterward.
+    ``aggregate``, ``filter``, ``map``, ``select``, ``group_by``, ``top_n``,
+    ``sort``, ``sql``, ``limit``. When the aggregate step is present, it
+    returns a **single
+    mapping** with merged aggregate results and row-wise steps are not
+    applied afterward. The ``group_by`` step replaces the records with one
+    row per distinct key combination, so later steps see the rollups. The
+    ``sql`` step runs its DuckDB query over the records as relation ``data``
+    (or the ``table`` named in its spec) and replaces them with the result.
+    ``top_n`` keeps the ``n`` highest-ranked records with a heap instead of
+    a full sort, and ``limit`` keeps the first records of the final output.
 
     Examples
     --------
@@ -305,7 +953,11 @@ def transform(
     if not operations:
         return data
 
-    ops = _normalize_operation_keys(operations)
+    plan = (
+        operations
+        if isinstance(operations, TransformPlan)
+        else compile_pipeline(operations)
+    )
 
     # Convert single dict to list for uniform processing.
     is_single_dict = isinstance(data, dict)
@@ -314,7 +966,7 @@ def transform(
 
     # All record-wise ops require a list of dicts.
     if isinstance(data, list):
-        data = _transform_records(cast(JSONList, data), ops)
+        data = plan.apply(cast(JSONList, data))
 
     # Convert back to single dict if input was single dict.
     if is_single_dict and isinstance(data, list) and len(data) == 1:
@@ -5,18 +5,43 @@ Aggregate helpers shared by :mod:`etlplus.ops.transform` and custom runners.
 
 Use :func:`apply_aggregate` for a single aggregate spec that returns one
 mapping. Use :func:`apply_aggregate_step` when you need the one-row list shape
-consumed by :func:`etlplus.ops.transform.transform`.
+consumed by :func:`etlplus.ops.transform.transform`, or :func:`apply_aggregates`
+to compute several specs in one pass over any record iterable.
+
+Aggregates run on the constant-memory accumulators in
+:mod:`etlplus.ops._accumulators`. :class:`AggregateState` exposes that state
+directly so partial aggregates over separate partitions or stream chunks can
+be merged before the final result is read.
+
+Examples
+--------
+Combining partial aggregates computed over two partitions::
+
+    specs = [{'field': 'amount', 'func': 'avg'}, {'func': 'count'}]
+    left = AggregateState.from_specs(specs).update(first_half)
+    right = AggregateState.from_specs(specs).update(second_half)
+    left.merge(right)
+    summary = left.result()
 """
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from collections.abc import Iterable
 from collections.abc import Mapping
+from collections.abc import Sequence
+from dataclasses import dataclass
+from dataclasses import field
 from typing import Any
+from typing import Self
 from typing import cast
 
-from ...utils import is_number_value
+from ...utils import SequenceParser
 from ...utils._types import JSONDict
 from ...utils._types import JSONList
+from .._accumulators import Accumulator
+from .._accumulators import QuantileSketch
+from .._accumulators import new_accumulator
 from .._enums import AggregateName
 from .._types import AggregateFunc
 from .._types import AggregateSpec
@@ -26,8 +51,12 @@ from .._types import FieldName
 
 
 __all__ = [
+    # Data Classes
+    'AggregateState',
+    # Functions
     'apply_aggregate',
     'apply_aggregate_step',
+    'apply_aggregates',
 ]
 
 
@@ -165,42 +194,6 @@ def _resolve_aggregator(
     raise TypeError(f'Invalid aggregate func: {func!r}')
 
 
-def _collect_numeric_and_presence(
-    rows: JSONList,
-    field: FieldName | None,
-) -> tuple[list[float], int]:
-    """
-    Collect numeric values and count presence of field in rows.
-
-    If field is None, returns ([], len(rows)).
-
-    Parameters
-    ----------
-    rows : JSONList
-        Input records.
-    field : FieldName | None
-        Field name to check for presence.
-
-    Returns
-    -------
-    tuple[list[float], int]
-        A tuple containing a list of numeric values and the count of present
-        fields.
-    """
-    if not field:
-        return [], len(rows)
-
-    nums: list[float] = []
-    present = 0
-    for record in rows:
-        if field in record:
-            present += 1
-            value = record.get(field)
-            if is_number_value(value):
-                nums.append(float(cast(float, value)))
-    return nums, present
-
-
 def _derive_agg_key(
     func_raw: AggregateName | AggregateFunc | str,
     field: FieldName | None,
@@ -240,6 +233,205 @@ def _derive_agg_key(
     return label if not field else f'{label}_{field}'
 
 
+def _aggregate_column(
+    spec: AggregateSpec,
+) -> _AggregateColumn:
+    """Resolve one aggregate spec into its output key and accumulator factory."""
+    field_value = spec.get('field')
+    field_name = str(field_value) if field_value else None
+    func_raw = spec.get('func', 'count')
+
+    def factory() -> Accumulator:
+        return new_accumulator(func_raw, spec)
+
+    sample = factory()  # Validates the function name and options eagerly.
+    alias = spec.get('alias')
+    if alias is None and isinstance(sample, QuantileSketch):
+        label = f'p{sample.q * 100:g}'
+        key = label if not field_name else f'{label}_{field_name}'
+    else:
+        key = _derive_agg_key(func_raw, field_name, alias)
+    return _AggregateColumn(key=key, field=field_name, factory=factory)
+
+
+# SECTION: INTERNAL DATA CLASSES ============================================ #
+
+
+@dataclass(frozen=True, slots=True)
+class _AggregateColumn:
+    """One resolved aggregate output."""
+
+    # -- Instance Attributes -- #
+
+    key: str
+    field: FieldName | None
+    factory: Callable[[], Accumulator]
+
+
+# SECTION: DATA CLASSES ===================================================== #
+
+
+@dataclass(slots=True)
+class AggregateState:
+    """
+    Mergeable running state for a set of aggregate specs.
+
+    Build instances with :meth:`from_specs`, feed records with :meth:`add` or
+    :meth:`update`, combine partial states with :meth:`merge`, and read the
+    merged single-row mapping with :meth:`result`.
+
+    Attributes
+    ----------
+    columns : tuple[_AggregateColumn, ...]
+        Resolved aggregate outputs, in spec order.
+    accumulators : list[Accumulator]
+        One accumulator per column.
+    """
+
+    # -- Instance Attributes -- #
+
+    columns: tuple[_AggregateColumn, ...]
+    accumulators: list[Accumulator] = field(default_factory=list)
+
+    # -- Magic Methods (Object Lifecycle) -- #
+
+    def __post_init__(self) -> None:
+        if not self.accumulators:
+            self.accumulators = [column.factory() for column in self.columns]
+
+    # -- Class Methods -- #
+
+    @classmethod
+    def from_specs(
+        cls,
+        specs: AggregateSpec | Sequence[AggregateSpec] | None,
+    ) -> Self:
+        """
+        Build an empty state for one aggregate spec or a sequence of them.
+
+        Parameters
+        ----------
+        specs : AggregateSpec | Sequence[AggregateSpec] | None
+            Aggregate specs. Entries that are not mappings are ignored.
+
+        Returns
+        -------
+        Self
+            Empty aggregate state.
+
+        Raises
+        ------
+        TypeError
+            If a spec's ``func`` is neither an aggregate name nor a callable.
+        ValueError
+            If a spec names an unknown aggregate or invalid quantile options.
+        """
+        if specs is None:
+            items: Sequence[Any] = ()
+        elif SequenceParser.is_non_text(specs):
+            items = cast(Sequence[Any], specs)
+        else:
+            items = [specs]
+        return cls(
+            columns=tuple(
+                _aggregate_column(spec) for spec in items if isinstance(spec, Mapping)
+            ),
+        )
+
+    # -- Instance Methods -- #
+
+    def add(
+        self,
+        record: Mapping[str, Any],
+    ) -> None:
+        """
+        Feed one record to every accumulator.
+
+        Parameters
+        ----------
+        record : Mapping[str, Any]
+            Record to aggregate. Accumulators for fields missing from it are
+            left untouched.
+        """
+        for column, accumulator in zip(
+            self.columns,
+            self.accumulators,
+            strict=True,
+        ):
+            if column.field is None:
+                accumulator.add(None)
+            elif column.field in record:
+                accumulator.add(record[column.field])
+
+    def merge(
+        self,
+        other: AggregateState,
+    ) -> None:
+        """
+        Fold a partial state built from the same specs into this one.
+
+        Parameters
+        ----------
+        other : AggregateState
+            Partial state to merge.
+
+        Raises
+        ------
+        ValueError
+            If *other* was built from different aggregate specs.
+        """
+        if [column.key for column in self.columns] != [
+            column.key for column in other.columns
+        ]:
+            raise ValueError('Cannot merge aggregate states with different specs')
+        for accumulator, partial in zip(
+            self.accumulators,
+            other.accumulators,
+            strict=True,
+        ):
+            accumulator.merge(partial)
+
+    def result(self) -> JSONDict:
+        """
+        Return the current aggregate values keyed by output name.
+
+        Returns
+        -------
+        JSONDict
+            Single-row mapping such as ``{"sum_age": 42, "count": 3}``.
+        """
+        return {
+            column.key: accumulator.result()
+            for column, accumulator in zip(
+                self.columns,
+                self.accumulators,
+                strict=True,
+            )
+        }
+
+    def update(
+        self,
+        records: Iterable[Mapping[str, Any]],
+    ) -> Self:
+        """
+        Feed every record from *records* in one pass.
+
+        Parameters
+        ----------
+        records : Iterable[Mapping[str, Any]]
+            Records to aggregate. Any iterable works, including generators
+            that stream records from a source.
+
+        Returns
+        -------
+        Self
+            This state, for chaining.
+        """
+        for record in records:
+            self.add(record)
+        return self
+
+
 # SECTION: FUNCTIONS ======================================================== #
 
 
@@ -256,9 +448,10 @@ def apply_aggregate(
         Records to aggregate.
     operation : AggregateSpec
         Dict with keys ``field`` and ``func``. ``func`` is one of
-        ``'sum'``, ``'avg'``, ``'min'``, ``'max'``, or ``'count'``.
-        A callable may also be supplied for ``func``. Optionally, set
-        ``alias`` to control the output key name.
+        ``'sum'``, ``'avg'``, ``'min'``, ``'max'``, ``'count'``,
+        ``'distinct'``, or ``'quantile'`` (with optional ``q``). A callable
+        may also be supplied for ``func``. Optionally, set ``alias`` to
+        control the output key name.
 
     Returns
     -------
@@ -268,23 +461,41 @@ def apply_aggregate(
     Notes
     -----
     Numeric operations ignore non-numeric values but count their presence
-    for ``'count'``.
+    for ``'count'``. Values are folded into a constant-memory accumulator;
+    only callables buffer numeric values, through a list-based adapter.
     """
-    field = operation.get('field')
     func = operation.get('func')
-    alias = operation.get('alias')
-
-    if not field or func is None:
+    if not operation.get('field') or func is None:
         return {'error': 'Invalid aggregation operation'}
 
     try:
-        aggregator = _resolve_aggregator(func)
+        state = AggregateState.from_specs(operation)
     except TypeError:
         return {'error': f'Unknown aggregation function: {func}'}
+    return state.update(records).result()
 
-    nums, present = _collect_numeric_and_presence(records, field)
-    key_name = _derive_agg_key(func, field, alias)
-    return {key_name: aggregator(nums, present)}
+
+def apply_aggregates(
+    records: Iterable[Mapping[str, Any]],
+    specs: AggregateSpec | Sequence[AggregateSpec] | None,
+) -> JSONDict:
+    """
+    Compute several aggregate specs in a single pass over *records*.
+
+    Parameters
+    ----------
+    records : Iterable[Mapping[str, Any]]
+        Records to aggregate. Any iterable works, so streamed records are
+        never materialized.
+    specs : AggregateSpec | Sequence[AggregateSpec] | None
+        Aggregate specs in the shape accepted by :func:`apply_aggregate_step`.
+
+    Returns
+    -------
+    JSONDict
+        Merged single-row mapping. Later specs win on duplicate keys.
+    """
+    return AggregateState.from_specs(specs).update(records).result()
 
 
 def apply_aggregate_step(
@@ -311,12 +522,4 @@ def apply_aggregate_step(
     if not isinstance(spec, Mapping):
         return rows
 
-    field: FieldName | None = spec.get('field')  # type: ignore[assignment]
-    func_raw = spec.get('func', 'count')
-    alias = spec.get('alias')
-
-    agg_func = _resolve_aggregator(func_raw)
-    nums, present = _collect_numeric_and_presence(rows, field)
-    key = _derive_agg_key(func_raw, field, alias)
-    result = agg_func(nums, present)
-    return [{key: result}]
+    return [apply_aggregates(rows, spec)]
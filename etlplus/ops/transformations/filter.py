@@ -5,22 +5,58 @@ Filter helpers shared by :mod:`etlplus.ops.transform` and custom runners.
 
 Use :func:`apply_filter` for direct record filtering. Use
 :func:`apply_filter_step` when you need the pipeline-style adapter consumed by
-:func:`etlplus.ops.transform.transform`.
+:func:`etlplus.ops.transform.transform`, or :func:`compile_filter_step` to
+resolve a step spec once into a reusable per-record callable.
+
+Examples
+--------
+Conditions combine into ``all``/``any``/``not`` trees evaluated in one pass::
+
+    spec = {
+        'all': [
+            {'field': 'status', 'op': 'eq', 'value': 'active'},
+            {'any': [
+                {'field': 'age', 'op': 'gte', 'value': 18},
+                {'not': {'field': 'country', 'op': 'in', 'value': ['US']}},
+            ]},
+        ],
+    }
+    rows = apply_filter_step(records, spec)
+
+Notes
+-----
+A tree compiles once into a single predicate. Within each ``all``/``any``
+node, cheaper conditions run first (built-in comparisons before membership
+tests, and those before custom callables), and evaluation stops at the first
+deciding condition. A top-level condition without a field or operator is
+ignored, but malformed trees raise :class:`ValueError` instead of silently
+widening the filter: an ``all``/``any`` node needs a non-empty list of
+usable conditions, and a ``not`` node exactly one condition mapping.
+
+Comparison operators coerce numeric-looking values to ``float`` before
+comparing. Compiled conditions coerce their constant once and dispatch on
+the record value's type, so ``int`` and ``float`` fields skip text parsing,
+and non-numeric constants skip coercion entirely.
 """
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from collections.abc import Mapping
+from dataclasses import dataclass
+from math import isfinite
 from typing import Any
 from typing import cast
 
 from ...utils import FloatParser
+from ...utils import SequenceParser
 from ...utils._types import JSONDict
 from ...utils._types import JSONList
 from .._enums import OperatorName
 from .._types import FieldName
 from .._types import FilterSpec
 from .._types import OperatorFunc
+from .._types import RecordStep
 
 # SECTION: EXPORTS ========================================================== #
 
@@ -28,12 +64,150 @@ from .._types import OperatorFunc
 __all__ = [
     'apply_filter',
     'apply_filter_step',
+    'bind_operator',
+    'compile_filter_step',
+    'filter_group',
 ]
 
 
+# SECTION: INTERNAL CONSTANTS =============================================== #
+
+
+# Relative evaluation cost of built-in operators; callables cost the most.
+_OPERATOR_COSTS: dict[OperatorName, int] = {
+    OperatorName.EQ: 1,
+    OperatorName.NE: 1,
+    OperatorName.GT: 1,
+    OperatorName.GTE: 1,
+    OperatorName.LT: 1,
+    OperatorName.LTE: 1,
+    OperatorName.IN: 2,
+    OperatorName.CONTAINS: 2,
+}
+_CALLABLE_COST = 3
+
+# Operators that compare numeric-looking operands as floats.
+_NUMERIC_OPERATORS: frozenset[OperatorName] = frozenset(
+    {
+        OperatorName.EQ,
+        OperatorName.NE,
+        OperatorName.GT,
+        OperatorName.GTE,
+        OperatorName.LT,
+        OperatorName.LTE,
+    },
+)
+
+# Boolean node keys accepted in filter specs.
+_GROUP_KEYS: tuple[str, ...] = ('all', 'any', 'not')
+
+
+# SECTION: INTERNAL DATA CLASSES ============================================ #
+
+
+@dataclass(frozen=True, slots=True)
+class _Predicate:
+    """One compiled filter condition and its relative evaluation cost."""
+
+    # -- Instance Attributes -- #
+
+    test: Callable[[JSONDict], bool]
+    cost: int
+
+
 # SECTION: INTERNAL FUNCTIONS ============================================== #
 
 
+def _compile_group(
+    kind: str,
+    children: list[Any],
+    *,
+    catch_all: bool,
+) -> _Predicate:
+    """
+    Compile an ``all``/``any``/``not`` node into one short-circuit test.
+
+    Raises
+    ------
+    ValueError
+        If a child is not a usable condition or boolean node.
+    """
+    compiled: list[_Predicate] = []
+    for child in children:
+        if (predicate := _compile_predicate(child, catch_all=catch_all)) is None:
+            raise ValueError(
+                f'Filter {kind!r} node holds an unusable condition: {child!r}'
+            )
+        compiled.append(predicate)
+    cost = sum(predicate.cost for predicate in compiled)
+    if kind == 'not':
+        inner = compiled[0].test
+        return _Predicate(lambda record: not inner(record), cost)
+    if len(compiled) == 1:
+        return compiled[0]
+
+    tests = tuple(
+        predicate.test for predicate in sorted(compiled, key=lambda p: p.cost)
+    )
+    if kind == 'all':
+
+        def _all(record: JSONDict) -> bool:
+            for test in tests:
+                if not test(record):
+                    return False
+            return True
+
+        return _Predicate(_all, cost)
+
+    def _any(record: JSONDict) -> bool:
+        for test in tests:
+            if test(record):
+                return True
+        return False
+
+    return _Predicate(_any, cost)
+
+
+def _compile_predicate(
+    spec: Any,
+    *,
+    catch_all: bool,
+) -> _Predicate | None:
+    """
+    Compile a filter condition or boolean tree into a record predicate.
+
+    Returns ``None`` when *spec* is a plain condition without a usable field
+    or operator. Malformed boolean trees raise :class:`ValueError`.
+    """
+    if (group := filter_group(spec)) is not None:
+        kind, children = group
+        return _compile_group(kind, children, catch_all=catch_all)
+    if not isinstance(spec, Mapping):
+        return None
+
+    field: FieldName = spec.get('field')  # type: ignore[assignment]
+    op = spec.get('op')
+    value = spec.get('value')
+    if not field or op is None:
+        return None
+    try:
+        op_func = bind_operator(op, value)
+    except TypeError:
+        return None
+
+    def _test(record: JSONDict) -> bool:
+        try:
+            return _eval_condition(record, field, op_func, value, catch_all)
+        except TypeError:
+            return False
+
+    if isinstance(op, OperatorName | str):
+        cost = _OPERATOR_COSTS[OperatorName.coerce(op)]
+    else:
+        cost = _CALLABLE_COST
+    return _Predicate(_test, cost)
+
+
 def _contains(
     container: Any,
     member: Any,
@@ -165,14 +339,7 @@ def _resolve_operator(
 
     def _wrap_numeric(op_name: OperatorName) -> OperatorFunc:
         base = op_name.func
-        if op_name in {
-            OperatorName.GT,
-            OperatorName.GTE,
-            OperatorName.LT,
-            OperatorName.LTE,
-            OperatorName.EQ,
-            OperatorName.NE,
-        }:
+        if op_name in _NUMERIC_OPERATORS:
 
             def compare(a: Any, b: Any) -> bool:  # noqa: ANN401 - generic
                 a_num = FloatParser.coerce(a)
@@ -218,7 +385,22 @@ def apply_filter(
     -------
     JSONList
         Filtered records.
+
+    Raises
+    ------
+    ValueError
+        If *condition* is a malformed ``all``/``any``/``not`` tree.
+
+    Notes
+    -----
+    *condition* may also be an ``all``/``any``/``not`` tree of conditions,
+    which is compiled once and evaluated in a single pass.
     """
+    if (group := filter_group(condition)) is not None:
+        kind, children = group
+        test = _compile_group(kind, children, catch_all=False).test
+        return [record for record in records if test(record)]
+
     field = condition.get('field')
     op_raw = condition.get('op')
     value = condition.get('value')
@@ -227,7 +409,7 @@ def apply_filter(
         return records
 
     try:
-        op_func = _resolve_operator(op_raw)
+        op_func = bind_operator(op_raw, value)
     except TypeError:
         return records
 
@@ -252,7 +434,8 @@ def apply_filter_step(
     records : JSONList
         Input records to filter.
     spec : Any
-        Mapping with keys ``field``, ``op``, and ``value``. ``op`` may be a
+        Mapping with keys ``field``, ``op``, and ``value``, or an
+        ``all``/``any``/``not`` tree of such mappings. ``op`` may be a
         string, :class:`OperatorName`, or a callable.
 
     Returns
@@ -260,26 +443,161 @@ def apply_filter_step(
     JSONList
         Filtered records using the same step semantics as
         :func:`etlplus.ops.transform.transform`.
+
+    Raises
+    ------
+    ValueError
+        If *spec* is a malformed ``all``/``any``/``not`` tree.
     """
-    if not isinstance(spec, Mapping):
+    step = compile_filter_step(spec)
+    if step is None:
         return records
+    return [record for record in records if step(record) is not None]
 
-    field: FieldName = spec.get('field')  # type: ignore[assignment]
-    op = spec.get('op')
-    value = spec.get('value')
 
-    if not field or op is None:
-        return records
+def bind_operator(
+    op: OperatorName | OperatorFunc | str,
+    value: Any,
+) -> OperatorFunc:
+    """
+    Resolve *op* specialized for the constant right-hand operand *value*.
 
-    try:
-        op_func = _resolve_operator(op)
-    except TypeError:
-        return records
+    The returned predicate must be called with *value* as its second
+    argument. It matches :func:`_resolve_operator` exactly, but coerces
+    *value* once instead of per record.
 
-    return _filter_records(
-        records,
-        field=field,
-        op_func=op_func,
-        value=value,
-        catch_all=True,
-    )
+    Parameters
+    ----------
+    op : OperatorName | OperatorFunc | str
+        An :class:`OperatorName`, a string (with aliases), or a callable.
+    value : Any
+        Constant compared against every record value.
+
+    Returns
+    -------
+    OperatorFunc
+        Function of signature ``(a: Any, b: Any) -> bool``.
+
+    Raises
+    ------
+    TypeError
+        If *op* cannot be interpreted as an operator.
+    """
+    if not isinstance(op, OperatorName | str):
+        return _resolve_operator(op)
+    op_name = OperatorName.coerce(op)
+    base = op_name.func
+    if op_name not in _NUMERIC_OPERATORS:
+        return base
+    value_num = FloatParser.coerce(value)
+    if value_num is None:
+        # Pure non-numeric constant: the raw comparison always applies.
+        return base
+
+    def compare(a: Any, b: Any) -> bool:  # noqa: ANN401 - generic
+        kind = type(a)
+        if kind is float:
+            # Pure numeric fast path; non-finite floats never coerce.
+            return bool(base(a, value_num) if isfinite(a) else base(a, b))
+        if kind is int:
+            return bool(base(float(a), value_num))
+        # Mixed values (numeric text, decimals, ``None``) take the full path.
+        a_num = FloatParser.coerce(a)
+        if a_num is not None:
+            return bool(base(a_num, value_num))
+        return bool(base(a, b))
+
+    return compare
+
+
+def compile_filter_step(
+    spec: Any,
+) -> RecordStep | None:
+    """
+    Compile a filter pipeline step into a reusable per-record callable.
+
+    The operator is resolved once, so the returned callable can be applied to
+    any number of records without re-reading *spec*.
+
+    Parameters
+    ----------
+    spec : Any
+        Mapping with keys ``field``, ``op``, and ``value``, or an
+        ``all``/``any``/``not`` tree of such mappings. ``op`` may be a
+        string, :class:`OperatorName`, or a callable.
+
+    Returns
+    -------
+    RecordStep | None
+        Callable returning the record when it matches and ``None`` otherwise,
+        or ``None`` when *spec* does not describe a usable filter.
+
+    Raises
+    ------
+    ValueError
+        If *spec* is a malformed ``all``/``any``/``not`` tree.
+    """
+    if (predicate := _compile_predicate(spec, catch_all=True)) is None:
+        return None
+    test = predicate.test
+
+    def _step(record: JSONDict) -> JSONDict | None:
+        return record if test(record) else None
+
+    return _step
+
+
+def filter_group(
+    spec: Any,
+) -> tuple[str, list[Any]] | None:
+    """
+    Return the ``(kind, children)`` of an ``all``/``any``/``not`` node.
+
+    Parameters
+    ----------
+    spec : Any
+        Filter spec to inspect.
+
+    Returns
+    -------
+    tuple[str, list[Any]] | None
+        Node kind and child specs, or ``None`` when *spec* is a plain
+        ``field``/``op``/``value`` condition or not a mapping. A ``not`` node
+        always has exactly one child.
+
+    Raises
+    ------
+    ValueError
+        If *spec* mixes boolean keys with each other or with condition keys,
+        if an ``all``/``any`` value is not a non-empty list of mappings, or
+        if a ``not`` value is not exactly one mapping.
+    """
+    if not isinstance(spec, Mapping):
+        return None
+    kinds = [kind for kind in _GROUP_KEYS if kind in spec]
+    if not kinds:
+        return None
+    if len(kinds) > 1 or 'field' in spec or 'op' in spec:
+        raise ValueError(
+            'Filter node must hold exactly one of all/any/not and no '
+            f'field/op keys: {dict(spec)!r}',
+        )
+    kind = kinds[0]
+    children = spec[kind]
+    if kind == 'not':
+        if not isinstance(children, Mapping):
+            raise ValueError(
+                "Filter 'not' node takes exactly one condition mapping, "
+                f'got {children!r}',
+            )
+        return kind, [children]
+    if not SequenceParser.is_non_text(children) or not children:
+        raise ValueError(
+            f'Filter {kind!r} node takes a non-empty list of conditions, '
+            f'got {children!r}',
+        )
+    if not all(isinstance(child, Mapping) for child in children):
+        raise ValueError(
+            f'Filter {kind!r} node takes condition mappings, got {children!r}',
+        )
+    return kind, list(children)
@@ -0,0 +1,217 @@
+"""
+:mod:`etlplus.ops.transformations.group_by` module.
+
+Grouped aggregate helpers shared by :mod:`etlplus.ops.transform` and custom
+runners.
+
+Use :func:`apply_group_by` to roll records up by key fields. Use
+:func:`apply_group_by_step` when you need the pipeline-style adapter consumed
+by :func:`etlplus.ops.transform.transform`, or :func:`compile_group_by_step`
+to resolve a step spec once into a reusable batch callable.
+
+Examples
+--------
+Per-customer rollup in one pass over the records::
+
+    spec = {
+        'keys': ['customer_id'],
+        'aggregates': [
+            {'field': 'amount', 'func': 'sum', 'alias': 'total'},
+            {'field': 'amount', 'func': 'quantile', 'q': 0.95},
+            {'field': 'order_id', 'func': 'distinct', 'alias': 'orders'},
+        ],
+    }
+    rows = apply_group_by_step(records, spec)
+
+Notes
+-----
+Records are scanned once. Each group holds one
+:class:`etlplus.ops.transformations.aggregate.AggregateState`, so memory
+grows with the number of groups rather than the number of records.
+``distinct`` keeps one entry per distinct value, and ``quantile`` keeps a
+bounded sketch whose estimate is exact for small groups.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from collections.abc import Sequence
+from functools import partial
+from typing import Any
+
+from ...utils._types import JSONDict
+from ...utils._types import JSONList
+from .._types import AggregateSpec
+from .._types import BatchStep
+from .._types import FieldName
+from .._types import Fields
+from .aggregate import AggregateState
+
+# SECTION: EXPORTS ========================================================== #
+
+
+__all__ = [
+    'apply_group_by',
+    'apply_group_by_step',
+    'compile_group_by_step',
+    'group_keys',
+]
+
+
+# SECTION: INTERNAL FUNCTIONS ============================================== #
+
+
+def _hash_key(
+    values: tuple[Any, ...],
+) -> tuple[Any, ...]:
+    """Return *values* usable as a dict key, using ``repr`` if unhashable."""
+    try:
+        hash(values)
+    except TypeError:
+        return tuple(repr(value) for value in values)
+    return values
+
+
+def _run_group_by(
+    records: JSONList,
+    keys: tuple[FieldName, ...],
+    template: AggregateState,
+) -> JSONList:
+    """Aggregate *records* per key tuple in one pass."""
+    groups: dict[tuple[Any, ...], tuple[tuple[Any, ...], AggregateState]] = {}
+    for record in records:
+        key_values = tuple(record.get(key) for key in keys)
+        group_key = _hash_key(key_values)
+        group = groups.get(group_key)
+        if group is None:
+            group = groups[group_key] = (
+                key_values,
+                AggregateState(template.columns),
+            )
+        group[1].add(record)
+
+    result: JSONList = []
+    for key_values, state in groups.values():
+        row: JSONDict = dict(zip(keys, key_values, strict=True))
+        row.update(state.result())
+        result.append(row)
+    return result
+
+
+# SECTION: FUNCTIONS ======================================================== #
+
+
+def apply_group_by(
+    records: JSONList,
+    keys: Fields | FieldName | None,
+    aggregates: AggregateSpec | Sequence[AggregateSpec] | None = None,
+) -> JSONList:
+    """
+    Aggregate records per distinct combination of key fields.
+
+    Parameters
+    ----------
+    records : JSONList
+        Records to aggregate.
+    keys : Fields | FieldName | None
+        Field name or names to group by. Records missing a key field are
+        grouped under ``None`` for it. Without keys, all records form one
+        group.
+    aggregates : AggregateSpec | Sequence[AggregateSpec] | None, optional
+        Aggregate specs in the shape accepted by
+        :func:`etlplus.ops.transformations.aggregate.apply_aggregate_step`.
+        ``func`` also accepts ``distinct`` and ``quantile`` (with optional
+        ``q``, default ``0.5``).
+
+    Returns
+    -------
+    JSONList
+        One record per group, in first-seen order, holding the key fields
+        followed by each aggregate result.
+    """
+    return _run_group_by(
+        records,
+        group_keys(keys),
+        AggregateState.from_specs(aggregates),
+    )
+
+
+def apply_group_by_step(
+    records: JSONList,
+    spec: Any,
+) -> JSONList:
+    """
+    Apply a group-by pipeline step to a list of records.
+
+    Parameters
+    ----------
+    records : JSONList
+        Input records to aggregate.
+    spec : Any
+        Mapping with keys ``'keys'`` and ``'aggregates'``.
+
+    Returns
+    -------
+    JSONList
+        Grouped rows using the same step semantics as
+        :func:`etlplus.ops.transform.transform`.
+    """
+    step = compile_group_by_step(spec)
+    return records if step is None else step(records)
+
+
+def compile_group_by_step(
+    spec: Any,
+) -> BatchStep | None:
+    """
+    Compile a group-by pipeline step into a reusable batch callable.
+
+    Parameters
+    ----------
+    spec : Any
+        Mapping with keys ``'keys'`` and ``'aggregates'``.
+
+    Returns
+    -------
+    BatchStep | None
+        Callable returning grouped rows, or ``None`` when *spec* names
+        neither keys nor aggregates.
+
+    Raises
+    ------
+    ValueError
+        If an aggregate names an unknown function or invalid quantile.
+    """
+    if not isinstance(spec, Mapping):
+        return None
+    keys = group_keys(spec.get('keys'))
+    try:
+        template = AggregateState.from_specs(spec.get('aggregates'))
+    except TypeError as exc:
+        raise ValueError(str(exc)) from exc
+    if not keys and not template.columns:
+        return None
+    return partial(_run_group_by, keys=keys, template=template)
+
+
+def group_keys(
+    keys: Fields | FieldName | None,
+) -> tuple[FieldName, ...]:
+    """
+    Normalize group key fields into a tuple of names.
+
+    Parameters
+    ----------
+    keys : Fields | FieldName | None
+        One field name, a sequence of them, or ``None``.
+
+    Returns
+    -------
+    tuple[FieldName, ...]
+        Key field names in spec order; empty without keys.
+    """
+    if keys is None:
+        return ()
+    if isinstance(keys, str):
+        return (keys,)
+    return tuple(str(key) for key in keys)
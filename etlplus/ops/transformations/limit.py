@@ -0,0 +1,170 @@
+"""
+:mod:`etlplus.ops.transformations.limit` module.
+
+Limit helpers shared by :mod:`etlplus.ops.transform` and custom runners.
+
+Use :func:`apply_limit` to keep the first records of a list, or
+:func:`iter_limit` to stop pulling from a record stream once enough records
+have been seen. Use :func:`apply_limit_step` when you need the pipeline-style
+adapter consumed by :func:`etlplus.ops.transform.transform`, or
+:func:`compile_limit_step` to resolve a step spec once into a reusable batch
+callable.
+
+Examples
+--------
+Step specs are either a record count or a mapping with ``count``::
+
+    ops = {'limit': 100}
+    ops = {'limit': {'count': 100}}
+
+Notes
+-----
+:func:`iter_limit` never reads past the last kept record, so a lazy extract
+feeding it stops as soon as the limit is reached.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from functools import partial
+from itertools import islice
+from typing import Any
+
+from ...utils import IntParser
+from ...utils._types import JSONDict
+from ...utils._types import JSONList
+from .._types import BatchStep
+
+# SECTION: EXPORTS ========================================================== #
+
+
+__all__ = [
+    'apply_limit',
+    'apply_limit_step',
+    'compile_limit_step',
+    'iter_limit',
+    'limit_count',
+]
+
+
+# SECTION: FUNCTIONS ======================================================== #
+
+
+def apply_limit(
+    records: JSONList,
+    count: int | None,
+) -> JSONList:
+    """
+    Keep the first *count* records.
+
+    Parameters
+    ----------
+    records : JSONList
+        Records to limit.
+    count : int | None
+        Maximum number of records to keep. If ``None``, input is returned
+        unchanged.
+
+    Returns
+    -------
+    JSONList
+        At most *count* records, in input order.
+    """
+    if count is None:
+        return records
+    return records[: max(count, 0)]
+
+
+def apply_limit_step(
+    records: JSONList,
+    spec: Any,
+) -> JSONList:
+    """
+    Apply a limit pipeline step to a list of records.
+
+    Parameters
+    ----------
+    records : JSONList
+        Input records to limit.
+    spec : Any
+        Either a record count, or a mapping with key ``'count'``.
+
+    Returns
+    -------
+    JSONList
+        Limited records using the same step semantics as
+        :func:`etlplus.ops.transform.transform`.
+    """
+    return apply_limit(records, limit_count(spec))
+
+
+def compile_limit_step(
+    spec: Any,
+) -> BatchStep | None:
+    """
+    Compile a limit pipeline step into a reusable batch callable.
+
+    Parameters
+    ----------
+    spec : Any
+        Either a record count, or a mapping with key ``'count'``.
+
+    Returns
+    -------
+    BatchStep | None
+        Callable returning the first records, or ``None`` when *spec* does
+        not contain a usable count.
+    """
+    if (count := limit_count(spec)) is None:
+        return None
+    return partial(apply_limit, count=count)
+
+
+def iter_limit(
+    records: Iterable[JSONDict],
+    count: int | None,
+) -> Iterator[JSONDict]:
+    """
+    Yield at most *count* records from *records*, then stop reading.
+
+    Parameters
+    ----------
+    records : Iterable[JSONDict]
+        Records to limit. Any iterable works, including lazy extracts.
+    count : int | None
+        Maximum number of records to yield. If ``None``, every record is
+        yielded.
+
+    Returns
+    -------
+    Iterator[JSONDict]
+        The first *count* records, in input order.
+    """
+    if count is None:
+        return iter(records)
+    return islice(records, max(count, 0))
+
+
+def limit_count(
+    spec: Any,
+) -> int | None:
+    """
+    Return the record count described by a limit spec.
+
+    Parameters
+    ----------
+    spec : Any
+        ``limit`` step spec: a count, or a mapping with a ``count`` key.
+
+    Returns
+    -------
+    int | None
+        Non-negative record count, or ``None`` when *spec* holds no usable
+        count.
+    """
+    value = spec.get('count') if isinstance(spec, Mapping) else spec
+    if isinstance(value, bool):
+        return None
+    return IntParser.parse(value, minimum=0)
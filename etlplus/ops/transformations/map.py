@@ -6,7 +6,8 @@ runners.
 
 Use :func:`apply_map` for direct field renaming. Use :func:`apply_map_step`
 when you need the pipeline-style adapter consumed by
-:func:`etlplus.ops.transform.transform`.
+:func:`etlplus.ops.transform.transform`, or :func:`compile_map_step` to resolve
+a step spec once into a reusable per-record callable.
 """
 
 from __future__ import annotations
@@ -14,8 +15,10 @@ from __future__ import annotations
 from collections.abc import Mapping
 from typing import Any
 
+from ...utils._types import JSONDict
 from ...utils._types import JSONList
 from .._types import MapSpec
+from .._types import RecordStep
 
 # SECTION: EXPORTS ========================================================== #
 
@@ -23,9 +26,29 @@ from .._types import MapSpec
 __all__ = [
     'apply_map',
     'apply_map_step',
+    'compile_map_step',
 ]
 
 
+# SECTION: INTERNAL FUNCTIONS =============================================== #
+
+
+def _rename_record(
+    record: JSONDict,
+    rename_map: dict[str, str],
+) -> JSONDict:
+    """Return a copy of *record* with keys renamed per *rename_map*."""
+    renamed = {
+        new_key: record[old_key]
+        for old_key, new_key in rename_map.items()
+        if old_key in record
+    }
+    renamed.update(
+        {key: value for key, value in record.items() if key not in rename_map},
+    )
+    return renamed
+
+
 # SECTION: FUNCTIONS ======================================================== #
 
 
@@ -49,20 +72,7 @@ def apply_map(
         New records with keys renamed. Unmapped fields are preserved.
     """
     rename_map = dict(mapping)
-    result: JSONList = []
-
-    for record in records:
-        renamed = {
-            new_key: record[old_key]
-            for old_key, new_key in rename_map.items()
-            if old_key in record
-        }
-        renamed.update(
-            {key: value for key, value in record.items() if key not in rename_map},
-        )
-        result.append(renamed)
-
-    return result
+    return [_rename_record(record, rename_map) for record in records]
 
 
 def apply_map_step(
@@ -89,3 +99,31 @@ def apply_map_step(
         return apply_map(records, spec)
 
     return records
+
+
+def compile_map_step(
+    spec: Any,
+) -> RecordStep | None:
+    """
+    Compile a map/rename pipeline step into a reusable per-record callable.
+
+    Parameters
+    ----------
+    spec : Any
+        Mapping of **old field names** to **new field names**.
+
+    Returns
+    -------
+    RecordStep | None
+        Callable returning a renamed copy of one record, or ``None`` when
+        *spec* is not a mapping.
+    """
+    if not isinstance(spec, Mapping):
+        return None
+
+    rename_map = dict(spec)
+
+    def _step(record: JSONDict) -> JSONDict:
+        return _rename_record(record, rename_map)
+
+    return _step
@@ -5,8 +5,9 @@ Select helpers shared by :mod:`etlplus.ops.transform` and custom runners.
 
 Use :func:`apply_select` for direct field projection. Use
 :func:`apply_select_step` when you need the pipeline-style adapter consumed by
-:func:`etlplus.ops.transform.transform`. The normalization helper
-:func:`is_plain_fields_list` and compatibility alias
+:func:`etlplus.ops.transform.transform`, or :func:`compile_select_step` to
+resolve a step spec once into a reusable per-record callable. The normalization
+helper :func:`is_plain_fields_list` and compatibility alias
 :func:`is_sequence_not_text` are public for callers that need to validate
 select-step configs before orchestration.
 """
@@ -19,8 +20,10 @@ from typing import Any
 from typing import TypeGuard
 
 from ...utils import SequenceParser
+from ...utils._types import JSONDict
 from ...utils._types import JSONList
 from .._types import Fields
+from .._types import RecordStep
 
 # SECTION: EXPORTS ========================================================== #
 
@@ -28,8 +31,10 @@ from .._types import Fields
 __all__ = [
     'apply_select',
     'apply_select_step',
+    'compile_select_step',
     'is_plain_fields_list',
     'is_sequence_not_text',
+    'select_fields',
 ]
 
 
@@ -79,18 +84,38 @@ def apply_select_step(
         Projected records using the same step semantics as
         :func:`etlplus.ops.transform.transform`.
     """
-    fields: Sequence[Any]
-    if isinstance(spec, Mapping):
-        maybe_fields = spec.get('fields')
-        if not is_plain_fields_list(maybe_fields):
-            return records
-        fields = maybe_fields
-    elif is_plain_fields_list(spec):
-        fields = spec
-    else:
+    fields = select_fields(spec)
+    if fields is None:
         return records
+    return apply_select(records, fields)
+
+
+def compile_select_step(
+    spec: Any,
+) -> RecordStep | None:
+    """
+    Compile a select/project pipeline step into a reusable per-record callable.
+
+    Parameters
+    ----------
+    spec : Any
+        Either a mapping with key ``'fields'`` whose value is a sequence of
+        field names, or a plain sequence of field names.
+
+    Returns
+    -------
+    RecordStep | None
+        Callable returning the projected record, or ``None`` when *spec* does
+        not name any fields.
+    """
+    fields = select_fields(spec)
+    if fields is None:
+        return None
 
-    return apply_select(records, [str(field) for field in fields])
+    def _step(record: JSONDict) -> JSONDict:
+        return {field: record.get(field) for field in fields}
+
+    return _step
 
 
 def is_plain_fields_list(
@@ -138,3 +163,33 @@ def is_sequence_not_text(
         ``True`` if *obj* is a non-text sequence; ``False`` otherwise.
     """
     return SequenceParser.is_non_text(obj)
+
+
+def select_fields(
+    spec: Any,
+) -> list[str] | None:
+    """
+    Return the projected field names described by a select spec.
+
+    Parameters
+    ----------
+    spec : Any
+        ``select`` step spec: a plain list of field names, or a mapping with
+        a ``fields`` list.
+
+    Returns
+    -------
+    list[str] | None
+        Field names in spec order, or ``None`` when *spec* is unusable.
+    """
+    fields: Sequence[Any]
+    if isinstance(spec, Mapping):
+        maybe_fields = spec.get('fields')
+        if not is_plain_fields_list(maybe_fields):
+            return None
+        fields = maybe_fields
+    elif is_plain_fields_list(spec):
+        fields = spec
+    else:
+        return None
+    return [str(field) for field in fields]
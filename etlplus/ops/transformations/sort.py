@@ -5,60 +5,180 @@ Sort helpers shared by :mod:`etlplus.ops.transform` and custom runners.
 
 Use :func:`apply_sort` for direct record sorting. Use :func:`apply_sort_step`
 when you need the pipeline-style adapter consumed by
-:func:`etlplus.ops.transform.transform`.
+:func:`etlplus.ops.transform.transform`, or :func:`compile_sort_step` to
+resolve a step spec once into a reusable batch callable. Use
+:func:`iter_sorted` to sort a record stream larger than memory.
+
+Examples
+--------
+Multi-key sort with per-key direction that spills to disk past 500k
+records::
+
+    spec = {
+        'keys': ['region', {'field': 'amount', 'reverse': True}],
+        'max_in_memory': 500_000,
+    }
+    rows = apply_sort_step(records, spec)
+
+Notes
+-----
+When more records arrive than ``max_in_memory``, each full buffer is sorted
+and written to a temporary run file, and the runs are k-way merged with
+:func:`heapq.merge`. Runs are pickled rather than serialized as JSON so
+values round-trip with their original Python types. Merges are stable, so
+spilled and in-memory sorts return records in the same order.
 """
 
 from __future__ import annotations
 
+import heapq
+import pickle
+import tempfile
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
 from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import partial
+from itertools import islice
+from pathlib import Path
 from typing import Any
 
+from ...utils import SequenceParser
 from ...utils import is_number_value
+from ...utils._types import JSONDict
 from ...utils._types import JSONList
+from ...utils._types import StrPath
+from .._types import BatchStep
 from .._types import FieldName
+from .._types import SortField
 from .._types import SortKey
 
 # SECTION: EXPORTS ========================================================== #
 
 
 __all__ = [
+    # Constants
+    'DEFAULT_SORT_BUFFER',
+    # Functions
     'apply_sort',
     'apply_sort_step',
+    'compile_sort_step',
+    'iter_sorted',
+    'record_sort_key',
+    'sort_fields',
+    'sort_key',
 ]
 
 
+# SECTION: CONSTANTS ======================================================== #
+
+
+# Records buffered per sorted run when a streaming run sorts without an
+# explicit ``max_in_memory`` budget.
+DEFAULT_SORT_BUFFER = 100_000
+
+
+# SECTION: INTERNAL CONSTANTS =============================================== #
+
+
+# Maximum number of run files merged at once; more runs merge in passes.
+_MAX_MERGE_WIDTH = 64
+
+
+# SECTION: INTERNAL DATA CLASSES ============================================ #
+
+
+@dataclass(frozen=True, slots=True)
+class _Descending:
+    """Sort key wrapper that inverts ordering for one descending key."""
+
+    # -- Instance Attributes -- #
+
+    key: SortKey
+
+    # -- Magic Methods (Object Comparison) -- #
+
+    def __lt__(
+        self,
+        other: _Descending,
+    ) -> bool:
+        return other.key < self.key
+
+
 # SECTION: INTERNAL FUNCTIONS ============================================== #
 
 
-def _sort_key(
-    value: Any,
-) -> SortKey:
-    """
-    Coerce mixed-type values into a sortable tuple key.
+def _sort_args(
+    spec: Any,
+) -> tuple[FieldName | None, bool]:
+    """Return the ``(field, reverse)`` pair described by a sort spec."""
+    if isinstance(spec, Mapping):
+        field_value = spec.get('field')
+        field = str(field_value) if field_value is not None else None
+        return field, bool(spec.get('reverse', False))
+    if spec is None:
+        return None, False
+    return str(spec), False
 
-    Notes
-    -----
-    The ordering policy of sorted keys is as follows:
-    1) Numbers
-    2) Non-numeric values (stringified)
-    3) ``None`` (last)
 
-    Parameters
-    ----------
-    value : Any
-        Value to normalize for sorting.
+def _read_run(
+    path: Path,
+) -> Iterator[JSONDict]:
+    """Yield the records pickled into one run file, in order."""
+    with path.open('rb') as handle:
+        while True:
+            try:
+                yield pickle.load(handle)
+            except EOFError:
+                return
 
-    Returns
-    -------
-    SortKey
-        A key with a type tag to avoid cross-type comparisons.
-    """
-    if value is None:
-        return (2, '')
-    if is_number_value(value):
-        return (0, float(value))
 
-    return (1, str(value))
+def _write_run(
+    path: Path,
+    records: Iterable[JSONDict],
+) -> Path:
+    """Pickle *records* one by one into a run file at *path*."""
+    with path.open('wb') as handle:
+        pickler = pickle.Pickler(handle, protocol=pickle.HIGHEST_PROTOCOL)
+        for record in records:
+            pickler.dump(record)
+            # Each record is independent; skip the shared memo.
+            pickler.clear_memo()
+    return path
+
+
+def _merge_runs(
+    runs: list[Path],
+    directory: Path,
+    key: Callable[[JSONDict], Any],
+    reverse: bool,
+) -> Iterator[JSONDict]:
+    """Merge sorted run files, in passes when there are too many to open."""
+    generation = 0
+    while len(runs) > _MAX_MERGE_WIDTH:
+        merged: list[Path] = []
+        for start in range(0, len(runs), _MAX_MERGE_WIDTH):
+            group = runs[start : start + _MAX_MERGE_WIDTH]
+            path = directory / f'merge-{generation:03d}-{len(merged):05d}.pkl'
+            _write_run(
+                path,
+                heapq.merge(
+                    *(_read_run(run) for run in group),
+                    key=key,
+                    reverse=reverse,
+                ),
+            )
+            for run in group:
+                run.unlink()
+            merged.append(path)
+        runs = merged
+        generation += 1
+    yield from heapq.merge(
+        *(_read_run(run) for run in runs),
+        key=key,
+        reverse=reverse,
+    )
 
 
 # SECTION: FUNCTIONS ======================================================== #
@@ -92,7 +212,7 @@ def apply_sort(
     key_field: FieldName = field
     return sorted(
         records,
-        key=lambda item: _sort_key(item.get(key_field)),
+        key=lambda item: sort_key(item.get(key_field)),
         reverse=reverse,
     )
 
@@ -109,8 +229,9 @@ def apply_sort_step(
     records : JSONList
         Input records to sort.
     spec : Any
-        Either a mapping with keys ``'field'`` and optional ``'reverse'``, or
-        a plain field name.
+        A plain field name, a mapping with keys ``'field'`` and optional
+        ``'reverse'``, or a mapping with a ``'keys'`` list of such entries.
+        Mappings may also set ``'max_in_memory'`` and ``'spill_dir'``.
 
     Returns
     -------
@@ -118,13 +239,221 @@ def apply_sort_step(
         Sorted records using the same step semantics as
         :func:`etlplus.ops.transform.transform`.
     """
-    if isinstance(spec, Mapping):
-        field_value = spec.get('field')
-        field = str(field_value) if field_value is not None else None
-        reverse = bool(spec.get('reverse', False))
-        return apply_sort(records, field, reverse)
+    step = compile_sort_step(spec)
+    return records if step is None else step(records)
 
-    if spec is None:
-        return records
 
-    return apply_sort(records, str(spec), False)
+def compile_sort_step(
+    spec: Any,
+) -> BatchStep | None:
+    """
+    Compile a sort pipeline step into a reusable batch callable.
+
+    Parameters
+    ----------
+    spec : Any
+        A plain field name, a mapping with keys ``'field'`` and optional
+        ``'reverse'``, or a mapping with a ``'keys'`` list of such entries.
+        Mappings may also set ``'max_in_memory'`` and ``'spill_dir'``.
+
+    Returns
+    -------
+    BatchStep | None
+        Callable returning sorted records, or ``None`` when *spec* does not
+        name a sort field.
+    """
+    fields = sort_fields(spec)
+    if not fields:
+        return None
+    options = spec if isinstance(spec, Mapping) else {}
+    max_in_memory = options.get('max_in_memory')
+    if len(fields) == 1 and max_in_memory is None:
+        field, reverse = fields[0]
+        return partial(apply_sort, field=field, reverse=reverse)
+
+    def _step(records: JSONList) -> JSONList:
+        return list(
+            iter_sorted(
+                records,
+                fields,
+                max_in_memory=max_in_memory,
+                spill_dir=options.get('spill_dir'),
+            ),
+        )
+
+    return _step
+
+
+def iter_sorted(
+    records: Iterable[JSONDict],
+    fields: tuple[SortField, ...],
+    *,
+    max_in_memory: int | None = None,
+    spill_dir: StrPath | None = None,
+) -> Iterator[JSONDict]:
+    """
+    Yield *records* sorted by *fields*, spilling to disk past a budget.
+
+    Parameters
+    ----------
+    records : Iterable[JSONDict]
+        Records to sort. Any iterable works; it is consumed once.
+    fields : tuple[SortField, ...]
+        ``(field, reverse)`` pairs, most significant first.
+    max_in_memory : int | None, optional
+        Maximum number of records held in memory at once. When more arrive,
+        sorted runs are written to temporary files and merged. ``None`` sorts
+        everything in memory.
+    spill_dir : StrPath | None, optional
+        Directory for temporary run files. Defaults to the system temporary
+        directory.
+
+    Yields
+    ------
+    JSONDict
+        Records in sorted order. Equal keys keep their input order.
+
+    Raises
+    ------
+    ValueError
+        If *max_in_memory* is not positive.
+    """
+    if not fields:
+        yield from records
+        return
+    key, reverse = record_sort_key(fields)
+    if max_in_memory is None:
+        yield from sorted(records, key=key, reverse=reverse)
+        return
+    if max_in_memory < 1:
+        raise ValueError('max_in_memory must be a positive integer')
+
+    iterator = iter(records)
+    chunk = list(islice(iterator, max_in_memory))
+    if len(chunk) < max_in_memory:
+        chunk.sort(key=key, reverse=reverse)
+        yield from chunk
+        return
+
+    with tempfile.TemporaryDirectory(prefix='etlplus-sort-', dir=spill_dir) as tmp:
+        directory = Path(tmp)
+        runs: list[Path] = []
+        while chunk:
+            chunk.sort(key=key, reverse=reverse)
+            runs.append(_write_run(directory / f'run-{len(runs):05d}.pkl', chunk))
+            chunk = list(islice(iterator, max_in_memory))
+        yield from _merge_runs(runs, directory, key, reverse)
+
+
+def record_sort_key(
+    fields: tuple[SortField, ...],
+) -> tuple[Callable[[JSONDict], Any], bool]:
+    """
+    Build a record key function and global ``reverse`` flag for *fields*.
+
+    Keys sharing one direction sort as plain tuples with Python's ``reverse``
+    flag. Mixed directions wrap the descending keys so that one ascending
+    sort applies every direction.
+
+    Parameters
+    ----------
+    fields : tuple[SortField, ...]
+        ``(field, reverse)`` pairs, most significant first, as returned by
+        :func:`sort_fields`.
+
+    Returns
+    -------
+    tuple[Callable[[JSONDict], Any], bool]
+        Key function for :func:`sorted` or :mod:`heapq`, and the ``reverse``
+        flag to use with it.
+    """
+    names = tuple(name for name, _ in fields)
+    directions = {reverse for _, reverse in fields}
+    if len(directions) == 1:
+        reverse = directions.pop()
+        if len(names) == 1:
+            name = names[0]
+            return (lambda record: sort_key(record.get(name))), reverse
+        return (
+            lambda record: tuple(sort_key(record.get(name)) for name in names)
+        ), reverse
+
+    def _key(record: JSONDict) -> tuple[Any, ...]:
+        return tuple(
+            _Descending(sort_key(record.get(name)))
+            if reverse
+            else sort_key(record.get(name))
+            for name, reverse in fields
+        )
+
+    return _key, False
+
+
+def sort_fields(
+    spec: Any,
+) -> tuple[SortField, ...]:
+    """
+    Return the ``(field, reverse)`` keys described by a sort spec.
+
+    Parameters
+    ----------
+    spec : Any
+        A plain field name, a mapping with keys ``'field'`` and optional
+        ``'reverse'``, or a mapping with a ``'keys'`` list whose entries are
+        field names or ``field``/``reverse`` mappings. A top-level
+        ``'reverse'`` is the default direction for ``'keys'`` entries.
+
+    Returns
+    -------
+    tuple[SortField, ...]
+        Sort keys, most significant first. Empty when *spec* names no field.
+    """
+    if isinstance(spec, Mapping) and spec.get('keys') is not None:
+        keys = spec['keys']
+        entries = keys if SequenceParser.is_non_text(keys) else [keys]
+        default_reverse = bool(spec.get('reverse', False))
+        fields: list[SortField] = []
+        for entry in entries:
+            if isinstance(entry, Mapping):
+                field, reverse = _sort_args(
+                    {'reverse': default_reverse, **entry},
+                )
+            else:
+                field, reverse = _sort_args(entry)
+                reverse = default_reverse
+            if field:
+                fields.append((field, reverse))
+        return tuple(fields)
+    field, reverse = _sort_args(spec)
+    return ((field, reverse),) if field else ()
+
+
+def sort_key(
+    value: Any,
+) -> SortKey:
+    """
+    Coerce mixed-type values into a sortable tuple key.
+
+    Notes
+    -----
+    The ordering policy of sorted keys is as follows:
+    1) Numbers
+    2) Non-numeric values (stringified)
+    3) ``None`` (last)
+
+    Parameters
+    ----------
+    value : Any
+        Value to normalize for sorting.
+
+    Returns
+    -------
+    SortKey
+        A key with a type tag to avoid cross-type comparisons.
+    """
+    if value is None:
+        return (2, '')
+    if is_number_value(value):
+        return (0, float(value))
+
+    return (1, str(value))
@@ -0,0 +1,254 @@
+"""
+:mod:`etlplus.ops.transformations.sql` module.
+
+SQL helpers shared by :mod:`etlplus.ops.transform` and custom runners.
+
+Use :func:`apply_sql` to run a DuckDB query against records, or
+:func:`apply_sql_table` to run it against a ``pyarrow.Table`` without copying
+the table into DuckDB. Use :func:`apply_sql_step` when you need the
+pipeline-style adapter consumed by :func:`etlplus.ops.transform.transform`,
+or :func:`compile_sql_step` to resolve a step spec once into a reusable batch
+callable.
+
+Examples
+--------
+Step specs are either a query string or a mapping naming the relation::
+
+    ops = {'sql': 'SELECT region, sum(amount) AS total FROM data GROUP BY 1'}
+    ops = {'sql': {'query': 'SELECT * FROM orders LIMIT 10', 'table': 'orders'}}
+
+Notes
+-----
+Each call opens a short-lived in-memory DuckDB connection, so queries cannot
+see catalogs, files, or relations other than the registered payload unless
+they name them explicitly. Whole-number decimal result columns, such as sums
+of integers, are cast to ``int64``. Fractional decimals stay exact and come
+back as :class:`decimal.Decimal` values.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from functools import partial
+from typing import Any
+
+from ...file._imports import get_dependency
+from ...file._io import records_to_arrow_table
+from ...utils._types import JSONList
+from .._types import BatchStep
+
+# SECTION: EXPORTS ========================================================== #
+
+
+__all__ = [
+    # Constants
+    'DEFAULT_SQL_TABLE',
+    # Functions
+    'apply_sql',
+    'apply_sql_step',
+    'apply_sql_table',
+    'compile_sql_step',
+    'sql_args',
+]
+
+
+# SECTION: CONSTANTS ======================================================== #
+
+
+DEFAULT_SQL_TABLE = 'data'
+
+
+# SECTION: INTERNAL FUNCTIONS ============================================== #
+
+
+def _duckdb() -> Any:
+    """Return the :mod:`duckdb` module."""
+    return get_dependency('duckdb', format_name='DUCKDB', required=True)
+
+
+def _pa() -> Any:
+    """Return the :mod:`pyarrow` module."""
+    return get_dependency('pyarrow', format_name='ARROW', required=True)
+
+
+def _plain_columns(
+    table: Any,
+) -> Any:
+    """
+    Cast whole-number decimal columns of *table* to ``int64``.
+
+    Fractional decimals, and whole numbers too wide for ``int64``, keep
+    their decimal type so no precision is lost.
+    """
+    pa = _pa()
+    for index, field in enumerate(table.schema):
+        if not pa.types.is_decimal(field.type) or field.type.scale != 0:
+            continue
+        try:
+            column = table.column(index).cast(pa.int64())
+        except pa.ArrowInvalid:
+            continue
+        table = table.set_column(index, field.name, column)
+    return table
+
+
+# SECTION: FUNCTIONS ======================================================== #
+
+
+def apply_sql(
+    records: JSONList,
+    query: str | None,
+    *,
+    table_name: str = DEFAULT_SQL_TABLE,
+) -> JSONList:
+    """
+    Run a DuckDB SQL query against records.
+
+    Parameters
+    ----------
+    records : JSONList
+        Records exposed to the query as relation *table_name*.
+    query : str | None
+        SQL query to run. If ``None``, input is returned unchanged.
+    table_name : str, optional
+        Relation name used by *query*. Default is ``'data'``.
+
+    Returns
+    -------
+    JSONList
+        Query result rows. Empty input yields an empty list because no
+        column types can be inferred for the relation.
+
+    Raises
+    ------
+    ValueError
+        If a record field mixes incompatible value types, or DuckDB rejects
+        or fails to execute *query*.
+    """
+    if not query:
+        return records
+    if not records:
+        return []
+    table = records_to_arrow_table(_pa(), records, format_name='SQL')
+    return apply_sql_table(table, query, table_name=table_name).to_pylist()
+
+
+def apply_sql_step(
+    records: JSONList,
+    spec: Any,
+) -> JSONList:
+    """
+    Apply a SQL pipeline step to a list of records.
+
+    Parameters
+    ----------
+    records : JSONList
+        Input records to query.
+    spec : Any
+        Either a query string, or a mapping with key ``'query'`` and optional
+        ``'table'`` relation name.
+
+    Returns
+    -------
+    JSONList
+        Query result rows using the same step semantics as
+        :func:`etlplus.ops.transform.transform`.
+    """
+    query, table_name = sql_args(spec)
+    return apply_sql(records, query, table_name=table_name)
+
+
+def apply_sql_table(
+    table: Any,
+    query: str,
+    *,
+    table_name: str = DEFAULT_SQL_TABLE,
+) -> Any:
+    """
+    Run a DuckDB SQL query against a ``pyarrow.Table``.
+
+    DuckDB scans the registered table in place, so no row conversion happens
+    on the way in.
+
+    Parameters
+    ----------
+    table : Any
+        ``pyarrow.Table`` exposed to the query as relation *table_name*.
+    query : str
+        SQL query to run.
+    table_name : str, optional
+        Relation name used by *query*. Default is ``'data'``.
+
+    Returns
+    -------
+    Any
+        Query result as a ``pyarrow.Table``.
+
+    Raises
+    ------
+    ValueError
+        If DuckDB rejects or fails to execute *query*.
+    """
+    duckdb = _duckdb()
+    connection = duckdb.connect()
+    try:
+        connection.register(table_name, table)
+        result = connection.execute(query).to_arrow_table()
+    except duckdb.Error as exc:
+        raise ValueError(f'SQL transform step failed: {exc}') from exc
+    finally:
+        connection.close()
+    return _plain_columns(result)
+
+
+def compile_sql_step(
+    spec: Any,
+) -> BatchStep | None:
+    """
+    Compile a SQL pipeline step into a reusable batch callable.
+
+    Parameters
+    ----------
+    spec : Any
+        Either a query string, or a mapping with key ``'query'`` and optional
+        ``'table'`` relation name.
+
+    Returns
+    -------
+    BatchStep | None
+        Callable returning query result rows, or ``None`` when *spec* does
+        not contain a query.
+    """
+    query, table_name = sql_args(spec)
+    if query is None:
+        return None
+    return partial(apply_sql, query=query, table_name=table_name)
+
+
+def sql_args(
+    spec: Any,
+) -> tuple[str | None, str]:
+    """
+    Return the ``(query, table_name)`` pair described by a SQL spec.
+
+    Parameters
+    ----------
+    spec : Any
+        ``sql`` step spec: a query string, or a mapping with ``query`` and
+        optional ``table`` keys.
+
+    Returns
+    -------
+    tuple[str | None, str]
+        Query text, or ``None`` when *spec* holds no query, and the relation
+        name the records are exposed as.
+    """
+    if isinstance(spec, Mapping):
+        query = spec.get('query')
+        table_name = spec.get('table') or DEFAULT_SQL_TABLE
+    else:
+        query = spec
+        table_name = DEFAULT_SQL_TABLE
+    if not isinstance(query, str) or not query.strip():
+        return None, str(table_name)
+    return query, str(table_name)
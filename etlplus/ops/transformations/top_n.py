@@ -0,0 +1,181 @@
+"""
+:mod:`etlplus.ops.transformations.top_n` module.
+
+Top-N helpers shared by :mod:`etlplus.ops.transform` and custom runners.
+
+Use :func:`apply_top_n` to keep the records with the highest (or lowest)
+values of one field. Use :func:`apply_top_n_step` when you need the
+pipeline-style adapter consumed by :func:`etlplus.ops.transform.transform`,
+or :func:`compile_top_n_step` to resolve a step spec once into a reusable
+batch callable.
+
+Examples
+--------
+The 100 highest scores, with ties broken by the lowest ``id``::
+
+    spec = {'n': 100, 'keys': ['score', {'field': 'id', 'reverse': False}]}
+    rows = apply_top_n_step(records, spec)
+
+Notes
+-----
+Selection keeps a heap of at most ``n`` records (:func:`heapq.nlargest` /
+:func:`heapq.nsmallest`), so it takes ``O(len(records) * log(n))`` time and
+``O(n)`` memory instead of sorting everything. Keys accept the same spec
+shapes as the ``sort`` step, but ``reverse`` defaults to ``True`` so the
+highest values come first. Results equal the first ``n`` records of the
+equivalent stable sort.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable
+from collections.abc import Mapping
+from functools import partial
+from typing import Any
+
+from ...utils import IntParser
+from ...utils._types import JSONDict
+from ...utils._types import JSONList
+from .._types import BatchStep
+from .._types import FieldName
+from .._types import SortField
+from .sort import record_sort_key
+from .sort import sort_fields
+
+# SECTION: EXPORTS ========================================================== #
+
+
+__all__ = [
+    'apply_top_n',
+    'apply_top_n_step',
+    'compile_top_n_step',
+    'top_n_args',
+]
+
+
+# SECTION: INTERNAL FUNCTIONS ============================================== #
+
+
+def _select_top(
+    records: Iterable[JSONDict],
+    n: int,
+    fields: tuple[SortField, ...],
+) -> JSONList:
+    """Return the first *n* records of a stable sort by *fields*."""
+    key, reverse = record_sort_key(fields)
+    select = heapq.nlargest if reverse else heapq.nsmallest
+    return select(n, records, key=key)
+
+
+# SECTION: FUNCTIONS ======================================================== #
+
+
+def apply_top_n(
+    records: Iterable[JSONDict],
+    field: FieldName | None,
+    n: int,
+    *,
+    reverse: bool = True,
+) -> JSONList:
+    """
+    Keep the *n* records with the highest values of *field*.
+
+    Parameters
+    ----------
+    records : Iterable[JSONDict]
+        Records to select from. Any iterable works; it is consumed once.
+    field : FieldName | None
+        Field name to rank by. If ``None``, the first *n* records are kept.
+    n : int
+        Number of records to keep.
+    reverse : bool, optional
+        Keep the highest values, highest first, if ``True`` (default).
+        ``False`` keeps the lowest values, lowest first.
+
+    Returns
+    -------
+    JSONList
+        At most *n* records, in ranked order.
+    """
+    if not field:
+        return list(records)[: max(n, 0)]
+    return _select_top(records, n, ((field, reverse),))
+
+
+def apply_top_n_step(
+    records: JSONList,
+    spec: Any,
+) -> JSONList:
+    """
+    Apply a top-N pipeline step to a list of records.
+
+    Parameters
+    ----------
+    records : JSONList
+        Input records to select from.
+    spec : Any
+        Mapping with key ``'n'`` and either ``'field'`` (with optional
+        ``'reverse'``, default ``True``) or a ``'keys'`` list in the shape
+        accepted by the ``sort`` step.
+
+    Returns
+    -------
+    JSONList
+        Selected records using the same step semantics as
+        :func:`etlplus.ops.transform.transform`.
+    """
+    step = compile_top_n_step(spec)
+    return records if step is None else step(records)
+
+
+def compile_top_n_step(
+    spec: Any,
+) -> BatchStep | None:
+    """
+    Compile a top-N pipeline step into a reusable batch callable.
+
+    Parameters
+    ----------
+    spec : Any
+        Mapping with key ``'n'`` and either ``'field'`` (with optional
+        ``'reverse'``, default ``True``) or a ``'keys'`` list in the shape
+        accepted by the ``sort`` step.
+
+    Returns
+    -------
+    BatchStep | None
+        Callable returning the selected records, or ``None`` when *spec*
+        lacks a usable ``'n'`` or key field.
+    """
+    n, fields = top_n_args(spec)
+    if n is None or not fields:
+        return None
+    return partial(_select_top, n=n, fields=fields)
+
+
+def top_n_args(
+    spec: Any,
+) -> tuple[int | None, tuple[SortField, ...]]:
+    """
+    Return the ``(n, fields)`` pair described by a top-N spec.
+
+    Parameters
+    ----------
+    spec : Any
+        ``top_n`` step spec: a mapping with ``n`` and the ``field``/``keys``
+        shapes accepted by
+        :func:`etlplus.ops.transformations.sort.sort_fields`. ``reverse``
+        defaults to ``True``.
+
+    Returns
+    -------
+    tuple[int | None, tuple[SortField, ...]]
+        Record count, or ``None`` when unusable, and the ranking fields.
+    """
+    if not isinstance(spec, Mapping):
+        return None, ()
+    n_value = spec.get('n')
+    n = None if isinstance(n_value, bool) else IntParser.parse(n_value, minimum=0)
+    fields = sort_fields({**spec, 'reverse': spec.get('reverse', True)})
+    return n, fields
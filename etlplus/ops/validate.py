@@ -13,6 +13,11 @@ Highlights
 - Consistent error wording; field and item paths like ``[2].email``.
 - Small, focused public API with :func:`validate_field`, :func:`validate`,
     and :func:`validate_schema`.
+- :func:`compile_rules` resolves a ruleset once into per-field checkers
+    (precompiled regexes, parsed bounds, enum sets) for repeated validation.
+- :func:`compile_jsonschema` caches checked JSON Schema validators per schema
+    file and modification time, and validates record batches one record at
+    a time, optionally across worker processes.
 
 Examples
 --------
@@ -23,14 +28,25 @@ Examples
 >>> data = {'name': 'Ada', 'age': 28}
 >>> validate(data, rules)['valid']
 True
+>>> compile_rules(rules).validate([data, {'age': -1}])['errors']
+['[1].name: Field is required', '[1].age: Value -1 is less than minimum 0.0']
 """
 
 from __future__ import annotations
 
+import operator
 import re
 from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
 from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import suppress
+from dataclasses import dataclass
+from dataclasses import field
+from functools import lru_cache
+from functools import partial
+from itertools import batched
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Any
@@ -43,8 +59,10 @@ from ..utils import JsonCodec
 from ..utils import is_integer_value
 from ..utils import is_number_value
 from ..utils._types import JSONData
+from ..utils._types import JSONList
 from ..utils._types import Record
 from ..utils._types import StrAnyMap
+from ._batches import worker_context
 from ._imports import get_frictionless
 from ._imports import get_jsonschema
 from ._imports import get_lxml_etree
@@ -56,7 +74,16 @@ from .load import load_data as _load_data
 
 
 __all__ = [
+    # Constants
+    'DEFAULT_ERROR_SAMPLES',
+    'DEFAULT_SCHEMA_PARTITION_SIZE',
+    # Data Classes
+    'CompiledJsonSchema',
+    'CompiledRules',
+    'ValidationReport',
     # Functions
+    'compile_jsonschema',
+    'compile_rules',
     'validate_field',
     'validate_schema',
     'validate',
@@ -64,9 +91,20 @@ __all__ = [
     'FieldRulesDict',
     'FieldValidationDict',
     'ValidationDict',
+    'ValidationSummaryDict',
 ]
 
 
+# SECTION: CONSTANTS ======================================================== #
+
+
+# Sample error messages kept by a :class:`ValidationReport` by default.
+DEFAULT_ERROR_SAMPLES = 20
+
+# Records per partition handed to one JSON Schema worker process by default.
+DEFAULT_SCHEMA_PARTITION_SIZE = 10_000
+
+
 # SECTION: TYPED DICTS ====================================================== #
 
 
@@ -132,12 +170,46 @@ class ValidationDict(TypedDict):
     data: JSONData | None
 
 
+class ValidationSummaryDict(TypedDict):
+    """
+    Bounded summary of validation errors across many records.
+
+    Attributes
+    ----------
+    records : int
+        Number of records (or list items) checked.
+    invalid_records : int
+        Number of checked records with at least one error.
+    error_count : int
+        Total number of errors.
+    counts : dict[str, dict[str, int]]
+        Error counts keyed by field, then by rule (``required``, ``type``,
+        ``min``, ``pattern``, ...). Non-record list items are counted under
+        field ``[*]`` and rule ``object``.
+    sample_errors : list[str]
+        The first errors, formatted like :func:`validate` errors.
+    budget_exceeded : bool
+        Whether more errors were seen than the configured budget allows.
+    """
+
+    records: int
+    invalid_records: int
+    error_count: int
+    counts: dict[str, dict[str, int]]
+    sample_errors: list[str]
+    budget_exceeded: bool
+
+
 # SECTION: TYPE ALIASES ===================================================== #
 
 
+type FieldChecker = Callable[[Any], list[FieldIssue]]
 type FieldErrors = dict[str, list[str]]
+type FieldIssue = tuple[str, str]
+type JsonSchemaIssue = tuple[str | None, str]
+type FieldRuleCompiler = Callable[[FieldRuleInput], RuleCheck | None]
 type FieldRuleInput = StrAnyMap | FieldRulesDict
-type FieldRuleValidator = Callable[[Any, FieldRuleInput, list[str]], None]
+type RuleCheck = Callable[[Any], str | None]
 type RulesMap = Mapping[str, FieldRulesDict]
 type SchemaFormat = Literal['frictionless', 'jsonschema', 'xsd']
 type SchemaValidator = Callable[[str | Path, str | Path, str | None], ValidationDict]
@@ -146,6 +218,45 @@ type SchemaValidator = Callable[[str | Path, str | Path, str | None], Validation
 # SECTION: INTERNAL FUNCTIONS ============================================== #
 
 
+def _build_jsonschema_validator(
+    schema_doc: Any,
+) -> Any:
+    """
+    Check *schema_doc* and build its :mod:`jsonschema` validator.
+
+    Raises
+    ------
+    ValueError
+        If *schema_doc* is not a valid JSON Schema.
+    """
+    jsonschema = get_jsonschema()
+    validator_cls = jsonschema.validators.validator_for(schema_doc)
+    try:
+        validator_cls.check_schema(schema_doc)
+    except jsonschema.exceptions.SchemaError as exc:
+        raise ValueError(f'Invalid JSON Schema: {exc.message}') from exc
+    return validator_cls(schema_doc)
+
+
+@lru_cache(maxsize=32)
+def _cached_jsonschema(
+    schema: str | Path,
+    stamp: tuple[int, int] | None,
+) -> CompiledJsonSchema:
+    """
+    Load and compile one JSON Schema; *stamp* only invalidates the cache.
+
+    Failures raise and are therefore never cached.
+    """
+    del stamp
+    schema_doc = _load_jsonschema_document(
+        schema,
+        format_hint=None,
+        label='Schema',
+    )
+    return CompiledJsonSchema(schema_doc, _build_jsonschema_validator(schema_doc))
+
+
 def _coerce_rule[CoercedT](
     rules: StrAnyMap,
     key: str,
@@ -188,6 +299,169 @@ def _coerce_rule[CoercedT](
         return None
 
 
+def _compile_bound(
+    rules: FieldRuleInput,
+    key: str,
+    *,
+    parse: Callable[[StrAnyMap, str, list[str]], float | None],
+    applies: Callable[[Any], bool],
+    measure: Callable[[Any], float],
+    exceeds: Callable[[float, float], bool],
+    message: str,
+) -> RuleCheck | None:
+    """
+    Compile one ``min``/``max``-style bound into a rule check.
+
+    Parameters
+    ----------
+    rules : FieldRuleInput
+        Rule dictionary for one field.
+    key : str
+        Rule key holding the bound.
+    parse : Callable[[StrAnyMap, str, list[str]], float | None]
+        Rule getter such as :func:`_get_numeric_rule`.
+    applies : Callable[[Any], bool]
+        Predicate selecting the values the bound applies to.
+    measure : Callable[[Any], float]
+        Function returning the quantity compared against the bound.
+    exceeds : Callable[[float, float], bool]
+        Comparison that is ``True`` when the measured quantity violates the
+        bound.
+    message : str
+        Error template with ``{value}``, ``{measured}``, and ``{limit}``
+        fields.
+
+    Returns
+    -------
+    RuleCheck | None
+        Check returning at most one message, or ``None`` when *key* is absent.
+    """
+    rule_errors: list[str] = []
+    limit = parse(rules, key, rule_errors)
+    if limit is None and not rule_errors:
+        return None
+
+    def check(value: Any) -> str | None:
+        if not applies(value):
+            return None
+        if limit is None:
+            return rule_errors[0]
+        measured = measure(value)
+        if exceeds(measured, limit):
+            return message.format(value=value, measured=measured, limit=limit)
+        return None
+
+    return check
+
+
+def _compile_enum_rule(
+    rules: FieldRuleInput,
+) -> RuleCheck | None:
+    """Compile the ``enum`` membership check, using a set when hashable."""
+    if 'enum' not in rules:
+        return None
+
+    enum_values = rules.get('enum')
+    if not isinstance(enum_values, list):
+        return lambda value: "Rule 'enum' must be a list"
+    allowed_list: list[Any] = enum_values
+    try:
+        allowed: frozenset[Any] | list[Any] = frozenset(allowed_list)
+    except TypeError:
+        allowed = allowed_list
+
+    def check(value: Any) -> str | None:
+        try:
+            found = value in allowed
+        except TypeError:
+            found = value in allowed_list
+        if found:
+            return None
+        return f'Value {value} not in allowed values {allowed_list}'
+
+    return check
+
+
+def _compile_field(
+    rules: FieldRuleInput,
+) -> FieldChecker:
+    """
+    Compile one field's rules into a checker returning rule-tagged issues.
+
+    Parameters
+    ----------
+    rules : FieldRuleInput
+        Rule dictionary for one field.
+
+    Returns
+    -------
+    FieldChecker
+        Callable returning ``(rule, message)`` pairs for one value, in the
+        same order and wording as :func:`validate_field`.
+    """
+    required = bool(rules.get('required', False))
+    checks = tuple(
+        (rule, check)
+        for rule, compiler in _FIELD_RULE_COMPILERS
+        if (check := compiler(rules)) is not None
+    )
+
+    def checker(value: Any) -> list[FieldIssue]:
+        # None is treated as missing; optional missing values are valid.
+        if value is None:
+            return [('required', 'Field is required')] if required else []
+        return [
+            (rule, message)
+            for rule, check in checks
+            if (message := check(value)) is not None
+        ]
+
+    return checker
+
+
+def _compile_pattern_rule(
+    rules: FieldRuleInput,
+) -> RuleCheck | None:
+    """Compile the ``pattern`` rule once for string values."""
+    if 'pattern' not in rules:
+        return None
+
+    pattern = rules.get('pattern')
+    if not isinstance(pattern, str):
+        rule_error = "Rule 'pattern' must be a string"
+    else:
+        try:
+            regex = re.compile(pattern)
+        except re.error as exc:
+            rule_error = f'Rule "pattern" is not a valid regex: {exc}'
+        else:
+
+            def check(value: Any) -> str | None:
+                if not isinstance(value, str) or regex.search(value):
+                    return None
+                return f'Value does not match pattern {pattern}'
+
+            return check
+
+    return lambda value: rule_error if isinstance(value, str) else None
+
+
+def _compile_type_rule(
+    rules: FieldRuleInput,
+) -> RuleCheck | None:
+    """Compile the declared ``type`` check into a direct type predicate."""
+    if not isinstance(expected_type := rules.get('type'), str):
+        return None
+    matcher = _TYPE_MATCHERS.get(expected_type, _never)
+
+    def check(value: Any) -> str | None:
+        if matcher(value):
+            return None
+        return f'Expected type {expected_type}, got {type(value).__name__}'
+
+    return check
+
+
 def _field_result(
     errors: list[str],
 ) -> FieldValidationDict:
@@ -306,6 +580,23 @@ def _infer_structured_text_format(
     return 'json' if text.lstrip().startswith(('{', '[')) else 'yaml'
 
 
+def _init_jsonschema_worker(
+    schema_doc: Any,
+) -> None:
+    """Build the JSON Schema validator once per worker process."""
+    _WORKER_JSONSCHEMA['validator'] = _build_jsonschema_validator(schema_doc)
+
+
+def _iter_record_issues(
+    validator: Any,
+    records: Iterable[Any],
+    start: int = 0,
+) -> Iterator[JsonSchemaIssue]:
+    """Yield JSON Schema issues per record, prefixed with its index."""
+    for idx, record in enumerate(records, start):
+        yield from _jsonschema_issues(validator, record, (idx,))
+
+
 def _looks_like_inline_text(
     value: str,
 ) -> bool:
@@ -318,6 +609,84 @@ def _looks_like_inline_text(
     )
 
 
+def _issue_path(
+    idx: int | None,
+    field_name: str,
+) -> str:
+    """Return the error key for one field, like ``"[2].email"``."""
+    if idx is None:
+        return field_name
+    return f'[{idx}].{field_name}' if field_name != _ITEM_FIELD else f'[{idx}]'
+
+
+def _jsonschema_cache_key(
+    schema: str | Path,
+) -> tuple[str | Path, tuple[int, int] | None]:
+    """
+    Return the compiled-schema cache key for *schema*.
+
+    Local files are keyed by absolute path plus modification time and size,
+    so edits are picked up. Inline schema text is keyed by the text itself.
+    """
+    path = schema if isinstance(schema, Path) else _resolve_declared_local_path(schema)
+    if path is None or not path.is_file():
+        return schema, None
+    stat = path.stat()
+    return path.resolve(), (stat.st_mtime_ns, stat.st_size)
+
+
+def _jsonschema_issues(
+    validator: Any,
+    instance: Any,
+    prefix: tuple[int, ...] = (),
+) -> list[JsonSchemaIssue]:
+    """Return ``(path, message)`` pairs for *instance*, sorted by path."""
+    errors = sorted(
+        validator.iter_errors(instance),
+        key=lambda error: list(error.absolute_path),
+    )
+    return [
+        (_format_jsonschema_path((*prefix, *error.absolute_path)), error.message)
+        for error in errors
+    ]
+
+
+def _jsonschema_partition(
+    partition: tuple[int, JSONList],
+) -> list[JsonSchemaIssue]:
+    """Validate one ``(start index, records)`` partition (worker)."""
+    start, records = partition
+    return list(
+        _iter_record_issues(_WORKER_JSONSCHEMA['validator'], records, start),
+    )
+
+
+def _jsonschema_result(
+    issues: Iterable[JsonSchemaIssue],
+) -> ValidationDict:
+    """Build a validation result from JSON Schema ``(path, message)`` pairs."""
+    errors: list[str] = []
+    field_errors: FieldErrors = {}
+    for path, message in issues:
+        if path is None:
+            errors.append(message)
+            continue
+        errors.append(f'{path}: {message}')
+        field_errors.setdefault(path, []).append(message)
+    return _validation_result(
+        data=None,
+        errors=errors,
+        field_errors=field_errors,
+    )
+
+
+def _never(
+    value: Any,
+) -> bool:
+    """Reject every value; used for unknown declared types."""
+    return False
+
+
 def _normalize_frictionless_source_format(
     format_hint: str | None,
 ) -> FileFormat | None:
@@ -540,131 +909,7 @@ def _type_matches(
     bool
         ``True`` if the value matches the expected type, else ``False``.
     """
-    match expected:
-        case 'array':
-            return isinstance(value, list)
-        case 'boolean':
-            return isinstance(value, bool)
-        case 'integer':
-            return is_integer_value(value)
-        case 'number':
-            return is_number_value(value)
-        case 'object':
-            return isinstance(value, dict)
-        case 'string':
-            return isinstance(value, str)
-        case _:
-            return False
-
-
-def _validate_enum_rule(
-    value: Any,
-    rules: FieldRuleInput,
-    errors: list[str],
-) -> None:
-    """Append enum-membership errors for one value."""
-    if 'enum' not in rules:
-        return
-
-    enum_values = rules.get('enum')
-    if not isinstance(enum_values, list):
-        errors.append("Rule 'enum' must be a list")
-        return
-    if value not in enum_values:
-        errors.append(f'Value {value} not in allowed values {enum_values}')
-
-
-def _validate_record(
-    record: Record,
-    rules: RulesMap,
-    idx: int | None = None,
-) -> tuple[list[str], FieldErrors]:
-    """
-    Validate a single record against rules and return aggregated errors.
-
-    Returns a tuple of (errors, field_errors) where errors are the flattened
-    messages with field prefixes and field_errors maps field keys to messages.
-    If idx is provided, the field keys are prefixed like ``"[i].field"``.
-
-    Parameters
-    ----------
-    record : Record
-        The record to validate.
-    rules : RulesMap
-        The field rules.
-    idx : int | None, optional
-        Optional index for prefixing field keys.
-
-    Returns
-    -------
-    tuple[list[str], FieldErrors]
-        A tuple of (errors, field_errors).
-    """
-    errors: list[str] = []
-    field_errors: FieldErrors = {}
-
-    for field, field_rules in rules.items():
-        value = record.get(field)
-        result = validate_field(value, field_rules)
-        if result['valid']:
-            continue
-        field_key = field if idx is None else f'[{idx}].{field}'
-        field_errors[field_key] = result['errors']
-        errors.extend(f'{field_key}: {err}' for err in result['errors'])
-
-    return errors, field_errors
-
-
-def _validate_loaded_data(
-    data: JSONData,
-    rules: RulesMap,
-) -> tuple[list[str], FieldErrors]:
-    """Validate one loaded payload against the provided rules."""
-    if isinstance(data, dict):
-        return _validate_record(data, rules)
-    return _validate_sequence(data, rules)
-
-
-def _validate_numeric_rules(
-    value: Any,
-    rules: FieldRuleInput,
-    errors: list[str],
-) -> None:
-    """Append numeric range errors for one value."""
-    if not is_number_value(value):
-        return
-
-    numeric_value = float(value)
-    if (min_value := _get_numeric_rule(rules, 'min', errors)) is not None:
-        if numeric_value < min_value:
-            errors.append(f'Value {value} is less than minimum {min_value}')
-    if (max_value := _get_numeric_rule(rules, 'max', errors)) is not None:
-        if numeric_value > max_value:
-            errors.append(f'Value {value} is greater than maximum {max_value}')
-
-
-def _validate_pattern_rule(
-    value: str,
-    rules: FieldRuleInput,
-    errors: list[str],
-) -> None:
-    """Append pattern-related errors for one string value."""
-    if 'pattern' not in rules:
-        return
-
-    pattern = rules.get('pattern')
-    if not isinstance(pattern, str):
-        errors.append("Rule 'pattern' must be a string")
-        return
-
-    try:
-        regex = re.compile(pattern)
-    except re.error as exc:
-        errors.append(f'Rule "pattern" is not a valid regex: {exc}')
-        return
-
-    if not regex.search(value):
-        errors.append(f'Value does not match pattern {pattern}')
+    return _TYPE_MATCHERS.get(expected, _never)(value)
 
 
 def _validate_jsonschema(
@@ -674,28 +919,10 @@ def _validate_jsonschema(
 ) -> ValidationDict:
     """Validate one JSON or YAML document against one JSON Schema."""
     try:
-        jsonschema = get_jsonschema()
-    except RuntimeError as exc:
-        return _validation_result(data=None, errors=[str(exc)])
-
-    try:
-        schema_doc = _load_jsonschema_document(
-            schema,
-            format_hint=None,
-            label='Schema',
-        )
+        compiled = compile_jsonschema(schema)
     except (RuntimeError, ValueError) as exc:
         return _validation_result(data=None, errors=[str(exc)])
 
-    try:
-        validator_cls = jsonschema.validators.validator_for(schema_doc)
-        validator_cls.check_schema(schema_doc)
-    except jsonschema.exceptions.SchemaError as exc:
-        return _validation_result(
-            data=None,
-            errors=[f'Invalid JSON Schema: {exc.message}'],
-        )
-
     try:
         instance = _load_jsonschema_document(
             source,
@@ -705,27 +932,7 @@ def _validate_jsonschema(
     except (RuntimeError, ValueError) as exc:
         return _validation_result(data=None, errors=[str(exc)])
 
-    errors: list[str] = []
-    field_errors: FieldErrors = {}
-    validator = validator_cls(schema_doc)
-    validation_errors = sorted(
-        validator.iter_errors(instance),
-        key=lambda error: list(error.absolute_path),
-    )
-
-    for error in validation_errors:
-        path = _format_jsonschema_path(error.absolute_path)
-        if path is None:
-            errors.append(error.message)
-            continue
-        errors.append(f'{path}: {error.message}')
-        field_errors.setdefault(path, []).append(error.message)
-
-    return _validation_result(
-        data=None,
-        errors=errors,
-        field_errors=field_errors,
-    )
+    return compiled.validate(instance)
 
 
 def _validate_frictionless(
@@ -804,63 +1011,6 @@ def _validate_frictionless(
     )
 
 
-def _validate_sequence(
-    data: list[Any],
-    rules: RulesMap,
-) -> tuple[list[str], FieldErrors]:
-    """Validate a list payload against field rules."""
-    errors: list[str] = []
-    field_errors: FieldErrors = {}
-    for i, item in enumerate(data):
-        if not isinstance(item, dict):
-            key = f'[{i}]'
-            msg = 'Item is not an object (expected dict)'
-            errors.append(f'{key}: {msg}')
-            field_errors.setdefault(key, []).append(msg)
-            continue
-        rec_errors, rec_field_errors = _validate_record(item, rules, i)
-        errors.extend(rec_errors)
-        field_errors.update(rec_field_errors)
-    return errors, field_errors
-
-
-def _validate_string_rules(
-    value: Any,
-    rules: FieldRuleInput,
-    errors: list[str],
-) -> None:
-    """Append string length and pattern errors for one value."""
-    if not isinstance(value, str):
-        return
-
-    value_length = len(value)
-    if (min_length := _get_int_rule(rules, 'minLength', errors)) is not None:
-        if value_length < min_length:
-            errors.append(
-                f'Length {value_length} is less than minimum {min_length}',
-            )
-    if (max_length := _get_int_rule(rules, 'maxLength', errors)) is not None:
-        if value_length > max_length:
-            errors.append(
-                f'Length {value_length} is greater than maximum {max_length}',
-            )
-    _validate_pattern_rule(value, rules, errors)
-
-
-def _validate_type_rule(
-    value: Any,
-    rules: FieldRuleInput,
-    errors: list[str],
-) -> None:
-    """Append an error when the runtime value violates the declared type."""
-    if not isinstance(expected_type := rules.get('type'), str):
-        return
-    if not _type_matches(value, expected_type):
-        errors.append(
-            f'Expected type {expected_type}, got {type(value).__name__}',
-        )
-
-
 def _validate_xsd(
     source: str | Path,
     schema: str | Path,
@@ -937,6 +1087,10 @@ def _validation_result(
 # SECTION: INTERNAL CONSTANTS =============================================== #
 
 
+# Validator built once per worker process by :func:`_init_jsonschema_worker`.
+_WORKER_JSONSCHEMA: dict[str, Any] = {}
+
+
 _SCHEMA_VALIDATORS: dict[SchemaFormat, SchemaValidator] = {
     'frictionless': _validate_frictionless,
     'jsonschema': _validate_jsonschema,
@@ -944,13 +1098,425 @@ _SCHEMA_VALIDATORS: dict[SchemaFormat, SchemaValidator] = {
 }
 
 
-_FIELD_RULE_VALIDATORS: tuple[FieldRuleValidator, ...] = (
-    _validate_type_rule,
-    _validate_numeric_rules,
-    _validate_string_rules,
-    _validate_enum_rule,
+_TYPE_MATCHERS: dict[str, Callable[[Any], bool]] = {
+    'array': lambda value: isinstance(value, list),
+    'boolean': lambda value: isinstance(value, bool),
+    'integer': is_integer_value,
+    'number': is_number_value,
+    'object': lambda value: isinstance(value, dict),
+    'string': lambda value: isinstance(value, str),
+}
+
+
+# Rule checks in the order their messages are reported.
+_FIELD_RULE_COMPILERS: tuple[tuple[str, FieldRuleCompiler], ...] = (
+    ('type', _compile_type_rule),
+    (
+        'min',
+        partial(
+            _compile_bound,
+            key='min',
+            parse=_get_numeric_rule,
+            applies=is_number_value,
+            measure=float,
+            exceeds=operator.lt,
+            message='Value {value} is less than minimum {limit}',
+        ),
+    ),
+    (
+        'max',
+        partial(
+            _compile_bound,
+            key='max',
+            parse=_get_numeric_rule,
+            applies=is_number_value,
+            measure=float,
+            exceeds=operator.gt,
+            message='Value {value} is greater than maximum {limit}',
+        ),
+    ),
+    (
+        'minLength',
+        partial(
+            _compile_bound,
+            key='minLength',
+            parse=_get_int_rule,
+            applies=_TYPE_MATCHERS['string'],
+            measure=len,
+            exceeds=operator.lt,
+            message='Length {measured} is less than minimum {limit}',
+        ),
+    ),
+    (
+        'maxLength',
+        partial(
+            _compile_bound,
+            key='maxLength',
+            parse=_get_int_rule,
+            applies=_TYPE_MATCHERS['string'],
+            measure=len,
+            exceeds=operator.gt,
+            message='Length {measured} is greater than maximum {limit}',
+        ),
+    ),
+    ('pattern', _compile_pattern_rule),
+    ('enum', _compile_enum_rule),
 )
 
+# Pseudo-field under which non-record list items are counted.
+_ITEM_FIELD = '[*]'
+
+
+# SECTION: DATA CLASSES ===================================================== #
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledJsonSchema:
+    """
+    JSON Schema checked once and bound to a reusable validator.
+
+    Build instances with :func:`compile_jsonschema`. Results match
+    :func:`validate_schema` with ``schema_format='jsonschema'``.
+
+    Attributes
+    ----------
+    schema : Any
+        Parsed schema document.
+    validator : Any
+        :mod:`jsonschema` validator instance for :attr:`schema`.
+    """
+
+    # -- Instance Attributes -- #
+
+    schema: Any
+    validator: Any
+
+    # -- Instance Methods -- #
+
+    def validate(
+        self,
+        instance: Any,
+    ) -> ValidationDict:
+        """
+        Validate one parsed document.
+
+        Parameters
+        ----------
+        instance : Any
+            Parsed JSON-like document.
+
+        Returns
+        -------
+        ValidationDict
+            Structured result with errors sorted by instance path.
+        """
+        return _jsonschema_result(_jsonschema_issues(self.validator, instance))
+
+    def validate_records(
+        self,
+        records: Iterable[Any],
+        *,
+        workers: int = 1,
+        partition_size: int = DEFAULT_SCHEMA_PARTITION_SIZE,
+    ) -> ValidationDict:
+        """
+        Validate each record against the schema on its own.
+
+        Parameters
+        ----------
+        records : Iterable[Any]
+            Parsed records, such as NDJSON lines or one API page. Any
+            iterable works; with one worker it is consumed lazily.
+        workers : int, optional
+            Worker processes. ``1`` (default) validates in-process.
+        partition_size : int, optional
+            Records per partition handed to one worker process.
+
+        Returns
+        -------
+        ValidationDict
+            Structured result whose error paths start with the record index,
+            like ``"[2].email"``, in record order.
+
+        Notes
+        -----
+        Each worker process builds the validator once from :attr:`schema`.
+        With more than one worker, *records* is split into partitions up
+        front, so pass a list or a bounded batch.
+        """
+        if workers < 2:
+            return _jsonschema_result(_iter_record_issues(self.validator, records))
+        partitions: list[tuple[int, JSONList]] = []
+        start = 0
+        for chunk in batched(records, max(partition_size, 1), strict=False):
+            partitions.append((start, list(chunk)))
+            start += len(chunk)
+        if len(partitions) < 2:
+            return _jsonschema_result(
+                issue
+                for start, chunk in partitions
+                for issue in _iter_record_issues(self.validator, chunk, start)
+            )
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(partitions)),
+            mp_context=worker_context(),
+            initializer=_init_jsonschema_worker,
+            initargs=(self.schema,),
+        ) as pool:
+            return _jsonschema_result(
+                issue
+                for issues in pool.map(_jsonschema_partition, partitions)
+                for issue in issues
+            )
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledRules:
+    """
+    Field rules resolved once into per-field checkers.
+
+    Build instances with :func:`compile_rules`. Results match
+    :func:`validate` with the same rules, but rule values are parsed, regexes
+    compiled, and enum sets built only once.
+
+    Attributes
+    ----------
+    checkers : tuple[tuple[str, FieldChecker], ...]
+        ``(field, checker)`` pairs in rule order.
+    """
+
+    # -- Instance Attributes -- #
+
+    checkers: tuple[tuple[str, FieldChecker], ...]
+
+    # -- Internal Instance Methods -- #
+
+    def _check_record(
+        self,
+        record: Record,
+        idx: int | None = None,
+    ) -> tuple[list[str], FieldErrors]:
+        """Validate one record; prefix field keys like ``"[i].field"``."""
+        errors: list[str] = []
+        field_errors: FieldErrors = {}
+        for field_name, checker in self.checkers:
+            if not (issues := checker(record.get(field_name))):
+                continue
+            field_key = _issue_path(idx, field_name)
+            field_errors[field_key] = [message for _, message in issues]
+            errors.extend(f'{field_key}: {message}' for _, message in issues)
+        return errors, field_errors
+
+    # -- Instance Methods -- #
+
+    def check(
+        self,
+        data: JSONData,
+    ) -> tuple[list[str], FieldErrors]:
+        """
+        Validate one loaded record or list of records.
+
+        Parameters
+        ----------
+        data : JSONData
+            A record, or a list whose items should all be records.
+
+        Returns
+        -------
+        tuple[list[str], FieldErrors]
+            Flattened messages with field prefixes, and messages keyed by
+            field (``"[i].field"`` for list items).
+        """
+        if isinstance(data, dict):
+            return self._check_record(data)
+        errors: list[str] = []
+        field_errors: FieldErrors = {}
+        for i, item in enumerate(data):
+            if not isinstance(item, dict):
+                key = f'[{i}]'
+                msg = 'Item is not an object (expected dict)'
+                errors.append(f'{key}: {msg}')
+                field_errors.setdefault(key, []).append(msg)
+                continue
+            rec_errors, rec_field_errors = self._check_record(item, i)
+            errors.extend(rec_errors)
+            field_errors.update(rec_field_errors)
+        return errors, field_errors
+
+    def split(
+        self,
+        data: JSONData,
+        report: ValidationReport | None = None,
+    ) -> tuple[JSONList, list[Any]]:
+        """
+        Partition records into valid and invalid ones.
+
+        Parameters
+        ----------
+        data : JSONData
+            A record, or a list whose items should all be records.
+        report : ValidationReport | None, optional
+            Report that tallies the errors. List items are numbered from
+            :attr:`ValidationReport.records`, so indexes keep counting
+            across batches.
+
+        Returns
+        -------
+        tuple[JSONList, list[Any]]
+            Valid records and invalid items, each in input order.
+        """
+        if isinstance(data, dict):
+            items: list[Any] = [data]
+            start: int | None = None
+        else:
+            items = data
+            start = report.records if report is not None else 0
+        valid: JSONList = []
+        invalid: list[Any] = []
+        for offset, item in enumerate(items):
+            if isinstance(item, dict):
+                issues = [
+                    (field_name, rule, message)
+                    for field_name, checker in self.checkers
+                    for rule, message in checker(item.get(field_name))
+                ]
+            else:
+                issues = [
+                    (_ITEM_FIELD, 'object', 'Item is not an object (expected dict)'),
+                ]
+            (invalid if issues else valid).append(item)
+            if report is not None:
+                report.add(None if start is None else start + offset, issues)
+        return valid, invalid
+
+    def validate(
+        self,
+        source: DataSourceArg,
+    ) -> ValidationDict:
+        """
+        Load *source* and validate it against the compiled rules.
+
+        Parameters
+        ----------
+        source : DataSourceArg
+            Data source to validate.
+
+        Returns
+        -------
+        ValidationDict
+            Structured result shaped like :func:`validate` output.
+        """
+        try:
+            data = _load_data(source)
+        except (TypeError, ValueError) as exc:
+            return _validation_result(
+                data=None,
+                errors=[f'Failed to load data: {exc}'],
+            )
+
+        if not self.checkers:
+            return _validation_result(data=data)
+
+        errors, field_errors = self.check(data)
+        return _validation_result(
+            data=data,
+            errors=errors,
+            field_errors=field_errors,
+        )
+
+
+@dataclass(slots=True)
+class ValidationReport:
+    """
+    Bounded running tally of validation errors across record batches.
+
+    Memory stays proportional to the number of fields and rules, not to the
+    number of errors: only counts and the first :attr:`max_samples` messages
+    are kept.
+
+    Attributes
+    ----------
+    max_samples : int
+        Number of error messages kept as samples.
+    max_errors : int | None
+        Error budget. :attr:`exhausted` turns ``True`` once more errors than
+        this have been seen. ``None`` means unlimited.
+    records : int
+        Number of records checked so far.
+    invalid_records : int
+        Number of checked records with at least one error.
+    error_count : int
+        Total number of errors seen so far.
+    counts : dict[str, dict[str, int]]
+        Error counts keyed by field, then by rule.
+    samples : list[str]
+        The first error messages, formatted like :func:`validate` errors.
+    """
+
+    # -- Instance Attributes -- #
+
+    max_samples: int = DEFAULT_ERROR_SAMPLES
+    max_errors: int | None = None
+    records: int = 0
+    invalid_records: int = 0
+    error_count: int = 0
+    counts: dict[str, dict[str, int]] = field(default_factory=dict)
+    samples: list[str] = field(default_factory=list)
+
+    # -- Instance Properties -- #
+
+    @property
+    def exhausted(self) -> bool:
+        """Return whether the error budget has been exceeded."""
+        return self.max_errors is not None and self.error_count > self.max_errors
+
+    # -- Instance Methods -- #
+
+    def add(
+        self,
+        idx: int | None,
+        issues: list[tuple[str, str, str]],
+    ) -> None:
+        """
+        Tally the ``(field, rule, message)`` issues of one checked record.
+
+        Parameters
+        ----------
+        idx : int | None
+            Record index used in sample messages, or ``None`` for a lone
+            record.
+        issues : list[tuple[str, str, str]]
+            Errors found in the record; empty for valid records.
+        """
+        self.records += 1
+        if not issues:
+            return
+        self.invalid_records += 1
+        self.error_count += len(issues)
+        for field_name, rule, message in issues:
+            rules = self.counts.setdefault(field_name, {})
+            rules[rule] = rules.get(rule, 0) + 1
+            if len(self.samples) < self.max_samples:
+                self.samples.append(f'{_issue_path(idx, field_name)}: {message}')
+
+    def summary(self) -> ValidationSummaryDict:
+        """
+        Return a JSON-ready snapshot of the report.
+
+        Returns
+        -------
+        ValidationSummaryDict
+            Counts, sample errors, and whether the budget was exceeded.
+        """
+        return {
+            'records': self.records,
+            'invalid_records': self.invalid_records,
+            'error_count': self.error_count,
+            'counts': {name: dict(rules) for name, rules in self.counts.items()},
+            'sample_errors': list(self.samples),
+            'budget_exceeded': self.exhausted,
+        }
+
 
 # SECTION: FUNCTIONS ======================================================== #
 
@@ -958,6 +1524,74 @@ _FIELD_RULE_VALIDATORS: tuple[FieldRuleValidator, ...] = (
 # -- Helpers -- #
 
 
+def compile_jsonschema(
+    schema: str | Path,
+) -> CompiledJsonSchema:
+    """
+    Load and check one JSON Schema, reusing a cached validator when possible.
+
+    Parameters
+    ----------
+    schema : str | Path
+        Schema path or raw JSON/YAML schema text.
+
+    Returns
+    -------
+    CompiledJsonSchema
+        Compiled schema. Repeated calls for an unchanged schema file (same
+        path, modification time, and size) or the same schema text return
+        the cached instance.
+
+    Raises
+    ------
+    RuntimeError
+        If :mod:`jsonschema` is not installed.
+    ValueError
+        If the schema cannot be loaded or is not a valid JSON Schema.
+    """
+    get_jsonschema()
+    return _cached_jsonschema(*_jsonschema_cache_key(schema))
+
+
+def compile_rules(
+    rules: RulesMap,
+) -> CompiledRules:
+    """
+    Resolve field rules once into reusable per-field checkers.
+
+    Parameters
+    ----------
+    rules : RulesMap
+        Field rules keyed by field name, as accepted by :func:`validate`.
+
+    Returns
+    -------
+    CompiledRules
+        Compiled rules whose :meth:`~CompiledRules.validate` and
+        :meth:`~CompiledRules.check` methods can be called repeatedly.
+
+    Raises
+    ------
+    TypeError
+        If the rules for a field are not a mapping.
+
+    Notes
+    -----
+    Malformed rule values (for example a non-numeric ``min`` or an invalid
+    ``pattern``) do not raise; they are reported for every checked value,
+    exactly as :func:`validate_field` reports them.
+    """
+    checkers: list[tuple[str, FieldChecker]] = []
+    for field_name, field_rules in rules.items():
+        if not isinstance(field_rules, Mapping):
+            raise TypeError(
+                f'Rules for field {field_name!r} must be a mapping, '
+                f'got {type(field_rules).__name__}',
+            )
+        checkers.append((field_name, _compile_field(field_rules)))
+    return CompiledRules(tuple(checkers))
+
+
 def validate_field(
     value: Any,
     rules: FieldRuleInput,
@@ -984,21 +1618,7 @@ def validate_field(
     If ``required`` is ``False`` or absent and the value is ``None``, the
     field is considered valid without further checks.
     """
-    errors: list[str] = []
-
-    # Required check (None is treated as missing).
-    if bool(rules.get('required', False)) and value is None:
-        errors.append('Field is required')
-        return _field_result(errors)
-
-    # If optional and missing, it's valid.
-    if value is None:
-        return _field_result(errors)
-
-    for validator in _FIELD_RULE_VALIDATORS:
-        validator(value, rules, errors)
-
-    return _field_result(errors)
+    return _field_result([message for _, message in _compile_field(rules)(value)])
 
 
 # -- Orchestration -- #
@@ -1070,21 +1690,10 @@ def validate(
         Structured result with keys ``valid``, ``errors``, ``field_errors``,
         and ``data``. If loading fails, ``data`` is ``None`` and an error is
         reported in ``errors``.
-    """
-    try:
-        data = _load_data(source)
-    except (TypeError, ValueError) as exc:
-        return _validation_result(
-            data=None,
-            errors=[f'Failed to load data: {exc}'],
-        )
-
-    if not rules:
-        return _validation_result(data=data)
 
-    errors, field_errors = _validate_loaded_data(data, rules)
-    return _validation_result(
-        data=data,
-        errors=errors,
-        field_errors=field_errors,
-    )
+    Raises
+    ------
+    TypeError
+        If the rules for a field are not a mapping.
+    """
+    return compile_rules(rules or {}).validate(source)
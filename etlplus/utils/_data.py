@@ -16,6 +16,7 @@ from datetime import time
 from typing import TextIO
 from typing import cast
 
+from ._json import JsonBackend
 from ._types import JSONData
 from ._types import JSONDict
 from ._types import JSONList
@@ -97,6 +98,10 @@ class JsonCodec:
     """
     Centralize JSON parse, render, and print behavior.
 
+    Parsing and compact or pretty rendering go through the active
+    :class:`~etlplus.utils._json.JsonBackend`, which uses :mod:`orjson` or
+    :mod:`msgspec` when installed. Other layouts use :mod:`json`.
+
     Attributes
     ----------
     compact : bool
@@ -143,7 +148,7 @@ class JsonCodec:
 
         """
         try:
-            data = json.loads(text)
+            data = JsonBackend.resolve().loads(text)
         except json.JSONDecodeError as exc:
             raise ValueError(
                 f'Invalid JSON payload: {exc.msg} (pos {exc.pos})',
@@ -202,13 +207,19 @@ class JsonCodec:
         str
             Serialized JSON text.
         """
+        default = self.default_serializer if default is None else default
+        if self.compact or self.pretty:
+            return JsonBackend.resolve().dumps(
+                obj,
+                default=default,
+                sort_keys=self.sort_keys,
+                pretty=self.pretty,
+            )
         return json.dumps(
             obj,
             ensure_ascii=False,
             sort_keys=self.sort_keys,
-            indent=2 if self.pretty else None,
-            separators=(',', ':') if self.compact and not self.pretty else None,
-            default=self.default_serializer if default is None else default,
+            default=default,
         )
 
     @staticmethod
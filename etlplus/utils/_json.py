@@ -0,0 +1,300 @@
+"""
+:mod:`etlplus.utils._json` module.
+
+Pluggable JSON encode/decode backends.
+
+:class:`JsonBackend` wraps :mod:`orjson` or :mod:`msgspec` when one is
+installed and falls back to the standard-library :mod:`json` module. The
+``ETLPLUS_JSON_BACKEND`` environment variable selects a backend explicitly
+(``orjson``, ``msgspec``, or ``json``); ``auto`` (the default) picks the
+first installed one in that order.
+
+Fast backends only produce the compact and two-space-indented layouts. Any
+payload a fast backend rejects, such as integers wider than 64 bits or
+``NaN`` literals, is retried with :mod:`json`, so results and errors match
+the standard library wherever the fast backend cannot handle the input.
+Fast backends also write non-finite floats as ``null``. Payloads holding
+``NaN`` or ``Infinity`` are therefore serialized by :mod:`json` too, which
+writes them as the ``NaN``/``Infinity`` literals.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from collections.abc import Callable
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Any
+from typing import Final
+
+# SECTION: EXPORTS ========================================================== #
+
+
+__all__ = [
+    # Constants
+    'JSON_BACKEND_ENV',
+    # Data Classes
+    'JsonBackend',
+]
+
+
+# SECTION: CONSTANTS ======================================================== #
+
+
+JSON_BACKEND_ENV: Final[str] = 'ETLPLUS_JSON_BACKEND'
+
+
+# SECTION: INTERNAL CONSTANTS =============================================== #
+
+
+# Fast backends in auto-detection order.
+_FAST_BACKENDS: Final[tuple[str, ...]] = ('orjson', 'msgspec')
+
+_BACKEND_NAMES: Final[frozenset[str]] = frozenset({'auto', 'json', *_FAST_BACKENDS})
+
+# Resolved backends, by requested name.
+_RESOLVED: dict[str, JsonBackend] = {}
+
+
+# SECTION: INTERNAL FUNCTIONS =============================================== #
+
+
+def _has_non_finite(
+    obj: object,
+) -> bool:
+    """Return whether *obj* holds a ``NaN`` or infinite float."""
+    match obj:
+        case float():
+            return not math.isfinite(obj)
+        case dict():
+            return any(map(_has_non_finite, obj.values()))
+        case list() | tuple():
+            return any(map(_has_non_finite, obj))
+    return False
+
+
+def _import_backend(
+    name: str,
+) -> Any | None:
+    """Return the module of one fast backend, or ``None`` when missing."""
+    try:
+        return import_module(name)
+    except ImportError:
+        return None
+
+
+def _stdlib_dumps(
+    obj: object,
+    *,
+    default: Callable[[object], object] | None,
+    sort_keys: bool,
+    pretty: bool,
+) -> str:
+    """Serialize *obj* with :mod:`json` in the compact or indented layout."""
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        sort_keys=sort_keys,
+        indent=2 if pretty else None,
+        separators=None if pretty else (',', ':'),
+        default=default,
+    )
+
+
+# SECTION: DATA CLASSES ===================================================== #
+
+
+@dataclass(frozen=True, slots=True)
+class JsonBackend:
+    """
+    One JSON encode/decode implementation.
+
+    Attributes
+    ----------
+    name : str
+        Backend name: ``'orjson'``, ``'msgspec'``, or ``'json'``.
+    module : Any | None
+        Imported fast backend module, or ``None`` for :mod:`json`.
+    """
+
+    # -- Instance Attributes -- #
+
+    name: str = 'json'
+    module: Any | None = None
+
+    # -- Class Methods -- #
+
+    @classmethod
+    def resolve(
+        cls,
+        name: str | None = None,
+    ) -> JsonBackend:
+        """
+        Return the backend for *name*, caching it for later calls.
+
+        Parameters
+        ----------
+        name : str | None, optional
+            Backend name, or ``'auto'``. Defaults to the
+            ``ETLPLUS_JSON_BACKEND`` environment variable, else ``'auto'``.
+
+        Returns
+        -------
+        JsonBackend
+            The resolved backend.
+
+        Raises
+        ------
+        ImportError
+            If an explicitly requested fast backend is not installed.
+        ValueError
+            If *name* is not a known backend.
+        """
+        requested = (name or os.environ.get(JSON_BACKEND_ENV) or 'auto').strip().lower()
+        if requested in _RESOLVED:
+            return _RESOLVED[requested]
+        if requested not in _BACKEND_NAMES:
+            raise ValueError(
+                f'Invalid JSON backend {requested!r}; '
+                f'expected one of: {", ".join(sorted(_BACKEND_NAMES))}',
+            )
+        backend = cls()
+        if requested == 'auto':
+            for candidate in _FAST_BACKENDS:
+                if (module := _import_backend(candidate)) is not None:
+                    backend = cls(candidate, module)
+                    break
+        elif requested != 'json':
+            if (module := _import_backend(requested)) is None:
+                raise ImportError(
+                    f'JSON backend {requested!r} requires the {requested!r} '
+                    f'package; install it with: pip install {requested}',
+                )
+            backend = cls(requested, module)
+        _RESOLVED[requested] = backend
+        return backend
+
+    # -- Internal Instance Methods -- #
+
+    def _fallback_errors(self) -> tuple[type[Exception], ...]:
+        """Return the exceptions that send one call back to :mod:`json`."""
+        module: Any = self.module
+        if self.name == 'msgspec':
+            return (TypeError, ValueError, OverflowError, module.MsgspecError)
+        return (TypeError, ValueError, OverflowError)
+
+    def _fast_dumps(
+        self,
+        obj: object,
+        *,
+        default: Callable[[object], object] | None,
+        sort_keys: bool,
+        pretty: bool,
+    ) -> str:
+        """Serialize *obj* with the fast backend module."""
+        module: Any = self.module
+        if self.name == 'orjson':
+            option = (
+                module.OPT_NON_STR_KEYS
+                | module.OPT_PASSTHROUGH_DATACLASS
+                | module.OPT_PASSTHROUGH_DATETIME
+            )
+            if sort_keys:
+                option |= module.OPT_SORT_KEYS
+            if pretty:
+                option |= module.OPT_INDENT_2
+            return module.dumps(obj, default=default, option=option).decode()
+        encoded = module.json.encode(
+            obj,
+            enc_hook=default,
+            order='sorted' if sort_keys else None,
+        )
+        if pretty:
+            encoded = module.json.format(encoded, indent=2)
+        return encoded.decode()
+
+    # -- Instance Methods -- #
+
+    def dumps(
+        self,
+        obj: object,
+        *,
+        default: Callable[[object], object] | None = None,
+        sort_keys: bool = False,
+        pretty: bool = False,
+    ) -> str:
+        """
+        Serialize *obj* as compact or two-space-indented UTF-8 JSON text.
+
+        Parameters
+        ----------
+        obj : object
+            Object to serialize.
+        default : Callable[[object], object] | None, optional
+            Fallback serializer for values JSON cannot represent natively.
+        sort_keys : bool, optional
+            Whether to sort mapping keys. Defaults to ``False``.
+        pretty : bool, optional
+            Whether to indent by two spaces instead of writing compact
+            text. Defaults to ``False``.
+
+        Returns
+        -------
+        str
+            Serialized JSON text.
+        """
+        if self.module is not None:
+            try:
+                text = self._fast_dumps(
+                    obj,
+                    default=default,
+                    sort_keys=sort_keys,
+                    pretty=pretty,
+                )
+            except self._fallback_errors():
+                pass
+            else:
+                # Non-finite floats encode as ``null``; only then is the
+                # payload walked to look for them.
+                if 'null' not in text or not _has_non_finite(obj):
+                    return text
+        return _stdlib_dumps(
+            obj,
+            default=default,
+            sort_keys=sort_keys,
+            pretty=pretty,
+        )
+
+    def loads(
+        self,
+        text: str | bytes,
+    ) -> Any:
+        """
+        Parse JSON *text*.
+
+        Parameters
+        ----------
+        text : str | bytes
+            JSON document to parse.
+
+        Returns
+        -------
+        Any
+            Parsed value.
+
+        Raises
+        ------
+        json.JSONDecodeError
+            If *text* is not valid JSON.
+        """
+        module: Any = self.module
+        if module is not None:
+            try:
+                if self.name == 'orjson':
+                    return module.loads(text)
+                return module.json.decode(text)
+            except self._fallback_errors():
+                pass
+        return json.loads(text)
@@ -10,7 +10,9 @@ from ._dag import topological_sort_jobs
 from ._errors import DagError
 from ._jobs import ExtractRef
 from ._jobs import JobConfig
+from ._jobs import JobIncrementalConfig
 from ._jobs import JobRetryConfig
+from ._jobs import JobStreamingConfig
 from ._jobs import LoadRef
 from ._jobs import TransformRef
 from ._jobs import ValidationRef
@@ -28,7 +30,9 @@ __all__ = [
     # Data Classes
     'ExtractRef',
     'JobConfig',
+    'JobIncrementalConfig',
     'JobRetryConfig',
+    'JobStreamingConfig',
     'LoadRef',
     'ProfileConfig',
     'ScheduleBackfillConfig',
@@ -32,7 +32,9 @@ __all__ = [
     # Data Classes
     'ExtractRef',
     'JobConfig',
+    'JobIncrementalConfig',
     'JobRetryConfig',
+    'JobStreamingConfig',
     'LoadRef',
     'TransformRef',
     'ValidationRef',
@@ -42,6 +44,8 @@ __all__ = [
 # SECTION: INTERNAL CONSTANTS =============================================== #
 
 
+_DEFAULT_STREAMING_BATCH_SIZE = 10_000
+
 _VALIDATION_PHASE_CHOICES = {
     'before_transform': 'before_transform',
     'after_transform': 'after_transform',
@@ -50,6 +54,7 @@ _VALIDATION_PHASE_CHOICES = {
 _VALIDATION_SEVERITY_CHOICES = {
     'warn': 'warn',
     'error': 'error',
+    'quarantine': 'quarantine',
 }
 
 
@@ -83,12 +88,15 @@ class ExtractRef:
         Name of the source connector.
     options : dict[str, Any]
         Optional extract-time options (e.g., query parameters overrides).
+    incremental : JobIncrementalConfig | None
+        Optional watermark settings that limit each run to new records.
     """
 
     # -- Attributes -- #
 
     source: str
     options: dict[str, Any] = field(default_factory=dict)
+    incremental: JobIncrementalConfig | None = None
 
     # -- Class Methods -- #
 
@@ -116,6 +124,66 @@ class ExtractRef:
         return cls(
             source=source,
             options=MappingParser.to_dict(data.get('options')),
+            incremental=JobIncrementalConfig.from_obj(data.get('incremental')),
+        )
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class JobIncrementalConfig:
+    """
+    Optional watermark-based incremental extraction for one job.
+
+    Attributes
+    ----------
+    field : str
+        Record field holding a timestamp or monotonically increasing id.
+        Each run only extracts records whose value is above the highest
+        value loaded by the previous successful run.
+    initial : Any | None
+        Watermark used before any run has been recorded. ``None`` reads the
+        full source on the first run.
+    param : str | None
+        Query parameter that carries the watermark to API sources. Defaults
+        to :attr:`field`.
+    """
+
+    # -- Attributes -- #
+
+    field: str
+    initial: Any | None = None
+    param: str | None = None
+
+    # -- Class Methods -- #
+
+    @classmethod
+    def from_obj(
+        cls,
+        obj: Any,
+    ) -> Self | None:
+        """
+        Parse one watermark field name or mapping.
+
+        Parameters
+        ----------
+        obj : Any
+            Field name (``incremental: updated_at``) or mapping containing
+            ``field`` plus optional ``initial`` and ``param`` controls.
+
+        Returns
+        -------
+        Self | None
+            Parsed incremental settings or ``None`` when the payload is
+            missing or invalid.
+        """
+        if isinstance(obj, str):
+            return cls(field=obj.strip()) if obj.strip() else None
+        if (parsed := _mapping_with_required_str(obj, 'field')) is None:
+            return None
+        data, field_name = parsed
+        return cls(
+            field=field_name,
+            initial=data.get('initial'),
+            param=ValueParser.optional_str(data.get('param')),
         )
 
 
@@ -177,6 +245,60 @@ class JobRetryConfig:
         return self.max_attempts > 1
 
 
+@dataclass(kw_only=True, slots=True, frozen=True)
+class JobStreamingConfig:
+    """
+    Optional streaming execution policy for one job or pipeline profile.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether the job streams record batches through validate, transform,
+        and load instead of materializing the full extract payload.
+    batch_size : int
+        Maximum number of records held in one in-flight batch.
+    """
+
+    # -- Attributes -- #
+
+    enabled: bool = True
+    batch_size: int = _DEFAULT_STREAMING_BATCH_SIZE
+
+    # -- Class Methods -- #
+
+    @classmethod
+    def from_obj(
+        cls,
+        obj: Any,
+    ) -> Self | None:
+        """
+        Parse one streaming policy flag or mapping.
+
+        Parameters
+        ----------
+        obj : Any
+            Boolean-like flag (``streaming: true``) or mapping containing
+            ``enabled`` and ``batch_size`` controls.
+
+        Returns
+        -------
+        Self | None
+            Parsed streaming policy or ``None`` when the payload is missing
+            or invalid.
+        """
+        if isinstance(obj, bool | str):
+            return cls(enabled=ValueParser.bool_flag(obj, default=False))
+        if not (data := MappingParser.optional(obj)):
+            return None
+        return cls(
+            enabled=ValueParser.bool_flag(data.get('enabled'), default=True),
+            batch_size=IntParser.positive(
+                data.get('batch_size'),
+                default=_DEFAULT_STREAMING_BATCH_SIZE,
+            ),
+        )
+
+
 @dataclass(kw_only=True, slots=True)
 class JobConfig:
     """
@@ -196,6 +318,8 @@ class JobConfig:
         Validation reference.
     retry : JobRetryConfig | None
         Optional retry controls applied by DAG-style execution.
+    streaming : JobStreamingConfig | None
+        Optional streaming controls; overrides the profile-level default.
     transform : TransformRef | None
         Transform reference.
     load : LoadRef | None
@@ -210,6 +334,7 @@ class JobConfig:
     extract: ExtractRef | None = None
     validate: ValidationRef | None = None
     retry: JobRetryConfig | None = None
+    streaming: JobStreamingConfig | None = None
     transform: TransformRef | None = None
     load: LoadRef | None = None
 
@@ -248,6 +373,7 @@ class JobConfig:
             extract=ExtractRef.from_obj(data.get('extract')),
             validate=ValidationRef.from_obj(data.get('validate')),
             retry=JobRetryConfig.from_obj(data.get('retry')),
+            streaming=JobStreamingConfig.from_obj(data.get('streaming')),
             transform=TransformRef.from_obj(data.get('transform')),
             load=LoadRef.from_obj(data.get('load')),
         )
@@ -351,17 +477,28 @@ class ValidationRef:
     ruleset : str
         Name of the validation rule set.
     severity : str | None
-        Severity level (``"warn"`` or ``"error"``).
+        Severity level (``"warn"``, ``"error"``, or ``"quarantine"``).
     phase : str | None
         Execution phase (``"before_transform"``, ``"after_transform"``,
         or ``"both"``).
+    max_errors : int | None
+        Error budget for bounded validation. With ``error`` severity, the job
+        fails once more errors than this have been seen.
+    max_samples : int | None
+        Number of sample error messages kept by bounded validation.
+    quarantine : str | None
+        Name of the file target receiving invalid records when severity is
+        ``"quarantine"``.
     """
 
     # -- Attributes -- #
 
     ruleset: str
-    severity: str | None = None  # warn|error
+    severity: str | None = None  # warn|error|quarantine
     phase: str | None = None  # before_transform|after_transform|both
+    max_errors: int | None = None
+    max_samples: int | None = None
+    quarantine: str | None = None
 
     # -- Class Methods -- #
 
@@ -396,4 +533,7 @@ class ValidationRef:
                 data.get('phase'),
                 _VALIDATION_PHASE_CHOICES,
             ),
+            max_errors=IntParser.parse(data.get('max_errors'), minimum=0),
+            max_samples=IntParser.parse(data.get('max_samples'), minimum=0),
+            quarantine=ValueParser.optional_str(data.get('quarantine')),
         )
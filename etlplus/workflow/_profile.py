@@ -17,6 +17,7 @@ from typing import Self
 
 from ..utils import MappingParser
 from ..utils import ValueParser
+from ._jobs import JobStreamingConfig
 
 # SECTION: EXPORTS ========================================================== #
 
@@ -41,12 +42,15 @@ class ProfileConfig:
         Default target name for jobs that omit an explicit target.
     env : dict[str, str]
         Environment variables available for substitution.
+    streaming : JobStreamingConfig | None
+        Default streaming controls for jobs that omit their own policy.
     """
 
     # -- Attributes -- #
 
     default_target: str | None = None
     env: dict[str, str] = field(default_factory=dict)
+    streaming: JobStreamingConfig | None = None
 
     # -- Class Methods -- #
 
@@ -78,4 +82,5 @@ class ProfileConfig:
         return cls(
             default_target=default_target if default_target else None,
             env=MappingParser.to_str_dict(MappingParser.optional(data.get('env'))),
+            streaming=JobStreamingConfig.from_obj(data.get('streaming')),
         )
@@ -185,8 +185,13 @@ class TestCliEndToEnd:
         args: CliArgs,
         should_pass: bool,
         stdin_text: StdinText,
+        tmp_path: Path,
     ) -> None:
         """Test CLI required-argument and option-order edge cases."""
+        # Route target files into the test directory instead of the cwd.
+        args = tuple(
+            str(tmp_path / arg) if arg.startswith('output.') else arg for arg in args
+        )
         if should_pass and args[0] == 'load':
             stdin_text(STDIN_PERSON_LIST)
         code, _out, err = cli_invoke(args)
@@ -26,9 +26,13 @@ import etlplus.ops._enums as ops_enums_mod
 import etlplus.ops._validation as ops_validation_mod
 import etlplus.ops.transformations.aggregate as aggregate_tx_mod
 import etlplus.ops.transformations.filter as filter_tx_mod
+import etlplus.ops.transformations.group_by as group_by_tx_mod
+import etlplus.ops.transformations.limit as limit_tx_mod
 import etlplus.ops.transformations.map as map_tx_mod
 import etlplus.ops.transformations.select as select_tx_mod
 import etlplus.ops.transformations.sort as sort_tx_mod
+import etlplus.ops.transformations.sql as sql_tx_mod
+import etlplus.ops.transformations.top_n as top_n_tx_mod
 from etlplus import Config
 from etlplus.api import endpoint_client as endpoint_client_mod
 from etlplus.api import pagination as pagination_mod
@@ -161,14 +165,34 @@ OPS_TRANSFORMATION_EXPORTS: tuple[ExportCase, ...] = (
     (aggregate_tx_mod, 'apply_aggregate_step', aggregate_tx_mod),
     (filter_tx_mod, 'apply_filter', filter_tx_mod),
     (filter_tx_mod, 'apply_filter_step', filter_tx_mod),
+    (filter_tx_mod, 'compile_filter_step', filter_tx_mod),
+    (group_by_tx_mod, 'apply_group_by', group_by_tx_mod),
+    (group_by_tx_mod, 'apply_group_by_step', group_by_tx_mod),
+    (group_by_tx_mod, 'compile_group_by_step', group_by_tx_mod),
+    (limit_tx_mod, 'apply_limit', limit_tx_mod),
+    (limit_tx_mod, 'apply_limit_step', limit_tx_mod),
+    (limit_tx_mod, 'compile_limit_step', limit_tx_mod),
+    (limit_tx_mod, 'iter_limit', limit_tx_mod),
     (map_tx_mod, 'apply_map', map_tx_mod),
     (map_tx_mod, 'apply_map_step', map_tx_mod),
+    (map_tx_mod, 'compile_map_step', map_tx_mod),
     (select_tx_mod, 'apply_select', select_tx_mod),
     (select_tx_mod, 'apply_select_step', select_tx_mod),
+    (select_tx_mod, 'compile_select_step', select_tx_mod),
     (select_tx_mod, 'is_plain_fields_list', select_tx_mod),
     (select_tx_mod, 'is_sequence_not_text', select_tx_mod),
     (sort_tx_mod, 'apply_sort', sort_tx_mod),
     (sort_tx_mod, 'apply_sort_step', sort_tx_mod),
+    (sort_tx_mod, 'compile_sort_step', sort_tx_mod),
+    (sort_tx_mod, 'iter_sorted', sort_tx_mod),
+    (sort_tx_mod, 'sort_fields', sort_tx_mod),
+    (sql_tx_mod, 'apply_sql', sql_tx_mod),
+    (sql_tx_mod, 'apply_sql_step', sql_tx_mod),
+    (sql_tx_mod, 'apply_sql_table', sql_tx_mod),
+    (sql_tx_mod, 'compile_sql_step', sql_tx_mod),
+    (top_n_tx_mod, 'apply_top_n', top_n_tx_mod),
+    (top_n_tx_mod, 'apply_top_n_step', top_n_tx_mod),
+    (top_n_tx_mod, 'compile_top_n_step', top_n_tx_mod),
 )
 
 DOCUMENTED_EXPORTS = tuple(
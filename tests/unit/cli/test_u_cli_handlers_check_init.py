@@ -936,6 +936,7 @@ class TestScheduleHandler:
         self,
         monkeypatch: pytest.MonkeyPatch,
         capture_io: CaptureIo,
+        tmp_path: Path,
     ) -> None:
         """Schedule handler should optionally include persisted scheduler state."""
         cfg = _schedule_test_config(
@@ -951,7 +952,7 @@ class TestScheduleHandler:
             },
         )
         patch_config_from_yaml(monkeypatch, cfg)
-        state_dir = Path('state-dir').resolve()
+        state_dir = tmp_path / 'state-dir'
         monkeypatch.setenv('ETLPLUS_STATE_DIR', str(state_dir))
         state_dir.mkdir(parents=True, exist_ok=True)
         (state_dir / 'scheduler-state.json').write_text(
@@ -72,11 +72,71 @@ class TestConnectorDb:
                     'schema': None,
                     'warehouse': None,
                     'query': 'False',
+                    'params': {},
                     'table': '456',
+                    'fetch_size': None,
+                    'partition_column': None,
+                    'partitions': None,
+                    'lower_bound': None,
+                    'upper_bound': None,
+                    'preserve_order': True,
                     'mode': None,
+                    'keys': (),
+                    'batch_size': None,
                 },
                 id='coerces-optional-strings',
             ),
+            pytest.param(
+                {
+                    'name': 'warehouse',
+                    'type': 'database',
+                    'query': 'SELECT * FROM events WHERE day = :day',
+                    'params': {'day': '2026-01-01'},
+                    'fetch_size': '5000',
+                },
+                {
+                    'type': DataConnectorType.DATABASE,
+                    'params': {'day': '2026-01-01'},
+                    'fetch_size': 5000,
+                },
+                id='parses-query-params-and-fetch-size',
+            ),
+            pytest.param(
+                {
+                    'name': 'warehouse',
+                    'type': 'database',
+                    'table': 'events',
+                    'partition_column': 'event_id',
+                    'partitions': '8',
+                    'lower_bound': 1,
+                    'upper_bound': 1_000_000,
+                    'preserve_order': 'false',
+                },
+                {
+                    'partition_column': 'event_id',
+                    'partitions': 8,
+                    'lower_bound': 1,
+                    'upper_bound': 1_000_000,
+                    'preserve_order': False,
+                },
+                id='parses-partition-settings',
+            ),
+            pytest.param(
+                {
+                    'name': 'warehouse',
+                    'type': 'database',
+                    'table': 'events',
+                    'mode': 'upsert',
+                    'keys': 'event_id',
+                    'batch_size': '500',
+                },
+                {
+                    'mode': 'upsert',
+                    'keys': ('event_id',),
+                    'batch_size': 500,
+                },
+                id='parses-load-mode-keys-and-batch-size',
+            ),
             pytest.param(
                 BIGQUERY_CASE.connector_payload(
                     include_provider=False,
@@ -212,9 +212,11 @@ class DelimitedReadWriteMixin(PathMixin):
             path: object,
             *,
             delimiter: str,
+            column_types: object,
         ) -> list[dict[str, object]]:
             calls['path'] = path
             calls['delimiter'] = delimiter
+            calls['column_types'] = column_types
             return expected_rows
 
         monkeypatch.setattr(base_mod, 'read_delimited', _read_delimited)
@@ -223,6 +225,89 @@ class DelimitedReadWriteMixin(PathMixin):
 
         assert result == expected_rows
         assert calls['delimiter'] == self.delimiter
+        assert calls['column_types'] is None
+
+    def test_read_with_arrow_engine_matches_default_engine(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that the ``arrow`` engine returns the default engine's rows."""
+        path = self.format_path(tmp_path)
+        path.write_text(
+            f'id{self.delimiter}name\n1{self.delimiter}Ada\n2{self.delimiter}\n',
+            encoding='utf-8',
+        )
+        options = ReadOptions(extras={'engine': 'arrow'})
+
+        rows = self.module_handler.read(path)
+
+        assert self.module_handler.read(path, options=options) == rows
+        assert list(
+            self.module_handler.read_iter(path, batch_size=1, options=options),
+        ) == [[row] for row in rows]
+        assert self.module_handler.read_arrow(path).to_pylist() == rows
+
+    @pytest.mark.parametrize('engine', ['python', 'arrow'])
+    def test_read_converts_schema_and_inferred_columns(
+        self,
+        tmp_path: Path,
+        engine: str,
+    ) -> None:
+        """Test typed reads from ``schema`` and ``infer_types`` extras."""
+        path = self.format_path(tmp_path)
+        path.write_text(
+            f'id{self.delimiter}score{self.delimiter}code\n'
+            f'1{self.delimiter}2.5{self.delimiter}7\n'
+            f'2{self.delimiter}{self.delimiter}8\n',
+            encoding='utf-8',
+        )
+        options = ReadOptions(
+            extras={
+                'engine': engine,
+                'infer_types': True,
+                'schema': {'code': 'str'},
+            },
+        )
+
+        assert self.module_handler.read(path, options=options) == [
+            {'id': 1, 'score': 2.5, 'code': '7'},
+            {'id': 2, 'score': None, 'code': '8'},
+        ]
+
+    def test_read_rejects_unknown_engine(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that unknown ``engine`` read extras are rejected."""
+        path = self.format_path(tmp_path)
+        path.write_text(f'id{self.delimiter}name\n', encoding='utf-8')
+
+        with pytest.raises(ValueError, match='Unsupported delimited read engine'):
+            self.module_handler.read(
+                path,
+                options=ReadOptions(extras={'engine': 'polars'}),
+            )
+
+    def test_write_with_explicit_columns_drops_late_columns(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test ``columns`` and ``late_columns`` write extras."""
+        path = self.format_path(tmp_path)
+        options = WriteOptions(
+            extras={'columns': 'name, id', 'late_columns': 'drop'},
+        )
+
+        written = self.module_handler.write(
+            path,
+            [{'id': 1, 'name': 'Ada', 'extra': True}],
+            options=options,
+        )
+
+        assert written == 1
+        assert path.read_text(encoding='utf-8') == (
+            f'name{self.delimiter}id\nAda{self.delimiter}1\n'
+        )
 
     def test_write_uses_expected_delimiter_and_format_name(
         self,
@@ -238,11 +323,15 @@ class DelimitedReadWriteMixin(PathMixin):
             *,
             delimiter: str,
             format_name: str,
+            columns: list[str] | None,
+            late_columns: str | None,
         ) -> int:
             calls['path'] = path
             calls['data'] = data
             calls['delimiter'] = delimiter
             calls['format_name'] = format_name
+            calls['columns'] = columns
+            calls['late_columns'] = late_columns
             return 1
 
         monkeypatch.setattr(base_mod, 'write_delimited', _write_delimited)
@@ -255,6 +344,8 @@ class DelimitedReadWriteMixin(PathMixin):
         assert written == 1
         assert calls['delimiter'] == self.delimiter
         assert calls['format_name'] == self.format_name.upper()
+        assert calls['columns'] is None
+        assert calls['late_columns'] is None
 
 
 class DelimitedTextRowsMixin(EmptyWriteReturnsZeroMixin):
@@ -173,6 +173,23 @@ class TestArrow(PyarrowMissingDependencyMixin):
     module = mod
     format_name = 'arrow'
 
+    def test_read_iter_and_write_iter_round_trip(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test incremental IPC batch writes and re-chunked batched reads."""
+        pytest.importorskip('pyarrow')
+        handler = mod.ArrowFile()
+        path = self.format_path(tmp_path / 'nested')
+        rows = [{'id': idx, 'name': f'n{idx}'} for idx in range(5)]
+
+        written = handler.write_iter(path, iter([rows[:3], [], rows[3:]]))
+        batches = list(handler.read_iter(path, batch_size=2))
+
+        assert written == 5
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [row for batch in batches for row in batch] == rows
+
     def test_read_table_uses_memory_map_and_ipc_reader(
         self,
         tmp_path: Path,
@@ -246,6 +263,36 @@ class TestArrow(PyarrowMissingDependencyMixin):
         actual = written if check_name == 'written' else path.exists()
         assert actual == expected
 
+    def test_write_iter_rejects_late_columns(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that later batches cannot widen the first-batch schema."""
+        pytest.importorskip('pyarrow')
+        with pytest.raises(ValueError, match='missing from the header: extra'):
+            mod.ArrowFile().write_iter(
+                self.format_path(tmp_path),
+                [[{'id': 1}], [{'id': 2, 'extra': 3}]],
+            )
+
+    def test_write_iter_types_columns_null_in_first_batch(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that sparse columns take their type from later batches."""
+        pytest.importorskip('pyarrow')
+        handler = mod.ArrowFile()
+        path = self.format_path(tmp_path)
+        rows = [{'a': 1, 'b': None}, {'a': 2, 'b': 5}, {'a': 3}]
+
+        written = handler.write_iter(path, iter([rows[:1], rows[1:]]))
+
+        assert written == 3
+        assert [row for batch in handler.read_iter(path) for row in batch] == [
+            *rows[:2],
+            {'a': 3, 'b': None},
+        ]
+
     def test_write_table_uses_osfile_and_ipc_writer(
         self,
         tmp_path: Path,
@@ -98,6 +98,11 @@ class TestAvroHandlerClass:
                 0,
                 id='write_empty',
             ),
+            pytest.param(
+                lambda h, path: h.write_iter(path, iter([[]])),
+                0,
+                id='write_iter_empty',
+            ),
         ],
     )
     def test_empty_payload_short_circuits(
@@ -116,6 +121,23 @@ class TestAvroHandlerClass:
         result = operation(handler, tmp_path / 'sample.avro')
         assert result == expected
 
+    def test_read_iter_and_write_iter_round_trip(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test incremental AVRO writes and block-wise batched reads."""
+        pytest.importorskip('fastavro')
+        handler = mod.AvroFile()
+        path = tmp_path / 'nested' / 'sample.avro'
+        rows = [{'id': idx, 'name': f'n{idx}'} for idx in range(5)]
+
+        written = handler.write_iter(path, iter([rows[:2], [], rows[2:]]))
+        batches = list(handler.read_iter(path, batch_size=2))
+
+        assert written == 5
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [row for batch in batches for row in batch] == rows
+
     def test_format_constant(self) -> None:
         """Test that :class:`AvroFile` exposes the expected format enum."""
         assert mod.AvroFile.format is FileFormat.AVRO
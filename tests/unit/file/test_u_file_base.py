@@ -367,7 +367,9 @@ class TestBaseAbcContracts:
             pytest.param('handler', 'handler', id='handler'),
             pytest.param('path', Path('ignored.csv'), id='path'),
             pytest.param('read', [{'id': 1}], id='read'),
+            pytest.param('read_iter', [[{'id': 1}]], id='read-iter-fallback'),
             pytest.param('write', 2, id='write'),
+            pytest.param('write_iter', 3, id='write-iter-fallback'),
         ],
     )
     def test_at_returns_path_bound_facade(
@@ -389,8 +391,13 @@ class TestBaseAbcContracts:
                 assert bound.path == expected
             case 'read':
                 assert bound.read() == expected
+            case 'read_iter':
+                assert list(bound.read_iter(batch_size=5)) == expected
             case 'write':
                 assert bound.write([{'id': 1}, {'id': 2}]) == expected
+            case 'write_iter':
+                batches = iter([[{'id': 1}, {'id': 2}], {'id': 3}])
+                assert bound.write_iter(batches) == expected
             case _:
                 pytest.fail(f'unhandled check: {check_name}')
 
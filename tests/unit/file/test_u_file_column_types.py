@@ -0,0 +1,141 @@
+"""
+:mod:`tests.unit.file.test_u_file_column_types` module.
+
+Unit tests for :mod:`etlplus.file._column_types`.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from datetime import datetime
+
+import pytest
+
+from etlplus.file import _column_types as mod
+
+# SECTION: TESTS ============================================================ #
+
+
+class TestColumnTypes:
+    """Unit tests for :class:`etlplus.file._column_types.ColumnTypes`."""
+
+    def test_apply_converts_explicit_columns_only(self) -> None:
+        """Test that explicit types convert their columns and keep the rest."""
+        column_types = mod.ColumnTypes(
+            types={'id': 'int', 'ok': 'bool', 'day': 'date', 'code': 'str'},
+        )
+
+        rows = list(
+            column_types.apply(
+                [
+                    {'id': '1', 'ok': 'Yes', 'day': '2024-01-02', 'code': '007'},
+                    {'id': ' ', 'ok': 'n', 'day': 'soon', 'code': ''},
+                ],
+            ),
+        )
+
+        assert rows == [
+            {'id': 1, 'ok': True, 'day': date(2024, 1, 2), 'code': '007'},
+            {'id': None, 'ok': False, 'day': 'soon', 'code': ''},
+        ]
+
+    def test_apply_infers_from_sample_and_keeps_unparsed_text(self) -> None:
+        """Test that inference uses the sample and tolerates later values."""
+        column_types = mod.ColumnTypes(infer=True, sample_size=1)
+
+        rows = list(
+            column_types.apply(
+                iter([{'n': '1', 'name': 'a'}, {'n': '2.5', 'name': 'b'}]),
+            ),
+        )
+
+        assert rows == [{'n': 1, 'name': 'a'}, {'n': '2.5', 'name': 'b'}]
+
+    def test_arrow_types_cover_explicit_and_text_columns(self) -> None:
+        """Test Arrow column types with and without inference."""
+        pa = pytest.importorskip('pyarrow')
+        header = ['id', 'name']
+
+        assert mod.ColumnTypes(types={'id': 'int'}).arrow_types(pa, header) == {
+            'id': pa.int64(),
+            'name': pa.string(),
+        }
+        assert mod.ColumnTypes(types={'id': 'float'}, infer=True).arrow_types(
+            pa,
+            header,
+        ) == {'id': pa.float64()}
+
+    @pytest.mark.parametrize(
+        ('options', 'expected'),
+        [
+            pytest.param({}, None, id='untyped'),
+            pytest.param(
+                {'infer': 'true', 'sample_size': '5'},
+                mod.ColumnTypes(infer=True, sample_size=5),
+                id='infer',
+            ),
+            pytest.param(
+                {'schema': {'id': 'Integer', 'at': 'timestamp'}},
+                mod.ColumnTypes(types={'id': 'int', 'at': 'datetime'}),
+                id='schema-aliases',
+            ),
+        ],
+    )
+    def test_from_options(
+        self,
+        options: dict[str, object],
+        expected: mod.ColumnTypes | None,
+    ) -> None:
+        """Test building column types from read extras."""
+        assert mod.ColumnTypes.from_options(**options) == expected
+
+    @pytest.mark.parametrize(
+        ('schema', 'match'),
+        [
+            pytest.param(['id'], 'must be a mapping', id='not-mapping'),
+            pytest.param({'id': 'uuid'}, 'Unsupported column type', id='type'),
+        ],
+    )
+    def test_from_options_rejects_invalid_schema(
+        self,
+        schema: object,
+        match: str,
+    ) -> None:
+        """Test that invalid ``schema`` extras are rejected."""
+        with pytest.raises(ValueError, match=match):
+            mod.ColumnTypes.from_options(schema=schema)
+
+    @pytest.mark.parametrize(
+        ('values', 'expected'),
+        [
+            pytest.param(['1', '-20', ''], 'int', id='int'),
+            pytest.param(['1', '2.5', '1e3'], 'float', id='float'),
+            pytest.param(['02134', '10001'], 'str', id='leading-zeros'),
+            pytest.param(['true', 'FALSE'], 'bool', id='bool'),
+            pytest.param(['2024-01-02', '2024-02-29'], 'date', id='date'),
+            pytest.param(
+                ['2024-01-02T03:04:05', '2024-01-02 03:04:05+00:00'],
+                'datetime',
+                id='datetime',
+            ),
+            pytest.param(['2024-02-30'], 'str', id='invalid-date'),
+            pytest.param(['', ' '], 'str', id='blank'),
+        ],
+    )
+    def test_infer_types(
+        self,
+        values: list[str],
+        expected: str,
+    ) -> None:
+        """Test inferring the narrowest type of one sampled column."""
+        rows = [{'value': value} for value in values]
+
+        assert mod.ColumnTypes.infer_types(rows) == {'value': expected}
+
+    def test_infer_types_values_round_trip(self) -> None:
+        """Test that inferred datetimes convert with :meth:`apply`."""
+        column_types = mod.ColumnTypes(infer=True)
+
+        rows = list(column_types.apply([{'at': '2024-01-02 03:04:05'}]))
+
+        assert rows == [{'at': datetime(2024, 1, 2, 3, 4, 5)}]
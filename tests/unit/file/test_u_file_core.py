@@ -594,6 +594,23 @@ class TestFile:
         assert result == {'name': 'Ada'}
         assert backend.calls == ['exists', 'rb']
 
+    def test_remote_read_iter_and_write_iter_stage_through_storage_backend(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that remote batch IO stages through the storage backend."""
+        backend = RemoteBytesBackendStub(read_payload=b'id\n1\n2\n3\n')
+        _install_storage_backend(monkeypatch, backend)
+        file = File('s3://bucket/data.csv', FileFormat.CSV)
+
+        batches = list(file.read_iter(batch_size=2))
+        written = file.write_iter(iter([[{'id': 1}], [{'id': 2}]]))
+
+        assert batches == [[{'id': '1'}, {'id': '2'}], [{'id': '3'}]]
+        assert written == 2
+        assert backend.calls == ['exists', 'rb', 'ensure_parent_dir', 'wb']
+        assert backend.uploads == [b'id\r\n1\r\n2\r\n']
+
     @pytest.mark.parametrize(
         ('field_path', 'expected'),
         [
@@ -629,6 +646,74 @@ class TestFile:
         assert backend.calls == ['ensure_parent_dir', 'wb']
         assert backend.uploads == [b'{\n  "name": "Ada"\n}\n']
 
+    @pytest.mark.parametrize(
+        'file_format',
+        [
+            pytest.param(FileFormat.JSON, id='record-fallback'),
+            pytest.param(FileFormat.PARQUET, id='native-parquet'),
+        ],
+    )
+    def test_read_arrow_returns_pyarrow_table(
+        self,
+        tmp_path: Path,
+        file_format: FileFormat,
+    ) -> None:
+        """Test that Arrow-table reads work for native and fallback handlers."""
+        pytest.importorskip('pyarrow')
+        file = File(tmp_path / f'data.{file_format.value}')
+        file.write([{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'}])
+
+        table = file.read_arrow()
+
+        assert table.column_names == ['id', 'name']
+        assert table.to_pylist() == [{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'}]
+
+    def test_read_arrow_fallback_keeps_keys_from_later_records(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that record-fallback Arrow reads use the union of keys."""
+        pytest.importorskip('pyarrow')
+        file = File(tmp_path / 'data.json')
+        file.write([{'id': 1}, {'id': 2, 'late': 'x'}])
+
+        assert file.read_arrow().to_pylist() == [
+            {'id': 1, 'late': None},
+            {'id': 2, 'late': 'x'},
+        ]
+
+    @pytest.mark.parametrize(
+        'file_format',
+        [
+            pytest.param(FileFormat.CSV, id='native-csv'),
+            pytest.param(FileFormat.NDJSON, id='native-ndjson'),
+            pytest.param(FileFormat.YAML, id='full-read-fallback'),
+        ],
+    )
+    def test_read_iter_and_write_iter_round_trip(
+        self,
+        tmp_path: Path,
+        file_format: FileFormat,
+    ) -> None:
+        """Test batched writes and reads for native and fallback handlers."""
+        if file_format is FileFormat.YAML:
+            pytest.importorskip('yaml')
+        file = File(tmp_path / 'nested' / f'data.{file_format.value}')
+
+        written = file.write_iter(iter([[{'id': '1'}, {'id': '2'}], [{'id': '3'}]]))
+        batches = list(file.read_iter(batch_size=2))
+
+        assert written == 3
+        assert batches == [[{'id': '1'}, {'id': '2'}], [{'id': '3'}]]
+
+    def test_read_iter_missing_file_raises(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that batched reads fail fast for missing files."""
+        with pytest.raises(FileNotFoundError, match='File not found'):
+            next(File(tmp_path / 'missing.csv').read_iter())
+
     def test_repr_preserves_public_path_and_format(
         self,
         tmp_path: Path,
@@ -49,6 +49,79 @@ class _PandasReadSasStub:
 class TestIoHelpers:
     """Unit tests for shared file IO helpers."""
 
+    def test_arrow_write_tables_types_sparse_columns(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that all-null columns are typed from a bounded sample of later
+        batches and that values past the sample fail clearly.
+        """
+        pa = pytest.importorskip('pyarrow')
+        batches = [[{'a': 1, 'b': None}, {'a': 2, 'c': 'x'}], [{'a': 3, 'b': 4.5}]]
+
+        schema, tables = mod.arrow_write_tables(pa, batches, format_name='Arrow')
+
+        assert schema.names == ['a', 'b', 'c']
+        assert schema.field('b').type == pa.float64()
+        assert [table.num_rows for table in tables] == [2, 1]
+
+        monkeypatch.setattr(mod, '_ARROW_SCHEMA_SAMPLE_ROWS', 2)
+        schema, tables = mod.arrow_write_tables(
+            pa,
+            [[{'a': 1, 'b': None}], [{'a': 2, 'b': None}], [{'a': 3, 'b': 5}]],
+            format_name='Arrow',
+        )
+
+        assert pa.types.is_null(schema.field('b').type)
+        with pytest.raises(ValueError, match='all-null in the first 2 rows: b'):
+            list(tables)
+
+    def test_arrow_write_tables_rejects_mismatched_types(self) -> None:
+        """Test that values of another type raise :class:`ValueError`."""
+        pa = pytest.importorskip('pyarrow')
+        _, tables = mod.arrow_write_tables(
+            pa,
+            [[{'a': 1}], [{'a': 'x'}]],
+            format_name='Arrow',
+        )
+
+        with pytest.raises(ValueError, match='does not match the schema'):
+            list(tables)
+
+    @pytest.mark.parametrize(
+        ('batch_size', 'expected_sizes'),
+        [
+            pytest.param(2, [2, 2, 1], id='partial-last-batch'),
+            pytest.param(5, [5], id='exact-fit'),
+        ],
+    )
+    def test_batch_records_groups_rows_in_order(
+        self,
+        batch_size: int,
+        expected_sizes: list[int],
+    ) -> None:
+        """Test that rows are grouped into bounded, ordered batches."""
+        rows = ({'id': idx} for idx in range(5))
+        batches = list(mod.batch_records(rows, batch_size))
+        assert [len(batch) for batch in batches] == expected_sizes
+        assert [row['id'] for batch in batches for row in batch] == list(range(5))
+
+    def test_batch_records_rejects_non_positive_size(self) -> None:
+        """Test that non-positive batch sizes are rejected."""
+        with pytest.raises(ValueError, match='batch_size'):
+            list(mod.batch_records([{'id': 1}], 0))
+
+    def test_check_batch_columns_rejects_late_columns(self) -> None:
+        """Test that rows with unknown columns are rejected."""
+        mod.check_batch_columns([{'a': 1}], frozenset({'a', 'b'}), format_name='CSV')
+        with pytest.raises(ValueError, match='CSV batch introduces columns.*: c'):
+            mod.check_batch_columns(
+                [{'a': 1, 'c': 2}],
+                frozenset({'a'}),
+                format_name='CSV',
+            )
+
     def test_close_connection_noop_when_close_is_not_callable(self) -> None:
         """
         Test connection cleanup no-op when ``close`` is non-callable.
@@ -202,6 +275,217 @@ class TestIoHelpers:
         assert mod.read_delimited(uri, delimiter=',') == [{'a': '1', 'b': '2'}]
         assert backend.calls == ['ensure_parent_dir', 'w', 'r']
 
+    def test_read_and_write_delimited_batches(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test incremental delimited writer/reader round trip."""
+        file_path = tmp_path / 'out' / 'rows.csv'
+        count = mod.write_delimited_batches(
+            file_path,
+            iter([[], [{'b': 2, 'a': 1}], {'a': 3}]),
+            delimiter=',',
+            format_name='CSV',
+        )
+        assert count == 2
+        assert file_path.read_text(encoding='utf-8') == 'a,b\n1,2\n3,\n'
+        assert list(
+            mod.read_delimited_batches(file_path, delimiter=',', batch_size=1),
+        ) == [[{'a': '1', 'b': '2'}], [{'a': '3', 'b': ''}]]
+
+    @pytest.mark.parametrize(
+        ('columns', 'late_columns', 'expected'),
+        [
+            pytest.param(
+                None,
+                None,
+                'a,b,c\n1,,\n2,x,3\n',
+                id='default-rewrites',
+            ),
+            pytest.param(
+                None,
+                'drop',
+                'a\n1\n2\n',
+                id='drop-inferred',
+            ),
+            pytest.param(
+                None,
+                'rewrite',
+                'a,b,c\n1,,\n2,x,3\n',
+                id='rewrite-inferred-sorted',
+            ),
+            pytest.param(
+                ['c', 'a'],
+                'rewrite',
+                'c,a,b\n,1,\n3,2,x\n',
+                id='rewrite-explicit-order',
+            ),
+            pytest.param(
+                ['c', 'a'],
+                'drop',
+                'c,a\n,1\n3,2\n',
+                id='drop-explicit',
+            ),
+        ],
+    )
+    def test_write_delimited_batches_late_column_policies(
+        self,
+        tmp_path: Path,
+        columns: list[str] | None,
+        late_columns: str | None,
+        expected: str,
+    ) -> None:
+        """Test explicit headers and each late-column policy."""
+        file_path = tmp_path / 'rows.csv'
+
+        count = mod.write_delimited_batches(
+            file_path,
+            iter([[{'a': 1}], [{'c': 3, 'b': 'x', 'a': 2}]]),
+            delimiter=',',
+            format_name='CSV',
+            columns=columns,
+            late_columns=late_columns,
+        )
+
+        assert count == 2
+        assert file_path.read_text(encoding='utf-8') == expected
+
+    def test_write_delimited_batches_rejects_unknown_policy(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that unknown late-column policies are rejected."""
+        with pytest.raises(ValueError, match='Invalid late column policy'):
+            mod.write_delimited_batches(
+                tmp_path / 'rows.csv',
+                [[{'a': 1}]],
+                delimiter=',',
+                late_columns='widen',
+            )
+
+    def test_write_delimited_streams_chunks_under_one_sorted_header(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that chunked writes still sort the header across all rows."""
+        monkeypatch.setattr(mod, '_DELIMITED_WRITE_CHUNK_SIZE', 1)
+        file_path = tmp_path / 'rows.tsv'
+
+        count = mod.write_delimited(
+            file_path,
+            [{'b': 1}, {'a': 'x\ty'}, {'c': None, 'b': 2}],
+            delimiter='\t',
+        )
+
+        assert count == 3
+        assert file_path.read_text(encoding='utf-8') == (
+            'a\tb\tc\n\t1\t\n"x\ty"\t\t\n\t2\t\n'
+        )
+
+    def test_write_delimited_batches_rejects_late_columns(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that the ``error`` policy rejects a wider later batch."""
+        with pytest.raises(ValueError, match='missing from the header: c'):
+            mod.write_delimited_batches(
+                tmp_path / 'rows.csv',
+                [[{'a': 1}], [{'a': 2, 'c': 3}]],
+                delimiter=',',
+                format_name='CSV',
+                late_columns='error',
+            )
+
+    def test_read_delimited_arrow_matches_python_reader(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that Arrow-parsed rows match the pure-Python reader."""
+        file_path = tmp_path / 'rows.psv'
+        file_path.write_text('a|b\n1|2\n\n"x|y"|\n', encoding='utf-8')
+
+        table = mod.read_delimited_arrow(file_path, delimiter='|')
+
+        assert table.column_names == ['a', 'b']
+        assert table.to_pylist() == mod.read_delimited(file_path, delimiter='|')
+        assert table.to_pylist() == [
+            {'a': '1', 'b': '2'},
+            {'a': 'x|y', 'b': ''},
+        ]
+        batches = list(mod.read_delimited_arrow_batches(file_path, delimiter='|'))
+        assert [row for batch in batches for row in batch.to_pylist()] == (
+            table.to_pylist()
+        )
+
+    def test_read_delimited_arrow_skips_blank_rows_and_strips_bom(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """
+        Test that rows of empty cells are skipped, short blank rows too, and
+        that a byte-order mark does not stop the first column reading as
+        text.
+        """
+        pytest.importorskip('pyarrow')
+        file_path = tmp_path / 'rows.csv'
+        file_path.write_bytes(b'\xef\xbb\xbfa,b,c\n1,2,3\n,,\n,\n" ",4,5\n')
+        expected = [
+            {'a': '1', 'b': '2', 'c': '3'},
+            {'a': ' ', 'b': '4', 'c': '5'},
+        ]
+
+        table = mod.read_delimited_arrow(file_path, delimiter=',')
+        batches = mod.read_delimited_arrow_batches(file_path, delimiter=',')
+
+        assert table.to_pylist() == expected
+        assert [row for batch in batches for row in batch.to_pylist()] == expected
+        assert [
+            {key.lstrip('\ufeff'): value for key, value in row.items()}
+            for row in mod.read_delimited(file_path, delimiter=',')
+        ] == expected
+
+    def test_read_delimited_arrow_rejects_ragged_rows(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that non-blank ragged rows raise :class:`ValueError`."""
+        pytest.importorskip('pyarrow')
+        file_path = tmp_path / 'rows.csv'
+        file_path.write_text('a,b,c\n1,2\n', encoding='utf-8')
+
+        with pytest.raises(ValueError, match='Use engine "python"'):
+            mod.read_delimited_arrow(file_path, delimiter=',')
+        with pytest.raises(ValueError, match='Use engine "python"'):
+            list(mod.read_delimited_arrow_batches(file_path, delimiter=','))
+
+    def test_read_delimited_arrow_handles_empty_files(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that files without a header read as empty tables."""
+        file_path = tmp_path / 'rows.csv'
+        file_path.write_text('', encoding='utf-8')
+
+        assert mod.read_delimited_arrow(file_path, delimiter=',').num_rows == 0
+        assert not list(mod.read_delimited_arrow_batches(file_path, delimiter=','))
+
+    def test_read_delimited_keeps_ragged_rows(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that short and long rows read as :class:`csv.DictReader` would."""
+        file_path = tmp_path / 'rows.csv'
+        file_path.write_text('\na,b\n1\n,\n2,3,4\n', encoding='utf-8')
+
+        rows = mod.read_delimited(file_path, delimiter=',')
+
+        assert rows == [
+            {'a': '1', 'b': None},
+            {'a': '2', 'b': '3', None: ['4']},
+        ]
+        assert rows[0].keys() == rows[1].keys() - {None}
+
     def test_read_and_write_text(
         self,
         tmp_path: Path,
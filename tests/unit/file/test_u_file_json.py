@@ -6,7 +6,9 @@ Unit tests for :mod:`etlplus.file.json`.
 
 from __future__ import annotations
 
+import io
 import json
+from datetime import date
 from pathlib import Path
 
 import pytest
@@ -61,6 +63,70 @@ class TestJson(
 
         assert mod.JsonFile().read(path) == [{'id': 1}]
 
+    @pytest.mark.parametrize(
+        'content',
+        [
+            pytest.param(json.dumps([{'id': 1}, {'id': 2}, {'id': 3}]), id='compact'),
+            pytest.param(
+                json.dumps([{'id': 1}, {'id': 2}, {'id': 3}], indent=2),
+                id='pretty',
+            ),
+        ],
+    )
+    def test_read_iter_decodes_array_elements_in_batches(
+        self,
+        tmp_path: Path,
+        content: str,
+    ) -> None:
+        """Test that :meth:`read_iter` yields array elements incrementally."""
+        path = self.format_path(tmp_path)
+        path.write_text(content, encoding='utf-8')
+
+        batches = list(mod.JsonFile().read_iter(path, batch_size=2))
+
+        assert batches == [[{'id': 1}, {'id': 2}], [{'id': 3}]]
+
+    def test_read_iter_handles_values_split_across_chunks(self) -> None:
+        """Test that array elements spanning buffer refills decode whole."""
+        text = '[12345, {"a": "]"}, [1, 2], "s"]'
+        handle = io.StringIO(text[1:])
+
+        items = list(mod._iter_array_items(handle, text[:1], chunk_size=1))
+
+        assert items == [12345, {'a': ']'}, [1, 2], 's']
+
+    @pytest.mark.parametrize(
+        ('content', 'match'),
+        [
+            pytest.param('[{"id": 1},', 'Unterminated', id='unterminated'),
+            pytest.param('[{"id": 1} {"id": 2}]', "Expected ','", id='missing-comma'),
+            pytest.param('[{"id": 1},]', "Unexpected ']'", id='trailing-comma'),
+            pytest.param('[{"id": 1}] []', 'Extra data', id='extra-data'),
+        ],
+    )
+    def test_read_iter_rejects_malformed_arrays(
+        self,
+        tmp_path: Path,
+        content: str,
+        match: str,
+    ) -> None:
+        """Test that incremental reads reject malformed arrays."""
+        path = self.format_path(tmp_path)
+        path.write_text(content, encoding='utf-8')
+
+        with pytest.raises(ValueError, match=match):
+            list(mod.JsonFile().read_iter(path))
+
+    def test_read_iter_wraps_object_root(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that an object root is yielded as one single-record batch."""
+        path = self.format_path(tmp_path)
+        path.write_text(json.dumps({'id': 1}), encoding='utf-8')
+
+        assert list(mod.JsonFile().read_iter(path)) == [[{'id': 1}]]
+
     @pytest.mark.parametrize(
         ('content', 'match'),
         [
@@ -96,3 +162,42 @@ class TestJson(
         assert written == 2
         content = path.read_text(encoding='utf-8')
         assert content.endswith('\n')
+
+    def test_write_serializes_dates_as_iso_text(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that typed date values write as ISO 8601 text."""
+        path = self.format_path(tmp_path)
+
+        mod.JsonFile().write(path, [{'day': date(2024, 1, 2)}])
+
+        assert json.loads(path.read_text(encoding='utf-8')) == [
+            {'day': '2024-01-02'},
+        ]
+
+    @pytest.mark.parametrize(
+        'batches',
+        [
+            pytest.param([[{'id': 1, 'tags': ['a']}], [], [{'id': 2}]], id='data'),
+            pytest.param([], id='empty'),
+        ],
+    )
+    def test_write_iter_matches_write_output(
+        self,
+        tmp_path: Path,
+        batches: list[list[dict[str, object]]],
+    ) -> None:
+        """Test that :meth:`write_iter` emits the same text as :meth:`write`."""
+        handler = mod.JsonFile()
+        expected_path = tmp_path / 'expected.json'
+        streamed_path = tmp_path / 'streamed.json'
+        rows = [row for batch in batches for row in batch]
+
+        handler.write(expected_path, rows)
+        written = handler.write_iter(streamed_path, iter(batches))
+
+        assert written == len(rows)
+        assert streamed_path.read_text(encoding='utf-8') == (
+            expected_path.read_text(encoding='utf-8')
+        )
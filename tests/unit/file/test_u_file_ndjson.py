@@ -47,7 +47,7 @@ class TestNdjson(
         path: Path,
     ) -> None:
         """Assert NDJSON dict payload serialization."""
-        assert path.read_text(encoding='utf-8').strip() == '{"id": 1}'
+        assert path.read_text(encoding='utf-8').strip() == '{"id":1}'
 
     def test_load_line_parses_one_record(self) -> None:
         """Test that :func:`load_line` parses one JSON object line."""
@@ -89,4 +89,87 @@ class TestNdjson(
 
     def test_dump_line_serializes_one_record_with_newline(self) -> None:
         """Test that :func:`dump_line` emits one NDJSON line."""
-        assert mod.NdjsonFile().dump_line({'id': 1}) == '{"id": 1}\n'
+        assert mod.NdjsonFile().dump_line({'id': 1}) == '{"id":1}\n'
+
+    def test_read_iter_streams_lines_in_batches(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that :meth:`read_iter` yields bounded batches and skips blanks."""
+        path = self.format_path(tmp_path)
+        path.write_text('{"id": 1}\n\n{"id": 2}\n{"id": 3}\n', encoding='utf-8')
+
+        batches = list(mod.NdjsonFile().read_iter(path, batch_size=2))
+
+        assert batches == [[{'id': 1}, {'id': 2}], [{'id': 3}]]
+
+    def test_read_iter_reports_source_line_numbers(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that incremental reads keep line numbers in errors."""
+        path = self.format_path(tmp_path)
+        path.write_text('{"id": 1}\n\n42\n', encoding='utf-8')
+
+        with pytest.raises(TypeError, match='line 3'):
+            list(mod.NdjsonFile().read_iter(path))
+
+    def test_read_streams_lines_from_the_handle(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that :meth:`read` parses lines without slurping the file."""
+        path = self.format_path(tmp_path)
+        path.write_text('{"id": 1}\n\n42\n', encoding='utf-8')
+        monkeypatch.setattr(
+            mod.NdjsonFile,
+            'loads',
+            lambda *args, **kwargs: pytest.fail('read() must not call loads()'),
+        )
+
+        with pytest.raises(TypeError, match='line 3'):
+            mod.NdjsonFile().read(path)
+
+    def test_write_streams_the_same_text_as_dumps(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that :meth:`write` streams lines instead of one big string."""
+        handler = mod.NdjsonFile()
+        rows = [{'id': 1, 'name': 'Ada'}, {'id': 2, 'name': None}]
+        expected = handler.dumps(rows)
+        path = self.format_path(tmp_path)
+        monkeypatch.setattr(
+            mod.NdjsonFile,
+            'dumps',
+            lambda *args, **kwargs: pytest.fail('write() must not call dumps()'),
+        )
+
+        assert handler.write(path, rows) == 2
+        assert path.read_text(encoding='utf-8') == expected
+
+    def test_write_iter_appends_batches_as_lines(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that :meth:`write_iter` writes each batch line by line."""
+        path = self.format_path(tmp_path / 'nested')
+
+        written = mod.NdjsonFile().write_iter(
+            path,
+            iter([[{'id': 1}], [], [{'id': 2}, {'id': 3}]]),
+        )
+
+        assert written == 3
+        assert path.read_text(encoding='utf-8') == '{"id":1}\n{"id":2}\n{"id":3}\n'
+
+    def test_write_iter_skips_file_without_records(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that empty batch streams do not create a file."""
+        path = self.format_path(tmp_path)
+        assert mod.NdjsonFile().write_iter(path, iter([[]])) == 0
+        assert not path.exists()
@@ -6,6 +6,10 @@ Unit tests for :mod:`etlplus.file.parquet`.
 
 from __future__ import annotations
 
+from pathlib import Path
+
+import pytest
+
 from etlplus.file import parquet as mod
 
 from .pytest_file_contracts import PyarrowGatedPandasColumnarModuleContract
@@ -25,3 +29,64 @@ class TestParquet(PyarrowGatedPandasColumnarModuleContract):
     read_method_name = 'read_parquet'
     write_calls_attr = 'to_parquet_calls'
     write_uses_index = True
+
+    def test_read_iter_and_write_iter_round_trip(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test row-group writes and batched reads through :mod:`pyarrow`."""
+        pytest.importorskip('pyarrow')
+        handler = mod.ParquetFile()
+        path = tmp_path / 'nested' / 'data.parquet'
+        rows = [{'id': idx, 'name': f'n{idx}'} for idx in range(5)]
+
+        written = handler.write_iter(path, iter([rows[:3], [], rows[3:]]))
+        batches = list(handler.read_iter(path, batch_size=2))
+
+        assert written == 5
+        assert all(0 < len(batch) <= 2 for batch in batches)
+        assert [row for batch in batches for row in batch] == rows
+
+    def test_read_arrow_uses_pyarrow_reader(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that Arrow-table reads skip the pandas reader."""
+        pytest.importorskip('pyarrow')
+        handler = mod.ParquetFile()
+        path = tmp_path / 'data.parquet'
+        handler.write_iter(path, iter([[{'id': 1}, {'id': 2}]]))
+        monkeypatch.setattr(
+            handler,
+            'read_table',
+            lambda *args, **kwargs: pytest.fail('pandas reader used'),
+        )
+
+        table = handler.read_arrow(path)
+
+        assert table.to_pylist() == [{'id': 1}, {'id': 2}]
+
+    def test_write_iter_types_columns_null_in_first_batch(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that sparse columns take their type from later batches."""
+        pytest.importorskip('pyarrow')
+        handler = mod.ParquetFile()
+        path = tmp_path / 'data.parquet'
+        rows = [{'a': 1, 'b': None}, {'a': 2, 'b': 5}]
+
+        written = handler.write_iter(path, iter([rows[:1], rows[1:]]))
+
+        assert written == 2
+        assert handler.read_arrow(path).to_pylist() == rows
+
+    def test_write_iter_returns_zero_without_records(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that empty batch streams do not create a file."""
+        path = tmp_path / 'data.parquet'
+        assert mod.ParquetFile().write_iter(path, iter([[]])) == 0
+        assert not path.exists()
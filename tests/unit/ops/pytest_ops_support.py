@@ -7,6 +7,7 @@ Shared :mod:`etlplus.ops` unit-test helpers.
 from __future__ import annotations
 
 import json
+import sqlite3
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -14,6 +15,22 @@ from typing import Any
 # SECTION: FUNCTIONS ======================================================= #
 
 
+def write_sqlite_table(
+    path: str | Path,
+    table: str,
+    rows: list[dict[str, Any]],
+) -> str:
+    """Create one SQLite table holding *rows*; return its database URL."""
+    columns = list(rows[0])
+    with sqlite3.connect(path) as conn:
+        conn.execute(f'CREATE TABLE {table} ({", ".join(columns)})')
+        conn.executemany(
+            f'INSERT INTO {table} VALUES ({", ".join("?" * len(columns))})',
+            [tuple(row[column] for column in columns) for row in rows],
+        )
+    return f'sqlite:///{path}'
+
+
 def write_json_payload(
     path: str | Path,
     payload: object,
@@ -0,0 +1,163 @@
+"""
+:mod:`tests.unit.ops.test_u_ops_accumulators` module.
+
+Unit tests for :mod:`etlplus.ops._accumulators`.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import pytest
+
+from etlplus.ops._accumulators import DistinctAccumulator
+from etlplus.ops._accumulators import ListAccumulator
+from etlplus.ops._accumulators import QuantileSketch
+from etlplus.ops._accumulators import new_accumulator
+from etlplus.ops._enums import AggregateName
+
+# SECTION: TESTS ============================================================ #
+
+
+class TestAccumulators:
+    """Unit tests for the streaming aggregate accumulators."""
+
+    @pytest.mark.parametrize(
+        'func',
+        [
+            pytest.param(AggregateName.AVG, id='avg'),
+            pytest.param(AggregateName.COUNT, id='count'),
+            pytest.param(AggregateName.MAX, id='max'),
+            pytest.param(AggregateName.MIN, id='min'),
+            pytest.param(AggregateName.SUM, id='sum'),
+        ],
+    )
+    def test_matches_list_based_functions(
+        self,
+        func: AggregateName,
+    ) -> None:
+        """Test that accumulators match the list-based aggregate functions."""
+        values = [3, 'skip', 1.5, None, 7]
+        accumulator = new_accumulator(func)
+        for value in values:
+            accumulator.add(value)
+
+        nums = [3.0, 1.5, 7.0]
+        assert accumulator.result() == func.func(nums, len(values))
+
+    def test_distinct_ignores_nulls_and_handles_unhashable_values(self) -> None:
+        """Test that distinct counts non-null values of any type."""
+        accumulator = DistinctAccumulator()
+        for value in ('a', 'a', None, 1, {'k': 1}, {'k': 1}):
+            accumulator.add(value)
+
+        assert accumulator.result() == 3
+
+    def test_list_accumulator_adapts_custom_callables(self) -> None:
+        """Test that custom callables receive numeric values and presence."""
+        accumulator = new_accumulator(lambda nums, present: (nums, present))
+        assert isinstance(accumulator, ListAccumulator)
+        for value in (1, 'x', 2):
+            accumulator.add(value)
+
+        assert accumulator.result() == ([1.0, 2.0], 3)
+
+
+class TestAccumulatorMerge:
+    """Unit tests for merging partial accumulator state."""
+
+    @pytest.mark.parametrize(
+        'func',
+        [
+            pytest.param(AggregateName.AVG, id='avg'),
+            pytest.param(AggregateName.COUNT, id='count'),
+            pytest.param(AggregateName.DISTINCT, id='distinct'),
+            pytest.param(AggregateName.MAX, id='max'),
+            pytest.param(AggregateName.MIN, id='min'),
+            pytest.param(AggregateName.QUANTILE, id='quantile'),
+            pytest.param(AggregateName.SUM, id='sum'),
+            pytest.param(lambda nums, present: (sum(nums), present), id='custom'),
+        ],
+    )
+    def test_merged_partials_match_single_accumulator(
+        self,
+        func: Any,
+    ) -> None:
+        """Test that merging partition accumulators matches one full pass."""
+        values = [5, 'x', 1, None, 9, 1, 4]
+        whole = new_accumulator(func)
+        left = new_accumulator(func)
+        right = new_accumulator(func)
+        for index, value in enumerate(values):
+            whole.add(value)
+            (left if index < 3 else right).add(value)
+
+        left.merge(right)
+
+        assert left.result() == whole.result()
+
+    def test_merged_sketches_stay_accurate(self) -> None:
+        """Test that merged sketches compact and keep rank error low."""
+        rng = random.Random(11)
+        values = [rng.random() for _ in range(20_000)]
+        sketches = [QuantileSketch(q=0.5, capacity=64) for _ in range(4)]
+        for index, value in enumerate(values):
+            sketches[index % 4].add(value)
+
+        merged = sketches[0]
+        for sketch in sketches[1:]:
+            merged.merge(sketch)
+
+        assert all(len(level) < 64 for level in merged.levels)
+        estimate = merged.result()
+        assert estimate is not None
+        rank = sum(value <= estimate for value in values) / len(values)
+        assert rank == pytest.approx(0.5, abs=0.03)
+
+
+class TestQuantileSketch:
+    """Unit tests for :class:`QuantileSketch`."""
+
+    def test_exact_below_capacity(self) -> None:
+        """Test that small inputs report the nearest-rank quantile."""
+        sketch = QuantileSketch(q=0.75)
+        for value in (4, 1, 3, 2):
+            sketch.add(value)
+
+        assert sketch.result() == 3
+
+    def test_empty_sketch_reports_none(self) -> None:
+        """Test that a sketch without numeric values reports ``None``."""
+        sketch = QuantileSketch()
+        sketch.add('text')
+
+        assert sketch.result() is None
+
+    def test_large_inputs_stay_bounded_and_accurate(self) -> None:
+        """Test that compaction bounds memory while keeping rank error low."""
+        rng = random.Random(7)
+        values = [rng.random() for _ in range(50_000)]
+        sketch = QuantileSketch(q=0.9, capacity=128)
+        for value in values:
+            sketch.add(value)
+
+        assert sum(len(level) for level in sketch.levels) < 2_000
+        rank = sum(value <= sketch.result() for value in values) / len(values)
+        assert rank == pytest.approx(0.9, abs=0.02)
+
+    @pytest.mark.parametrize(
+        'options',
+        [
+            pytest.param({'q': -0.1}, id='q-low'),
+            pytest.param({'q': 1.5}, id='q-high'),
+            pytest.param({'capacity': 1}, id='capacity'),
+        ],
+    )
+    def test_rejects_invalid_options(
+        self,
+        options: dict[str, float],
+    ) -> None:
+        """Test that out-of-range options raise :class:`ValueError`."""
+        with pytest.raises(ValueError):
+            QuantileSketch(**options)  # type: ignore[arg-type]
@@ -0,0 +1,301 @@
+"""
+:mod:`tests.unit.ops.test_u_ops_arrow` module.
+
+Unit tests for :mod:`etlplus.ops._arrow`.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pyarrow as pa
+import pytest
+
+from etlplus.ops._arrow import aggregate_table
+from etlplus.ops._arrow import compile_table_step
+from etlplus.ops._arrow import records_to_table
+from etlplus.ops._arrow import table_to_records
+from etlplus.ops.transform import transform
+
+# SECTION: HELPERS ========================================================== #
+
+
+ROWS: list[dict[str, Any]] = [
+    {'id': 1, 'name': 'ann', 'age': 40, 'tag': '7'},
+    {'id': 2, 'name': None, 'age': None, 'tag': 'x'},
+    {'id': 3, 'name': 'bob', 'age': 18, 'tag': '2'},
+    {'id': 4, 'name': 'cy', 'age': 3, 'tag': None},
+    {'id': 5, 'name': 'ann', 'age': 18, 'tag': '12'},
+]
+
+
+# SECTION: TESTS ============================================================ #
+
+
+class TestArrowEngineParity:
+    """Unit tests comparing the Arrow engine with the row-wise engine."""
+
+    @pytest.mark.parametrize(
+        'operations',
+        [
+            pytest.param({'filter': {'field': 'age', 'op': 'gte', 'value': 18}}),
+            pytest.param(
+                {'filter': {'field': 'age', 'op': 'ne', 'value': 18}},
+                id='ne-keeps-nulls',
+            ),
+            pytest.param(
+                {'filter': {'field': 'name', 'op': 'in', 'value': ['ann', 'cy']}},
+                id='in',
+            ),
+            pytest.param(
+                {'filter': {'field': 'name', 'op': 'contains', 'value': 'n'}},
+                id='contains',
+            ),
+            pytest.param(
+                {'filter': {'field': 'tag', 'op': 'gt', 'value': 5}},
+                id='numeric-text-fallback',
+            ),
+            pytest.param(
+                {'filter': {'field': 'name', 'op': lambda a, b: a == b, 'value': 'cy'}},
+                id='callable-fallback',
+            ),
+            pytest.param(
+                {'filter': {'field': 'missing', 'op': 'eq', 'value': 1}},
+                id='missing-field',
+            ),
+            pytest.param(
+                {
+                    'filter': {
+                        'any': [
+                            {'field': 'age', 'op': 'gte', 'value': 30},
+                            {
+                                'all': [
+                                    {'field': 'name', 'op': 'contains', 'value': 'n'},
+                                    {'not': {'field': 'age', 'op': 'gt', 'value': 5}},
+                                ],
+                            },
+                        ],
+                    },
+                },
+                id='filter-tree',
+            ),
+            pytest.param({'map': {'name': 'id', 'age': 'years'}}, id='map-collision'),
+            pytest.param({'select': ['name', 'missing', 'name']}, id='select'),
+            pytest.param({'sort': {'field': 'age', 'reverse': True}}, id='sort-desc'),
+            pytest.param({'sort': {'field': 'name'}}, id='sort-text'),
+            pytest.param({'sort': {'field': 'missing'}}, id='sort-missing'),
+            pytest.param(
+                {'sort': {'keys': ['name', {'field': 'age', 'reverse': True}]}},
+                id='sort-multi-key',
+            ),
+            pytest.param({'top_n': {'field': 'age', 'n': 2}}, id='top-n'),
+            pytest.param(
+                {'top_n': {'keys': ['name'], 'n': 3, 'reverse': False}, 'limit': 2},
+                id='top-n-asc-limit',
+            ),
+            pytest.param(
+                {'filter': {'field': 'age', 'op': 'gte', 'value': 0}, 'limit': 1},
+                id='limit',
+            ),
+            pytest.param(
+                {
+                    'aggregate': [
+                        {'field': 'age', 'func': 'sum'},
+                        {'field': 'age', 'func': 'avg'},
+                        {'field': 'age', 'func': 'min'},
+                        {'field': 'age', 'func': 'max'},
+                        {'field': 'age', 'func': 'count'},
+                        {'field': 'name', 'func': 'sum'},
+                        {'field': 'missing', 'func': 'max'},
+                        {'func': 'count', 'alias': 'rows'},
+                        {'field': 'name', 'func': 'distinct'},
+                        {'field': 'age', 'func': 'median'},
+                        {'field': 'age', 'func': 'quantile', 'q': 0.9},
+                        {'field': 'age', 'func': lambda xs, n: len(xs)},
+                    ],
+                },
+                id='aggregate',
+            ),
+            pytest.param(
+                {
+                    'filter': {'field': 'age', 'op': 'gt', 'value': 5},
+                    'map': {'name': 'who'},
+                    'select': ['who', 'age'],
+                    'sort': {'field': 'who', 'reverse': True},
+                },
+                id='combined',
+            ),
+            pytest.param(
+                {
+                    'filter': {'field': 'age', 'op': 'gte', 'value': 18},
+                    'sql': (
+                        'SELECT name, sum(age) AS total, count(*) AS n '
+                        'FROM data GROUP BY name ORDER BY name'
+                    ),
+                },
+                id='sql',
+            ),
+            pytest.param(
+                {
+                    'group_by': {
+                        'keys': 'name',
+                        'aggregates': [
+                            {'field': 'age', 'func': 'sum'},
+                            {'field': 'tag', 'func': 'distinct'},
+                        ],
+                    },
+                    'sort': {'field': 'sum_age'},
+                },
+                id='group-by',
+            ),
+            pytest.param(
+                {
+                    'group_by': {
+                        'keys': ['name', 'missing'],
+                        'aggregates': [
+                            {'func': 'count'},
+                            {'field': 'age', 'func': 'count'},
+                            {'field': 'missing', 'func': 'count'},
+                            {'field': 'age', 'func': 'sum'},
+                            {'field': 'age', 'func': 'avg'},
+                            {'field': 'age', 'func': 'min'},
+                            {'field': 'age', 'func': 'max'},
+                            {'field': 'tag', 'func': 'distinct'},
+                            {'field': 'age', 'func': 'median'},
+                            {'field': 'age', 'func': 'quantile', 'q': 0.25},
+                            {'field': 'tag', 'func': 'sum'},
+                        ],
+                    },
+                },
+                id='group-by-kernels',
+            ),
+            pytest.param(
+                {
+                    'group_by': {
+                        'keys': 'name',
+                        'aggregates': [
+                            {'field': 'age', 'func': lambda xs, n: sorted(xs)},
+                        ],
+                    },
+                },
+                id='group-by-callable-fallback',
+            ),
+            pytest.param(
+                {'group_by': {'aggregates': [{'field': 'age', 'func': 'median'}]}},
+                id='group-by-without-keys',
+            ),
+        ],
+    )
+    def test_matches_row_wise_engine(
+        self,
+        operations: dict[str, Any],
+    ) -> None:
+        """Test that both engines return the same output for one pipeline."""
+        expected = transform(ROWS, operations)
+
+        assert transform(ROWS, {**operations, 'engine': 'arrow'}) == expected
+
+
+class TestArrowHelpers:
+    """Unit tests for Arrow engine helper functions."""
+
+    def test_aggregate_table_returns_none_without_mapping_specs(self) -> None:
+        """Test that non-mapping aggregate specs produce no result."""
+        assert aggregate_table(records_to_table(ROWS), [['age']]) is None
+
+    def test_group_by_runs_without_row_records(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that built-in group aggregates never materialize row records."""
+        step = compile_table_step(
+            'group_by',
+            {
+                'keys': 'name',
+                'aggregates': [
+                    {'field': 'age', 'func': 'sum'},
+                    {'field': 'tag', 'func': 'distinct'},
+                    {'field': 'age', 'func': 'median'},
+                ],
+            },
+        )
+        assert step is not None
+        table = records_to_table(ROWS)
+
+        def _fail(table: Any) -> Any:
+            raise AssertionError('row records were materialized')
+
+        monkeypatch.setattr('etlplus.ops._arrow.table_to_records', _fail)
+
+        assert step(table).to_pylist() == [
+            {'name': 'ann', 'sum_age': 58.0, 'distinct_tag': 2, 'p50_age': 18.0},
+            {'name': None, 'sum_age': 0, 'distinct_tag': 1, 'p50_age': None},
+            {'name': 'bob', 'sum_age': 18.0, 'distinct_tag': 1, 'p50_age': 18.0},
+            {'name': 'cy', 'sum_age': 3.0, 'distinct_tag': 0, 'p50_age': 3.0},
+        ]
+
+    def test_compile_table_step_rejects_unknown_steps_and_specs(self) -> None:
+        """Test that unknown steps and unusable specs compile to no step."""
+        assert compile_table_step('aggregate', {'field': 'id'}) is None
+        assert compile_table_step('filter', {'op': 'eq'}) is None
+        assert compile_table_step('filter', {'field': 'a', 'op': 5}) is None
+        assert compile_table_step('map', ['a']) is None
+        assert compile_table_step('select', 5) is None
+        assert compile_table_step('sort', None) is None
+        assert compile_table_step('sql', {'table': 'data'}) is None
+
+    @pytest.mark.parametrize(
+        'spec',
+        [
+            pytest.param(
+                {'all': [{'field': 'age', 'op': 'gt', 'value': 1}, {'field': 'id'}]},
+                id='unusable-child',
+            ),
+            pytest.param({'not': [{'field': 'age', 'op': 'gt', 'value': 1}]}, id='not'),
+            pytest.param({'any': []}, id='empty'),
+        ],
+    )
+    def test_filter_rejects_malformed_trees(
+        self,
+        spec: dict[str, Any],
+    ) -> None:
+        """Test that malformed filter trees raise as in the row-wise engine."""
+        with pytest.raises(ValueError, match='Filter'):
+            compile_table_step('filter', spec)
+
+    def test_filter_uses_numeric_kernel_on_numeric_columns(self) -> None:
+        """Test that numeric filters keep Arrow column types intact."""
+        step = compile_table_step('filter', {'field': 'age', 'op': 'lt', 'value': 20})
+        assert step is not None
+
+        result = step(records_to_table(ROWS))
+
+        assert result.column_names == ['id', 'name', 'age', 'tag']
+        assert result.column('age').to_pylist() == [18, 3, 18]
+        assert pa.types.is_integer(result.schema.field('age').type)
+
+    def test_select_keeps_row_count_without_fields(self) -> None:
+        """Test that projecting no fields keeps one empty record per row."""
+        step = compile_table_step('select', [])
+        assert step is not None
+
+        assert table_to_records(step(records_to_table(ROWS[:2]))) == [{}, {}]
+
+    def test_records_to_table_keeps_keys_from_later_records(self) -> None:
+        """Test that keys absent from the first record still become columns."""
+        table = records_to_table([{'id': 1}, {'id': 2, 'late': 'x'}])
+
+        assert table.column_names == ['id', 'late']
+        assert table_to_records(table) == [
+            {'id': 1, 'late': None},
+            {'id': 2, 'late': 'x'},
+        ]
+        assert transform(
+            [{'id': 1}, {'id': 2, 'late': 'x'}],
+            {'engine': 'arrow', 'select': ['late']},
+        ) == [{'late': None}, {'late': 'x'}]
+
+    def test_records_to_table_names_mixed_type_fields(self) -> None:
+        """Test that mixed-type columns raise :class:`ValueError`."""
+        with pytest.raises(ValueError, match="field 'code' holds values"):
+            records_to_table([{'code': 1}, {'code': 'A1'}])
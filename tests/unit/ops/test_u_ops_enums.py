@@ -40,6 +40,8 @@ class TestAggregateName:
             pytest.param(AggregateName.MIN, 1, id='min'),
             pytest.param(AggregateName.COUNT, 3, id='count'),
             pytest.param(AggregateName.AVG, pytest.approx(2.0), id='avg'),
+            pytest.param(AggregateName.DISTINCT, 3, id='distinct'),
+            pytest.param(AggregateName.QUANTILE, 2, id='quantile'),
         ],
     )
     def test_funcs(
@@ -51,6 +53,21 @@ class TestAggregateName:
         """Test the aggregate functions across numeric inputs."""
         assert aggregate.func(nums, len(nums)) == expected
 
+    @pytest.mark.parametrize(
+        ('alias', 'expected'),
+        [
+            pytest.param('nunique', AggregateName.DISTINCT, id='nunique'),
+            pytest.param('median', AggregateName.QUANTILE, id='median'),
+        ],
+    )
+    def test_aliases(
+        self,
+        alias: str,
+        expected: AggregateName,
+    ) -> None:
+        """Test that common aggregate aliases coerce to their members."""
+        assert AggregateName.coerce(alias) is expected
+
 
 class TestOperatorName:
     """Unit tests for :class:`etlplus.ops._enums.OperatorName`."""
@@ -92,6 +109,10 @@ class TestPipelineStep:
         [
             pytest.param(PipelineStep.FILTER, 0, id='filter'),
             pytest.param(PipelineStep.AGGREGATE, 4, id='aggregate'),
+            pytest.param(PipelineStep.SQL, 5, id='sql'),
+            pytest.param(PipelineStep.GROUP_BY, 6, id='group-by'),
+            pytest.param(PipelineStep.TOP_N, 7, id='top-n'),
+            pytest.param(PipelineStep.LIMIT, 8, id='limit'),
         ],
     )
     def test_order(self, step: PipelineStep, expected: int) -> None:
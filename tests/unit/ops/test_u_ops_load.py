@@ -17,7 +17,9 @@ from __future__ import annotations
 import csv
 import importlib
 import json
+import sqlite3
 from collections.abc import Callable
+from contextlib import closing
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
@@ -29,6 +31,8 @@ from etlplus.api import HttpMethod
 from etlplus.connector import DataConnectorType
 from etlplus.ops.load import _parse_json_string
 from etlplus.ops.load import load
+from etlplus.ops.load import load_batches_to_database
+from etlplus.ops.load import load_batches_to_file
 from etlplus.ops.load import load_data
 from etlplus.ops.load import load_to_api
 from etlplus.ops.load import load_to_database
@@ -49,6 +53,31 @@ from tests.unit.ops.pytest_ops_support import write_json_payload
 load_mod = importlib.import_module('etlplus.ops.load')
 
 
+# SECTION: HELPERS ========================================================== #
+
+
+def _sqlite_rows(
+    path: Path,
+    query: str,
+) -> list[tuple[Any, ...]]:
+    """Return the rows of one SQLite query."""
+    with closing(sqlite3.connect(path)) as conn:
+        return conn.execute(query).fetchall()
+
+
+def _table_rows(
+    scheme: str,
+    path: Path,
+    query: str,
+) -> list[tuple[Any, ...]]:
+    """Return the rows of one query against a SQLite or DuckDB file."""
+    if scheme == 'sqlite':
+        return _sqlite_rows(path, query)
+    duckdb = pytest.importorskip('duckdb')
+    with closing(duckdb.connect(str(path))) as conn:
+        return conn.execute(query).fetchall()
+
+
 # SECTION: TESTS ============================================================ #
 
 
@@ -66,44 +95,25 @@ class TestLoad:
         with pytest.raises(ValueError, match='Invalid DataConnectorType'):
             load({'test': 'data'}, 'invalid', 'target')
 
-    @pytest.mark.parametrize(
-        ('target_type', 'target', 'expected_status'),
-        [
-            (
-                'database',
-                'postgresql://localhost/testdb',
-                'not_implemented',
-            ),
-        ],
-    )
     def test_wrapper_database(
         self,
-        target_type: str,
-        target: str,
-        expected_status: str,
+        tmp_path: Path,
     ) -> None:
-        """
-        Test loading data to a database with a supported format.
-
-        Parameters
-        ----------
-        target_type : str
-            Type of target (e.g., 'database').
-        target : str
-            Target connection string.
-        expected_status : str
-            Expected status in result.
-        """
-        mock_data = {'test': 'data'}
+        """Test that database targets forward table settings to the loader."""
+        path = tmp_path / 'load.db'
         result = cast(
             dict[str, Any],
             load(
-                mock_data,
-                target_type,
-                target,
+                {'test': 'data'},
+                'database',
+                f'sqlite:///{path}',
+                table='items',
             ),
         )
-        assert result['status'] == expected_status
+
+        assert result['status'] == 'success'
+        assert result['records'] == 1
+        assert _sqlite_rows(path, 'SELECT test FROM items') == [('data',)]
 
     @pytest.mark.parametrize(
         ('file_format', 'write', 'expected_data'),
@@ -506,29 +516,127 @@ class TestLoadToDatabase:
             )
 
     @pytest.mark.parametrize(
-        ('field_name', 'expected'),
+        ('kwargs', 'match'),
         [
-            pytest.param('status', 'not_implemented', id='status'),
-            pytest.param('records', 1, id='records'),
-            pytest.param('connection_string', 'sqlite', id='connection-string'),
+            pytest.param({}, 'requires a "table"', id='missing-table'),
+            pytest.param(
+                {'table': 'items', 'mode': 'merge'},
+                'Invalid database load mode',
+                id='invalid-mode',
+            ),
+            pytest.param(
+                {'table': 'items', 'mode': 'upsert'},
+                'require "keys"',
+                id='upsert-without-keys',
+            ),
         ],
     )
-    def test_load_to_database_returns_note(
+    def test_invalid_settings_raise(
         self,
-        field_name: str,
-        expected: object,
+        tmp_path: Path,
+        kwargs: dict[str, Any],
+        match: str,
+    ) -> None:
+        """Test that unusable load settings fail before connecting."""
+        with pytest.raises(ValueError, match=match):
+            load_to_database([{'id': 1}], f'sqlite:///{tmp_path}/x.db', **kwargs)
+        assert not (tmp_path / 'x.db').exists()
+
+    @pytest.mark.parametrize('scheme', ['sqlite', 'duckdb'])
+    def test_load_modes_write_rows(
+        self,
+        tmp_path: Path,
+        scheme: str,
     ) -> None:
         """
-        Test that placeholder implementation echoes the connection string.
+        Test that upsert creates the table and updates matching keys, append
+        adds rows, and replace clears existing rows, on SQLite and DuckDB.
         """
+        path = tmp_path / f'load.{scheme}'
+        url = f'{scheme}:///{path}'
+
+        def _rows() -> list[tuple[Any, ...]]:
+            return _table_rows(scheme, path, 'SELECT id, name FROM items ORDER BY id')
+
+        created = load_to_database(
+            [{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'}],
+            url,
+            table='items',
+            mode='upsert',
+            keys=['id'],
+            batch_size=1,
+        )
+        upserted = load_to_database(
+            [{'id': 2, 'name': 'B'}, {'id': 3, 'name': 'c'}],
+            url,
+            table='items',
+            mode='upsert',
+            keys=['id'],
+        )
 
-        data = [{'name': 'Ada'}]
-        result = load_to_database(data, 'sqlite:///tmp.db')
+        assert created['status'] == 'success'
+        assert created['records'] == 2
+        assert created['method'] == ('upsert' if scheme == 'sqlite' else 'arrow')
+        assert upserted['records'] == 2
+        assert _rows() == [(1, 'a'), (2, 'B'), (3, 'c')]
+
+        appended = load_to_database({'id': 4}, url, table='items')
+
+        assert appended['records'] == 1
+        assert _rows()[-1] == (4, None)
+
+        replaced = load_batches_to_database(
+            iter([[{'id': 9, 'name': 'z'}], []]),
+            url,
+            table='items',
+            mode='replace',
+        )
+
+        assert replaced['mode'] == 'replace'
+        assert replaced['records'] == 1
+        assert replaced['rows_per_second'] is None or replaced['rows_per_second'] > 0
+        assert _rows() == [(9, 'z')]
+
+    @pytest.mark.parametrize('scheme', ['sqlite', 'duckdb'])
+    def test_columns_absent_from_first_row_are_loaded(
+        self,
+        tmp_path: Path,
+        scheme: str,
+    ) -> None:
+        """Test that values of columns missing from a batch's first row load."""
+        path = tmp_path / f'load.{scheme}'
+        url = f'{scheme}:///{path}'
+        load_to_database([{'id': 1, 'x': 0}], url, table='items')
+
+        load_to_database([{'id': 2}, {'id': 3, 'x': 5}], url, table='items')
 
-        if field_name == 'connection_string':
-            assert expected in result[field_name]
-        else:
-            assert result[field_name] == expected
+        assert _table_rows(scheme, path, 'SELECT id, x FROM items ORDER BY id') == [
+            (1, 0),
+            (2, None),
+            (3, 5),
+        ]
+
+    @pytest.mark.parametrize('scheme', ['sqlite', 'duckdb'])
+    def test_unknown_columns_roll_back(
+        self,
+        tmp_path: Path,
+        scheme: str,
+    ) -> None:
+        """Test that a row with an unknown column aborts the whole load."""
+        path = tmp_path / f'load.{scheme}'
+        url = f'{scheme}:///{path}'
+        load_to_database([{'id': 1}], url, table='items')
+
+        with pytest.raises(ValueError, match='Columns not in table "items": extra'):
+            load_to_database(
+                [{'id': 2}, {'id': 3, 'extra': True}],
+                url,
+                table='items',
+                mode='replace',
+                batch_size=1,
+            )
+
+        assert _table_rows(scheme, path, 'SELECT id FROM items') == [(1,)]
 
 
 class TestParseJsonString:
@@ -968,6 +1076,26 @@ class TestLoadToFile:
         with pytest.raises(ValueError, match='Invalid FileFormat'):
             load_to_file(mock_data, str(output_path), 'unsupported')
 
+    def test_batches_to_json_file(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that record batches are written as one JSON document."""
+        output_path = tmp_path / 'output.json'
+        result = load_batches_to_file(
+            iter([[{'id': 1}, {'id': 2}], [{'id': 3}]]),
+            output_path,
+            'json',
+        )
+        assert result['status'] == 'success'
+        assert result['records'] == 3
+        assert result['batches'] == 2
+        assert json.loads(output_path.read_text(encoding='utf-8')) == [
+            {'id': 1},
+            {'id': 2},
+            {'id': 3},
+        ]
+
     def test_to_json_file(
         self,
         tmp_path: Path,
@@ -0,0 +1,85 @@
+"""
+:mod:`tests.unit.ops.test_u_ops_quarantine` module.
+
+Unit tests for :mod:`etlplus.ops._quarantine`.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from etlplus.ops._quarantine import QuarantineWriter
+
+# SECTION: HELPERS ========================================================== #
+
+
+quarantine_mod = importlib.import_module('etlplus.ops._quarantine')
+
+
+# SECTION: TESTS ============================================================ #
+
+
+class TestQuarantineWriter:
+    """Unit tests for :class:`QuarantineWriter`."""
+
+    def test_streams_batches_to_file(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that pushed batches land in one file, in order."""
+        path = tmp_path / 'rejects.ndjson'
+        writer = QuarantineWriter(path)
+
+        writer.write([{'id': 1}])
+        writer.write([])
+        writer.write([{'id': 2}, 'raw'])
+        result = writer.close()
+
+        assert result['records'] == 3
+        assert result['path'] == str(path)
+        assert writer.close() is result
+        lines = path.read_text(encoding='utf-8').splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {'id': 1},
+            {'id': 2},
+            {'value': 'raw'},
+        ]
+        with pytest.raises(RuntimeError, match='closed'):
+            writer.write([{'id': 3}])
+
+    def test_skips_file_when_nothing_is_rejected(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that no file is created when no records were rejected."""
+        path = tmp_path / 'rejects.csv'
+
+        assert QuarantineWriter(path).close() == {
+            'status': 'success',
+            'records': 0,
+        }
+        assert not path.exists()
+
+    def test_surfaces_writer_errors(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+    ) -> None:
+        """Test that writer-thread failures are raised to the producer."""
+
+        def _fail(batches: Any, *args: Any) -> Any:
+            next(iter(batches))
+            raise OSError('disk full')
+
+        monkeypatch.setattr(quarantine_mod, 'load_batches_to_file', _fail)
+        writer = QuarantineWriter(tmp_path / 'rejects.json')
+
+        with pytest.raises(OSError, match='disk full'):
+            for _ in range(100):
+                writer.write([{'id': 1}])
+            writer.close()
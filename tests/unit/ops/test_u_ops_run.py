@@ -7,6 +7,9 @@ Unit tests for :mod:`etlplus.ops.run`.
 from __future__ import annotations
 
 import importlib
+import json
+import sqlite3
+from contextlib import closing
 from pathlib import Path
 from threading import Lock
 from time import sleep
@@ -18,6 +21,8 @@ from typing import cast
 
 import pytest
 
+from tests.unit.ops.pytest_ops_support import write_sqlite_table
+
 # SECTION: PRAGMAS ========================================================== #
 
 # pylint: disable=import-outside-toplevel,protected-access,unused-argument
@@ -76,6 +81,17 @@ def _patch_config(
     )
 
 
+# SECTION: FIXTURES ========================================================= #
+
+
+@pytest.fixture(autouse=True)
+def _clear_transform_plans(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Start each test without transform plans cached by earlier runs."""
+    monkeypatch.setattr(run_mod, '_TRANSFORM_PLANS', {})
+
+
 # SECTION: TESTS ============================================================ #
 
 
@@ -1423,6 +1439,90 @@ class TestRun:
         assert load_calls == [([{'id': 1}], 'file', str(tgt_path))]
         assert result == {'status': 'ok'}
 
+    def test_transform_plan_is_compiled_once_per_pipeline(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that run contexts reuse compiled plans for shared pipelines."""
+        ops = {'filter': {'field': 'id', 'op': 'gt', 'value': 1}}
+        cfg = SimpleNamespace(
+            sources=[],
+            targets=[],
+            transforms={'keep': ops},
+        )
+        compiled: list[Any] = []
+        compile_pipeline = run_mod.compile_pipeline
+
+        def _capture_compile(operations: Any) -> Any:
+            compiled.append(operations)
+            return compile_pipeline(operations)
+
+        monkeypatch.setattr(run_mod, 'compile_pipeline', _capture_compile)
+        context = run_mod._RunContext.from_config(cfg)
+        first = _make_job(name='a', source='src', target='tgt')
+        first.transform = SimpleNamespace(pipeline='keep')
+        second = _make_job(name='b', source='src', target='tgt')
+        second.transform = SimpleNamespace(pipeline='keep')
+        untransformed = _make_job(name='c', source='src', target='tgt')
+        untransformed.transform = None
+
+        plan = context.transform_plan(first)
+
+        assert context.transform_plan(second) is plan
+        assert context.transform_plan(untransformed) is None
+        assert compiled == [ops]
+        assert run_mod.transform([{'id': 1}, {'id': 2}], plan) == [{'id': 2}]
+
+    def test_transform_plan_is_reused_across_runs(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+    ) -> None:
+        """Test that later :func:`run` calls reuse the cached plan."""
+        source_path = tmp_path / 'input.json'
+        source_path.write_text('[{"id": 1}, {"id": 2}]', encoding='utf-8')
+        target_path = tmp_path / 'output.json'
+        job = _make_job(name='job', source='src', target='tgt')
+        cfg = _base_config(
+            job,
+            SimpleNamespace(name='src', type='file', path=str(source_path)),
+            SimpleNamespace(name='tgt', type='file', path=str(target_path)),
+        )
+        cfg.transforms = {'noop': {'filter': {'field': 'id', 'op': 'gt', 'value': 1}}}
+        _patch_config(monkeypatch, cfg)
+        plans: list[Any] = []
+        transform = run_mod.transform
+
+        def _capture_transform(data: Any, operations: Any) -> Any:
+            plans.append(operations)
+            return transform(data, operations)
+
+        monkeypatch.setattr(run_mod, 'transform', _capture_transform)
+
+        for _ in range(2):
+            assert run_mod.run('job')['status'] == 'success'
+
+        assert len(plans) == 2
+        assert isinstance(plans[0], run_mod.TransformPlan)
+        assert plans[1] is plans[0]
+        assert json.loads(target_path.read_text(encoding='utf-8')) == [{'id': 2}]
+
+    def test_transform_plan_cache_is_bounded(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the plan cache evicts the least recently used plan."""
+        monkeypatch.setattr(run_mod, '_TRANSFORM_PLAN_CACHE_SIZE', 2)
+        first = run_mod._transform_plan({'limit': 1})
+        run_mod._transform_plan({'limit': 2})
+
+        assert run_mod._transform_plan({'limit': 1}) is first
+        run_mod._transform_plan({'limit': 3})
+
+        assert len(run_mod._TRANSFORM_PLANS) == 2
+        assert run_mod._transform_plan({'limit': 1}) is first
+        assert run_mod._transform_plan({'limit': True}) is not first
+
     def test_unknown_source_raises(
         self,
         monkeypatch: pytest.MonkeyPatch,
@@ -2528,6 +2628,58 @@ class TestRunInternals:
 
         assert getattr(settings, field) == expected
 
+    def test_validation_config_compiles_rules_once(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Job validation should compile its ruleset once and reuse it."""
+        job = SimpleNamespace(
+            validate=SimpleNamespace(
+                ruleset='customer_rules',
+                severity='warn',
+                phase='before_transform',
+            ),
+        )
+        cfg = SimpleNamespace(
+            validations={'customer_rules': {'id': {'required': True}}},
+        )
+        settings = run_mod._JobValidationConfig.from_job(job, cfg)
+        assert settings.compiled is not None
+        monkeypatch.setattr(
+            run_mod,
+            'validate',
+            lambda *_args: pytest.fail('validate() should not recompile rules'),
+        )
+        printed: list[Any] = []
+        monkeypatch.setattr(
+            run_mod.JsonCodec,
+            'print',
+            lambda _self, payload: printed.append(payload),
+        )
+
+        for batch in ([{'id': 1}], [{'id': None}]):
+            settings.apply(batch, when='before_transform')
+
+        assert len(printed) == 1
+        assert printed[0]['result']['errors'] == ['[0].id: Field is required']
+
+    def test_validation_config_defers_malformed_rules(self) -> None:
+        """Rulesets that cannot compile should fail only when validation runs."""
+        job = SimpleNamespace(
+            validate=SimpleNamespace(
+                ruleset='customer_rules',
+                severity=None,
+                phase=None,
+            ),
+        )
+        cfg = SimpleNamespace(validations={'customer_rules': {'id': ['bad']}})
+
+        settings = run_mod._JobValidationConfig.from_job(job, cfg)
+
+        assert settings.compiled is None
+        with pytest.raises(TypeError, match='must be a mapping'):
+            settings.apply({'id': 1}, when='before_transform')
+
 
 class TestRunPipeline:
     """Unit tests for :func:`etlplus.ops.run.run_pipeline`."""
@@ -2582,3 +2734,1073 @@ class TestRunPipeline:
                 target_type='file',
                 target=None,
             )
+
+
+class TestRunArrowEngine:
+    """Unit tests for Arrow-engine job execution in :func:`run`."""
+
+    def test_columnar_source_is_transformed_as_table(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+    ) -> None:
+        """
+        Test that Arrow-engine jobs read file sources as tables and only
+        convert to records for loading.
+        """
+        pytest.importorskip('pyarrow')
+        from etlplus.file import File
+
+        source_path = tmp_path / 'input.parquet'
+        File(source_path).write(
+            [{'id': 1, 'v': 5}, {'id': 2, 'v': 50}, {'id': 3, 'v': 500}],
+        )
+        target_path = tmp_path / 'output.json'
+        job = _make_job(name='arrow_job', source='src', target='tgt')
+        cfg = _base_config(
+            job,
+            SimpleNamespace(
+                name='src',
+                type='file',
+                path=str(source_path),
+                format='parquet',
+            ),
+            SimpleNamespace(name='tgt', type='file', path=str(target_path)),
+        )
+        cfg.transforms = {
+            'noop': {
+                'engine': 'arrow',
+                'filter': {'field': 'v', 'op': 'gte', 'value': 50},
+                'map': {'v': 'value'},
+                'sort': {'field': 'value', 'reverse': True},
+            },
+        }
+        _patch_config(monkeypatch, cfg)
+        monkeypatch.setattr(
+            run_mod,
+            'extract',
+            lambda *args, **kwargs: pytest.fail('record extract used'),
+        )
+
+        result = run_mod.run('arrow_job')
+
+        assert result['status'] == 'success'
+        assert File(target_path).read() == [
+            {'value': 500, 'id': 3},
+            {'value': 50, 'id': 2},
+        ]
+
+    def test_before_transform_validation_uses_records(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that Arrow-engine jobs validating before the transform extract
+        row records first.
+        """
+        job = _make_job(name='arrow_job', source='src', target='tgt')
+        job.validate = SimpleNamespace(
+            ruleset='rules',
+            phase='before_transform',
+            severity='error',
+        )
+        cfg = _base_config(
+            job,
+            SimpleNamespace(name='src', type='file', path='/tmp/in.json'),
+            SimpleNamespace(name='tgt', type='file', path='/tmp/out.json'),
+        )
+        cfg.transforms = {'noop': {'engine': 'arrow', 'select': ['id']}}
+        cfg.validations = {'rules': {'id': {'type': 'integer'}}}
+        _patch_config(monkeypatch, cfg)
+        monkeypatch.setattr(
+            run_mod,
+            'extract',
+            lambda *args, **kwargs: [{'id': 1, 'x': 2}],
+        )
+        monkeypatch.setattr(
+            run_mod,
+            'extract_file_table',
+            lambda *args, **kwargs: pytest.fail('table extract used'),
+        )
+        monkeypatch.setattr(
+            run_mod,
+            'maybe_validate',
+            lambda data, stage, **kwargs: data,
+        )
+        load_calls: list[Any] = []
+
+        def _capture_load(data: Any, *args: Any, **kwargs: Any) -> dict[str, Any]:
+            load_calls.append(data)
+            return {'status': 'ok'}
+
+        monkeypatch.setattr(run_mod, 'load', _capture_load)
+
+        assert run_mod.run('arrow_job') == {'status': 'ok'}
+        assert load_calls == [[{'id': 1}]]
+
+
+class TestRunStreaming:
+    """Unit tests for streaming job execution in :func:`run`."""
+
+    def test_file_to_file_streams_batches_through_row_steps(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+    ) -> None:
+        """
+        Test that streaming jobs validate and transform each batch before
+        loading the concatenated output.
+        """
+        source_path = tmp_path / 'input.json'
+        source_path.write_text(
+            '[{"id": 1, "v": 5}, {"id": 2, "v": 50}, {"id": 3, "v": 500}]',
+            encoding='utf-8',
+        )
+        target_path = tmp_path / 'output.json'
+        job = _make_job(name='stream_job', source='src', target='tgt')
+        job.streaming = {'batch_size': 2}
+        cfg = _base_config(
+            job,
+            SimpleNamespace(name='src', type='file', path=str(source_path)),
+            SimpleNamespace(name='tgt', type='file', path=str(target_path)),
+        )
+        cfg.transforms = {
+            'noop': {
+                'filter': {'field': 'v', 'op': 'gte', 'value': 50},
+                'select': ['id'],
+            },
+        }
+        _patch_config(monkeypatch, cfg)
+
+        validated: list[tuple[str, int]] = []
+
+        def _capture_validate(data: Any, stage: str, **kwargs: Any) -> Any:
+            validated.append((stage, len(data)))
+            return data
+
+        monkeypatch.setattr(run_mod, 'maybe_validate', _capture_validate)
+
+        result = run_mod.run('stream_job')
+
+        assert result['status'] == 'success'
+        assert result['records'] == 2
+        assert result['batches'] == 2
+        assert validated == [
+            ('before_transform', 2),
+            ('after_transform', 1),
+            ('before_transform', 1),
+            ('after_transform', 1),
+        ]
+        assert target_path.read_text(encoding='utf-8').count('"id"') == 2
+
+    def test_worker_plans_spread_batches_over_workers(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+    ) -> None:
+        """
+        Test that streaming jobs with ``workers`` run batches smaller than
+        ``partition_size`` on the worker pool and keep batch order.
+        """
+        source_path = tmp_path / 'input.json'
+        source_path.write_text(
+            json.dumps([{'id': i, 'v': i * 10} for i in range(7)]),
+            encoding='utf-8',
+        )
+        target_path = tmp_path / 'output.json'
+        job = _make_job(name='stream_job', source='src', target='tgt')
+        job.streaming = {'batch_size': 2}
+        cfg = _base_config(
+            job,
+            SimpleNamespace(name='src', type='file', path=str(source_path)),
+            SimpleNamespace(name='tgt', type='file', path=str(target_path)),
+        )
+        cfg.transforms = {
+            'noop': {
+                'filter': {'field': 'v', 'op': 'gte', 'value': 20},
+                'select': ['id'],
+                'workers': 2,
+            },
+        }
+        _patch_config(monkeypatch, cfg)
+        transform_mod = importlib.import_module('etlplus.ops.transform')
+        yielded: list[int] = []
+        iter_apply = transform_mod.TransformPlan.iter_apply
+
+        def _spy(plan: Any, batches: Any) -> Any:
+            assert plan.workers == 2
+            for batch in iter_apply(plan, batches):
+                yielded.append(len(batch))
+                yield batch
+
+        monkeypatch.setattr(transform_mod.TransformPlan, 'iter_apply', _spy)
+
+        result = run_mod.run('stream_job')
+
+        out = json.loads(target_path.read_text(encoding='utf-8'))
+        assert result['status'] == 'success'
+        assert out == [{'id': i} for i in range(2, 7)]
+        assert yielded == [0, 2, 2, 1]
+
+    def test_non_file_target_loads_each_batch(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that non-file targets receive one load call per record batch and
+        that the profile-level streaming default applies.
+        """
+        job = _make_job(name='stream_job', source='src', target='tgt')
+        cfg = _base_config(
+            job,
+            SimpleNamespace(name='src', type='api'),
+            SimpleNamespace(name='tgt', type='api'),
+        )
+        cfg.profile = SimpleNamespace(streaming={'batch_size': 2})
+        _patch_config(monkeypatch, cfg)
+        monkeypatch.setattr(
+            run_mod,
+            'extract_from_api_source',
+            lambda cfg_obj, source_obj, opts: [{'id': i} for i in range(5)],
+        )
+        load_calls: list[Any] = []
+
+        def _capture_load(data: Any, *args: Any, **kwargs: Any) -> dict[str, Any]:
+            load_calls.append(data)
+            return {'status': 'not_implemented', 'records': len(data)}
+
+        monkeypatch.setattr(
+            run_mod,
+            'load_to_api_target',
+            lambda cfg_obj, target_obj, opts, data: _capture_load(data),
+        )
+
+        result = run_mod.run('stream_job')
+
+        assert [len(batch) for batch in load_calls] == [2, 2, 1]
+        assert result == {'status': 'not_implemented', 'records': 5, 'batches': 3}
+
+    def test_sorts_across_batches(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that streaming sort steps order records across all batches and
+        re-batch the sorted stream for loading.
+        """
+        job = _make_job(name='stream_job', source='src', target='tgt')
+        cfg = _base_config(
+            job,
+            SimpleNamespace(name='src', type='api'),
+            SimpleNamespace(name='tgt', type='api'),
+        )
+        cfg.profile = SimpleNamespace(streaming={'batch_size': 2})
+        cfg.transforms = {
+            'noop': {
+                'filter': {'field': 'id', 'op': 'ne', 'value': 2},
+                'sort': {'field': 'id', 'reverse': True, 'max_in_memory': 2},
+            },
+        }
+        _patch_config(monkeypatch, cfg)
+        monkeypatch.setattr(
+            run_mod,
+            'extract_from_api_source',
+            lambda cfg_obj, source_obj, opts: [{'id': i} for i in (3, 0, 4, 2, 1)],
+        )
+        load_calls: list[Any] = []
+
+        def _capture_load(data: Any, *args: Any, **kwargs: Any) -> dict[str, Any]:
+            load_calls.append(data)
+            return {'status': 'not_implemented', 'records': len(data)}
+
+        monkeypatch.setattr(
+            run_mod,
+            'load_to_api_target',
+            lambda cfg_obj, target_obj, opts, data: _capture_load(data),
+        )
+
+        result = run_mod.run('stream_job')
+
+        assert load_calls == [[{'id': 4}, {'id': 3}], [{'id': 1}, {'id': 0}]]
+        assert result == {'status': 'not_implemented', 'records': 4, 'batches': 2}
+
+    def test_limit_stops_extraction_early(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that streaming ``top_n`` steps run over the whole stream while
+        a ``limit`` alone stops pulling records from the source.
+        """
+        job = _make_job(name='stream_job', source='src', target='tgt')
+        cfg = _base_config(
+            job,
+            SimpleNamespace(name='src', type='api'),
+            SimpleNamespace(name='tgt', type='api'),
+        )
+        cfg.profile = SimpleNamespace(streaming={'batch_size': 2})
+        cfg.transforms = {'noop': {'limit': 3}}
+        _patch_config(monkeypatch, cfg)
+        pulled: list[int] = []
+
+        def _source(*args: Any) -> Any:
+            for i in range(100):
+                pulled.append(i)
+                yield {'id': i}
+
+        monkeypatch.setattr(run_mod, 'extract_from_api_source', _source)
+        load_calls: list[Any] = []
+
+        def _capture_load(data: Any, *args: Any, **kwargs: Any) -> dict[str, Any]:
+            load_calls.append(data)
+            return {'status': 'not_implemented', 'records': len(data)}
+
+        monkeypatch.setattr(
+            run_mod,
+            'load_to_api_target',
+            lambda cfg_obj, target_obj, opts, data: _capture_load(data),
+        )
+
+        result = run_mod.run('stream_job')
+
+        assert load_calls == [[{'id': 0}, {'id': 1}], [{'id': 2}]]
+        assert result['records'] == 3
+        assert len(pulled) < 10
+
+        cfg.transforms = {'noop': {'top_n': {'field': 'id', 'n': 2}}}
+        load_calls.clear()
+
+        run_mod.run('stream_job')
+
+        assert load_calls == [[{'id': 99}, {'id': 98}]]
+
+    @pytest.mark.parametrize(
+        'ops',
+        [
+            pytest.param(
+                {'sort': {'field': 'id', 'reverse': True}, 'limit': 2},
+                id='sort',
+            ),
+            pytest.param(
+                {'top_n': {'field': 'id', 'n': 3}, 'limit': 2},
+                id='top-n',
+            ),
+        ],
+    )
+    def test_limit_applies_after_global_ordering(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        ops: dict[str, Any],
+    ) -> None:
+        """
+        Test that ``limit`` keeps the top rows of the whole stream, not of
+        each batch, when it follows ``sort`` or ``top_n``.
+        """
+        job = _make_job(name='stream_job', source='src', target='tgt')
+        cfg = _base_config(
+            job,
+            SimpleNamespace(name='src', type='api'),
+            SimpleNamespace(name='tgt', type='api'),
+        )
+        cfg.profile = SimpleNamespace(streaming={'batch_size': 4})
+        cfg.transforms = {'noop': ops}
+        _patch_config(monkeypatch, cfg)
+        monkeypatch.setattr(
+            run_mod,
+            'extract_from_api_source',
+            lambda *args: iter([{'id': i} for i in (1, 2, 9, 8, 3, 7)]),
+        )
+        load_calls: list[Any] = []
+
+        def _capture_load(data: Any) -> dict[str, Any]:
+            load_calls.append(data)
+            return {'status': 'not_implemented', 'records': len(data)}
+
+        monkeypatch.setattr(
+            run_mod,
+            'load_to_api_target',
+            lambda cfg_obj, target_obj, opts, data: _capture_load(data),
+        )
+
+        run_mod.run('stream_job')
+
+        assert load_calls == [[{'id': 9}, {'id': 8}]]
+
+    @pytest.mark.parametrize('streaming', [False, True], ids=['batch', 'stream'])
+    def test_database_source_reads_query_through_sqlalchemy(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        streaming: bool,
+    ) -> None:
+        """
+        Test that database sources run their query, with extract overrides,
+        and stream one cursor fetch per batch.
+        """
+        rows = [{'id': i, 'region': 'eu' if i % 2 else 'us'} for i in range(9)]
+        url = write_sqlite_table(tmp_path / 'src.db', 'orders', rows)
+        job = _make_job(
+            name='job',
+            source='src',
+            target='tgt',
+            options={'params': {'region': 'eu'}},
+        )
+        tgt_path = tmp_path / 'out.json'
+        cfg = _base_config(
+            job,
+            SimpleNamespace(
+                name='src',
+                type='database',
+                connection_string=url,
+                query='SELECT id FROM orders WHERE region = :region',
+                fetch_size=2,
+            ),
+            SimpleNamespace(name='tgt', type='file', path=str(tgt_path)),
+        )
+        if streaming:
+            cfg.profile = SimpleNamespace(streaming={'batch_size': 100})
+        _patch_config(monkeypatch, cfg)
+        fetch_sizes: list[int] = []
+        extract_batches = run_mod.extract_database_batches
+
+        def _extract_batches(*args: Any, **kwargs: Any) -> Any:
+            fetch_sizes.append(kwargs['batch_size'])
+            return extract_batches(*args, **kwargs)
+
+        monkeypatch.setattr(run_mod, 'extract_database_batches', _extract_batches)
+
+        result = run_mod.run('job')
+
+        loaded = json.loads(tgt_path.read_text(encoding='utf-8'))
+        assert loaded == [{'id': 1}, {'id': 3}, {'id': 5}, {'id': 7}]
+        assert result['status'] == 'success'
+        assert fetch_sizes == ([2] if streaming else [])
+
+    @pytest.mark.parametrize('streaming', [False, True], ids=['batch', 'stream'])
+    def test_database_source_reads_partitions_concurrently(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        streaming: bool,
+    ) -> None:
+        """
+        Test that partitioned database sources read every range and report
+        per-partition timings on the job result.
+        """
+        rows = [{'id': i} for i in range(1, 21)]
+        url = write_sqlite_table(tmp_path / 'src.db', 'orders', rows)
+        job = _make_job(
+            name='job',
+            source='src',
+            target='tgt',
+            options={'partitions': 4},
+        )
+        tgt_path = tmp_path / 'out.json'
+        cfg = _base_config(
+            job,
+            SimpleNamespace(
+                name='src',
+                type='database',
+                connection_string=url,
+                table='orders',
+                partition_column='id',
+                partitions=2,
+            ),
+            SimpleNamespace(name='tgt', type='file', path=str(tgt_path)),
+        )
+        if streaming:
+            cfg.profile = SimpleNamespace(streaming={'batch_size': 5})
+        _patch_config(monkeypatch, cfg)
+
+        result = run_mod.run('job')
+
+        assert json.loads(tgt_path.read_text(encoding='utf-8')) == rows
+        partitions = result['extract_partitions']
+        assert [entry['partition'] for entry in partitions] == [0, 1, 2, 3]
+        assert sum(entry['records'] for entry in partitions) == len(rows)
+
+    @pytest.mark.parametrize('streaming', [False, True], ids=['batch', 'stream'])
+    def test_database_target_upserts_in_one_load(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        streaming: bool,
+    ) -> None:
+        """
+        Test that database targets load with the connector mode and keys,
+        applying load overrides, and receive every batch in one load call.
+        """
+        url = write_sqlite_table(
+            tmp_path / 'tgt.db',
+            'orders',
+            [{'id': 1, 'total': 0}],
+        )
+        with closing(sqlite3.connect(tmp_path / 'tgt.db')) as conn:
+            conn.execute('CREATE UNIQUE INDEX orders_id ON orders (id)')
+            conn.commit()
+        job = _make_job(name='job', source='src', target='tgt')
+        job.load.overrides = {'batch_size': 1}
+        cfg = _base_config(
+            job,
+            SimpleNamespace(name='src', type='api'),
+            SimpleNamespace(
+                name='tgt',
+                type='database',
+                connection_string=url,
+                table='orders',
+                mode='upsert',
+                keys=('id',),
+            ),
+        )
+        if streaming:
+            cfg.profile = SimpleNamespace(streaming={'batch_size': 2})
+        _patch_config(monkeypatch, cfg)
+        monkeypatch.setattr(
+            run_mod,
+            'extract_from_api_source',
+            lambda cfg_obj, source_obj, opts: [
+                {'id': i, 'total': i * 10} for i in range(1, 4)
+            ],
+        )
+
+        result = run_mod.run('job')
+
+        with closing(sqlite3.connect(tmp_path / 'tgt.db')) as conn:
+            rows = conn.execute('SELECT id, total FROM orders ORDER BY id').fetchall()
+        assert rows == [(1, 10), (2, 20), (3, 30)]
+        assert result['status'] == 'success'
+        assert result['records'] == 3
+        assert result['mode'] == 'upsert'
+
+    @pytest.mark.parametrize('streaming', [False, True], ids=['batch', 'stream'])
+    def test_quarantine_diverts_invalid_records(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        streaming: bool,
+    ) -> None:
+        """
+        Test that ``quarantine`` severity writes invalid records to the
+        quarantine target while valid records continue to load.
+        """
+        job = _make_job(name='job', source='src', target='tgt')
+        job.validate = SimpleNamespace(
+            ruleset='ids',
+            severity='quarantine',
+            phase='before_transform',
+            quarantine='rejects',
+        )
+        src_path = tmp_path / 'in.json'
+        rows = [{'id': i if i % 4 else f'bad-{i}'} for i in range(10)]
+        src_path.write_text(json.dumps(rows), encoding='utf-8')
+        tgt_path = tmp_path / 'out.json'
+        rejects_path = tmp_path / 'rejects.csv'
+        cfg = _base_config(
+            job,
+            SimpleNamespace(name='src', type='file', path=str(src_path)),
+            SimpleNamespace(name='tgt', type='file', path=str(tgt_path)),
+        )
+        cfg.targets.append(
+            SimpleNamespace(
+                name='rejects',
+                type='file',
+                format='csv',
+                path=str(rejects_path),
+            ),
+        )
+        cfg.validations = {'ids': {'id': {'type': 'integer'}}}
+        if streaming:
+            cfg.profile = SimpleNamespace(streaming={'batch_size': 3})
+        _patch_config(monkeypatch, cfg)
+
+        result = run_mod.run('job')
+
+        loaded = json.loads(tgt_path.read_text(encoding='utf-8'))
+        assert [row['id'] for row in loaded] == [1, 2, 3, 5, 6, 7, 9]
+        assert rejects_path.read_text(encoding='utf-8').split() == [
+            'id',
+            'bad-0',
+            'bad-4',
+            'bad-8',
+        ]
+        summary = result['validation']
+        assert summary['before_transform']['invalid_records'] == 3
+        assert summary['quarantine']['records'] == 3
+        assert summary['quarantine']['path'] == str(rejects_path)
+
+    @pytest.mark.parametrize(
+        ('quarantine', 'target_type', 'message'),
+        [
+            pytest.param(None, 'file', 'requires a "quarantine"', id='missing'),
+            pytest.param('rejects', 'api', 'must be a file target', id='not-file'),
+        ],
+    )
+    def test_quarantine_requires_file_target(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        quarantine: str | None,
+        target_type: str,
+        message: str,
+    ) -> None:
+        """Test that quarantine severity needs a configured file target."""
+        job = _make_job(name='job', source='src', target='tgt')
+        job.validate = SimpleNamespace(
+            ruleset='ids',
+            severity='quarantine',
+            phase=None,
+            quarantine=quarantine,
+        )
+        cfg = _base_config(
+            job,
+            SimpleNamespace(name='src', type='api'),
+            SimpleNamespace(name='tgt', type='api'),
+        )
+        cfg.targets.append(SimpleNamespace(name='rejects', type=target_type))
+        cfg.validations = {'ids': {'id': {'type': 'integer'}}}
+        _patch_config(monkeypatch, cfg)
+
+        with pytest.raises(ValueError, match=message):
+            run_mod.run('job')
+
+    def test_bounded_validation_fails_fast_past_error_budget(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that bounded validation tallies batches into one report, stops
+        extraction once the error budget is spent, and reports a summary.
+        """
+        job = _make_job(name='stream_job', source='src', target='tgt')
+        job.validate = SimpleNamespace(
+            ruleset='ids',
+            severity='error',
+            phase='before_transform',
+            max_errors=2,
+            max_samples=1,
+        )
+        cfg = _base_config(
+            job,
+            SimpleNamespace(name='src', type='api'),
+            SimpleNamespace(name='tgt', type='api'),
+        )
+        cfg.profile = SimpleNamespace(streaming={'batch_size': 2})
+        cfg.validations = {'ids': {'id': {'type': 'integer'}}}
+        _patch_config(monkeypatch, cfg)
+        pulled: list[int] = []
+
+        def _source(*args: Any) -> Any:
+            for i in range(100):
+                pulled.append(i)
+                yield {'id': i if i % 3 else str(i)}
+
+        monkeypatch.setattr(run_mod, 'extract_from_api_source', _source)
+        monkeypatch.setattr(
+            run_mod,
+            'load_to_api_target',
+            lambda data, *args, **kwargs: {'status': 'ok'},
+        )
+        printed: list[Any] = []
+        monkeypatch.setattr(
+            run_mod.JsonCodec,
+            'print',
+            lambda _self, payload: printed.append(payload),
+        )
+
+        with pytest.raises(ValueError, match='Validation failed'):
+            run_mod.run('stream_job')
+
+        assert len(pulled) < 10
+        summary = printed[-1]['result']['summary']
+        assert summary['error_count'] == 3
+        assert summary['counts'] == {'id': {'type': 3}}
+        assert summary['sample_errors'] == ['[0].id: Expected type integer, got str']
+        assert 'data' not in printed[-1]['result']
+
+        job.validate.severity = 'warn'
+        printed.clear()
+
+        result = run_mod.run('stream_job')
+
+        assert printed == []
+        assert result['records'] == 100
+        assert result['validation']['before_transform'] == {
+            'records': 100,
+            'invalid_records': 34,
+            'error_count': 34,
+            'counts': {'id': {'type': 34}},
+            'sample_errors': ['[0].id: Expected type integer, got str'],
+            'budget_exceeded': False,
+        }
+
+    @pytest.mark.parametrize(
+        'operations',
+        [
+            pytest.param({'aggregate': {'field': 'id', 'func': 'sum'}}, id='agg'),
+            pytest.param(
+                {'group_by': {'keys': ['id']}, 'sort': {'field': 'id'}},
+                id='group-by-and-sort',
+            ),
+        ],
+    )
+    def test_rejects_blocking_transform_steps(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        operations: dict[str, Any],
+    ) -> None:
+        """
+        Test that streaming jobs reject steps that need the full dataset.
+        """
+        job = _make_job(name='stream_job', source='src', target='tgt')
+        job.streaming = True
+        cfg = _base_config(
+            job,
+            SimpleNamespace(name='src', type='file', path='/tmp/in.json'),
+            SimpleNamespace(name='tgt', type='file', path='/tmp/out.json'),
+        )
+        cfg.transforms = {'noop': operations}
+        _patch_config(monkeypatch, cfg)
+
+        with pytest.raises(ValueError, match='does not support transform steps'):
+            run_mod.run('stream_job')
+
+    @pytest.mark.parametrize(
+        ('job_streaming', 'profile_streaming', 'expected'),
+        [
+            pytest.param(None, None, (False, 10_000), id='disabled-by-default'),
+            pytest.param(True, None, (True, 10_000), id='job-flag'),
+            pytest.param(
+                None,
+                {'batch_size': 50},
+                (True, 50),
+                id='profile-default',
+            ),
+            pytest.param(
+                {'enabled': False},
+                {'batch_size': 50},
+                (False, 10_000),
+                id='job-overrides-profile',
+            ),
+        ],
+    )
+    def test_job_streaming_settings_resolution(
+        self,
+        job_streaming: Any,
+        profile_streaming: Any,
+        expected: tuple[bool, int],
+    ) -> None:
+        """
+        Test that job-level streaming policies take precedence over profile
+        defaults.
+        """
+        job = SimpleNamespace(streaming=job_streaming)
+        cfg = SimpleNamespace(profile=SimpleNamespace(streaming=profile_streaming))
+
+        settings = run_mod._job_streaming_settings(cfg, job)
+
+        assert (settings.enabled, settings.batch_size) == expected
+
+
+class TestRunIncremental:
+    """Unit tests for watermark-based incremental job runs."""
+
+    @staticmethod
+    def _config(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        source: SimpleNamespace,
+        incremental: SimpleNamespace,
+        *,
+        streaming: bool = False,
+    ) -> SimpleNamespace:
+        job = _make_job(name='job', source=source.name, target='tgt')
+        job.extract.incremental = incremental
+        cfg = _base_config(
+            job,
+            source,
+            SimpleNamespace(
+                name='tgt',
+                type='file',
+                path=str(tmp_path / 'out.json'),
+            ),
+        )
+        cfg.name = 'pipe'
+        cfg.history = SimpleNamespace(
+            enabled=True,
+            backend=None,
+            state_dir=str(tmp_path / 'state'),
+            capture_tracebacks=False,
+        )
+        if streaming:
+            cfg.profile = SimpleNamespace(streaming={'batch_size': 2})
+        monkeypatch.delenv('ETLPLUS_STATE_DIR', raising=False)
+        _patch_config(monkeypatch, cfg)
+        return cfg
+
+    @pytest.mark.parametrize('streaming', [False, True], ids=['batch', 'stream'])
+    def test_database_source_reads_rows_above_watermark(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        streaming: bool,
+    ) -> None:
+        """
+        Test that the second run only reads rows above the watermark that
+        the first run persisted.
+        """
+        db_path = tmp_path / 'src.db'
+        url = write_sqlite_table(db_path, 'orders', [{'id': i} for i in range(1, 4)])
+        self._config(
+            tmp_path,
+            monkeypatch,
+            SimpleNamespace(
+                name='src',
+                type='database',
+                connection_string=url,
+                table='orders',
+            ),
+            SimpleNamespace(field='id', param=None, initial=None),
+            streaming=streaming,
+        )
+
+        first = run_mod.run('job')
+        with closing(sqlite3.connect(db_path)) as conn, conn:
+            conn.executemany('INSERT INTO orders VALUES (?)', [(4,), (5,)])
+        second = run_mod.run('job')
+
+        out = json.loads((tmp_path / 'out.json').read_text(encoding='utf-8'))
+        assert out == [{'id': 4}, {'id': 5}]
+        assert first['watermark'] == {'field': 'id', 'previous': None, 'current': 3}
+        assert second['watermark'] == {'field': 'id', 'previous': 3, 'current': 5}
+        state = json.loads(
+            (tmp_path / 'state' / 'watermarks.json').read_text(encoding='utf-8'),
+        )
+        assert state['jobs']['pipe/job']['value'] == 5
+
+    def test_file_source_filters_records_from_initial_watermark(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that file sources are filtered against the watermark, numeric
+        text included, and that an empty delta keeps the stored mark.
+        """
+        src = tmp_path / 'src.csv'
+        src.write_text('id,name\n1,a\n2,b\n10,c\n', encoding='utf-8')
+        self._config(
+            tmp_path,
+            monkeypatch,
+            SimpleNamespace(name='src', type='file', path=str(src), format='csv'),
+            SimpleNamespace(field='id', param=None, initial=1),
+        )
+
+        first = run_mod.run('job')
+        loaded = json.loads((tmp_path / 'out.json').read_text(encoding='utf-8'))
+        second = run_mod.run('job')
+
+        assert [row['id'] for row in loaded] == ['2', '10']
+        assert first['watermark']['current'] == '10'
+        assert second['watermark'] == {
+            'field': 'id',
+            'previous': '10',
+            'current': '10',
+        }
+
+    def test_api_source_receives_watermark_query_param(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that API sources get the watermark as a query parameter and
+        that records at or below it are still dropped.
+        """
+        self._config(
+            tmp_path,
+            monkeypatch,
+            SimpleNamespace(name='src', type='api'),
+            SimpleNamespace(
+                field='updated_at',
+                param='since',
+                initial='2026-01-01T00:00:00',
+            ),
+        )
+        seen: list[dict[str, Any]] = []
+
+        def _extract(cfg_obj: Any, source_obj: Any, opts: Any) -> Any:
+            seen.append(dict(opts))
+            return [
+                {'id': 1, 'updated_at': '2026-01-01T00:00:00'},
+                {'id': 2, 'updated_at': '2026-02-01T00:00:00'},
+            ]
+
+        monkeypatch.setattr(run_mod, 'extract_from_api_source', _extract)
+
+        result = run_mod.run('job')
+
+        assert seen == [{'query_params': {'since': '2026-01-01T00:00:00'}}]
+        out = json.loads((tmp_path / 'out.json').read_text(encoding='utf-8'))
+        assert [row['id'] for row in out] == [2]
+        assert result['watermark']['current'] == '2026-02-01T00:00:00'
+
+    @pytest.mark.parametrize('streaming', [False, True], ids=['batch', 'stream'])
+    def test_watermark_survives_transforms_dropping_the_field(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        streaming: bool,
+    ) -> None:
+        """
+        Test that the watermark advances on extracted records even when the
+        transform renames the field away, so the next run reads the delta.
+        """
+        src = tmp_path / 'src.csv'
+        src.write_text('id\n1\n2\n3\n', encoding='utf-8')
+        cfg = self._config(
+            tmp_path,
+            monkeypatch,
+            SimpleNamespace(name='src', type='file', path=str(src), format='csv'),
+            SimpleNamespace(field='id', param=None, initial=None),
+            streaming=streaming,
+        )
+        cfg.transforms = {'noop': {'map': {'id': 'order_id'}}}
+
+        first = run_mod.run('job')
+        src.write_text('id\n1\n2\n3\n4\n', encoding='utf-8')
+        second = run_mod.run('job')
+
+        out = json.loads((tmp_path / 'out.json').read_text(encoding='utf-8'))
+        assert out == [{'order_id': '4'}]
+        assert first['watermark']['current'] == '3'
+        assert second['watermark']['current'] == '4'
+
+    @pytest.mark.parametrize('streaming', [False, True], ids=['batch', 'stream'])
+    @pytest.mark.parametrize(
+        ('operations', 'step'),
+        [
+            pytest.param({'limit': 2}, 'limit', id='limit'),
+            pytest.param({'top_n': {'field': 'id', 'n': 2}}, 'top_n', id='top-n'),
+        ],
+    )
+    def test_count_bounded_steps_are_rejected(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        streaming: bool,
+        operations: dict[str, Any],
+        step: str,
+    ) -> None:
+        """
+        Test that incremental jobs reject steps whose cut records the next
+        run would skip, before anything is read or loaded.
+        """
+        src = tmp_path / 'src.csv'
+        src.write_text('id\n1\n2\n3\n', encoding='utf-8')
+        cfg = self._config(
+            tmp_path,
+            monkeypatch,
+            SimpleNamespace(name='src', type='file', path=str(src), format='csv'),
+            SimpleNamespace(field='id', param=None, initial=None),
+            streaming=streaming,
+        )
+        cfg.transforms = {'noop': operations}
+
+        with pytest.raises(ValueError, match=f'Incremental jobs .*: {step}'):
+            run_mod.run('job')
+        assert not (tmp_path / 'out.json').exists()
+        assert not (tmp_path / 'state' / 'watermarks.json').exists()
+
+    @pytest.mark.parametrize('streaming', [False, True], ids=['batch', 'stream'])
+    def test_field_missing_from_every_record_raises(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        streaming: bool,
+    ) -> None:
+        """
+        Test that a watermark field no record carries fails the run before
+        the load instead of turning every run into a full reload.
+        """
+        src = tmp_path / 'src.csv'
+        src.write_text('id\n1\n2\n', encoding='utf-8')
+        self._config(
+            tmp_path,
+            monkeypatch,
+            SimpleNamespace(name='src', type='file', path=str(src), format='csv'),
+            SimpleNamespace(field='updated_at', param=None, initial=None),
+            streaming=streaming,
+        )
+
+        with pytest.raises(ValueError, match="'updated_at' is missing"):
+            run_mod.run('job')
+        assert not (tmp_path / 'state' / 'watermarks.json').exists()
+
+    def test_records_without_field_are_dropped_once_watermarked(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that records missing the watermark field are not reloaded
+        on every run once a watermark exists.
+        """
+        self._config(
+            tmp_path,
+            monkeypatch,
+            SimpleNamespace(name='src', type='api'),
+            SimpleNamespace(field='updated_at', param='since', initial=None),
+        )
+        monkeypatch.setattr(
+            run_mod,
+            'extract_from_api_source',
+            lambda *_args: [
+                {'id': 1, 'updated_at': '2026-01-01T00:00:00'},
+                {'id': 2},
+                {'id': 3, 'updated_at': None},
+            ],
+        )
+
+        run_mod.run('job')
+        first = json.loads((tmp_path / 'out.json').read_text(encoding='utf-8'))
+        second = run_mod.run('job')
+
+        out = json.loads((tmp_path / 'out.json').read_text(encoding='utf-8'))
+        assert [row['id'] for row in first] == [1, 2, 3]
+        assert out == []
+        assert second['watermark']['current'] == '2026-01-01T00:00:00'
+
+    def test_timestamps_compare_as_points_in_time(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that ISO timestamps with different offset spellings and
+        fractional precision compare by the instant they denote.
+        """
+        self._config(
+            tmp_path,
+            monkeypatch,
+            SimpleNamespace(name='src', type='api'),
+            SimpleNamespace(
+                field='updated_at',
+                param='since',
+                initial='2026-01-01T00:00:00Z',
+            ),
+        )
+        monkeypatch.setattr(
+            run_mod,
+            'extract_from_api_source',
+            lambda *_args: [
+                {'id': 1, 'updated_at': '2026-01-01T00:00:00+00:00'},
+                {'id': 2, 'updated_at': '2026-01-01T00:00:00.5Z'},
+                {'id': 3, 'updated_at': '2026-01-01T01:00:00+02:00'},
+                {'id': 4, 'updated_at': '2026-01-01T00:00:00.25+00:00'},
+            ],
+        )
+
+        result = run_mod.run('job')
+
+        out = json.loads((tmp_path / 'out.json').read_text(encoding='utf-8'))
+        assert [row['id'] for row in out] == [2, 4]
+        assert result['watermark']['current'] == '2026-01-01T00:00:00.5Z'
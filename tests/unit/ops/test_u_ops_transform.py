@@ -18,6 +18,7 @@ from __future__ import annotations
 import importlib
 from collections.abc import Callable
 from dataclasses import dataclass
+from decimal import Decimal
 from pathlib import Path
 from typing import Any
 from typing import Literal
@@ -29,6 +30,8 @@ import pytest
 from etlplus.ops._enums import AggregateName
 from etlplus.ops._enums import OperatorName
 from etlplus.ops._enums import PipelineStep
+from etlplus.ops._enums import TransformEngine
+from etlplus.ops.transform import TransformPlan
 from etlplus.ops.transform import _normalize_operation_keys
 from etlplus.ops.transform import _normalize_specs
 from etlplus.ops.transform import apply_aggregate
@@ -36,27 +39,50 @@ from etlplus.ops.transform import apply_filter
 from etlplus.ops.transform import apply_map
 from etlplus.ops.transform import apply_select
 from etlplus.ops.transform import apply_sort
+from etlplus.ops.transform import blocking_steps
+from etlplus.ops.transform import compile_pipeline
 from etlplus.ops.transform import transform
+from etlplus.ops.transformations.aggregate import AggregateState
 from etlplus.ops.transformations.aggregate import _agg_avg
 from etlplus.ops.transformations.aggregate import _agg_count
 from etlplus.ops.transformations.aggregate import _agg_max
 from etlplus.ops.transformations.aggregate import _agg_min
 from etlplus.ops.transformations.aggregate import _agg_sum
-from etlplus.ops.transformations.aggregate import _collect_numeric_and_presence
 from etlplus.ops.transformations.aggregate import _derive_agg_key
 from etlplus.ops.transformations.aggregate import _resolve_aggregator
 from etlplus.ops.transformations.aggregate import apply_aggregate_step
+from etlplus.ops.transformations.aggregate import apply_aggregates
 from etlplus.ops.transformations.filter import _contains
 from etlplus.ops.transformations.filter import _eval_condition
 from etlplus.ops.transformations.filter import _has
 from etlplus.ops.transformations.filter import _resolve_operator
 from etlplus.ops.transformations.filter import apply_filter_step
+from etlplus.ops.transformations.filter import bind_operator
+from etlplus.ops.transformations.filter import compile_filter_step
+from etlplus.ops.transformations.group_by import apply_group_by
+from etlplus.ops.transformations.group_by import apply_group_by_step
+from etlplus.ops.transformations.group_by import compile_group_by_step
+from etlplus.ops.transformations.limit import apply_limit
+from etlplus.ops.transformations.limit import apply_limit_step
+from etlplus.ops.transformations.limit import compile_limit_step
+from etlplus.ops.transformations.limit import iter_limit
 from etlplus.ops.transformations.map import apply_map_step
+from etlplus.ops.transformations.map import compile_map_step
 from etlplus.ops.transformations.select import apply_select_step
+from etlplus.ops.transformations.select import compile_select_step
 from etlplus.ops.transformations.select import is_plain_fields_list
 from etlplus.ops.transformations.select import is_sequence_not_text
-from etlplus.ops.transformations.sort import _sort_key
 from etlplus.ops.transformations.sort import apply_sort_step
+from etlplus.ops.transformations.sort import compile_sort_step
+from etlplus.ops.transformations.sort import iter_sorted
+from etlplus.ops.transformations.sort import sort_fields
+from etlplus.ops.transformations.sort import sort_key
+from etlplus.ops.transformations.sql import apply_sql
+from etlplus.ops.transformations.sql import apply_sql_step
+from etlplus.ops.transformations.sql import compile_sql_step
+from etlplus.ops.transformations.top_n import apply_top_n
+from etlplus.ops.transformations.top_n import apply_top_n_step
+from etlplus.ops.transformations.top_n import compile_top_n_step
 from etlplus.utils._types import JSONData
 
 # SECTION: PRAGMAS ========================================================== #
@@ -66,6 +92,8 @@ from etlplus.utils._types import JSONData
 # SECTION: HELPERS ========================================================== #
 
 
+batches_mod = importlib.import_module('etlplus.ops._batches')
+filter_mod = importlib.import_module('etlplus.ops.transformations.filter')
 transform_mod = importlib.import_module('etlplus.ops.transform')
 
 
@@ -136,6 +164,47 @@ class TestApplyAggregate:
         assert result == {'score': 48}
 
 
+class TestApplyAggregates:
+    """Unit tests for :func:`apply_aggregates` and :class:`AggregateState`."""
+
+    def test_consumes_record_streams_in_one_pass(self) -> None:
+        """Test that several specs are computed from a one-shot iterator."""
+        records = iter(copy_rows(VALUE_ROWS))
+
+        result = apply_aggregates(
+            records,
+            [
+                {'field': 'value', 'func': 'sum'},
+                {'field': 'value', 'func': 'max'},
+                {'field': 'value', 'func': 'quantile', 'q': 0.9},
+                'ignored',
+            ],
+        )
+
+        assert result == {'sum_value': 45, 'max_value': 20, 'p90_value': 20}
+
+    def test_merged_partitions_match_single_pass(self) -> None:
+        """Test that merging partial states matches one full pass."""
+        specs = [
+            {'field': 'value', 'func': func}
+            for func in ('avg', 'count', 'distinct', 'max', 'min', 'median', 'sum')
+        ]
+        rows = copy_rows(VALUE_ROWS)
+
+        left = AggregateState.from_specs(specs).update(rows[:1])
+        right = AggregateState.from_specs(specs).update(rows[1:])
+        left.merge(right)
+
+        assert left.result() == apply_aggregates(rows, specs)
+
+    def test_merge_rejects_different_specs(self) -> None:
+        """Test that states built from different specs cannot be merged."""
+        state = AggregateState.from_specs({'func': 'count'})
+
+        with pytest.raises(ValueError, match='different specs'):
+            state.merge(AggregateState.from_specs({'field': 'a', 'func': 'sum'}))
+
+
 class TestApplyFilter:
     """Unit tests for :func:`apply_filter`."""
 
@@ -277,6 +346,400 @@ class TestApplyFilter:
         assert result == data
 
 
+class TestFilterTrees:
+    """Unit tests for ``all``/``any``/``not`` filter trees."""
+
+    records = [
+        {'name': 'ann', 'age': 30, 'country': 'US'},
+        {'name': 'bob', 'age': None, 'country': 'CA'},
+        {'name': 'cy', 'age': 15, 'country': 'MX'},
+        {'name': 'dee', 'age': 40},
+    ]
+
+    @pytest.mark.parametrize(
+        ('spec', 'expected'),
+        [
+            pytest.param(
+                {
+                    'all': [
+                        {'field': 'age', 'op': 'gte', 'value': 16},
+                        {'field': 'country', 'op': 'eq', 'value': 'US'},
+                    ],
+                },
+                ['ann'],
+                id='all',
+            ),
+            pytest.param(
+                {
+                    'any': [
+                        {'field': 'age', 'op': 'lt', 'value': 16},
+                        {'not': {'field': 'country', 'op': 'in', 'value': ['US']}},
+                    ],
+                },
+                ['bob', 'cy', 'dee'],
+                id='any-with-not',
+            ),
+            pytest.param(
+                {'not': {'field': 'age', 'op': 'gt', 'value': 20}},
+                ['bob', 'cy'],
+                id='not-keeps-failed-comparisons',
+            ),
+        ],
+    )
+    def test_tree_semantics(
+        self,
+        spec: dict[str, Any],
+        expected: list[str],
+    ) -> None:
+        """Test that trees combine conditions in one compiled predicate."""
+        step = compile_filter_step(spec)
+        names = [row['name'] for row in apply_filter_step(self.records, spec)]
+
+        assert step is not None
+        assert names == expected
+        assert [row['name'] for row in apply_filter(self.records, spec)] == expected
+
+    @pytest.mark.parametrize(
+        ('spec', 'match'),
+        [
+            pytest.param(
+                {
+                    'all': [
+                        {'field': 'age', 'op': 'gte', 'value': 16},
+                        {'field': 'country', 'opp': 'eq', 'value': 'US'},
+                    ],
+                },
+                'unusable condition',
+                id='misspelled-child-key',
+            ),
+            pytest.param(
+                {'any': [{'field': 'age', 'op': 'bogus', 'value': 1}]},
+                'Invalid OperatorName',
+                id='unknown-operator',
+            ),
+            pytest.param(
+                {'all': [{'field': 'age', 'op': 'gt', 'value': 1}, 'age > 1']},
+                'condition mappings',
+                id='non-mapping-child',
+            ),
+            pytest.param(
+                {'not': [{'field': 'age', 'op': 'gt', 'value': 20}]},
+                "'not' node takes exactly one condition mapping",
+                id='not-with-list',
+            ),
+            pytest.param({'all': []}, 'non-empty list', id='empty-all'),
+            pytest.param(
+                {
+                    'all': [
+                        {'field': 'name', 'op': 'contains', 'value': 'e'},
+                        {'any': []},
+                    ],
+                },
+                'non-empty list',
+                id='nested-empty-any',
+            ),
+            pytest.param(
+                {'all': [{'field': 'age', 'op': 'gt', 'value': 1}], 'any': []},
+                'exactly one of all/any/not',
+                id='two-boolean-keys',
+            ),
+        ],
+    )
+    def test_malformed_trees_raise(
+        self,
+        spec: dict[str, Any],
+        match: str,
+    ) -> None:
+        """
+        Test that malformed trees raise instead of silently widening the
+        filter.
+        """
+        with pytest.raises(ValueError, match=match):
+            compile_filter_step(spec)
+        with pytest.raises(ValueError, match=match):
+            apply_filter(self.records, cast(Any, spec))
+
+    def test_cheapest_conditions_run_first_and_short_circuit(self) -> None:
+        """
+        Test that built-in comparisons run before custom callables and that
+        deciding conditions stop evaluation.
+        """
+        calls: list[str] = []
+
+        def _expensive(lhs: Any, rhs: Any) -> bool:
+            calls.append(lhs)
+            return lhs == rhs
+
+        spec = {
+            'all': [
+                {'field': 'name', 'op': _expensive, 'value': 'ann'},
+                {'field': 'age', 'op': 'gte', 'value': 16},
+            ],
+        }
+
+        result = apply_filter_step(self.records, spec)
+
+        assert [row['name'] for row in result] == ['ann']
+        assert calls == ['ann', 'dee']
+
+
+class TestApplyGroupBy:
+    """Unit tests for :func:`apply_group_by` and its step adapter."""
+
+    def test_computes_every_aggregate_per_group(self) -> None:
+        """Test that grouped aggregates are computed per key combination."""
+        data = [
+            {'customer': 'a', 'region': 'x', 'amount': 10, 'sku': 1},
+            {'customer': 'b', 'region': 'x', 'amount': 5, 'sku': 1},
+            {'customer': 'a', 'region': 'x', 'amount': 'n/a', 'sku': 2},
+            {'customer': 'a', 'region': 'y', 'amount': 30, 'sku': 2},
+            {'customer': 'a', 'region': 'x', 'amount': 20, 'sku': 2},
+        ]
+
+        result = apply_group_by(
+            data,
+            ['customer', 'region'],
+            [
+                {'func': 'count', 'alias': 'rows'},
+                {'field': 'amount', 'func': 'sum'},
+                {'field': 'amount', 'func': 'avg'},
+                {'field': 'amount', 'func': 'min'},
+                {'field': 'amount', 'func': 'max'},
+                {'field': 'amount', 'func': 'median'},
+                {'field': 'sku', 'func': 'distinct'},
+            ],
+        )
+
+        assert result == [
+            {
+                'customer': 'a',
+                'region': 'x',
+                'rows': 3,
+                'sum_amount': 30,
+                'avg_amount': 15,
+                'min_amount': 10,
+                'max_amount': 20,
+                'p50_amount': 10,
+                'distinct_sku': 2,
+            },
+            {
+                'customer': 'b',
+                'region': 'x',
+                'rows': 1,
+                'sum_amount': 5,
+                'avg_amount': 5,
+                'min_amount': 5,
+                'max_amount': 5,
+                'p50_amount': 5,
+                'distinct_sku': 1,
+            },
+            {
+                'customer': 'a',
+                'region': 'y',
+                'rows': 1,
+                'sum_amount': 30,
+                'avg_amount': 30,
+                'min_amount': 30,
+                'max_amount': 30,
+                'p50_amount': 30,
+                'distinct_sku': 1,
+            },
+        ]
+
+    def test_matches_ungrouped_aggregate_without_keys(self) -> None:
+        """Test that keyless grouping matches the ungrouped aggregate step."""
+        spec = {'field': 'value', 'func': 'avg', 'alias': 'mean'}
+
+        assert apply_group_by(copy_rows(VALUE_ROWS), None, spec) == (
+            apply_aggregate_step(copy_rows(VALUE_ROWS), spec)
+        )
+
+    def test_missing_and_unhashable_keys_form_groups(self) -> None:
+        """Test that missing keys group under ``None`` and lists still group."""
+        data = [{'tags': ['a']}, {'tags': ['a']}, {'other': 1}]
+
+        assert apply_group_by(data, 'tags', {'func': 'count'}) == [
+            {'tags': ['a'], 'count': 2},
+            {'tags': None, 'count': 1},
+        ]
+
+    def test_step_adapter_and_compiler_handle_invalid_specs(self) -> None:
+        """Test that unusable specs are skipped and bad functions raise."""
+        data = [{'a': 1}]
+
+        assert apply_group_by_step(data, {'keys': []}) is data
+        with pytest.raises(ValueError, match='Invalid AggregateName'):
+            compile_group_by_step({'keys': 'a', 'aggregates': {'func': 'nope'}})
+        with pytest.raises(ValueError, match='Quantile must be between'):
+            compile_group_by_step(
+                {'aggregates': {'field': 'a', 'func': 'quantile', 'q': 2}},
+            )
+        with pytest.raises(ValueError, match='Invalid aggregate func'):
+            compile_group_by_step({'aggregates': {'field': 'a', 'func': 5}})
+
+    def test_transform_sorts_grouped_rows(self) -> None:
+        """Test that pipeline ``group_by`` runs before ``sort``."""
+        data = [{'k': 'a', 'v': 1}, {'k': 'b', 'v': 5}, {'k': 'a', 'v': 2}]
+
+        result = transform(
+            data,
+            {
+                'sort': {'field': 'total', 'reverse': True},
+                'group_by': {
+                    'keys': 'k',
+                    'aggregates': {'field': 'v', 'func': 'sum', 'alias': 'total'},
+                },
+            },
+        )
+
+        assert result == [{'k': 'b', 'total': 5}, {'k': 'a', 'total': 3}]
+
+
+class TestApplyLimit:
+    """Unit tests for the ``limit`` step."""
+
+    records = [{'n': n} for n in range(5)]
+
+    @pytest.mark.parametrize(
+        ('spec', 'expected'),
+        [
+            pytest.param(2, [0, 1], id='count'),
+            pytest.param({'count': '3'}, [0, 1, 2], id='mapping'),
+            pytest.param(0, [], id='zero'),
+            pytest.param(-1, [], id='negative-clamped'),
+            pytest.param(10, [0, 1, 2, 3, 4], id='larger-than-input'),
+            pytest.param('many', [0, 1, 2, 3, 4], id='invalid-is-noop'),
+            pytest.param(True, [0, 1, 2, 3, 4], id='bool-is-noop'),
+        ],
+    )
+    def test_limit_step_keeps_leading_records(
+        self,
+        spec: Any,
+        expected: list[int],
+    ) -> None:
+        """Test that limit specs keep the first records in input order."""
+        result = apply_limit_step(self.records, spec)
+
+        assert [row['n'] for row in result] == expected
+
+    def test_compile_and_iter_limit(self) -> None:
+        """
+        Test that compiled limits slice batches and :func:`iter_limit` stops
+        reading its source once the limit is met.
+        """
+        pulled: list[int] = []
+
+        def _source() -> Any:
+            for record in self.records:
+                pulled.append(record['n'])
+                yield record
+
+        step = compile_limit_step({'count': 1})
+
+        assert compile_limit_step(None) is None
+        assert step is not None and step(self.records) == [{'n': 0}]
+        assert apply_limit(self.records, None) == self.records
+        assert list(iter_limit(_source(), 2)) == [{'n': 0}, {'n': 1}]
+        assert pulled == [0, 1]
+
+    def test_transform_stops_record_pass_at_limit(self) -> None:
+        """
+        Test that a limit after row-wise steps stops evaluating records once
+        enough have been kept.
+        """
+        seen: list[int] = []
+
+        def _gte(lhs: Any, rhs: Any) -> bool:
+            seen.append(lhs)
+            return lhs >= rhs
+
+        ops = {'filter': {'field': 'n', 'op': _gte, 'value': 1}, 'limit': 2}
+
+        assert transform(self.records, ops) == [{'n': 1}, {'n': 2}]
+        assert seen == [0, 1, 2]
+
+
+class TestApplyTopN:
+    """Unit tests for the ``top_n`` step."""
+
+    records = [
+        {'id': 0, 'score': 7},
+        {'id': 1, 'score': 9},
+        {'id': 2, 'score': None},
+        {'id': 3, 'score': 9},
+        {'id': 4, 'score': 3},
+        {'id': 5, 'score': 'n/a'},
+    ]
+
+    @pytest.mark.parametrize('reverse', [True, False])
+    @pytest.mark.parametrize('n', [0, 1, 3, 10])
+    def test_matches_stable_sort_prefix(
+        self,
+        n: int,
+        reverse: bool,
+    ) -> None:
+        """
+        Test that heap selection returns the first *n* records of the
+        equivalent stable sort.
+        """
+        expected = apply_sort(self.records, 'score', reverse=reverse)[:n]
+
+        assert apply_top_n(self.records, 'score', n, reverse=reverse) == expected
+        assert (
+            apply_top_n_step(
+                self.records,
+                {'field': 'score', 'n': n, 'reverse': reverse},
+            )
+            == expected
+        )
+
+    def test_defaults_to_highest_values_with_sort_keys(self) -> None:
+        """
+        Test that ``top_n`` ranks highest-first by default and accepts
+        multi-key ``keys`` lists with per-key direction.
+        """
+        spec = {'n': 2, 'keys': ['score', {'field': 'id', 'reverse': False}]}
+        numeric = [row for row in self.records if isinstance(row['score'], int)]
+
+        assert [row['id'] for row in apply_top_n_step(numeric, spec)] == [1, 3]
+        assert apply_top_n(iter(numeric), None, 1) == [numeric[0]]
+
+    @pytest.mark.parametrize(
+        'spec',
+        [
+            pytest.param(None, id='none'),
+            pytest.param({'field': 'score'}, id='missing-n'),
+            pytest.param({'n': 'x', 'field': 'score'}, id='invalid-n'),
+            pytest.param({'n': 2}, id='missing-field'),
+        ],
+    )
+    def test_invalid_specs_are_noop(
+        self,
+        spec: Any,
+    ) -> None:
+        """Test that unusable top-N specs compile to nothing."""
+        assert compile_top_n_step(spec) is None
+        assert apply_top_n_step(self.records, spec) == self.records
+
+    def test_plan_streams_bounded_steps(self) -> None:
+        """
+        Test that :meth:`TransformPlan.iter_bounded` matches the batch plan
+        for ``top_n``, ``sort``, and ``limit``.
+        """
+        ops: dict[str, Any] = {
+            'top_n': {'field': 'score', 'n': 4},
+            'sort': {'field': 'id'},
+            'limit': [3, {'count': 5}],
+        }
+        plan = compile_pipeline(ops)
+
+        assert plan.limit == 3
+        assert list(plan.iter_bounded(iter(self.records))) == transform(
+            self.records,
+            plan,
+        )
+
+
 class TestApplyMap:
     """Unit tests for :func:`apply_map`."""
 
@@ -401,6 +864,494 @@ class TestApplySort:
         assert apply_sort(data, None) == data
 
 
+class TestIterSorted:
+    """Unit tests for multi-key and external sorting."""
+
+    records = [
+        {'region': 'w', 'amount': 5, 'id': 0},
+        {'region': 'e', 'amount': 1, 'id': 1},
+        {'region': 'w', 'amount': 9, 'id': 2},
+        {'region': 'e', 'amount': 7, 'id': 3},
+        {'region': 'w', 'amount': 5, 'id': 4},
+        {'region': 'e', 'amount': None, 'id': 5},
+        {'region': 'e', 'amount': 1, 'id': 6},
+    ]
+
+    def test_multi_key_matches_sequential_sorts(self) -> None:
+        """
+        Test that one multi-key spec matches sorting once per key from the
+        least significant key, including mixed directions.
+        """
+        spec = {'keys': ['region', {'field': 'amount', 'reverse': True}]}
+        expected = apply_sort(
+            apply_sort(self.records, 'amount', reverse=True),
+            'region',
+        )
+
+        assert apply_sort_step(self.records, spec) == expected
+        assert [row['id'] for row in expected] == [5, 3, 1, 6, 2, 0, 4]
+
+    @pytest.mark.parametrize('max_in_memory', [1, 2, 3, 100])
+    def test_spilled_sort_matches_in_memory_sort(
+        self,
+        tmp_path: Path,
+        max_in_memory: int,
+    ) -> None:
+        """
+        Test that spilling sorted runs to disk keeps the stable in-memory
+        order and removes the run files afterward.
+        """
+        fields = (('amount', False), ('region', True))
+        expected = list(iter_sorted(self.records, fields))
+
+        result = iter_sorted(
+            iter(self.records),
+            fields,
+            max_in_memory=max_in_memory,
+            spill_dir=tmp_path,
+        )
+
+        assert list(result) == expected
+        assert not any(tmp_path.iterdir())
+
+    def test_spilled_runs_merge_in_passes(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+    ) -> None:
+        """Test that more runs than the merge width merge in several passes."""
+        sort_mod = importlib.import_module('etlplus.ops.transformations.sort')
+        monkeypatch.setattr(sort_mod, '_MAX_MERGE_WIDTH', 2)
+        records = [{'n': (i * 7) % 11} for i in range(11)]
+
+        result = iter_sorted(
+            records,
+            (('n', True),),
+            max_in_memory=2,
+            spill_dir=tmp_path,
+        )
+
+        assert [row['n'] for row in result] == list(range(10, -1, -1))
+
+    def test_rejects_non_positive_buffer(self) -> None:
+        """Test that a non-positive ``max_in_memory`` budget is rejected."""
+        with pytest.raises(ValueError, match='max_in_memory'):
+            list(iter_sorted(self.records, (('id', False),), max_in_memory=0))
+
+    @pytest.mark.parametrize(
+        ('spec', 'expected'),
+        [
+            pytest.param('a', (('a', False),), id='name'),
+            pytest.param({'field': 'a', 'reverse': True}, (('a', True),), id='map'),
+            pytest.param(
+                {'keys': ['a', {'field': 'b', 'reverse': False}], 'reverse': True},
+                (('a', True), ('b', False)),
+                id='keys',
+            ),
+            pytest.param({'keys': 'a'}, (('a', False),), id='single-key'),
+            pytest.param({'keys': [{'reverse': True}]}, (), id='no-field'),
+            pytest.param(None, (), id='none'),
+        ],
+    )
+    def test_sort_fields_parses_specs(
+        self,
+        spec: Any,
+        expected: tuple[tuple[str, bool], ...],
+    ) -> None:
+        """Test that :func:`sort_fields` normalizes each sort spec shape."""
+        assert sort_fields(spec) == expected
+
+    def test_plan_folds_sort_steps_into_one_stream(self) -> None:
+        """
+        Test that :meth:`TransformPlan.iter_sorted` matches applying each
+        sort spec in turn.
+        """
+        ops: dict[str, Any] = {
+            'sort': [
+                {'field': 'amount', 'reverse': True},
+                {'field': 'region', 'max_in_memory': 2},
+            ],
+        }
+        plan = compile_pipeline(ops)
+
+        assert list(plan.iter_sorted(iter(self.records))) == transform(
+            self.records,
+            ops,
+        )
+
+
+class TestApplySql:
+    """Unit tests for :func:`apply_sql` and its step adapter."""
+
+    def test_empty_records_or_query_short_circuit(self) -> None:
+        """Test that empty input and missing queries skip DuckDB."""
+        data = [{'a': 1}]
+
+        assert apply_sql([], 'SELECT 1 AS one') == []
+        assert apply_sql(data, None) is data
+        assert apply_sql_step(data, {'query': '   '}) is data
+
+    def test_failed_query_raises_value_error(self) -> None:
+        """Test that DuckDB errors surface as :class:`ValueError`."""
+        with pytest.raises(ValueError, match='SQL transform step failed'):
+            apply_sql([{'a': 1}], 'SELECT missing FROM data')
+
+    def test_group_by_returns_plain_numbers(self) -> None:
+        """Test that grouped results convert decimal sums to plain ints."""
+        data = [
+            {'region': 'east', 'amount': 2},
+            {'region': 'west', 'amount': 5},
+            {'region': 'east', 'amount': 3},
+        ]
+
+        result = apply_sql(
+            data,
+            'SELECT region, sum(amount) AS total FROM data '
+            'GROUP BY region ORDER BY region',
+        )
+
+        assert result == [
+            {'region': 'east', 'total': 5},
+            {'region': 'west', 'total': 5},
+        ]
+        assert all(type(row['total']) is int for row in result)
+
+    def test_fractional_decimals_keep_precision(self) -> None:
+        """Test that fractional decimal results are not rounded to floats."""
+        result = apply_sql(
+            [{'id': 1}],
+            'SELECT 0.1::DECIMAL(38, 20) + 0.2::DECIMAL(38, 20) AS total, '
+            '12345678901234567890::DECIMAL(38, 0) AS wide FROM data',
+        )
+
+        assert result == [
+            {'total': Decimal('0.30000000000000000000'), 'wide': 12345678901234567890},
+        ]
+
+    def test_keys_absent_from_first_record_reach_query(self) -> None:
+        """Test that later-only keys are exposed as columns to the query."""
+        data = [{'id': 1}, {'id': 2, 'late': 'x'}]
+
+        assert apply_sql(data, "SELECT id FROM data WHERE late = 'x'") == [
+            {'id': 2},
+        ]
+
+    def test_step_spec_can_name_relation(self) -> None:
+        """Test that mapping specs expose records under a custom name."""
+        data = [{'id': 1}, {'id': 2}]
+
+        assert apply_sql_step(
+            data,
+            {'query': 'SELECT id FROM orders WHERE id > 1', 'table': 'orders'},
+        ) == [{'id': 2}]
+
+
+class TestBlockingSteps:
+    """Unit tests for :func:`blocking_steps`."""
+
+    @pytest.mark.parametrize(
+        ('operations', 'expected'),
+        [
+            pytest.param(None, (), id='none'),
+            pytest.param(
+                {'filter': {'field': 'a'}, 'map': {'a': 'b'}, 'select': ['b']},
+                (),
+                id='row-wise-only',
+            ),
+            pytest.param(
+                {PipelineStep.SORT: {'field': 'a'}, 'aggregate': []},
+                ('sort',),
+                id='enum-key-and-empty-aggregate',
+            ),
+            pytest.param(
+                {'sort': {'field': 'a'}, 'aggregate': {'field': 'a'}},
+                ('aggregate', 'sort'),
+                id='pipeline-order',
+            ),
+            pytest.param(
+                {'sql': 'SELECT * FROM data', 'filter': {'field': 'a'}},
+                ('sql',),
+                id='sql',
+            ),
+            pytest.param(
+                {'sort': 'a', 'group_by': {'keys': 'a'}},
+                ('group_by', 'sort'),
+                id='group-by',
+            ),
+            pytest.param(
+                {'limit': 5, 'top_n': {'field': 'a', 'n': 2}},
+                ('top_n',),
+                id='top-n-not-limit',
+            ),
+        ],
+    )
+    def test_reports_full_dataset_steps(
+        self,
+        operations: Any,
+        expected: tuple[str, ...],
+    ) -> None:
+        """Test that only configured aggregate/sort/sql steps are reported."""
+        assert blocking_steps(operations) == expected
+
+
+class TestCompilePipeline:
+    """Unit tests for :func:`compile_pipeline` and step compilers."""
+
+    @pytest.mark.parametrize(
+        'compiler',
+        [
+            pytest.param(compile_filter_step, id='filter'),
+            pytest.param(compile_map_step, id='map'),
+            pytest.param(compile_select_step, id='select'),
+            pytest.param(compile_sql_step, id='sql'),
+            pytest.param(compile_group_by_step, id='group-by'),
+        ],
+    )
+    def test_compilers_return_none_for_invalid_specs(
+        self,
+        compiler: Callable[[Any], Any],
+    ) -> None:
+        """Test that unusable step specs compile to no step."""
+        assert compiler(123) is None
+
+    def test_compile_filter_step_drops_non_matching_records(self) -> None:
+        """Test that compiled filter steps keep or drop single records."""
+        step = compile_filter_step({'field': 'age', 'op': 'gte', 'value': 18})
+
+        assert step is not None
+        assert step({'age': 21}) == {'age': 21}
+        assert step({'age': 12}) is None
+        assert step({'name': 'Ada'}) is None
+
+    def test_compile_map_and_select_steps_reshape_records(self) -> None:
+        """Test that compiled map/select steps reshape one record."""
+        rename = compile_map_step({'a': 'x'})
+        pick = compile_select_step({'fields': ['x']})
+
+        assert rename is not None
+        assert pick is not None
+        assert pick(rename({'a': 1, 'b': 2})) == {'x': 1}
+
+    def test_compile_sort_step_sorts_batches(self) -> None:
+        """Test that compiled sort steps order whole batches."""
+        assert compile_sort_step({'reverse': True}) is None
+        step = compile_sort_step({'field': 'n', 'reverse': True})
+
+        assert step is not None
+        assert step([{'n': 1}, {'n': 3}, {'n': 2}]) == [
+            {'n': 3},
+            {'n': 2},
+            {'n': 1},
+        ]
+
+    def test_empty_operations_compile_to_empty_plan(self) -> None:
+        """Test that missing operations compile to a no-op plan."""
+        plan = compile_pipeline(None)
+
+        assert plan == TransformPlan()
+        assert plan.apply([{'a': 1}]) == [{'a': 1}]
+
+    def test_fuses_row_wise_steps_in_pipeline_order(self) -> None:
+        """Test that filter/map/select compile into one ordered record pass."""
+        plan = compile_pipeline(
+            {
+                'select': ['name'],
+                'map': {'full_name': 'name'},
+                'filter': [
+                    {'field': 'age', 'op': 'gte', 'value': 18},
+                    {'field': 'full_name', 'op': 'ne', 'value': 'Bob'},
+                ],
+                'sort': {'field': 'name'},
+            },
+        )
+        data = [
+            {'full_name': 'Cy', 'age': 30},
+            {'full_name': 'Bob', 'age': 40},
+            {'full_name': 'Ann', 'age': 25},
+            {'full_name': 'Dee', 'age': 10},
+        ]
+
+        assert len(plan.record_steps) == 4
+        assert len(plan.batch_steps) == 1
+        assert plan.blocking_steps == ('sort',)
+        assert plan.apply(data) == [{'name': 'Ann'}, {'name': 'Cy'}]
+
+    def test_plan_is_reusable_across_transform_calls(self) -> None:
+        """Test that one compiled plan matches uncompiled transform output."""
+        ops: dict[str, Any] = {
+            'filter': {'field': 'n', 'op': 'gt', 'value': 1},
+            'map': {'n': 'value'},
+        }
+        plan = compile_pipeline(ops)
+
+        for batch in ([{'n': 1}, {'n': 2}], [{'n': 5}], {'n': 3}):
+            assert transform(batch, plan) == transform(batch, ops)
+
+    def test_arrow_engine_compiles_table_steps(self) -> None:
+        """Test that ``engine: arrow`` compiles columnar steps only."""
+        plan = compile_pipeline(
+            {
+                'engine': 'arrow',
+                'filter': {'field': 'n', 'op': 'gt', 'value': 1},
+                'sort': {'field': 'n'},
+            },
+        )
+
+        assert plan.engine is TransformEngine.ARROW
+        assert not plan.record_steps
+        assert not plan.batch_steps
+        assert len(plan.table_steps) == 2
+        assert plan.blocking_steps == ('sort',)
+        assert plan.apply([{'n': 3}, {'n': 1}, {'n': 2}]) == [{'n': 2}, {'n': 3}]
+
+    def test_apply_table_round_trips_python_engine_plans(self) -> None:
+        """Test that row-wise plans accept and return Arrow tables."""
+        import pyarrow as pa
+
+        plan = compile_pipeline({'map': {'n': 'value'}})
+
+        result = plan.apply_table(pa.table({'n': [1, 2]}))
+
+        assert result.to_pylist() == [{'value': 1}, {'value': 2}]
+
+    @pytest.mark.parametrize(
+        'ops',
+        [
+            pytest.param(
+                {
+                    'filter': {'field': 'n', 'op': 'gte', 'value': 3},
+                    'map': {'n': 'value'},
+                    'select': ['value', 'tag'],
+                    'sort': {'field': 'value', 'reverse': True},
+                },
+                id='row-wise',
+            ),
+            pytest.param(
+                {
+                    'aggregate': [
+                        {'field': 'n', 'func': 'avg'},
+                        {'field': 'n', 'func': 'median'},
+                        {'field': 'tag', 'func': 'distinct'},
+                        {'func': 'count'},
+                    ],
+                },
+                id='aggregate',
+            ),
+        ],
+    )
+    def test_partitioned_plans_match_in_process_plans(
+        self,
+        ops: dict[str, Any],
+    ) -> None:
+        """
+        Test that ``workers`` plans merge partition results in order and
+        match in-process plans.
+        """
+        records = [{'n': (i * 7) % 10, 'tag': f't{i % 3}'} for i in range(25)]
+        plan = compile_pipeline({**ops, 'workers': 2, 'partition_size': 4})
+
+        assert plan.workers == 2
+        assert plan.partition_payload is not None
+        assert transform(records, plan) == transform(records, ops)
+
+    def test_partitioned_plans_fall_back_in_process(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that unpicklable specs and single-partition batches skip the
+        worker pool.
+        """
+
+        def _no_pool(*args: Any, **kwargs: Any) -> Any:
+            raise AssertionError('worker pool should not start')
+
+        monkeypatch.setattr(transform_mod, 'ProcessPoolExecutor', _no_pool)
+        records = [{'n': n} for n in range(6)]
+        custom = compile_pipeline(
+            {
+                'filter': {'field': 'n', 'op': lambda a, b: a > b, 'value': 3},
+                'workers': 'auto',
+                'partition_size': 2,
+            },
+        )
+        small = compile_pipeline({'select': ['n'], 'workers': 4})
+
+        assert custom.workers >= 1
+        assert custom.partition_payload is None
+        assert transform(records, custom) == [{'n': 4}, {'n': 5}]
+        assert transform(records, small) == records
+
+    def test_partitioned_plans_reuse_one_worker_pool(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that repeated applies and a batch stream share one worker pool,
+        and that batches below ``partition_size`` still go to the workers.
+        """
+        real_pool = transform_mod.ProcessPoolExecutor
+        started: list[int] = []
+
+        def _counting_pool(*args: Any, **kwargs: Any) -> Any:
+            started.append(kwargs['max_workers'])
+            return real_pool(*args, **kwargs)
+
+        monkeypatch.setattr(transform_mod, 'ProcessPoolExecutor', _counting_pool)
+        ops = {'filter': {'field': 'n', 'op': 'gt', 'value': 2}, 'limit': 1}
+        records = [{'n': n} for n in range(9)]
+        plan = compile_pipeline({**ops, 'workers': 2, 'partition_size': 4})
+        stream_plan = compile_pipeline({**ops, 'workers': 2})
+        batches = [records[start : start + 3] for start in range(0, 9, 3)]
+
+        try:
+            first = transform(records, plan)
+            second = transform(records, plan)
+            streamed = list(stream_plan.iter_apply(batches))
+        finally:
+            plan.close()
+            stream_plan.close()
+
+        assert first == second == transform(records, ops)
+        assert streamed == [transform(batch, ops) for batch in batches]
+        assert started == [2, 2]
+
+    @pytest.mark.parametrize(
+        ('methods', 'expected'),
+        [
+            pytest.param(['fork', 'spawn', 'forkserver'], 'forkserver', id='posix'),
+            pytest.param(['spawn'], 'spawn', id='windows'),
+        ],
+    )
+    def test_partition_workers_use_available_start_method(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        methods: list[str],
+        expected: str,
+    ) -> None:
+        """
+        Test that worker pools fall back to ``spawn`` without
+        ``forkserver``.
+        """
+        monkeypatch.setattr(batches_mod, 'get_all_start_methods', lambda: methods)
+
+        assert batches_mod.worker_context().get_start_method() == expected
+
+    def test_rejects_unknown_engine(self) -> None:
+        """Test that unknown engine names fail at compile time."""
+        with pytest.raises(ValueError):
+            compile_pipeline({'engine': 'gpu', 'select': ['a']})
+
+    def test_skips_invalid_specs(self) -> None:
+        """Test that specs compiling to no step are dropped from the plan."""
+        plan = compile_pipeline(
+            {'filter': [123], 'map': 'bad', 'sort': {'reverse': True}},
+        )
+
+        assert not plan.record_steps
+        assert not plan.batch_steps
+
+
 class TestTransform:
     """Unit tests for :func:`transform`."""
 
@@ -411,8 +1362,8 @@ class TestTransform:
         """Test that empty aggregate outputs do not mutate records."""
         monkeypatch.setattr(
             transform_mod,
-            'apply_aggregate_step',
-            lambda _records, _spec: [],
+            'apply_aggregates',
+            lambda _records, _specs: {},
         )
         data = [{'value': 1}]
         assert (
@@ -501,8 +1452,16 @@ class TestTransform:
         self,
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """Test that missing appliers skip step execution safely."""
-        monkeypatch.delitem(transform_mod._STEP_APPLIERS, 'filter')
+        """Test that missing step compilers skip step execution safely."""
+        monkeypatch.setattr(
+            transform_mod,
+            '_RECORD_STEP_COMPILERS',
+            tuple(
+                entry
+                for entry in transform_mod._RECORD_STEP_COMPILERS
+                if entry[0] != 'filter'
+            ),
+        )
         data = [{'a': 1}]
         assert (
             transform(data, {'filter': {'field': 'a', 'op': 'eq', 'value': 1}}) == data
@@ -730,18 +1689,13 @@ class TestTransformInternalHelpers:
         rows = [{'a': 1}]
         assert apply_map_step(rows, 123) == rows
 
-    def test_apply_row_step_returns_original_rows_for_empty_specs(self) -> None:
-        """Test that empty normalized specs leave row batches unchanged."""
-        rows = [{'id': 1}]
+    def test_step_specs_returns_empty_list_for_empty_specs(self) -> None:
+        """Test that empty step specs compile to no steps."""
+        assert not transform_mod._step_specs('filter', [])
 
-        assert (
-            transform_mod._apply_row_step(
-                rows,
-                step='filter',
-                raw_spec=[],
-            )
-            is rows
-        )
+    def test_step_specs_keeps_plain_select_fields_whole(self) -> None:
+        """Test that plain select field lists stay one spec."""
+        assert transform_mod._step_specs('select', ['a', 'b']) == [['a', 'b']]
 
     @pytest.mark.parametrize(
         ('spec', 'expected'),
@@ -793,30 +1747,24 @@ class TestTransformInternalHelpers:
         result = apply_sort_step(rows, spec)
         assert result == expected
 
-    def test_collect_numeric_and_presence(self) -> None:
+    def test_aggregate_state_counts_presence_and_numeric_values(self) -> None:
         """
-        Test that :func:`_collect_numeric_and_presence` returns correct numeric
-        values and their count.
+        Test that :class:`AggregateState` counts presence and numeric values.
         """
-        rows = [{'a': 1}, {'a': 2}, {'b': 3}]
-        nums, present = _collect_numeric_and_presence(rows, None)
-        assert not nums
-        assert present == 3
-
-        nums, present = _collect_numeric_and_presence(rows, 'a')
-        assert nums == [1, 2]
-        assert present == 2
+        rows: list[dict[str, Any]] = [{'a': 'x'}, {'a': True}, {'a': 2}, {'b': 3}]
+        state = AggregateState.from_specs(
+            [
+                {'func': 'count', 'alias': 'rows'},
+                {'field': 'a', 'func': 'count'},
+                {'field': 'a', 'func': lambda nums, present: nums},
+            ],
+        )
 
-    def test_collect_numeric_and_presence_ignores_non_numeric_values(
-        self,
-    ) -> None:
-        """
-        Test that presence increments even when values are non-numeric.
-        """
-        rows: list[dict[str, Any]] = [{'a': 'x'}, {'a': True}, {'a': 2}]
-        nums, present = _collect_numeric_and_presence(rows, 'a')
-        assert nums == [2.0]
-        assert present == 3
+        assert state.update(rows).result() == {
+            'rows': 4,
+            'count_a': 3,
+            '<lambda>_a': [2.0],
+        }
 
     def test_contains(self) -> None:
         """
@@ -1090,12 +2038,75 @@ class TestTransformInternalHelpers:
         fn = _resolve_operator('gt')
         assert fn('b', 'a') is True
 
+    @pytest.mark.parametrize('op', ['eq', 'ne', 'gt', 'gte', 'lt', 'lte'])
+    @pytest.mark.parametrize(
+        'value',
+        [10, 10.0, '10', 'b', None],
+        ids=['int', 'float', 'numeric-text', 'text', 'none'],
+    )
+    def test_bind_operator_matches_resolve_operator(
+        self,
+        op: str,
+        value: object,
+    ) -> None:
+        """
+        Test that :func:`bind_operator` matches :func:`_resolve_operator`
+        for ints, floats, non-finite floats, text, booleans, and ``None``.
+        """
+        bound = bind_operator(op, value)
+        resolved = _resolve_operator(op)
+        for lhs in [9, 10, 11, 9.5, 10.0, float('inf'), '10', ' 11 ', 'a', True]:
+            try:
+                expected: object = resolved(lhs, value)
+            except TypeError:
+                expected = TypeError
+            try:
+                actual: object = bound(lhs, value)
+            except TypeError:
+                actual = TypeError
+            assert actual == expected, lhs
+
+    def test_bind_operator_coerces_constant_once(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test that bound numeric operators coerce the constant once and skip
+        coercion for ``int``/``float`` record values.
+        """
+        calls: list[object] = []
+        original = filter_mod.FloatParser.coerce
+
+        def coerce(value: object) -> float | None:
+            calls.append(value)
+            return original(value)
+
+        monkeypatch.setattr(filter_mod.FloatParser, 'coerce', coerce)
+        bound = bind_operator('gte', '5')
+        assert calls == ['5']
+        assert [bound(x, '5') for x in (4, 5, 6.5)] == [False, True, True]
+        assert calls == ['5']
+
+    def test_bind_operator_passes_callables_and_non_numeric_ops_through(
+        self,
+    ) -> None:
+        """
+        Test that callables and non-numeric operators are not wrapped.
+        """
+
+        def op(a: object, b: object) -> bool:
+            return a == b
+
+        assert bind_operator(op, 1) is op
+        assert bind_operator('in', [1])(1, [1]) is True
+        assert bind_operator('gt', 'b')('c', 'b') is True
+
     def test_sort_key(self) -> None:
         """
-        Test that :func:`_sort_key` places numbers before strings, then `None`
+        Test that :func:`sort_key` places numbers before strings, then `None`
         values last.
         """
-        assert _sort_key(None)[0] == 2
-        assert _sort_key(5)[0] == 0
-        assert _sort_key(True)[0] == 1
-        assert _sort_key('abc')[0] == 1
+        assert sort_key(None)[0] == 2
+        assert sort_key(5)[0] == 0
+        assert sort_key(True)[0] == 1
+        assert sort_key('abc')[0] == 1
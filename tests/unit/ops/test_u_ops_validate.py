@@ -21,6 +21,9 @@ from typing import cast
 import pytest
 
 from etlplus.ops.validate import FieldRulesDict
+from etlplus.ops.validate import ValidationReport
+from etlplus.ops.validate import compile_jsonschema
+from etlplus.ops.validate import compile_rules
 from etlplus.ops.validate import validate
 from etlplus.ops.validate import validate_field
 from etlplus.ops.validate import validate_schema
@@ -52,6 +55,12 @@ def _raise_yaml_install_error() -> None:
     _raise_runtime_error('install yaml')
 
 
+@pytest.fixture(autouse=True)
+def _clear_jsonschema_cache() -> None:
+    """Start each test without cached JSON Schema validators."""
+    validate_mod._cached_jsonschema.cache_clear()
+
+
 # SECTION: TESTS ============================================================ #
 
 
@@ -673,6 +682,204 @@ class TestValidate:
         assert result['data'] is None
 
 
+class TestCompileJsonSchema:
+    """Unit tests for :func:`compile_jsonschema`."""
+
+    schema = (
+        '{"type": "object", "required": ["id"],'
+        ' "properties": {"id": {"type": "integer"}}}'
+    )
+    records: list[Any] = [
+        {'id': 1},
+        {'id': 'x'},
+        {},
+        {'id': 4},
+        {'id': None},
+    ]
+
+    def test_caches_by_file_modification(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """
+        Test that unchanged schema files reuse one compiled validator and
+        edited files are recompiled.
+        """
+        pytest.importorskip('jsonschema')
+        path = tmp_path / 'schema.json'
+        path.write_text(self.schema, encoding='utf-8')
+
+        first = compile_jsonschema(path)
+        assert compile_jsonschema(str(path)) is first
+
+        path.write_text('{"type": "array"}', encoding='utf-8')
+        second = compile_jsonschema(path)
+
+        assert second is not first
+        assert second.schema == {'type': 'array'}
+
+    def test_invalid_schema_is_not_cached(self) -> None:
+        """Test that schema errors raise on every call."""
+        pytest.importorskip('jsonschema')
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match='Invalid JSON Schema'):
+                compile_jsonschema('{"type": 12}')
+        assert validate_mod._cached_jsonschema.cache_info().currsize == 0
+
+    @pytest.mark.parametrize(
+        'kwargs',
+        [
+            pytest.param({}, id='in-process'),
+            pytest.param({'workers': 4, 'partition_size': 100}, id='one-partition'),
+            pytest.param({'workers': 2, 'partition_size': 2}, id='workers'),
+        ],
+    )
+    def test_validate_records_prefixes_record_indexes(
+        self,
+        kwargs: dict[str, int],
+    ) -> None:
+        """
+        Test that records are validated one by one, in record order, with
+        and without worker processes.
+        """
+        pytest.importorskip('jsonschema')
+        compiled = compile_jsonschema(self.schema)
+
+        result = compiled.validate_records(iter(self.records), **kwargs)
+
+        assert result['valid'] is False
+        assert result['errors'] == [
+            "[1].id: 'x' is not of type 'integer'",
+            "[2]: 'id' is a required property",
+            "[4].id: None is not of type 'integer'",
+        ]
+        assert list(result['field_errors']) == ['[1].id', '[2]', '[4].id']
+
+    def test_validate_matches_validate_schema(self) -> None:
+        """Test that one compiled document check matches the schema helper."""
+        pytest.importorskip('jsonschema')
+        payload = '[{"id": 1}, {"id": "x"}]'
+        schema = f'{{"type": "array", "items": {self.schema}}}'
+
+        compiled = compile_jsonschema(schema)
+
+        assert compiled.validate(
+            [{'id': 1}, {'id': 'x'}],
+        ) == validate_schema(payload, schema, schema_format='jsonschema')
+        assert compile_jsonschema(schema) is compiled
+
+
+class TestCompileRules:
+    """Unit tests for :func:`compile_rules`."""
+
+    rules: dict[str, Any] = {
+        'id': {'required': True, 'type': 'integer', 'min': 1},
+        'code': {'type': 'string', 'minLength': 2, 'pattern': '^[A-Z]+$'},
+        'status': {'enum': ['new', 'done', [1]]},
+        'score': {'min': 'low', 'max': 10},
+        'tag': {'pattern': '[', 'maxLength': 'x'},
+    }
+    data: list[Any] = [
+        {'id': 1, 'code': 'AB', 'status': 'new', 'score': 3, 'tag': 'a'},
+        {'id': 0, 'code': 'a', 'status': 'old', 'score': 11},
+        {'id': True, 'code': 5, 'status': [1], 'tag': None},
+        {'status': {'k': 1}},
+        'not-a-record',
+    ]
+
+    def test_matches_uncompiled_field_validation(self) -> None:
+        """
+        Test that compiled rules report the same errors as per-field
+        validation, including malformed rule values.
+        """
+        result = compile_rules(self.rules).validate(self.data)
+
+        expected: dict[str, list[str]] = {}
+        for i, item in enumerate(self.data):
+            if not isinstance(item, dict):
+                continue
+            for field, field_rules in self.rules.items():
+                field_result = validate_field(item.get(field), field_rules)
+                if not field_result['valid']:
+                    expected[f'[{i}].{field}'] = field_result['errors']
+        expected['[4]'] = ['Item is not an object (expected dict)']
+
+        assert result['valid'] is False
+        assert result['field_errors'] == expected
+        assert result == validate(self.data, self.rules)
+
+    def test_reuses_compiled_patterns(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that patterns compile once, not once per checked value."""
+        compiled = compile_rules({'code': {'pattern': '^[A-Z]+$'}})
+        calls: list[object] = []
+        monkeypatch.setattr(
+            validate_mod.re,
+            'compile',
+            lambda *args: calls.append(args),
+        )
+
+        result = compiled.validate([{'code': 'AB'}, {'code': 'c'}])
+
+        assert calls == []
+        assert result['errors'] == [
+            '[1].code: Value does not match pattern ^[A-Z]+$',
+        ]
+
+    def test_split_tallies_batches_into_bounded_report(self) -> None:
+        """
+        Test that splitting batches keeps global indexes, per-field/rule
+        counts, a bounded sample list, and the error budget.
+        """
+        compiled = compile_rules({'id': {'required': True, 'min': 1}})
+        report = ValidationReport(max_samples=2, max_errors=2)
+
+        valid, invalid = compiled.split([{'id': 1}, {'id': 0}], report)
+        assert valid == [{'id': 1}]
+        assert invalid == [{'id': 0}]
+        assert not report.exhausted
+
+        valid, invalid = compiled.split([{}, 'x', {'id': 2}], report)
+        assert valid == [{'id': 2}]
+        assert invalid == [{}, 'x']
+        assert report.exhausted
+        assert report.summary() == {
+            'records': 5,
+            'invalid_records': 3,
+            'error_count': 3,
+            'counts': {'id': {'min': 1, 'required': 1}, '[*]': {'object': 1}},
+            'sample_errors': [
+                '[1].id: Value 0 is less than minimum 1.0',
+                '[2].id: Field is required',
+            ],
+            'budget_exceeded': True,
+        }
+
+    def test_split_single_record_without_report(self) -> None:
+        """Test that a lone record splits without index prefixes."""
+        compiled = compile_rules({'id': {'type': 'integer'}})
+        assert compiled.split({'id': 'a'}) == ([], [{'id': 'a'}])
+        report = ValidationReport()
+        compiled.split({'id': 'a'}, report)
+        assert report.samples == ['id: Expected type integer, got str']
+        assert not report.exhausted
+
+    def test_rejects_non_mapping_field_rules(self) -> None:
+        """Test that field rules must be mappings."""
+        with pytest.raises(TypeError, match='must be a mapping'):
+            compile_rules(cast(Any, {'id': ['required']}))
+
+    def test_reports_load_errors_and_empty_rules(self) -> None:
+        """Test load failures and rule-free validation."""
+        assert compile_rules({}).validate({'a': 1})['data'] == {'a': 1}
+        result = compile_rules({}).validate(cast(Any, 123))
+        assert result['data'] is None
+        assert result['errors'][0].startswith('Failed to load data')
+
+
 class TestValidateField:
     """Unit tests for :func:`validate_field`."""
 
@@ -0,0 +1,169 @@
+"""
+:mod:`tests.unit.utils.test_u_utils_json` module.
+
+Unit tests for :mod:`etlplus.utils._json`.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from datetime import date
+
+import pytest
+
+from etlplus.utils import JsonCodec
+from etlplus.utils import _json as mod
+
+# SECTION: FIXTURES ========================================================= #
+
+
+@pytest.fixture(autouse=True)
+def fresh_backends(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Resolve JSON backends from scratch in every test."""
+    monkeypatch.setattr(mod, '_RESOLVED', {})
+    monkeypatch.delenv(mod.JSON_BACKEND_ENV, raising=False)
+
+
+@pytest.fixture(name='backend', params=['json', 'orjson', 'msgspec'])
+def backend_fixture(
+    request: pytest.FixtureRequest,
+) -> mod.JsonBackend:
+    """Return each JSON backend that is installed."""
+    if request.param != 'json':
+        pytest.importorskip(request.param)
+    return mod.JsonBackend.resolve(request.param)
+
+
+# SECTION: TESTS ============================================================ #
+
+
+class TestJsonBackend:
+    """Unit tests for :class:`etlplus.utils._json.JsonBackend`."""
+
+    @pytest.mark.parametrize(
+        ('sort_keys', 'pretty'),
+        [
+            pytest.param(False, False, id='compact'),
+            pytest.param(True, False, id='compact-sorted'),
+            pytest.param(False, True, id='pretty'),
+        ],
+    )
+    def test_dumps_matches_standard_library(
+        self,
+        backend: mod.JsonBackend,
+        sort_keys: bool,
+        pretty: bool,
+    ) -> None:
+        """Test that every backend renders the same text as :mod:`json`."""
+        payload = {'b': [1, 2.5, None, True], 'a': {'name': 'Zoë'}, 'c': {}}
+
+        assert backend.dumps(payload, sort_keys=sort_keys, pretty=pretty) == (
+            json.dumps(
+                payload,
+                ensure_ascii=False,
+                sort_keys=sort_keys,
+                indent=2 if pretty else None,
+                separators=None if pretty else (',', ':'),
+            )
+        )
+
+    def test_dumps_routes_dates_through_default(
+        self,
+        backend: mod.JsonBackend,
+    ) -> None:
+        """Test that dates use the fallback serializer on every backend."""
+        text = backend.dumps({'day': date(2024, 1, 2)}, default=JsonCodec.default)
+
+        assert text == '{"day":"2024-01-02"}'
+
+    def test_dumps_falls_back_for_unsupported_values(
+        self,
+        backend: mod.JsonBackend,
+    ) -> None:
+        """Test that values a fast backend rejects use :mod:`json`."""
+        assert backend.dumps({'n': 2**70}) == f'{{"n":{2**70}}}'
+        with pytest.raises(TypeError):
+            backend.dumps({'value': object()})
+
+    def test_dumps_writes_non_finite_floats_like_standard_library(
+        self,
+        backend: mod.JsonBackend,
+    ) -> None:
+        """Test that ``NaN`` and infinities are not rewritten as ``null``."""
+        payload = {'nan': math.nan, 'inf': [math.inf, -math.inf], 'none': None}
+
+        text = backend.dumps(payload)
+
+        assert text == '{"nan":NaN,"inf":[Infinity,-Infinity],"none":null}'
+        assert backend.dumps({'values': (1.5, None)}) == '{"values":[1.5,null]}'
+        parsed = backend.loads(text)
+        assert math.isnan(parsed['nan'])
+        assert parsed['inf'] == [math.inf, -math.inf]
+
+    def test_loads_falls_back_and_raises_standard_errors(
+        self,
+        backend: mod.JsonBackend,
+    ) -> None:
+        """Test that fast-backend parse failures defer to :mod:`json`."""
+        assert backend.loads('{"n": 1, "s": "x"}') == {'n': 1, 's': 'x'}
+        assert backend.loads(f'[{2**70}]') == [2**70]
+        with pytest.raises(json.JSONDecodeError):
+            backend.loads('{broken')
+
+    def test_resolve_reads_environment_and_caches(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test backend selection from ``ETLPLUS_JSON_BACKEND``."""
+        monkeypatch.setenv(mod.JSON_BACKEND_ENV, ' JSON ')
+
+        backend = mod.JsonBackend.resolve()
+
+        assert backend == mod.JsonBackend()
+        assert mod.JsonBackend.resolve() is backend
+
+    def test_resolve_auto_prefers_installed_fast_backend(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that ``auto`` picks the first installed fast backend."""
+        module = object()
+        monkeypatch.setattr(
+            mod,
+            '_import_backend',
+            lambda name: module if name == 'msgspec' else None,
+        )
+
+        assert mod.JsonBackend.resolve('auto') == mod.JsonBackend('msgspec', module)
+
+    def test_resolve_auto_falls_back_to_standard_library(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that ``auto`` uses :mod:`json` without fast backends."""
+        monkeypatch.setattr(mod, '_import_backend', lambda name: None)
+
+        assert mod.JsonBackend.resolve() == mod.JsonBackend()
+
+    @pytest.mark.parametrize(
+        ('name', 'error', 'match'),
+        [
+            pytest.param('ujson', ValueError, 'Invalid JSON backend', id='unknown'),
+            pytest.param('orjson', ImportError, 'pip install orjson', id='missing'),
+        ],
+    )
+    def test_resolve_rejects_unusable_names(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        name: str,
+        error: type[Exception],
+        match: str,
+    ) -> None:
+        """Test errors for unknown and uninstalled backends."""
+        monkeypatch.setattr(mod, '_import_backend', lambda name: None)
+
+        with pytest.raises(error, match=match):
+            mod.JsonBackend.resolve(name)
@@ -13,7 +13,9 @@ from etlplus.workflow._dag import topological_sort_jobs
 from etlplus.workflow._errors import DagError
 from etlplus.workflow._jobs import ExtractRef
 from etlplus.workflow._jobs import JobConfig
+from etlplus.workflow._jobs import JobIncrementalConfig
 from etlplus.workflow._jobs import JobRetryConfig
+from etlplus.workflow._jobs import JobStreamingConfig
 from etlplus.workflow._jobs import LoadRef
 from etlplus.workflow._jobs import TransformRef
 from etlplus.workflow._jobs import ValidationRef
@@ -36,7 +38,9 @@ from ..pytest_export_contracts import assert_package_exports
 WORKFLOW_EXPORTS: tuple[tuple[str, object], ...] = (
     ('ExtractRef', ExtractRef),
     ('JobConfig', JobConfig),
+    ('JobIncrementalConfig', JobIncrementalConfig),
     ('JobRetryConfig', JobRetryConfig),
+    ('JobStreamingConfig', JobStreamingConfig),
     ('LoadRef', LoadRef),
     ('ProfileConfig', ProfileConfig),
     ('ScheduleBackfillConfig', ScheduleBackfillConfig),
@@ -12,7 +12,9 @@ import pytest
 
 from etlplus.workflow._jobs import ExtractRef
 from etlplus.workflow._jobs import JobConfig
+from etlplus.workflow._jobs import JobIncrementalConfig
 from etlplus.workflow._jobs import JobRetryConfig
+from etlplus.workflow._jobs import JobStreamingConfig
 from etlplus.workflow._jobs import LoadRef
 from etlplus.workflow._jobs import TransformRef
 from etlplus.workflow._jobs import ValidationRef
@@ -27,7 +29,9 @@ from etlplus.workflow._jobs import ValidationRef
 
 type RefClass = (
     type[ExtractRef]
+    | type[JobIncrementalConfig]
     | type[JobRetryConfig]
+    | type[JobStreamingConfig]
     | type[LoadRef]
     | type[TransformRef]
     | type[ValidationRef]
@@ -58,6 +62,21 @@ class TestReferenceParsing:
                 {'source': 'my_source', 'options': {'foo': 1}},
                 id='extract-ref-strips-source',
             ),
+            pytest.param(
+                ExtractRef,
+                {'source': 'db', 'incremental': 'updated_at'},
+                {
+                    'source': 'db',
+                    'incremental': JobIncrementalConfig(field='updated_at'),
+                },
+                id='extract-ref-incremental-field',
+            ),
+            pytest.param(
+                JobIncrementalConfig,
+                {'field': ' id ', 'initial': 100, 'param': 'since_id'},
+                {'field': 'id', 'initial': 100, 'param': 'since_id'},
+                id='incremental-mapping',
+            ),
             pytest.param(
                 LoadRef,
                 {'target': '  my_target  ', 'overrides': {'foo': 2}},
@@ -76,6 +95,24 @@ class TestReferenceParsing:
                 {'max_attempts': 3, 'backoff_seconds': 1.5},
                 id='retry-ref',
             ),
+            pytest.param(
+                JobStreamingConfig,
+                {'batch_size': '500'},
+                {'enabled': True, 'batch_size': 500},
+                id='streaming-mapping',
+            ),
+            pytest.param(
+                JobStreamingConfig,
+                {'enabled': 'off', 'batch_size': 'many'},
+                {'enabled': False, 'batch_size': 10_000},
+                id='streaming-disabled-default-batch-size',
+            ),
+            pytest.param(
+                JobStreamingConfig,
+                True,
+                {'enabled': True, 'batch_size': 10_000},
+                id='streaming-flag',
+            ),
             pytest.param(
                 ValidationRef,
                 {'ruleset': '  rs  ', 'severity': 'warn', 'phase': 'both'},
@@ -96,6 +133,22 @@ class TestReferenceParsing:
                 },
                 id='validation-ref-normalizes-known-choices',
             ),
+            pytest.param(
+                ValidationRef,
+                {'ruleset': 'rs', 'max_errors': '10', 'max_samples': -1},
+                {'ruleset': 'rs', 'max_errors': 10, 'max_samples': 0},
+                id='validation-ref-bounded-settings',
+            ),
+            pytest.param(
+                ValidationRef,
+                {
+                    'ruleset': 'rs',
+                    'severity': 'Quarantine',
+                    'quarantine': 'rejects',
+                },
+                {'ruleset': 'rs', 'severity': 'quarantine', 'quarantine': 'rejects'},
+                id='validation-ref-quarantine-target',
+            ),
         ],
     )
     def test_ref_from_obj_valid(
@@ -121,7 +174,16 @@ class TestReferenceParsing:
             pytest.param(LoadRef, {'target': 123}, id='load-bad'),
             pytest.param(LoadRef, {'target': ''}, id='load-blank'),
             pytest.param(LoadRef, {'target': '   '}, id='load-whitespace'),
+            pytest.param(JobIncrementalConfig, None, id='incremental-none'),
+            pytest.param(JobIncrementalConfig, '  ', id='incremental-blank'),
+            pytest.param(
+                JobIncrementalConfig,
+                {'initial': 1},
+                id='incremental-missing-field',
+            ),
             pytest.param(JobRetryConfig, None, id='retry-none'),
+            pytest.param(JobStreamingConfig, None, id='streaming-none'),
+            pytest.param(JobStreamingConfig, 10, id='streaming-bad'),
             pytest.param(TransformRef, {'pipeline': 123}, id='transform-bad'),
             pytest.param(TransformRef, {'pipeline': ''}, id='transform-blank'),
             pytest.param(TransformRef, {'pipeline': '   '}, id='transform-whitespace'),
@@ -170,6 +232,7 @@ class TestJobConfigParsing:
                 'extract': {'source': 'src'},
                 'validate': {'ruleset': 'rs'},
                 'retry': {'max_attempts': 3, 'backoff_seconds': 0.25},
+                'streaming': {'batch_size': 100},
                 'transform': {'pipeline': 'p'},
                 'load': {'target': 't'},
             },
@@ -180,6 +243,7 @@ class TestJobConfigParsing:
         assert cfg.extract is not None
         assert cfg.validate is not None
         assert cfg.retry == JobRetryConfig(max_attempts=3, backoff_seconds=0.25)
+        assert cfg.streaming == JobStreamingConfig(batch_size=100)
         assert cfg.transform is not None
         assert cfg.load is not None
 
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import pytest
 
+from etlplus.workflow._jobs import JobStreamingConfig
 from etlplus.workflow._profile import ProfileConfig
 
 # SECTION: PRAGMAS ========================================================== #
@@ -78,6 +79,13 @@ class TestProfileConfig:
         assert cfg.default_target == expected_default_target
         assert cfg.env == expected_env
 
+    def test_from_obj_parses_streaming_default(self) -> None:
+        """
+        Test that profile parsing exposes a config-wide streaming default.
+        """
+        cfg = ProfileConfig.from_obj({'streaming': {'batch_size': 250}})
+        assert cfg.streaming == JobStreamingConfig(batch_size=250)
+
     @pytest.mark.parametrize(
         'payload',
         [